@@ -11,45 +11,95 @@
 """Entry point for PIXrun frame copy program"""
 
 import os
+import re
 import struct
 import sys
-from pixparser import Parser
+from array import array
+from bisect import bisect_left, bisect_right
+from pixfunc import functionName
+from pixindex import openIndex
+from pixobjects import CreateEID, RecordSize, loadObjects
+from pixparser import Parser, DWord
 
 LongSize = 2 * struct.calcsize('I')
+BlockSize = 64 << 20
+MaxArgs = 16 # argument dwords scanned for object addresses
+
+# calls defining the content of their objects (creations are found from the CreateEIDs)
+ContentCalls = re.compile(r'Lock|Unlock|Update|AddDirty|GenerateMipSubLevels|ColorFill|StretchRect|'
+                          r'GetRenderTargetData|GetFrontBufferData')
+# classes whose methods only use "this" as a context
+ContextClasses = re.compile(r'^IDirect3D9|Device')
+
+def copyRange(source, output, start, end, position):
+    # copy source bytes [start, end) to a given output position, from the memory map without intermediate copies
+    output.seek(position)
+    while start < end:
+        n = min(end - start, BlockSize)
+        source.load(start, start + n) # packed traces
+        output.write(buffer(source.data, start, n))
+        start += n
 
 class FrameParser(Parser):
     def __init__(self, stream, output, frames):
         Parser.__init__(self, stream, 0)
         self.output = output
         self.frames = frames
-        self.skipped_bytes  = 0 # byte offset
-        self.skipped_events = 0 # EID offset
-        self.stream_length = os.fstat(self.stream.fileno()).st_size
-        self.parentFrame = 0
+        self.stream_length = self.stream.size
+        self.spans = [] # source byte ranges [start, end) to copy, in order
+        self.kept = [] # (eventType, data, offsets) of the kept Frame Begin events
 
     def parse(self):
-        Parser.parse(self)
+        # plan all the kept byte ranges, then move the data
+        if self.index is not None:
+            self.planFrames()
+        else:
+            Parser.parse(self)
+        self.copy()
         self.output.flush()
 
+    def planFrames(self):
+        # the plan of the sequential parse, seeking from frame to frame with the index
+        # and only decoding the Frame Begin events of the kept frames
+        index = self.index
+        for frame in xrange(1, index.frameCount() + 1):
+            offset, chunkID, frameID = index.findFrame(frame)
+            if offset < self.nextChunkOffset:
+                continue # within the previous frame
+            if self.nextChunkOffset < offset:
+                self.parseRange(offset) # chunks out of frames
+            if str(frame) in self.frames:
+                data, offsets = self.decodeEvent(offset)
+                eventType = self.eventTypes[DWord.unpack_from(self.stream.data, offset + 8)[0]]
+                self.lastChunkOffset = offset
+                self.frameID = frame
+                self.processFrame(eventType, data, offsets)
+            else:
+                print "Skipping frame %i" % frame
+            nextOffset = int(index.frameNextPos[frame - 1]) or self.stream_length
+            self.seekChunk(nextOffset, bisect_left(index.chunkOffsets, nextOffset) + 1, frame + 1)
+        if self.nextChunkOffset < self.stream_length:
+            self.parseRange(self.stream_length)
+
     def parseChunk(self):
         currChunk = self.chunkID
         currFrame = self.frameID
         res = Parser.parseChunk(self)
         
         # did we parse something else than a frame?
-        if self.frameID == currFrame:
+        if res and self.frameID == currFrame:
             print "Copying chunk %i" % currChunk
-            # we must copy the chunk
-            tempOffset = self.stream.tell() # save 
-            self.stream.seek(self.lastChunkOffset)
-            buf = self.stream.read(self.nextChunkOffset - self.lastChunkOffset)
-            self.output.write(buf)
-            # rewind to where we were locally
-            self.stream.seek(tempOffset)
+            self.addSpan(self.lastChunkOffset, min(self.nextChunkOffset, self.stream_length))
 
         # forward the parsing result
         return res
 
+    def addSpan(self, start, end):
+        if self.spans and self.spans[-1][1] == start:
+            self.spans[-1] = (self.spans[-1][0], end)
+        else:
+            self.spans.append((start, end))
+
     def processEvent(self, eventType, data, offsets):
         pass # we could update the EID data
 
@@ -61,54 +111,58 @@ class FrameParser(Parser):
             nextOffset = self.stream_length
         
         if str(self.frameID) in self.frames:
-            # copy frame:
+            # copy full frame content
             print "Copying frame %i" % self.frameID
-
-            # transformed data
-            transform = {}
-            transform['ThisEventPos'] = baseOffset - self.skipped_bytes
-            transform['NextSiblingPos'] = max(0, data['NextSiblingPos'] - self.skipped_bytes)
-
-            self.copyEvent(eventType, data, offsets, transform)
-            
-            # - copy full frame content
-            buf = self.stream.read(nextOffset - self.stream.tell())
-            self.output.write(buf)
-            
+            self.kept.append((eventType, data, offsets))
+            self.addSpan(baseOffset, nextOffset)
         else:
             # skip frame
-	    frameSize = nextOffset - baseOffset
-            self.skipped_bytes += frameSize
             print "Skipping frame %i" % self.frameID
         
-        return False
-
-    def copyEvent(self, eventType, data, offsets, transform):
-        anchor = self.lastChunkOffset # where to copy from
-        tempOffset = self.stream.tell()
-        for elementId, fieldFormat in eventType.fields:
-            element = self.elements[elementId]
-            if element.name in transform:
-                # copy part up to here
-                bufSize = offsets[element.name] - anchor
-                if bufSize > 0:
-                    self.stream.seek(anchor)
-                    buf = self.stream.read(bufSize)
-                    self.output.write(buf)
-                else:
-                    assert bufSize == 0
-                # re-parse element data (for size)
-                self.parseElement(element)
-
-                # reset anchor
-                anchor = self.stream.tell()
-                
-                # write new element data
-                self.writeElement(element, transform[element.name])
-
-        # write the rest up to the next event
-        buf = self.stream.read(self.nextChunkOffset - anchor)
-        self.output.write(buf)
+        return False # jump to the next frame
+
+    def outputOffset(self, offset):
+        # where a source offset lands in the output (or what follows it, if it was cut)
+        i = bisect_right(self.spanStarts, offset) - 1
+        if i < 0:
+            return 0
+        start, end = self.spans[i]
+        return self.outputStarts[i] + min(offset, end) - start
+
+    def copy(self):
+        self.spanStarts = [start for start, end in self.spans]
+        self.outputStarts = []
+        position = 0
+        for start, end in self.spans:
+            self.outputStarts.append(position)
+            position += end - start
+
+        # fix up the frame positions, now that the output layout is known: as with the
+        # sequential copy, NextSiblingPos is the output position right after the frame
+        patches = []
+        for i, (eventType, data, offsets) in enumerate(self.kept):
+            transform = {}
+            transform['ThisEventPos'] = self.outputOffset(data['ThisEventPos'])
+            if i + 1 < len(self.kept):
+                transform['NextSiblingPos'] = self.outputOffset(self.kept[i + 1][1]['ThisEventPos'])
+            elif data['NextSiblingPos'] == 0:
+                transform['NextSiblingPos'] = 0
+            else:
+                transform['NextSiblingPos'] = self.outputOffset(data['NextSiblingPos'])
+            for elementId, fieldFormat in eventType.fields:
+                element = self.elements[elementId]
+                if element.name in transform:
+                    patches.append((self.outputOffset(offsets[element.name]), element, transform[element.name]))
+
+        # move the data in large spans, then patch the Frame Begin events
+        self.output.flush()
+        base = self.output.tell()
+        for (start, end), position in zip(self.spans, self.outputStarts):
+            copyRange(self.stream, self.output, start, end, base + position)
+        for position, element, value in patches:
+            self.output.seek(base + position)
+            self.writeElement(element, value)
+        self.output.seek(0, 2)
 
     def writeElement(self, element, value): # this should keep the same exact buffer size as read data
         if element.typeId == 1:
@@ -132,21 +186,209 @@ class FrameParser(Parser):
         buf = struct.pack('I', int(word))
         self.output.write(buf)
 
+class DependencyParser(FrameParser):
+    def __init__(self, stream, output, frames):
+        FrameParser.__init__(self, stream, output, frames)
+        self.keeping = True # chunks before the first frame are always copied
+        self.contentIds = set(i for i, name in functionName.items() if ContentCalls.search(name))
+        self.contextIds = set(i for i, name in functionName.items() if ContextClasses.search(name.split('::')[0]))
+        self.callFields = {} # event type name -> call package decoded with the event
+        self.uses = {} # object -> last EID using it in a kept frame
+        # events of the skipped frames
+        self.skipped = {} # EID -> row
+        self.eventEIDs = array('I')
+        self.eventParents = array('I')
+        self.eventFrames = array('I')
+        self.eventStarts = array('d')
+        self.eventEnds = array('d')
+        self.eventCalls = array('B')
+        self.frameBegins = {} # EID -> (eventType, data, offsets) of the skipped Frame Begin events
+        self.asyncEIDs = array('I')
+        self.asyncStarts = array('d')
+        self.asyncEnds = array('d')
+        # objects referenced by the skipped events, and by their content calls
+        self.touchEIDs = array('I')
+        self.touchObjects = array('I')
+        self.contentEIDs = array('I')
+        self.contentObjects = array('I')
+
+    def parse(self):
+        # read the object lifetimes, plan the kept frames while recording the
+        # skipped events, then add the ones kept frames depend on
+        self.objects = loadObjects(self.stream)
+        self.stream.seek(0)
+        Parser.parse(self)
+        self.resolve()
+        self.copy()
+        self.output.flush()
+
+    def parseChunk(self):
+        currFrame = self.frameID
+        res = Parser.parseChunk(self)
+        if res and self.frameID == currFrame:
+            start, end = self.lastChunkOffset, min(self.nextChunkOffset, self.stream_length)
+            if self.frameID == 1 or (not self.keeping and self.chunkTag not in (1003, 1004)):
+                self.addSpan(start, end) # chunks out of frames, and capture information
+            elif self.chunkTag == 1004 and not self.keeping:
+                self.asyncEIDs.append(DWord.unpack_from(self.stream.data, start + 8)[0])
+                self.asyncStarts.append(start)
+                self.asyncEnds.append(end)
+        return res
+
+    def parseObjectInfo(self):
+        pass # already loaded
+
+    def processFrame(self, eventType, data, offsets):
+        FrameParser.processFrame(self, eventType, data, offsets)
+        self.keeping = str(self.frameID) in self.frames
+        if not self.keeping:
+            self.frameBegins[data['EID']] = (eventType, data, offsets)
+            self.addEvent(data, self.frameID)
+        return True # every call is needed
+
+    def processEvent(self, eventType, data, offsets):
+        eid = data.get('EID', 0)
+        if not self.keeping:
+            self.addEvent(data, self.frameID - 1)
+        field = self.callField(eventType)
+        if field in offsets:
+            offset = offsets[field]
+            size, functionId = struct.unpack_from('<II', self.stream.data, offset)
+            self.processArguments(eid, functionId, offset + 8, offset + 4 + size)
+
+    def parseEventAsync(self):
+        eid, elementId = self.parseStruct('<II')
+        element = self.elements.get(elementId)
+        if element is not None and element.typeId == 7:
+            size, functionId = self.parseStruct('<II')
+            self.processArguments(eid, functionId, self.stream.pos, self.stream.pos + size - 4)
+
+    def callField(self, eventType):
+        if eventType.name not in self.callFields:
+            field = None
+            for elementId, fieldFormat in eventType.fields:
+                element = self.elements[elementId]
+                if element.typeId == 7 and fieldFormat.startswith('('):
+                    field = element.name
+            self.callFields[eventType.name] = field
+        return self.callFields[eventType.name]
+
+    def addEvent(self, data, frame):
+        eid = data.get('EID', 0)
+        self.skipped[eid] = len(self.eventEIDs)
+        self.eventEIDs.append(eid)
+        self.eventParents.append(data.get('Parent EID', 0xFFFFFFFF))
+        self.eventFrames.append(frame)
+        self.eventStarts.append(self.lastChunkOffset)
+        self.eventEnds.append(min(self.nextChunkOffset, self.stream_length))
+        self.eventCalls.append(0)
+
+    def processArguments(self, eid, functionId, start, end):
+        # resolve the argument dwords ([1, return value, this, args...]) to live objects
+        row = self.skipped.get(eid)
+        if row is not None:
+            self.eventCalls[row] = 1
+        content = row is not None and functionId in self.contentIds
+        context = start + 8 if functionId in self.contextIds else -1
+        data = self.stream.data
+        end = min(end, start + 4 * MaxArgs, self.stream_length)
+        for pos in xrange(start + 4, end, 4):
+            obj = self.objects.findObject(DWord.unpack_from(data, pos)[0], eid)
+            if obj < 0:
+                continue
+            if row is None:
+                if self.uses.get(obj, 0) < eid:
+                    self.uses[obj] = eid
+                continue
+            self.touchEIDs.append(eid)
+            self.touchObjects.append(obj)
+            if content and pos != context:
+                self.contentEIDs.append(eid)
+                self.contentObjects.append(obj)
+
+    def resolve(self):
+        # close the objects used by kept frames over the skipped events creating or filling them
+        touches = {}
+        for eid, obj in zip(self.touchEIDs, self.touchObjects):
+            touches.setdefault(eid, []).append(obj)
+        contents = {}
+        for eid, obj in zip(self.contentEIDs, self.contentObjects):
+            contents.setdefault(obj, []).append(eid)
+        children = {}
+        for eid, parent in zip(self.eventEIDs, self.eventParents):
+            if parent in self.skipped:
+                children.setdefault(parent, []).append(eid)
+
+        required = {} # EID -> whether its children are required too
+        needed = {} # object -> last EID it is needed at
+        objects = self.uses.items()
+        events = []
+        while objects or events:
+            if events:
+                eid, subtree = events.pop()
+                if required.get(eid, False) or (eid in required and not subtree):
+                    continue
+                required[eid] = subtree
+                # keep the hierarchy, and whole calls with the objects they create
+                parent = self.eventParents[self.skipped[eid]]
+                if parent in self.skipped:
+                    events.append((parent, self.eventCalls[self.skipped[parent]] == 1))
+                if subtree:
+                    events.extend((child, True) for child in children.get(eid, []))
+                    objects.extend((obj, eid) for obj in touches.get(eid, []))
+            else:
+                obj, last = objects.pop()
+                if needed.get(obj, 0) >= last:
+                    continue
+                needed[obj] = last
+                create = self.objects.records[obj * RecordSize + CreateEID]
+                if create in self.skipped:
+                    events.append((create, True))
+                events.extend((eid, True) for eid in contents.get(obj, []) if eid < last)
+
+        # copy the required events, within their (partial) frames
+        counts = {}
+        for eid in required:
+            row = self.skipped[eid]
+            self.addSpan(int(self.eventStarts[row]), int(self.eventEnds[row]))
+            counts[self.eventFrames[row]] = counts.get(self.eventFrames[row], 0) + 1
+            if eid in self.frameBegins:
+                self.kept.append(self.frameBegins[eid])
+        for eid, start, end in zip(self.asyncEIDs, self.asyncStarts, self.asyncEnds):
+            if eid in required:
+                self.addSpan(int(start), int(end))
+        for frame in sorted(counts):
+            print "Copying %i setup events of frame %i" % (counts[frame], frame)
+        self.kept.sort(key=lambda frame: frame[1]['ThisEventPos'])
+        self.mergeSpans()
+
+    def mergeSpans(self):
+        spans = sorted(self.spans)
+        self.spans = []
+        for start, end in spans:
+            if self.spans and start <= self.spans[-1][1]:
+                self.spans[-1] = (self.spans[-1][0], max(end, self.spans[-1][1]))
+            else:
+                self.spans.append((start, end))
+
 def main():
-    if len(sys.argv) < 4:
+    argv = [arg for arg in sys.argv if arg != '--deps']
+    deps = len(argv) != len(sys.argv)
+    if len(argv) < 4:
         sys.stdout.flush()
-        sys.stderr.write('Usage: copy_frames.py pix_in pix_out frame_ranges...\n')
+        sys.stderr.write('Usage: copy_frames.py [--deps] pix_in pix_out frame_ranges...\n')
+        sys.stderr.write('\n\t--deps\tkeep the setup events of skipped frames that kept frames depend on')
         sys.stderr.write('\n\tpix_in\tinput pix file')
         sys.stderr.write('\n\tpix_out\toutput pix file')
         sys.stderr.write('\n\tranges...\tranges of the form x y,z a:b a:b:c\n\n')
         exit(1)
     else:
         
-        stream = open(sys.argv[1], 'rb')
-        output = open(sys.argv[2], 'wb')
+        stream = open(argv[1], 'rb')
+        output = open(argv[2], 'wb')
 
         # parse frame list
-        ranges = ','.join(sys.argv[2:]).replace(' ', ',').split(',')
+        ranges = ','.join(argv[3:]).replace(' ', ',').split(',')
         frames = {}
         for r in ranges:
             if ':' in r:
@@ -166,7 +408,11 @@ def main():
             else:
                 frames[r] = True
         
-        parser = FrameParser(stream, output, frames)
+        if deps:
+            parser = DependencyParser(stream, output, frames)
+        else:
+            parser = FrameParser(stream, output, frames)
+            parser.index = openIndex(argv[1])
         parser.parse()
 
 if __name__ == '__main__':
@@ -11,6 +11,8 @@
 """Entry point for PIXrun frame counter"""
 
 import sys
+import time
+from pixindex import loadIndex
 from pixparser import Parser
 
 class FrameParser(Parser):
@@ -22,12 +24,41 @@ class FrameParser(Parser):
         self.count += 1
         return False
 
+class FrameFollower(FrameParser):
+    def __init__(self, stream):
+        FrameParser.__init__(self, stream)
+        self.lastCount = 0
+        self.lastTime = time.time()
+
+    def processIdle(self):
+        # report the frames written since the last report
+        if self.count != self.lastCount:
+            now = time.time()
+            print '#frames = %i (%.1f frames/s)' % (self.count, (self.count - self.lastCount) / max(now - self.lastTime, 1e-6))
+            sys.stdout.flush()
+            self.lastCount = self.count
+            self.lastTime = now
+
 def main():
-    if len(sys.argv) < 2:
+    argv = [arg for arg in sys.argv if arg != '--follow']
+    if len(argv) < 2:
         sys.stdout.flush()
         sys.stderr.write('Requires a pixfile as argument!\n')
         exit(1)
+    elif len(argv) != len(sys.argv):
+        # watch a capture being written
+        parser = FrameFollower(open(argv[1], 'rb'))
+        try:
+            parser.follow()
+        except KeyboardInterrupt:
+            pass
+        print '#frames = %i\n' % parser.count
     else:
+        # an up-to-date index already knows the answer
+        index = loadIndex(sys.argv[1])
+        if index is not None:
+            print '#frames = %i\n' % index.frameCount()
+            return
         pixfile = open(sys.argv[1], 'rb')
         parser = FrameParser(pixfile)
         parser.parse()
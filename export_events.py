@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+##########################################################################
+#
+# Released under the MIT License
+#
+##########################################################################
+
+
+"""Entry point for PIXrun columnar event export"""
+
+import sys
+import numpy
+from pixargs import argumentView
+from pixparser import Parser, DWord
+
+NoParent = 0xFFFFFFFF
+MaxArgs = 16 # payload dwords kept per call, [1, return value, arguments...]
+
+class Column:
+
+    def __init__(self, dtype, width=None, capacity=1 << 16):
+        self.shape = () if width is None else (width,)
+        self.values = numpy.empty((capacity,) + self.shape, dtype)
+
+    def grow(self, used):
+        # double the capacity, keeping the used rows
+        values = numpy.empty((2 * len(self.values),) + self.shape, self.values.dtype)
+        values[:used] = self.values[:used]
+        self.values = values
+
+class EventExporter(Parser):
+
+    columns = [('eid', numpy.uint32), ('parent', numpy.uint32), ('function', numpy.uint32),
+               ('frame', numpy.uint32), ('time', numpy.uint64), ('offset', numpy.uint64),
+               ('argc', numpy.uint8), ('args', numpy.uint32, MaxArgs)]
+
+    def __init__(self, stream):
+        Parser.__init__(self, stream, 0)
+        self.table = dict((column[0], Column(*column[1:])) for column in self.columns)
+        self.size = 0
+        self.pending = {} # EID -> row waiting for its async call package
+        self.callFields = {} # event type name -> (sync call package field, async one)
+
+    def callField(self, eventType):
+        fields = self.callFields.get(eventType.name)
+        if fields is None:
+            syncField = asyncField = None
+            for elementId, fieldFormat in eventType.fields:
+                element = self.elements[elementId]
+                if element.typeId == 7:
+                    if fieldFormat.startswith('('):
+                        syncField = element.name
+                    else:
+                        asyncField = element.name
+            fields = self.callFields[eventType.name] = (syncField, asyncField)
+        return fields
+
+    def append(self, eventType, data, offsets):
+        row = self.size
+        self.size += 1
+        if row == len(self.table['eid'].values):
+            for column in self.table.values():
+                column.grow(row)
+        eid = data.get('EID', 0)
+        function = 0
+        table = self.table
+        table['argc'].values[row] = 0
+        table['args'].values[row] = 0
+        syncField, asyncField = self.callField(eventType)
+        if syncField in offsets:
+            function = DWord.unpack_from(self.stream.data, offsets[syncField] + 4)[0]
+            self.setArguments(row, offsets[syncField])
+        elif asyncField is not None:
+            self.pending[eid] = row
+        table['eid'].values[row] = eid
+        table['parent'].values[row] = data.get('Parent EID', NoParent)
+        table['function'].values[row] = function
+        table['frame'].values[row] = self.frameID - 1
+        table['time'].values[row] = data.get('StartTime', 0)
+        table['offset'].values[row] = self.lastChunkOffset
+
+    def processEvent(self, eventType, data, offsets):
+        self.append(eventType, data, offsets)
+
+    def processFrame(self, eventType, data, offsets):
+        self.frameID += 1 # the Frame Begin event is part of its frame
+        self.append(eventType, data, offsets)
+        self.frameID -= 1
+        return True
+
+    def parseEventAsync(self):
+        # only call packages matter here: eventId, elementId, size, functionId
+        stream = self.stream
+        eid = DWord.unpack_from(stream.data, stream.pos)[0]
+        element = self.elements.get(DWord.unpack_from(stream.data, stream.pos + 4)[0])
+        if element is not None and element.typeId == 7:
+            row = self.pending.pop(eid, None)
+            if row is not None:
+                function = DWord.unpack_from(stream.data, stream.pos + 12)[0]
+                self.table['function'].values[row] = function
+                self.setArguments(row, stream.pos + 8)
+
+    def setArguments(self, row, offset):
+        # first payload dwords of the call package at offset, copied from a view of the trace
+        args = argumentView(self.stream.data, offset)[:MaxArgs]
+        self.table['argc'].values[row] = len(args)
+        self.table['args'].values[row, :len(args)] = args
+
+    def arrays(self):
+        return dict((name, column.values[:self.size]) for name, column in self.table.items())
+
+    def save(self, path):
+        arrays = self.arrays()
+        if path.endswith('.npz'):
+            numpy.savez(path, **arrays)
+        else:
+            # one .npy file per column
+            for name, values in arrays.items():
+                numpy.save('%s.%s.npy' % (path, name), values)
+
+def main():
+    if len(sys.argv) < 3:
+        sys.stdout.flush()
+        sys.stderr.write('Usage: export_events.py pix_in out[.npz]\n')
+        exit(1)
+    else:
+        stream = open(sys.argv[1], 'rb')
+        parser = EventExporter(stream)
+        parser.parse()
+        parser.save(sys.argv[2])
+        print '#events = %i' % parser.size
+
+if __name__ == '__main__':
+    main()
@@ -11,32 +11,40 @@
 """Entry point for PIXrun frame grep program"""
 
 import os
-import re
 import struct
 import sys
+from pixfunc import functionName
 from pixparser import Parser, Verbosity
+from pixpool import mapFrames
+from pixquery import Query
 
 LongSize = 2 * struct.calcsize('I')
 
 class FrameMatcher(Parser):
     def __init__(self, stream, pattern, verbosity):
+        # pattern is the query text, or a Query compiled by workerArgs
         Parser.__init__(self, stream, 0)
         self.verb = int(verbosity)
-        self.pattern = pattern
-        self.regex = re.compile(pattern)
+        self.query = pattern if isinstance(pattern, Query) else Query(pattern)
+        self.pattern = self.query.text
         self.frames = {}
         self.strbuffer = ''
         self.lastFrame = -1
 
+    @staticmethod
+    def workerArgs(pattern, verbosity):
+        # pool workers resolve the pattern against the function table once
+        return Query(pattern), verbosity
+
     def flush(self):
-        if self.lastFrame is -1:
+        if self.lastFrame == -1:
             return
         print "Frame #%i (%i)%s" % (self.lastFrame, self.frames[self.lastFrame], self.strbuffer)
         self.strbuffer = ''
 
-    def matched(self, functionName):
+    def matched(self, functionId):
         frame = self.frameID - 1
-        if self.lastFrame is not frame:
+        if self.lastFrame != frame:
             self.flush()
             self.lastFrame = frame
 
@@ -46,32 +54,72 @@ class FrameMatcher(Parser):
             self.frames[frame] += 1
 
         if self.verb > Verbosity.silent:
-            self.strbuffer = "%s\n\t%s @ %i" % (self.strbuffer, functionName, self.chunkID - 1)
+            name = functionName.get(functionId, '')
+            self.strbuffer = "%s\n\t%s @ %i" % (self.strbuffer, name, self.chunkID - 1)
 
-    def processCall(self, functionName):
+    def processCallId(self, functionId):
         if self.verb > Verbosity.basic:
-            print "%s -> %s" % (self.pattern, functionName)
-        m = re.search(self.pattern, functionName)
-        if m is not None:
-            self.matched(functionName)
+            print "%s -> %s" % (self.pattern, functionName.get(functionId, ''))
+        if self.query.matches(functionId, self.stream.data, self.callOffset):
+            self.matched(functionId)
 
     def processFrame(self, eventType, data, offsets):
+        if self.following:
+            # report the previous frame as soon as it is complete
+            self.flush()
+            self.lastFrame = -1
         return True
 
+    def processIdle(self):
+        sys.stdout.flush()
+
+    def collect(self):
+        # matches of the frame parsed by a pool worker
+        return self.frames.get(self.lastFrame, 0), self.strbuffer
+
+    def merge(self, frame, result):
+        count, strbuffer = result
+        if count:
+            self.flush()
+            self.lastFrame = frame
+            self.frames[frame] = count
+            self.strbuffer = strbuffer
+
 
 def main():
-    if len(sys.argv) < 3:
+    argv = [arg for arg in sys.argv if arg != '--follow']
+    follow = len(argv) != len(sys.argv)
+    if len(argv) < 3:
         sys.stdout.flush()
-        sys.stderr.write('Usage: grep_frames.py pix_in pattern\n')
+        sys.stderr.write('Usage: grep_frames.py [--follow] pix_in pattern [verbosity [jobs]]\n')
+        sys.stderr.write('\n\tpattern\tfunction regex [where condition]\n\n')
         exit(1)
     else:
-        stream = open(sys.argv[1], 'rb')
-        pattern = sys.argv[2]
+        stream = open(argv[1], 'rb')
+        pattern = argv[2]
         verbosity = Verbosity.silent
-        if len(sys.argv) >= 4:
-            verbosity = sys.argv[3]
-        parser = FrameMatcher(stream, pattern, verbosity)
-        parser.parse()
+        if len(argv) >= 4:
+            verbosity = argv[3]
+        jobs = 1
+        if len(argv) >= 5:
+            jobs = int(argv[4])
+        try:
+            parser = FrameMatcher(stream, pattern, verbosity)
+        except ValueError, e:
+            sys.stderr.write('Invalid pattern: %s\n' % e)
+            exit(1)
+        if follow:
+            # report the matches of the frames as they are written
+            try:
+                parser.follow()
+            except KeyboardInterrupt:
+                pass
+        elif jobs > 1:
+            # frames are scanned by a process pool, results come back in order
+            for frame, result in mapFrames(argv[1], FrameMatcher, (pattern, verbosity), jobs):
+                parser.merge(frame, result)
+        else:
+            parser.parse()
         parser.flush()
 
 if __name__ == '__main__':
@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+##########################################################################
+#
+# Released under the MIT License
+#
+##########################################################################
+
+"""PIX Functions Arguments"""
+
+import struct
+from pixfunc import functionName
+
+# call package payload: [1, return value, arguments...], "this" being the first argument of methods
+ArgumentsStart = 2
+
+# one "name argument[:constants] ..." line per function
+signatureTable = """\
+CreateObject Type Address Unknown
+DestroyObject Type Address Unknown
+Direct3DCreate9 SDKVersion
+D3DPERF_BeginEvent Color Name
+D3DPERF_SetMarker Color Name
+IDirect3D9::CreateDevice this Adapter DeviceType hFocusWindow BehaviorFlags pPresentationParameters ppReturnedDeviceInterface
+IDirect3DDevice9::Clear this Count pRects Flags Color Z:float Stencil
+IDirect3DDevice9::BeginScene this
+IDirect3DDevice9::EndScene this
+IDirect3DDevice9::Present this pSourceRect pDestRect hDestWindowOverride pDirtyRegion
+IDirect3DDevice9::CreateTexture this Width Height Levels Usage Format:D3DFORMAT Pool:D3DPOOL ppTexture pSharedHandle
+IDirect3DDevice9::CreateVolumeTexture this Width Height Depth Levels Usage Format:D3DFORMAT Pool:D3DPOOL ppVolumeTexture pSharedHandle
+IDirect3DDevice9::CreateCubeTexture this EdgeLength Levels Usage Format:D3DFORMAT Pool:D3DPOOL ppCubeTexture pSharedHandle
+IDirect3DDevice9::CreateVertexBuffer this Length Usage FVF Pool:D3DPOOL ppVertexBuffer pSharedHandle
+IDirect3DDevice9::CreateIndexBuffer this Length Usage Format:D3DFORMAT Pool:D3DPOOL ppIndexBuffer pSharedHandle
+IDirect3DDevice9::CreateRenderTarget this Width Height Format:D3DFORMAT MultiSample MultisampleQuality Lockable ppSurface pSharedHandle
+IDirect3DDevice9::CreateDepthStencilSurface this Width Height Format:D3DFORMAT MultiSample MultisampleQuality Discard ppSurface pSharedHandle
+IDirect3DDevice9::SetRenderTarget this RenderTargetIndex pRenderTarget
+IDirect3DDevice9::SetDepthStencilSurface this pNewZStencil
+IDirect3DDevice9::SetViewport this pViewport
+IDirect3DDevice9::SetTransform this State:D3DTRANSFORMSTATETYPE pMatrix
+IDirect3DDevice9::SetRenderState this State:D3DRENDERSTATETYPE Value
+IDirect3DDevice9::SetTexture this Stage pTexture
+IDirect3DDevice9::SetTextureStageState this Stage Type:D3DTEXTURESTAGESTATETYPE Value
+IDirect3DDevice9::SetSamplerState this Sampler Type:D3DSAMPLERSTATETYPE Value
+IDirect3DDevice9::SetScissorRect this pRect
+IDirect3DDevice9::DrawPrimitive this PrimitiveType:D3DPRIMITIVETYPE StartVertex PrimitiveCount
+IDirect3DDevice9::DrawIndexedPrimitive this PrimitiveType:D3DPRIMITIVETYPE BaseVertexIndex MinVertexIndex NumVertices startIndex primCount
+IDirect3DDevice9::DrawPrimitiveUP this PrimitiveType:D3DPRIMITIVETYPE PrimitiveCount pVertexStreamZeroData VertexStreamZeroStride
+IDirect3DDevice9::DrawIndexedPrimitiveUP this PrimitiveType:D3DPRIMITIVETYPE MinVertexIndex NumVertices PrimitiveCount pIndexData IndexDataFormat:D3DFORMAT pVertexStreamZeroData VertexStreamZeroStride
+IDirect3DDevice9::SetVertexDeclaration this pDecl
+IDirect3DDevice9::SetFVF this FVF
+IDirect3DDevice9::SetVertexShader this pShader
+IDirect3DDevice9::SetVertexShaderConstantF this StartRegister pConstantData Vector4fCount
+IDirect3DDevice9::SetStreamSource this StreamNumber pStreamData OffsetInBytes Stride
+IDirect3DDevice9::SetStreamSourceFreq this StreamNumber Setting
+IDirect3DDevice9::SetIndices this pIndexData
+IDirect3DDevice9::SetPixelShader this pShader
+IDirect3DDevice9::SetPixelShaderConstantF this StartRegister pConstantData Vector4fCount
+IDirect3DTexture9::LockRect this Level pLockedRect pRect Flags
+IDirect3DTexture9::UnlockRect this Level
+IDirect3DVertexBuffer9::Lock this OffsetToLock SizeToLock ppbData Flags
+IDirect3DVertexBuffer9::Unlock this
+IDirect3DIndexBuffer9::Lock this OffsetToLock SizeToLock ppbData Flags
+IDirect3DIndexBuffer9::Unlock this
+"""
+
+# value -> name, per constant type
+constantTables = {
+    'D3DRENDERSTATETYPE': {
+        7: 'D3DRS_ZENABLE', 8: 'D3DRS_FILLMODE', 9: 'D3DRS_SHADEMODE', 14: 'D3DRS_ZWRITEENABLE',
+        15: 'D3DRS_ALPHATESTENABLE', 16: 'D3DRS_LASTPIXEL', 19: 'D3DRS_SRCBLEND', 20: 'D3DRS_DESTBLEND',
+        22: 'D3DRS_CULLMODE', 23: 'D3DRS_ZFUNC', 24: 'D3DRS_ALPHAREF', 25: 'D3DRS_ALPHAFUNC',
+        26: 'D3DRS_DITHERENABLE', 27: 'D3DRS_ALPHABLENDENABLE', 28: 'D3DRS_FOGENABLE', 29: 'D3DRS_SPECULARENABLE',
+        34: 'D3DRS_FOGCOLOR', 35: 'D3DRS_FOGTABLEMODE', 36: 'D3DRS_FOGSTART', 37: 'D3DRS_FOGEND',
+        38: 'D3DRS_FOGDENSITY', 48: 'D3DRS_RANGEFOGENABLE', 52: 'D3DRS_STENCILENABLE', 53: 'D3DRS_STENCILFAIL',
+        54: 'D3DRS_STENCILZFAIL', 55: 'D3DRS_STENCILPASS', 56: 'D3DRS_STENCILFUNC', 57: 'D3DRS_STENCILREF',
+        58: 'D3DRS_STENCILMASK', 59: 'D3DRS_STENCILWRITEMASK', 60: 'D3DRS_TEXTUREFACTOR',
+        128: 'D3DRS_WRAP0', 129: 'D3DRS_WRAP1', 130: 'D3DRS_WRAP2', 131: 'D3DRS_WRAP3',
+        132: 'D3DRS_WRAP4', 133: 'D3DRS_WRAP5', 134: 'D3DRS_WRAP6', 135: 'D3DRS_WRAP7',
+        136: 'D3DRS_CLIPPING', 137: 'D3DRS_LIGHTING', 139: 'D3DRS_AMBIENT', 140: 'D3DRS_FOGVERTEXMODE',
+        141: 'D3DRS_COLORVERTEX', 142: 'D3DRS_LOCALVIEWER', 143: 'D3DRS_NORMALIZENORMALS',
+        145: 'D3DRS_DIFFUSEMATERIALSOURCE', 146: 'D3DRS_SPECULARMATERIALSOURCE',
+        147: 'D3DRS_AMBIENTMATERIALSOURCE', 148: 'D3DRS_EMISSIVEMATERIALSOURCE', 151: 'D3DRS_VERTEXBLEND',
+        152: 'D3DRS_CLIPPLANEENABLE', 154: 'D3DRS_POINTSIZE', 155: 'D3DRS_POINTSIZE_MIN',
+        156: 'D3DRS_POINTSPRITEENABLE', 157: 'D3DRS_POINTSCALEENABLE', 158: 'D3DRS_POINTSCALE_A',
+        159: 'D3DRS_POINTSCALE_B', 160: 'D3DRS_POINTSCALE_C', 161: 'D3DRS_MULTISAMPLEANTIALIAS',
+        162: 'D3DRS_MULTISAMPLEMASK', 163: 'D3DRS_PATCHEDGESTYLE', 165: 'D3DRS_DEBUGMONITORTOKEN',
+        166: 'D3DRS_POINTSIZE_MAX', 167: 'D3DRS_INDEXEDVERTEXBLENDENABLE', 168: 'D3DRS_COLORWRITEENABLE',
+        170: 'D3DRS_TWEENFACTOR', 171: 'D3DRS_BLENDOP', 172: 'D3DRS_POSITIONDEGREE', 173: 'D3DRS_NORMALDEGREE',
+        174: 'D3DRS_SCISSORTESTENABLE', 175: 'D3DRS_SLOPESCALEDEPTHBIAS', 176: 'D3DRS_ANTIALIASEDLINEENABLE',
+        178: 'D3DRS_MINTESSELLATIONLEVEL', 179: 'D3DRS_MAXTESSELLATIONLEVEL', 180: 'D3DRS_ADAPTIVETESS_X',
+        181: 'D3DRS_ADAPTIVETESS_Y', 182: 'D3DRS_ADAPTIVETESS_Z', 183: 'D3DRS_ADAPTIVETESS_W',
+        184: 'D3DRS_ENABLEADAPTIVETESSELLATION', 185: 'D3DRS_TWOSIDEDSTENCILMODE', 186: 'D3DRS_CCW_STENCILFAIL',
+        187: 'D3DRS_CCW_STENCILZFAIL', 188: 'D3DRS_CCW_STENCILPASS', 189: 'D3DRS_CCW_STENCILFUNC',
+        190: 'D3DRS_COLORWRITEENABLE1', 191: 'D3DRS_COLORWRITEENABLE2', 192: 'D3DRS_COLORWRITEENABLE3',
+        193: 'D3DRS_BLENDFACTOR', 194: 'D3DRS_SRGBWRITEENABLE', 195: 'D3DRS_DEPTHBIAS',
+        198: 'D3DRS_WRAP8', 199: 'D3DRS_WRAP9', 200: 'D3DRS_WRAP10', 201: 'D3DRS_WRAP11',
+        202: 'D3DRS_WRAP12', 203: 'D3DRS_WRAP13', 204: 'D3DRS_WRAP14', 205: 'D3DRS_WRAP15',
+        206: 'D3DRS_SEPARATEALPHABLENDENABLE', 207: 'D3DRS_SRCBLENDALPHA', 208: 'D3DRS_DESTBLENDALPHA',
+        209: 'D3DRS_BLENDOPALPHA',
+    },
+    'D3DSAMPLERSTATETYPE': {
+        1: 'D3DSAMP_ADDRESSU', 2: 'D3DSAMP_ADDRESSV', 3: 'D3DSAMP_ADDRESSW', 4: 'D3DSAMP_BORDERCOLOR',
+        5: 'D3DSAMP_MAGFILTER', 6: 'D3DSAMP_MINFILTER', 7: 'D3DSAMP_MIPFILTER', 8: 'D3DSAMP_MIPMAPLODBIAS',
+        9: 'D3DSAMP_MAXMIPLEVEL', 10: 'D3DSAMP_MAXANISOTROPY', 11: 'D3DSAMP_SRGBTEXTURE',
+        12: 'D3DSAMP_ELEMENTINDEX', 13: 'D3DSAMP_DMAPOFFSET',
+    },
+    'D3DTEXTURESTAGESTATETYPE': {
+        1: 'D3DTSS_COLOROP', 2: 'D3DTSS_COLORARG1', 3: 'D3DTSS_COLORARG2', 4: 'D3DTSS_ALPHAOP',
+        5: 'D3DTSS_ALPHAARG1', 6: 'D3DTSS_ALPHAARG2', 7: 'D3DTSS_BUMPENVMAT00', 8: 'D3DTSS_BUMPENVMAT01',
+        9: 'D3DTSS_BUMPENVMAT10', 10: 'D3DTSS_BUMPENVMAT11', 11: 'D3DTSS_TEXCOORDINDEX',
+        22: 'D3DTSS_BUMPENVLSCALE', 23: 'D3DTSS_BUMPENVLOFFSET', 24: 'D3DTSS_TEXTURETRANSFORMFLAGS',
+        26: 'D3DTSS_COLORARG0', 27: 'D3DTSS_ALPHAARG0', 28: 'D3DTSS_RESULTARG', 32: 'D3DTSS_CONSTANT',
+    },
+    'D3DTRANSFORMSTATETYPE': {
+        2: 'D3DTS_VIEW', 3: 'D3DTS_PROJECTION', 16: 'D3DTS_TEXTURE0', 17: 'D3DTS_TEXTURE1',
+        18: 'D3DTS_TEXTURE2', 19: 'D3DTS_TEXTURE3', 20: 'D3DTS_TEXTURE4', 21: 'D3DTS_TEXTURE5',
+        22: 'D3DTS_TEXTURE6', 23: 'D3DTS_TEXTURE7', 256: 'D3DTS_WORLD',
+    },
+    'D3DPRIMITIVETYPE': {
+        1: 'D3DPT_POINTLIST', 2: 'D3DPT_LINELIST', 3: 'D3DPT_LINESTRIP', 4: 'D3DPT_TRIANGLELIST',
+        5: 'D3DPT_TRIANGLESTRIP', 6: 'D3DPT_TRIANGLEFAN',
+    },
+    'D3DPOOL': {
+        0: 'D3DPOOL_DEFAULT', 1: 'D3DPOOL_MANAGED', 2: 'D3DPOOL_SYSTEMMEM', 3: 'D3DPOOL_SCRATCH',
+    },
+    'D3DFORMAT': {
+        20: 'D3DFMT_R8G8B8', 21: 'D3DFMT_A8R8G8B8', 22: 'D3DFMT_X8R8G8B8', 23: 'D3DFMT_R5G6B5',
+        24: 'D3DFMT_X1R5G5B5', 25: 'D3DFMT_A1R5G5B5', 26: 'D3DFMT_A4R4G4B4', 28: 'D3DFMT_A8',
+        32: 'D3DFMT_A8B8G8R8', 33: 'D3DFMT_X8B8G8R8', 34: 'D3DFMT_G16R16', 35: 'D3DFMT_A2R10G10B10',
+        36: 'D3DFMT_A16B16G16R16', 50: 'D3DFMT_L8', 51: 'D3DFMT_A8L8', 71: 'D3DFMT_D32', 75: 'D3DFMT_D24S8',
+        77: 'D3DFMT_D24X8', 80: 'D3DFMT_D16', 100: 'D3DFMT_VERTEXDATA', 101: 'D3DFMT_INDEX16',
+        102: 'D3DFMT_INDEX32', 111: 'D3DFMT_R16F', 112: 'D3DFMT_G16R16F', 113: 'D3DFMT_A16B16G16R16F',
+        114: 'D3DFMT_R32F', 115: 'D3DFMT_G32R32F', 116: 'D3DFMT_A32B32G32R32F',
+        0x31545844: 'D3DFMT_DXT1', 0x32545844: 'D3DFMT_DXT2', 0x33545844: 'D3DFMT_DXT3',
+        0x34545844: 'D3DFMT_DXT4', 0x35545844: 'D3DFMT_DXT5',
+    },
+}
+
+# name -> value, over all the constant types
+constants = dict((name, value) for table in constantTables.values() for value, name in table.items())
+
+Float = struct.Struct('<f')
+
+class Signature:
+
+    def __init__(self, name, arguments):
+        self.name = name
+        self.arguments = [] # (name, constant type or None)
+        for argument in arguments:
+            if ':' in argument:
+                argument, kind = argument.split(':', 1)
+                self.arguments.append((argument, kind))
+            else:
+                self.arguments.append((argument, None))
+
+    def index(self, argument):
+        # position of an argument in the call package payload
+        for i, (name, kind) in enumerate(self.arguments):
+            if name == argument:
+                return ArgumentsStart + i
+        raise KeyError(argument)
+
+    def value(self, i, dword):
+        kind = self.arguments[i][1]
+        if kind == 'float':
+            return Float.unpack(struct.pack('<I', dword))[0]
+        table = constantTables.get(kind)
+        if table is not None:
+            return table.get(dword, dword)
+        return dword
+
+    def format(self, payload):
+        values = payload[ArgumentsStart:]
+        args = []
+        for i, (name, kind) in enumerate(self.arguments[:len(values)]):
+            value = self.value(i, values[i])
+            if isinstance(value, basestring):
+                args.append('%s=%s' % (name, value))
+            elif isinstance(value, float):
+                args.append('%s=%g' % (name, value))
+            else:
+                args.append('%s=%#x' % (name, value))
+        return '%s(%s)' % (self.name, ', '.join(args))
+
+class SignatureTable:
+    """Argument signatures by function id, parsed on first use"""
+
+    def __init__(self, table):
+        self.table = table
+        self.signatures = None
+
+    def load(self):
+        self.signatures = {}
+        for line in self.table.splitlines():
+            parts = line.split()
+            functionId = functionName.getId(parts[0])
+            if functionId is not None:
+                self.signatures[functionId] = Signature(parts[0], parts[1:])
+
+    def get(self, functionId, default=None):
+        if self.signatures is None:
+            self.load()
+        return self.signatures.get(functionId, default)
+
+    def __getitem__(self, functionId):
+        signature = self.get(functionId)
+        if signature is None:
+            raise KeyError(functionId)
+        return signature
+
+    def __contains__(self, functionId):
+        return self.get(functionId) is not None
+
+    def index(self, functionId, argument):
+        return self[functionId].index(argument)
+
+functionArguments = SignatureTable(signatureTable)
+
+def formatCall(functionId, payload):
+    # "Name(arg=value, ...)" for a call package payload
+    signature = functionArguments.get(functionId)
+    if signature is None:
+        return '%s(%s)' % (functionName.get(functionId, ''), ', '.join('%#x' % v for v in payload[ArgumentsStart:]))
+    return signature.format(payload)
+
+def argumentView(data, offset):
+    # NumPy uint32 view of the payload of the call package at offset, without copying
+    import numpy
+    size = struct.unpack_from('<I', data, offset)[0]
+    count = max(0, min(size - 4, len(data) - offset - 8) // 4)
+    return numpy.frombuffer(data, '<u4', count, offset + 8)
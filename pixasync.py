@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+##########################################################################
+#
+# Released under the MIT License
+#
+##########################################################################
+
+
+"""EID-keyed table of the asynchronous event values"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+class AsyncTable:
+    """Values of the Event Async chunks, in arrays sorted by EID on first lookup"""
+
+    def __init__(self):
+        self.eids = array('I')
+        self.elements = array('I')
+        self.values = array('d') # numbers (exact up to 2**53), function id of call packages
+        self.offsets = array('d') # file offset of each value
+        self.sorted = 0 # rows already in EID order
+
+    def __len__(self):
+        return len(self.eids)
+
+    def add(self, eid, elementId, value, offset):
+        self.eids.append(eid)
+        self.elements.append(elementId)
+        self.values.append(value)
+        self.offsets.append(offset)
+
+    def sort(self):
+        # async chunks mostly arrive in EID order, so this is usually a no-op
+        n = len(self.eids)
+        eids = self.eids
+        if all(eids[i - 1] <= eids[i] for i in xrange(max(self.sorted, 1), n)):
+            self.sorted = n
+            return
+        order = sorted(xrange(n), key=eids.__getitem__)
+        for name in ('eids', 'elements', 'values', 'offsets'):
+            column = getattr(self, name)
+            setattr(self, name, array(column.typecode, [column[i] for i in order]))
+        self.sorted = n
+
+    def rows(self, eid):
+        if self.sorted != len(self.eids):
+            self.sort()
+        return xrange(bisect_left(self.eids, eid), bisect_right(self.eids, eid))
+
+    def find(self, eid, elementId):
+        for row in self.rows(eid):
+            if self.elements[row] == elementId:
+                return row
+        return -1
+
+    def get(self, eid, elementId, default=None):
+        row = self.find(eid, elementId)
+        if row < 0:
+            return default
+        return self.values[row]
+
+    def items(self, eid):
+        # (elementId, value) pairs of an event
+        return [(self.elements[row], self.values[row]) for row in self.rows(eid)]
+
+    def join(self, eids, elementId, default=0):
+        # values of an element for a sequence of EIDs, in one merge when the EIDs are sorted
+        if self.sorted != len(self.eids):
+            self.sort()
+        values = array('d')
+        row = 0
+        last = -1
+        for eid in eids:
+            if eid < last:
+                row = 0
+            last = eid
+            row = bisect_left(self.eids, eid, row)
+            value = default
+            for r in xrange(row, len(self.eids)):
+                if self.eids[r] != eid:
+                    break
+                if self.elements[r] == elementId:
+                    value = self.values[r]
+                    break
+            values.append(value)
+        return values
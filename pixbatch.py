@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+##########################################################################
+#
+# Released under the MIT License
+#
+##########################################################################
+
+
+"""Batch frame counting and grepping over many PIXrun files"""
+
+import csv
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import time
+from pixindex import loadIndex
+from pixparser import Parser
+from pixquery import Query
+
+Columns = ['path', 'size', 'frames', 'matches', 'matched_frames', 'seconds', 'error']
+
+# per-process state, set up once by initWorker
+worker = {}
+
+def initWorker(pattern):
+    # the pattern is resolved against the function table once per process
+    worker['query'] = Query(pattern) if pattern is not None else None
+
+class TraceSummary(Parser):
+    def __init__(self, stream, query=None):
+        Parser.__init__(self, stream, 0)
+        self.query = query
+        self.frames = 0
+        self.matches = 0
+        self.matchedFrames = 0
+        self.lastFrame = -1
+
+    def processFrame(self, eventType, data, offsets):
+        self.frames += 1
+        return self.query is not None # only counting frames can skip them
+
+    def processCallId(self, functionId):
+        if self.query is not None and self.query.matches(functionId, self.stream.data, self.callOffset):
+            self.matches += 1
+            if self.lastFrame != self.frameID - 1:
+                self.lastFrame = self.frameID - 1
+                self.matchedFrames += 1
+
+def summarize(path):
+    result = dict((column, None) for column in Columns)
+    result['path'] = path
+    start = time.time()
+    try:
+        result['size'] = os.path.getsize(path)
+        query = worker['query']
+        index = loadIndex(path) if query is None else None
+        if index is not None:
+            result['frames'] = index.frameCount()
+        else:
+            with open(path, 'rb') as stream:
+                parser = TraceSummary(stream, query)
+                parser.parse()
+                parser.stream.close()
+            result['frames'] = parser.frames
+            if query is not None:
+                result['matches'] = parser.matches
+                result['matched_frames'] = parser.matchedFrames
+    except Exception, e:
+        result['error'] = '%s: %s' % (e.__class__.__name__, e)
+    result['seconds'] = round(time.time() - start, 6)
+    return result
+
+def expandPaths(args):
+    # globs, file names, and @lists of file names
+    paths = []
+    for arg in args:
+        if arg.startswith('@'):
+            with open(arg[1:]) as f:
+                paths.extend(line.strip() for line in f if line.strip())
+        elif glob.has_magic(arg):
+            paths.extend(sorted(glob.glob(arg)))
+        else:
+            paths.append(arg)
+    return paths
+
+def runBatch(paths, pattern=None, jobs=None):
+    # summaries in input order; the largest traces are scheduled first
+    jobs = jobs or multiprocessing.cpu_count()
+    sizes = []
+    for path in paths:
+        try:
+            sizes.append(os.path.getsize(path))
+        except EnvironmentError:
+            sizes.append(0)
+    order = sorted(range(len(paths)), key=lambda i: -sizes[i])
+    results = [None] * len(paths)
+    if jobs <= 1:
+        initWorker(pattern)
+        for i in order:
+            results[i] = summarize(paths[i])
+        return results
+    pool = multiprocessing.Pool(jobs, initWorker, (pattern,))
+    try:
+        tasks = [paths[i] for i in order]
+        for i, result in zip(order, pool.imap(summarize, tasks)):
+            results[i] = result
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+    return results
+
+def writeReport(results, output, fmt):
+    if fmt == 'json':
+        totals = {'traces': len(results), 'errors': sum(1 for r in results if r['error'])}
+        for column in ('size', 'frames', 'matches', 'matched_frames', 'seconds'):
+            totals[column] = sum(r[column] or 0 for r in results)
+        json.dump({'traces': results, 'totals': totals}, output, indent=1, sort_keys=True)
+        output.write('\n')
+    else:
+        writer = csv.writer(output)
+        writer.writerow(Columns)
+        for result in results:
+            writer.writerow(['' if result[column] is None else result[column] for column in Columns])
+
+def main(args):
+    options = {}
+    paths = []
+    for arg in args:
+        if arg.startswith('--') and '=' in arg:
+            name, value = arg[2:].split('=', 1)
+            options[name] = value
+        else:
+            paths.append(arg)
+    paths = expandPaths(paths)
+    if not paths:
+        sys.stdout.flush()
+        sys.stderr.write('Usage: pixrun.py batch [--jobs=n] [--grep=pattern] [--output=report.json|.csv] pix_in...\n')
+        sys.stderr.write('\n\tpix_in\tfile, glob or @file_list\n\n')
+        exit(1)
+    else:
+        jobs = int(options.get('jobs', 0))
+        if 'grep' in options:
+            try:
+                Query(options['grep'])
+            except ValueError, e:
+                sys.stderr.write('Invalid pattern: %s\n' % e)
+                exit(1)
+        results = runBatch(paths, options.get('grep'), jobs)
+        path = options.get('output')
+        fmt = 'json' if path is not None and path.endswith('.json') else 'csv'
+        fmt = options.get('format', fmt)
+        if path is None:
+            writeReport(results, sys.stdout, fmt)
+        else:
+            with open(path, 'wb') as output:
+                writeReport(results, output, fmt)
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
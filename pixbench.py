@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+##########################################################################
+#
+# Released under the MIT License
+#
+##########################################################################
+
+
+"""Parser throughput benchmark over synthetic PIXrun traces"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from copy_frames import FrameParser as FrameCopier
+from count_frames import FrameParser as FrameCounter
+from grep_frames import FrameMatcher
+from pixgen import TraceGenerator
+from pixparser import Parser
+
+DefaultSizes = ['100:100', '500:200', '1000:500']
+
+class FullParser(Parser):
+    def processFrame(self, eventType, data, offsets):
+        return True # decode every frame
+
+def runParse(path, tmpdir, frames):
+    FullParser(open(path, 'rb')).parse()
+
+def runCount(path, tmpdir, frames):
+    FrameCounter(open(path, 'rb')).parse()
+
+def runGrep(path, tmpdir, frames):
+    parser = FrameMatcher(open(path, 'rb'), 'Draw', 1)
+    parser.parse()
+    parser.flush()
+
+def runCopy(path, tmpdir, frames):
+    # keep every other frame
+    kept = dict((str(i), True) for i in range(1, frames + 1, 2))
+    output = open(os.path.join(tmpdir, 'copy.pixrun'), 'wb')
+    FrameCopier(open(path, 'rb'), output, kept).parse()
+    output.close()
+
+Benchmarks = [
+    ('parse', runParse),
+    ('count_frames', runCount),
+    ('grep_frames', runGrep),
+    ('copy_frames', runCopy),
+]
+
+def timed(run, *args):
+    # tools report on stdout, which would dominate the timings
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        start = time.time()
+        run(*args)
+        return time.time() - start
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+def main():
+    sizes = sys.argv[1:] or DefaultSizes
+    tmpdir = tempfile.mkdtemp(prefix='pixbench')
+    try:
+        print '%-14s %8s %6s %10s %9s %10s %12s' % ('benchmark', 'frames', 'calls', 'MB', 'seconds', 'MB/s', 'events/s')
+        for size in sizes:
+            frames, calls = [int(v) for v in size.split(':')]
+            path = os.path.join(tmpdir, 'trace-%i-%i.pixrun' % (frames, calls))
+            output = open(path, 'wb')
+            generator = TraceGenerator(output, frames, calls)
+            generator.generate()
+            output.close()
+            mb = os.path.getsize(path) / float(1 << 20)
+            for name, run in Benchmarks:
+                seconds = max(timed(run, path, tmpdir, frames), 1e-6)
+                print '%-14s %8i %6i %10.2f %9.3f %10.2f %12.0f' % (
+                    name, frames, calls, mb, seconds, mb / seconds, generator.events / seconds)
+                sys.stdout.flush()
+    finally:
+        shutil.rmtree(tmpdir)
+
+if __name__ == '__main__':
+    main()
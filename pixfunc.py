@@ -9,1794 +9,1873 @@
 
 """PIX Functions Names"""
 
-functionName = {
-    1: "CreateObject",
-    2: "DestroyObject",
-    206: "Direct3DCreate9",
-    207: "DebugSetMute",
-    208: "DebugSetLevel",
-    209: "Direct3DShaderValidatorCreate9",
-    210: "PSGPSampleTexture",
-    212: "D3DPERF_BeginEvent",
-    213: "D3DPERF_EndEvent",
-    214: "D3DPERF_SetMarker",
-    215: "D3DPERF_SetRegion",
-    216: "D3DPERF_QueryRepeatFrame",
-    217: "D3DPERF_SetOptions",
-    218: "D3DPERF_GetStatus",
-    219: "IDirect3D9::QueryInterface",
-    220: "IDirect3D9::AddRef",
-    221: "IDirect3D9::Release",
-    222: "IDirect3D9::RegisterSoftwareDevice",
-    223: "IDirect3D9::GetAdapterCount",
-    224: "IDirect3D9::GetAdapterIdentifier",
-    225: "IDirect3D9::GetAdapterModeCount",
-    226: "IDirect3D9::EnumAdapterModes",
-    227: "IDirect3D9::GetAdapterDisplayMode",
-    228: "IDirect3D9::CheckDeviceType",
-    229: "IDirect3D9::CheckDeviceFormat",
-    230: "IDirect3D9::CheckDeviceMultiSampleType",
-    231: "IDirect3D9::CheckDepthStencilMatch",
-    232: "IDirect3D9::CheckDeviceFormatConversion",
-    233: "IDirect3D9::GetDeviceCaps",
-    234: "IDirect3D9::GetAdapterMonitor",
-    235: "IDirect3D9::CreateDevice",
-    236: "IDirect3DDevice9::QueryInterface",
-    237: "IDirect3DDevice9::AddRef",
-    238: "IDirect3DDevice9::Release",
-    239: "IDirect3DDevice9::TestCooperativeLevel",
-    240: "IDirect3DDevice9::GetAvailableTextureMem",
-    241: "IDirect3DDevice9::EvictManagedResources",
-    242: "IDirect3DDevice9::GetDirect3D",
-    243: "IDirect3DDevice9::GetDeviceCaps",
-    244: "IDirect3DDevice9::GetDisplayMode",
-    245: "IDirect3DDevice9::GetCreationParameters",
-    246: "IDirect3DDevice9::SetCursorProperties",
-    247: "IDirect3DDevice9::SetCursorPosition",
-    248: "IDirect3DDevice9::ShowCursor",
-    249: "IDirect3DDevice9::CreateAdditionalSwapChain",
-    250: "IDirect3DDevice9::GetSwapChain",
-    251: "IDirect3DDevice9::GetNumberOfSwapChains",
-    252: "IDirect3DDevice9::Reset",
-    253: "IDirect3DDevice9::Present",
-    254: "IDirect3DDevice9::GetBackBuffer",
-    255: "IDirect3DDevice9::GetRasterStatus",
-    256: "IDirect3DDevice9::SetDialogBoxMode",
-    257: "IDirect3DDevice9::SetGammaRamp",
-    258: "IDirect3DDevice9::GetGammaRamp",
-    259: "IDirect3DDevice9::CreateTexture",
-    260: "IDirect3DDevice9::CreateVolumeTexture",
-    261: "IDirect3DDevice9::CreateCubeTexture",
-    262: "IDirect3DDevice9::CreateVertexBuffer",
-    263: "IDirect3DDevice9::CreateIndexBuffer",
-    264: "IDirect3DDevice9::CreateRenderTarget",
-    265: "IDirect3DDevice9::CreateDepthStencilSurface",
-    266: "IDirect3DDevice9::UpdateSurface",
-    267: "IDirect3DDevice9::UpdateTexture",
-    268: "IDirect3DDevice9::GetRenderTargetData",
-    269: "IDirect3DDevice9::GetFrontBufferData",
-    270: "IDirect3DDevice9::StretchRect",
-    271: "IDirect3DDevice9::ColorFill",
-    272: "IDirect3DDevice9::CreateOffscreenPlainSurface",
-    273: "IDirect3DDevice9::SetRenderTarget",
-    274: "IDirect3DDevice9::GetRenderTarget",
-    275: "IDirect3DDevice9::SetDepthStencilSurface",
-    276: "IDirect3DDevice9::GetDepthStencilSurface",
-    277: "IDirect3DDevice9::BeginScene",
-    278: "IDirect3DDevice9::EndScene",
-    279: "IDirect3DDevice9::Clear",
-    280: "IDirect3DDevice9::SetTransform",
-    281: "IDirect3DDevice9::GetTransform",
-    282: "IDirect3DDevice9::MultiplyTransform",
-    283: "IDirect3DDevice9::SetViewport",
-    284: "IDirect3DDevice9::GetViewport",
-    285: "IDirect3DDevice9::SetMaterial",
-    286: "IDirect3DDevice9::GetMaterial",
-    287: "IDirect3DDevice9::SetLight",
-    288: "IDirect3DDevice9::GetLight",
-    289: "IDirect3DDevice9::LightEnable",
-    290: "IDirect3DDevice9::GetLightEnable",
-    291: "IDirect3DDevice9::SetClipPlane",
-    292: "IDirect3DDevice9::GetClipPlane",
-    293: "IDirect3DDevice9::SetRenderState",
-    294: "IDirect3DDevice9::GetRenderState",
-    295: "IDirect3DDevice9::CreateStateBlock",
-    296: "IDirect3DDevice9::BeginStateBlock",
-    297: "IDirect3DDevice9::EndStateBlock",
-    298: "IDirect3DDevice9::SetClipStatus",
-    299: "IDirect3DDevice9::GetClipStatus",
-    300: "IDirect3DDevice9::GetTexture",
-    301: "IDirect3DDevice9::SetTexture",
-    302: "IDirect3DDevice9::GetTextureStageState",
-    303: "IDirect3DDevice9::SetTextureStageState",
-    304: "IDirect3DDevice9::GetSamplerState",
-    305: "IDirect3DDevice9::SetSamplerState",
-    306: "IDirect3DDevice9::ValidateDevice",
-    307: "IDirect3DDevice9::SetPaletteEntries",
-    308: "IDirect3DDevice9::GetPaletteEntries",
-    309: "IDirect3DDevice9::SetCurrentTexturePalette",
-    310: "IDirect3DDevice9::GetCurrentTexturePalette",
-    311: "IDirect3DDevice9::SetScissorRect",
-    312: "IDirect3DDevice9::GetScissorRect",
-    313: "IDirect3DDevice9::SetSoftwareVertexProcessing",
-    314: "IDirect3DDevice9::GetSoftwareVertexProcessing",
-    315: "IDirect3DDevice9::SetNPatchMode",
-    316: "IDirect3DDevice9::GetNPatchMode",
-    317: "IDirect3DDevice9::DrawPrimitive",
-    318: "IDirect3DDevice9::DrawIndexedPrimitive",
-    319: "IDirect3DDevice9::DrawPrimitiveUP",
-    320: "IDirect3DDevice9::DrawIndexedPrimitiveUP",
-    321: "IDirect3DDevice9::ProcessVertices",
-    322: "IDirect3DDevice9::CreateVertexDeclaration",
-    323: "IDirect3DDevice9::SetVertexDeclaration",
-    324: "IDirect3DDevice9::GetVertexDeclaration",
-    325: "IDirect3DDevice9::SetFVF",
-    326: "IDirect3DDevice9::GetFVF",
-    327: "IDirect3DDevice9::CreateVertexShader",
-    328: "IDirect3DDevice9::SetVertexShader",
-    329: "IDirect3DDevice9::GetVertexShader",
-    330: "IDirect3DDevice9::SetVertexShaderConstantF",
-    331: "IDirect3DDevice9::GetVertexShaderConstantF",
-    332: "IDirect3DDevice9::SetVertexShaderConstantI",
-    333: "IDirect3DDevice9::GetVertexShaderConstantI",
-    334: "IDirect3DDevice9::SetVertexShaderConstantB",
-    335: "IDirect3DDevice9::GetVertexShaderConstantB",
-    336: "IDirect3DDevice9::SetStreamSource",
-    337: "IDirect3DDevice9::GetStreamSource",
-    338: "IDirect3DDevice9::SetStreamSourceFreq",
-    339: "IDirect3DDevice9::GetStreamSourceFreq",
-    340: "IDirect3DDevice9::SetIndices",
-    341: "IDirect3DDevice9::GetIndices",
-    342: "IDirect3DDevice9::CreatePixelShader",
-    343: "IDirect3DDevice9::SetPixelShader",
-    344: "IDirect3DDevice9::GetPixelShader",
-    345: "IDirect3DDevice9::SetPixelShaderConstantF",
-    346: "IDirect3DDevice9::GetPixelShaderConstantF",
-    347: "IDirect3DDevice9::SetPixelShaderConstantI",
-    348: "IDirect3DDevice9::GetPixelShaderConstantI",
-    349: "IDirect3DDevice9::SetPixelShaderConstantB",
-    350: "IDirect3DDevice9::GetPixelShaderConstantB",
-    351: "IDirect3DDevice9::DrawRectPatch",
-    352: "IDirect3DDevice9::DrawTriPatch",
-    353: "IDirect3DDevice9::DeletePatch",
-    354: "IDirect3DDevice9::CreateQuery",
-    355: "IDirect3DSwapChain9::QueryInterface",
-    356: "IDirect3DSwapChain9::AddRef",
-    357: "IDirect3DSwapChain9::Release",
-    358: "IDirect3DSwapChain9::Present",
-    359: "IDirect3DSwapChain9::GetFrontBufferData",
-    360: "IDirect3DSwapChain9::GetBackBuffer",
-    361: "IDirect3DSwapChain9::GetRasterStatus",
-    362: "IDirect3DSwapChain9::GetDisplayMode",
-    363: "IDirect3DSwapChain9::GetDevice",
-    364: "IDirect3DSwapChain9::GetPresentParameters",
-    365: "IDirect3DTexture9::QueryInterface",
-    366: "IDirect3DTexture9::AddRef",
-    367: "IDirect3DTexture9::Release",
-    368: "IDirect3DTexture9::GetDevice",
-    369: "IDirect3DTexture9::SetPrivateData",
-    370: "IDirect3DTexture9::GetPrivateData",
-    371: "IDirect3DTexture9::FreePrivateData",
-    372: "IDirect3DTexture9::SetPriority",
-    373: "IDirect3DTexture9::GetPriority",
-    374: "IDirect3DTexture9::PreLoad",
-    375: "IDirect3DTexture9::GetType",
-    376: "IDirect3DTexture9::SetLOD",
-    377: "IDirect3DTexture9::GetLOD",
-    378: "IDirect3DTexture9::GetLevelCount",
-    379: "IDirect3DTexture9::SetAutoGenFilterType",
-    380: "IDirect3DTexture9::GetAutoGenFilterType",
-    381: "IDirect3DTexture9::GenerateMipSubLevels",
-    382: "IDirect3DTexture9::GetLevelDesc",
-    383: "IDirect3DTexture9::GetSurfaceLevel",
-    384: "IDirect3DTexture9::LockRect",
-    385: "IDirect3DTexture9::UnlockRect",
-    386: "IDirect3DTexture9::AddDirtyRect",
-    387: "IDirect3DVolumeTexture9::QueryInterface",
-    388: "IDirect3DVolumeTexture9::AddRef",
-    389: "IDirect3DVolumeTexture9::Release",
-    390: "IDirect3DVolumeTexture9::GetDevice",
-    391: "IDirect3DVolumeTexture9::SetPrivateData",
-    392: "IDirect3DVolumeTexture9::GetPrivateData",
-    393: "IDirect3DVolumeTexture9::FreePrivateData",
-    394: "IDirect3DVolumeTexture9::SetPriority",
-    395: "IDirect3DVolumeTexture9::GetPriority",
-    396: "IDirect3DVolumeTexture9::PreLoad",
-    397: "IDirect3DVolumeTexture9::GetType",
-    398: "IDirect3DVolumeTexture9::SetLOD",
-    399: "IDirect3DVolumeTexture9::GetLOD",
-    400: "IDirect3DVolumeTexture9::GetLevelCount",
-    401: "IDirect3DVolumeTexture9::SetAutoGenFilterType",
-    402: "IDirect3DVolumeTexture9::GetAutoGenFilterType",
-    403: "IDirect3DVolumeTexture9::GenerateMipSubLevels",
-    404: "IDirect3DVolumeTexture9::GetLevelDesc",
-    405: "IDirect3DVolumeTexture9::GetVolumeLevel",
-    406: "IDirect3DVolumeTexture9::LockBox",
-    407: "IDirect3DVolumeTexture9::UnlockBox",
-    408: "IDirect3DVolumeTexture9::AddDirtyBox",
-    409: "IDirect3DCubeTexture9::QueryInterface",
-    410: "IDirect3DCubeTexture9::AddRef",
-    411: "IDirect3DCubeTexture9::Release",
-    412: "IDirect3DCubeTexture9::GetDevice",
-    413: "IDirect3DCubeTexture9::SetPrivateData",
-    414: "IDirect3DCubeTexture9::GetPrivateData",
-    415: "IDirect3DCubeTexture9::FreePrivateData",
-    416: "IDirect3DCubeTexture9::SetPriority",
-    417: "IDirect3DCubeTexture9::GetPriority",
-    418: "IDirect3DCubeTexture9::PreLoad",
-    419: "IDirect3DCubeTexture9::GetType",
-    420: "IDirect3DCubeTexture9::SetLOD",
-    421: "IDirect3DCubeTexture9::GetLOD",
-    422: "IDirect3DCubeTexture9::GetLevelCount",
-    423: "IDirect3DCubeTexture9::SetAutoGenFilterType",
-    424: "IDirect3DCubeTexture9::GetAutoGenFilterType",
-    425: "IDirect3DCubeTexture9::GenerateMipSubLevels",
-    426: "IDirect3DCubeTexture9::GetLevelDesc",
-    427: "IDirect3DCubeTexture9::GetCubeMapSurface",
-    428: "IDirect3DCubeTexture9::LockRect",
-    429: "IDirect3DCubeTexture9::UnlockRect",
-    430: "IDirect3DCubeTexture9::AddDirtyRect",
-    431: "IDirect3DVertexBuffer9::QueryInterface",
-    432: "IDirect3DVertexBuffer9::AddRef",
-    433: "IDirect3DVertexBuffer9::Release",
-    434: "IDirect3DVertexBuffer9::GetDevice",
-    435: "IDirect3DVertexBuffer9::SetPrivateData",
-    436: "IDirect3DVertexBuffer9::GetPrivateData",
-    437: "IDirect3DVertexBuffer9::FreePrivateData",
-    438: "IDirect3DVertexBuffer9::SetPriority",
-    439: "IDirect3DVertexBuffer9::GetPriority",
-    440: "IDirect3DVertexBuffer9::PreLoad",
-    441: "IDirect3DVertexBuffer9::GetType",
-    442: "IDirect3DVertexBuffer9::Lock",
-    443: "IDirect3DVertexBuffer9::Unlock",
-    444: "IDirect3DVertexBuffer9::GetDesc",
-    445: "IDirect3DIndexBuffer9::QueryInterface",
-    446: "IDirect3DIndexBuffer9::AddRef",
-    447: "IDirect3DIndexBuffer9::Release",
-    448: "IDirect3DIndexBuffer9::GetDevice",
-    449: "IDirect3DIndexBuffer9::SetPrivateData",
-    450: "IDirect3DIndexBuffer9::GetPrivateData",
-    451: "IDirect3DIndexBuffer9::FreePrivateData",
-    452: "IDirect3DIndexBuffer9::SetPriority",
-    453: "IDirect3DIndexBuffer9::GetPriority",
-    454: "IDirect3DIndexBuffer9::PreLoad",
-    455: "IDirect3DIndexBuffer9::GetType",
-    456: "IDirect3DIndexBuffer9::Lock",
-    457: "IDirect3DIndexBuffer9::Unlock",
-    458: "IDirect3DIndexBuffer9::GetDesc",
-    459: "IDirect3DSurface9::QueryInterface",
-    460: "IDirect3DSurface9::AddRef",
-    461: "IDirect3DSurface9::Release",
-    462: "IDirect3DSurface9::GetDevice",
-    463: "IDirect3DSurface9::SetPrivateData",
-    464: "IDirect3DSurface9::GetPrivateData",
-    465: "IDirect3DSurface9::FreePrivateData",
-    466: "IDirect3DSurface9::SetPriority",
-    467: "IDirect3DSurface9::GetPriority",
-    468: "IDirect3DSurface9::PreLoad",
-    469: "IDirect3DSurface9::GetType",
-    470: "IDirect3DSurface9::GetContainer",
-    471: "IDirect3DSurface9::GetDesc",
-    472: "IDirect3DSurface9::LockRect",
-    473: "IDirect3DSurface9::UnlockRect",
-    474: "IDirect3DSurface9::GetDC",
-    475: "IDirect3DSurface9::ReleaseDC",
-    476: "IDirect3DVolume9::QueryInterface",
-    477: "IDirect3DVolume9::AddRef",
-    478: "IDirect3DVolume9::Release",
-    479: "IDirect3DVolume9::GetDevice",
-    480: "IDirect3DVolume9::SetPrivateData",
-    481: "IDirect3DVolume9::GetPrivateData",
-    482: "IDirect3DVolume9::FreePrivateData",
-    483: "IDirect3DVolume9::GetContainer",
-    484: "IDirect3DVolume9::GetDesc",
-    485: "IDirect3DVolume9::LockBox",
-    486: "IDirect3DVolume9::UnlockBox",
-    487: "IDirect3DVertexDeclaration9::QueryInterface",
-    488: "IDirect3DVertexDeclaration9::AddRef",
-    489: "IDirect3DVertexDeclaration9::Release",
-    490: "IDirect3DVertexDeclaration9::GetDevice",
-    491: "IDirect3DVertexDeclaration9::GetDeclaration",
-    492: "IDirect3DVertexShader9::QueryInterface",
-    493: "IDirect3DVertexShader9::AddRef",
-    494: "IDirect3DVertexShader9::Release",
-    495: "IDirect3DVertexShader9::GetDevice",
-    496: "IDirect3DVertexShader9::GetFunction",
-    497: "IDirect3DPixelShader9::QueryInterface",
-    498: "IDirect3DPixelShader9::AddRef",
-    499: "IDirect3DPixelShader9::Release",
-    500: "IDirect3DPixelShader9::GetDevice",
-    501: "IDirect3DPixelShader9::GetFunction",
-    502: "IDirect3DStateBlock9::QueryInterface",
-    503: "IDirect3DStateBlock9::AddRef",
-    504: "IDirect3DStateBlock9::Release",
-    505: "IDirect3DStateBlock9::GetDevice",
-    506: "IDirect3DStateBlock9::Capture",
-    507: "IDirect3DStateBlock9::Apply",
-    508: "IDirect3DQuery9::QueryInterface",
-    509: "IDirect3DQuery9::AddRef",
-    510: "IDirect3DQuery9::Release",
-    511: "IDirect3DQuery9::GetDevice",
-    512: "IDirect3DQuery9::GetType",
-    513: "IDirect3DQuery9::GetDataSize",
-    514: "IDirect3DQuery9::Issue",
-    515: "IDirect3DQuery9::GetData",
-    516: "IDirect3DVideoDevice9::QueryInterface",
-    517: "IDirect3DVideoDevice9::AddRef",
-    518: "IDirect3DVideoDevice9::Release",
-    519: "IDirect3DVideoDevice9::CreateSurface",
-    520: "IDirect3DVideoDevice9::GetDXVACompressedBufferInfo",
-    521: "IDirect3DVideoDevice9::GetDXVAGuids",
-    522: "IDirect3DVideoDevice9::GetDXVAInternalInfo",
-    523: "IDirect3DVideoDevice9::GetUncompressedDXVAFormats",
-    524: "IDirect3DVideoDevice9::CreateDXVADevice",
-    525: "IDirect3DDXVADevice9::QueryInterface",
-    526: "IDirect3DDXVADevice9::AddRef",
-    527: "IDirect3DDXVADevice9::Release",
-    528: "IDirect3DDXVADevice9::BeginFrame",
-    529: "IDirect3DDXVADevice9::EndFrame",
-    530: "IDirect3DDXVADevice9::Execute",
-    531: "IDirect3DDXVADevice9::QueryStatus",
-    532: "D3DXCheckVersion",
-    533: "D3DXCreateSprite",
-    534: "D3DXCreateFontW",
-    535: "D3DXCreateEffect",
-    536: "D3DXCreateEffectFromFileA",
-    537: "D3DXCreateEffectFromFileW",
-    538: "D3DXCreateEffectFromResourceA",
-    539: "D3DXCreateEffectFromResourceW",
-    540: "D3DXCreateEffectEx",
-    541: "D3DXCreateEffectFromFileExA",
-    542: "D3DXCreateEffectFromFileExW",
-    543: "D3DXCreateEffectFromResourceExA",
-    544: "D3DXCreateEffectFromResourceExW",
-    545: "D3DXCreateMesh",
-    546: "D3DXCreateMeshFVF",
-    547: "D3DXLoadMeshFromXA",
-    548: "D3DXLoadMeshFromXW",
-    549: "D3DXCompileShaderFromFileA",
-    550: "D3DXCompileShaderFromFileW",
-    551: "D3DXCompileShaderFromResourceA",
-    552: "D3DXCompileShaderFromResourceW",
-    553: "D3DXCompileShader",
-    554: "D3DXGetShaderConstantTable",
-    555: "ID3DXSprite::QueryInterface",
-    556: "ID3DXSprite::AddRef",
-    557: "ID3DXSprite::Release",
-    558: "ID3DXSprite::GetDevice",
-    559: "ID3DXSprite::GetTransform",
-    560: "ID3DXSprite::SetTransform",
-    561: "ID3DXSprite::SetWorldViewRH",
-    562: "ID3DXSprite::SetWorldViewLH",
-    563: "ID3DXSprite::Begin",
-    564: "ID3DXSprite::Draw",
-    565: "ID3DXSprite::Flush",
-    566: "ID3DXSprite::End",
-    567: "ID3DXSprite::OnLostDevice",
-    568: "ID3DXSprite::OnResetDevice",
-    569: "ID3DXFont::QueryInterface",
-    570: "ID3DXFont::AddRef",
-    571: "ID3DXFont::Release",
-    572: "ID3DXFont::GetDevice",
-    573: "ID3DXFont::GetDescA",
-    574: "ID3DXFont::GetDescW",
-    575: "ID3DXFont::GetTextMetricsA",
-    576: "ID3DXFont::GetTextMetricsW",
-    577: "ID3DXFont::GetDC",
-    578: "ID3DXFont::GetGlyphData",
-    579: "ID3DXFont::PreloadCharacters",
-    580: "ID3DXFont::PreloadGlyphs",
-    581: "ID3DXFont::PreloadTextA",
-    582: "ID3DXFont::PreloadTextW",
-    583: "ID3DXFont::DrawTextA",
-    584: "ID3DXFont::DrawTextW",
-    585: "ID3DXFont::OnLostDevice",
-    586: "ID3DXFont::OnResetDevice",
-    587: "ID3DXEffect::QueryInterface",
-    588: "ID3DXEffect::AddRef",
-    589: "ID3DXEffect::Release",
-    590: "ID3DXEffect::GetDesc",
-    591: "ID3DXEffect::GetParameterDesc",
-    592: "ID3DXEffect::GetTechniqueDesc",
-    593: "ID3DXEffect::GetPassDesc",
-    594: "ID3DXEffect::GetFunctionDesc",
-    595: "ID3DXEffect::GetParameter",
-    596: "ID3DXEffect::GetParameterByName",
-    597: "ID3DXEffect::GetParameterBySemantic",
-    598: "ID3DXEffect::GetParameterElement",
-    599: "ID3DXEffect::GetTechnique",
-    600: "ID3DXEffect::GetTechniqueByName",
-    601: "ID3DXEffect::GetPass",
-    602: "ID3DXEffect::GetPassByName",
-    603: "ID3DXEffect::GetFunction",
-    604: "ID3DXEffect::GetFunctionByName",
-    605: "ID3DXEffect::GetAnnotation",
-    606: "ID3DXEffect::GetAnnotationByName",
-    607: "ID3DXEffect::SetValue",
-    608: "ID3DXEffect::GetValue",
-    609: "ID3DXEffect::SetBool",
-    610: "ID3DXEffect::GetBool",
-    611: "ID3DXEffect::SetBoolArray",
-    612: "ID3DXEffect::GetBoolArray",
-    613: "ID3DXEffect::SetInt",
-    614: "ID3DXEffect::GetInt",
-    615: "ID3DXEffect::SetIntArray",
-    616: "ID3DXEffect::GetIntArray",
-    617: "ID3DXEffect::SetFloat",
-    618: "ID3DXEffect::GetFloat",
-    619: "ID3DXEffect::SetFloatArray",
-    620: "ID3DXEffect::GetFloatArray",
-    621: "ID3DXEffect::SetVector",
-    622: "ID3DXEffect::GetVector",
-    623: "ID3DXEffect::SetVectorArray",
-    624: "ID3DXEffect::GetVectorArray",
-    625: "ID3DXEffect::SetMatrix",
-    626: "ID3DXEffect::GetMatrix",
-    627: "ID3DXEffect::SetMatrixArray",
-    628: "ID3DXEffect::GetMatrixArray",
-    629: "ID3DXEffect::SetMatrixPointerArray",
-    630: "ID3DXEffect::GetMatrixPointerArray",
-    631: "ID3DXEffect::SetMatrixTranspose",
-    632: "ID3DXEffect::GetMatrixTranspose",
-    633: "ID3DXEffect::SetMatrixTransposeArray",
-    634: "ID3DXEffect::GetMatrixTransposeArray",
-    635: "ID3DXEffect::SetMatrixTransposePointerArray",
-    636: "ID3DXEffect::GetMatrixTransposePointerArray",
-    637: "ID3DXEffect::SetString",
-    638: "ID3DXEffect::GetString",
-    639: "ID3DXEffect::SetTexture",
-    640: "ID3DXEffect::GetTexture",
-    641: "ID3DXEffect::SetPixelShader",
-    642: "ID3DXEffect::GetPixelShader",
-    643: "ID3DXEffect::SetVertexShader",
-    644: "ID3DXEffect::GetVertexShader",
-    645: "ID3DXEffect::SetArrayRange",
-    646: "ID3DXEffect::GetPool",
-    647: "ID3DXEffect::SetTechnique",
-    648: "ID3DXEffect::GetCurrentTechnique",
-    649: "ID3DXEffect::ValidateTechnique",
-    650: "ID3DXEffect::FindNextValidTechnique",
-    651: "ID3DXEffect::IsParameterUsed",
-    652: "ID3DXEffect::Begin",
-    653: "ID3DXEffect::BeginPass",
-    654: "ID3DXEffect::CommitChanges",
-    655: "ID3DXEffect::EndPass",
-    656: "ID3DXEffect::End",
-    657: "ID3DXEffect::GetDevice",
-    658: "ID3DXEffect::OnLostDevice",
-    659: "ID3DXEffect::OnResetDevice",
-    660: "ID3DXEffect::SetStateManager",
-    661: "ID3DXEffect::GetStateManager",
-    662: "ID3DXEffect::BeginParameterBlock",
-    663: "ID3DXEffect::EndParameterBlock",
-    664: "ID3DXEffect::ApplyParameterBlock",
-    665: "ID3DXEffect::CloneEffect",
-    666: "ID3DXMesh::QueryInterface",
-    667: "ID3DXMesh::AddRef",
-    668: "ID3DXMesh::Release",
-    669: "ID3DXMesh::DrawSubset",
-    670: "ID3DXMesh::GetNumFaces",
-    671: "ID3DXMesh::GetNumVertices",
-    672: "ID3DXMesh::GetFVF",
-    673: "ID3DXMesh::GetDeclaration",
-    674: "ID3DXMesh::GetNumBytesPerVertex",
-    675: "ID3DXMesh::GetOptions",
-    676: "ID3DXMesh::GetDevice",
-    677: "ID3DXMesh::CloneMeshFVF",
-    678: "ID3DXMesh::CloneMesh",
-    679: "ID3DXMesh::GetVertexBuffer",
-    680: "ID3DXMesh::GetIndexBuffer",
-    681: "ID3DXMesh::LockVertexBuffer",
-    682: "ID3DXMesh::UnlockVertexBuffer",
-    683: "ID3DXMesh::LockIndexBuffer",
-    684: "ID3DXMesh::UnlockIndexBuffer",
-    685: "ID3DXMesh::GetAttributeTable",
-    686: "ID3DXMesh::ConvertPointRepsToAdjacency",
-    687: "ID3DXMesh::ConvertAdjacencyToPointReps",
-    688: "ID3DXMesh::GenerateAdjacency",
-    689: "ID3DXMesh::UpdateSemantics",
-    690: "ID3DXMesh::LockAttributeBuffer",
-    691: "ID3DXMesh::UnlockAttributeBuffer",
-    692: "ID3DXMesh::Optimize",
-    693: "ID3DXMesh::OptimizeInplace",
-    694: "ID3DXMesh::SetAttributeTable",
-    695: "ID3DXConstantTable::QueryInterface",
-    696: "ID3DXConstantTable::AddRef",
-    697: "ID3DXConstantTable::Release",
-    698: "ID3DXConstantTable::GetBufferPointer",
-    699: "ID3DXConstantTable::GetBufferSize",
-    700: "ID3DXConstantTable::GetDesc",
-    701: "ID3DXConstantTable::GetConstantDesc",
-    702: "ID3DXConstantTable::GetSamplerIndex",
-    703: "ID3DXConstantTable::GetConstant",
-    704: "ID3DXConstantTable::GetConstantByName",
-    705: "ID3DXConstantTable::GetConstantElement",
-    706: "ID3DXConstantTable::SetDefaults",
-    707: "ID3DXConstantTable::SetValue",
-    708: "ID3DXConstantTable::SetBool",
-    709: "ID3DXConstantTable::SetBoolArray",
-    710: "ID3DXConstantTable::SetInt",
-    711: "ID3DXConstantTable::SetIntArray",
-    712: "ID3DXConstantTable::SetFloat",
-    713: "ID3DXConstantTable::SetFloatArray",
-    714: "ID3DXConstantTable::SetVector",
-    715: "ID3DXConstantTable::SetVectorArray",
-    716: "ID3DXConstantTable::SetMatrix",
-    717: "ID3DXConstantTable::SetMatrixArray",
-    718: "ID3DXConstantTable::SetMatrixPointerArray",
-    719: "ID3DXConstantTable::SetMatrixTranspose",
-    720: "ID3DXConstantTable::SetMatrixTransposeArray",
-    721: "ID3DXConstantTable::SetMatrixTransposePointerArray",
-    722: "CreateProcessA",
-    723: "CreateProcessW",
-    724: "ID3DXEffect::DeleteParameterBlock",
-    725: "D3DXTessellateNPatches",
-    726: "D3DXGeneratePMesh",
-    727: "D3DXLoadMeshHierarchyFromXA",
-    728: "D3DXLoadMeshHierarchyFromXW",
-    729: "ID3DXEffect::SetRawValue",
-    730: "D3DXSimplifyMesh",
-    731: "Direct3DCreate9Ex",
-    732: "IDirect3D9::GetAdapterModeCountEx",
-    733: "IDirect3D9::EnumAdapterModesEx",
-    734: "IDirect3D9::GetAdapterDisplayModeEx",
-    735: "IDirect3D9::CreateDeviceEx",
-    736: "IDirect3D9::GetAdapterLUID",
-    737: "IDirect3DDevice9::SetConvolutionMonoKernel",
-    738: "IDirect3DDevice9::ComposeRects",
-    739: "IDirect3DDevice9::PresentEx",
-    740: "IDirect3DDevice9::GetGPUThreadPriority",
-    741: "IDirect3DDevice9::SetGPUThreadPriority",
-    742: "IDirect3DDevice9::WaitForVBlank",
-    743: "IDirect3DDevice9::CheckResourceResidency",
-    744: "IDirect3DDevice9::SetMaximumFrameLatency",
-    745: "IDirect3DDevice9::GetMaximumFrameLatency",
-    746: "IDirect3DDevice9::CheckDeviceState",
-    747: "IDirect3DDevice9::CreateRenderTargetEx",
-    748: "IDirect3DDevice9::CreateOffscreenPlainSurfaceEx",
-    749: "IDirect3DDevice9::CreateDepthStencilSurfaceEx",
-    750: "IDirect3DDevice9::ResetEx",
-    751: "IDirect3DDevice9::GetDisplayModeEx",
-    752: "IDirect3DSwapChain9::GetLastPresentCount",
-    753: "IDirect3DSwapChain9::GetPresentStats",
-    754: "IDirect3DSwapChain9::GetDisplayModeEx",
-    755: "OutputDebugStringA",
-    756: "OutputDebugStringW",
-    1000: "CreateDXGIFactory",
-    1001: "IDXGISurface::QueryInterface",
-    1002: "IDXGISurface::AddRef",
-    1003: "IDXGISurface::Release",
-    1004: "IDXGISurface::SetPrivateData",
-    1005: "IDXGISurface::SetPrivateDataInterface",
-    1006: "IDXGISurface::GetPrivateData",
-    1007: "IDXGISurface::GetParent",
-    1008: "IDXGISurface::GetDevice",
-    1009: "IDXGISurface::GetDesc",
-    1010: "IDXGISurface::Map",
-    1011: "IDXGISurface::Unmap",
-    1012: "IDXGIAdapter::QueryInterface",
-    1013: "IDXGIAdapter::AddRef",
-    1014: "IDXGIAdapter::Release",
-    1015: "IDXGIAdapter::SetPrivateData",
-    1016: "IDXGIAdapter::SetPrivateDataInterface",
-    1017: "IDXGIAdapter::GetPrivateData",
-    1018: "IDXGIAdapter::GetParent",
-    1019: "IDXGIAdapter::EnumOutputs",
-    1020: "IDXGIAdapter::GetDesc",
-    1021: "IDXGIAdapter::CheckInterfaceSupport",
-    1022: "IDXGIOutput::QueryInterface",
-    1023: "IDXGIOutput::AddRef",
-    1024: "IDXGIOutput::Release",
-    1025: "IDXGIOutput::SetPrivateData",
-    1026: "IDXGIOutput::SetPrivateDataInterface",
-    1027: "IDXGIOutput::GetPrivateData",
-    1028: "IDXGIOutput::GetParent",
-    1029: "IDXGIOutput::GetDesc",
-    1030: "IDXGIOutput::GetDisplayModeList",
-    1031: "IDXGIOutput::FindClosestMatchingMode",
-    1032: "IDXGIOutput::WaitForVBlank",
-    1033: "IDXGIOutput::TakeOwnership",
-    1034: "IDXGIOutput::ReleaseOwnership",
-    1035: "IDXGIOutput::GetGammaControlCapabilities",
-    1036: "IDXGIOutput::SetGammaControl",
-    1037: "IDXGIOutput::GetGammaControl",
-    1038: "IDXGIOutput::SetDisplaySurface",
-    1039: "IDXGIOutput::GetDisplaySurfaceData",
-    1040: "IDXGIOutput::GetFrameStatistics",
-    1041: "IDXGISwapChain::QueryInterface",
-    1042: "IDXGISwapChain::AddRef",
-    1043: "IDXGISwapChain::Release",
-    1044: "IDXGISwapChain::SetPrivateData",
-    1045: "IDXGISwapChain::SetPrivateDataInterface",
-    1046: "IDXGISwapChain::GetPrivateData",
-    1047: "IDXGISwapChain::GetParent",
-    1048: "IDXGISwapChain::GetDevice",
-    1049: "IDXGISwapChain::Present",
-    1050: "IDXGISwapChain::GetBuffer",
-    1051: "IDXGISwapChain::SetFullscreenState",
-    1052: "IDXGISwapChain::GetFullscreenState",
-    1053: "IDXGISwapChain::GetDesc",
-    1054: "IDXGISwapChain::ResizeBuffers",
-    1055: "IDXGISwapChain::ResizeTarget",
-    1056: "IDXGISwapChain::GetContainingOutput",
-    1057: "IDXGISwapChain::GetFrameStatistics",
-    1058: "IDXGISwapChain::GetLastPresentCount",
-    1059: "IDXGIFactory::QueryInterface",
-    1060: "IDXGIFactory::AddRef",
-    1061: "IDXGIFactory::Release",
-    1062: "IDXGIFactory::SetPrivateData",
-    1063: "IDXGIFactory::SetPrivateDataInterface",
-    1064: "IDXGIFactory::GetPrivateData",
-    1065: "IDXGIFactory::GetParent",
-    1066: "IDXGIFactory::EnumAdapters",
-    1067: "IDXGIFactory::MakeWindowAssociation",
-    1068: "IDXGIFactory::GetWindowAssociation",
-    1069: "IDXGIFactory::CreateSwapChain",
-    1070: "IDXGIFactory::CreateSoftwareAdapter",
-    1071: "IDXGIDevice::QueryInterface",
-    1072: "IDXGIDevice::AddRef",
-    1073: "IDXGIDevice::Release",
-    1074: "IDXGIDevice::SetPrivateData",
-    1075: "IDXGIDevice::SetPrivateDataInterface",
-    1076: "IDXGIDevice::GetPrivateData",
-    1077: "IDXGIDevice::GetParent",
-    1078: "IDXGIDevice::GetAdapter",
-    1079: "IDXGIDevice::CreateSurface",
-    1080: "IDXGIDevice::QueryResourceResidency",
-    1081: "IDXGIDevice::SetGPUThreadPriority",
-    1082: "IDXGIDevice::GetGPUThreadPriority",
-    1083: "D3D10CreateDevice",
-    1084: "D3D10CreateDeviceAndSwapChain",
-    1085: "D3D10CreateStateBlock",
-    1086: "D3D10CreateEffectFromMemory",
-    1087: "D3D10CreateEffectPoolFromMemory",
-    1088: "D3D10CreateDevice1",
-    1089: "D3D10CreateDeviceAndSwapChain1",
-    1090: "ID3D10Device1::CreateShaderResourceView1",
-    1091: "ID3D10Device1::CreateBlendState1",
-    1092: "ID3D10Device1::GetFeatureLevel",
-    1093: "ID3D10BlendState::GetDesc1",
-    1094: "ID3D10ShaderResourceView::GetDesc1",
-    1113: "ID3D10DepthStencilState::QueryInterface",
-    1114: "ID3D10DepthStencilState::AddRef",
-    1115: "ID3D10DepthStencilState::Release",
-    1116: "ID3D10DepthStencilState::GetDevice",
-    1117: "ID3D10DepthStencilState::GetPrivateData",
-    1118: "ID3D10DepthStencilState::SetPrivateData",
-    1119: "ID3D10DepthStencilState::SetPrivateDataInterface",
-    1120: "ID3D10DepthStencilState::GetDesc",
-    1121: "ID3D10BlendState::QueryInterface",
-    1122: "ID3D10BlendState::AddRef",
-    1123: "ID3D10BlendState::Release",
-    1124: "ID3D10BlendState::GetDevice",
-    1125: "ID3D10BlendState::GetPrivateData",
-    1126: "ID3D10BlendState::SetPrivateData",
-    1127: "ID3D10BlendState::SetPrivateDataInterface",
-    1128: "ID3D10BlendState::GetDesc",
-    1129: "ID3D10RasterizerState::QueryInterface",
-    1130: "ID3D10RasterizerState::AddRef",
-    1131: "ID3D10RasterizerState::Release",
-    1132: "ID3D10RasterizerState::GetDevice",
-    1133: "ID3D10RasterizerState::GetPrivateData",
-    1134: "ID3D10RasterizerState::SetPrivateData",
-    1135: "ID3D10RasterizerState::SetPrivateDataInterface",
-    1136: "ID3D10RasterizerState::GetDesc",
-    1137: "ID3D10Buffer::QueryInterface",
-    1138: "ID3D10Buffer::AddRef",
-    1139: "ID3D10Buffer::Release",
-    1140: "ID3D10Buffer::GetDevice",
-    1141: "ID3D10Buffer::GetPrivateData",
-    1142: "ID3D10Buffer::SetPrivateData",
-    1143: "ID3D10Buffer::SetPrivateDataInterface",
-    1144: "ID3D10Buffer::GetType",
-    1145: "ID3D10Buffer::SetEvictionPriority",
-    1146: "ID3D10Buffer::GetEvictionPriority",
-    1147: "ID3D10Buffer::Map",
-    1148: "ID3D10Buffer::Unmap",
-    1149: "ID3D10Buffer::GetDesc",
-    1150: "ID3D10Texture1D::QueryInterface",
-    1151: "ID3D10Texture1D::AddRef",
-    1152: "ID3D10Texture1D::Release",
-    1153: "ID3D10Texture1D::GetDevice",
-    1154: "ID3D10Texture1D::GetPrivateData",
-    1155: "ID3D10Texture1D::SetPrivateData",
-    1156: "ID3D10Texture1D::SetPrivateDataInterface",
-    1157: "ID3D10Texture1D::GetType",
-    1158: "ID3D10Texture1D::SetEvictionPriority",
-    1159: "ID3D10Texture1D::GetEvictionPriority",
-    1160: "ID3D10Texture1D::Map",
-    1161: "ID3D10Texture1D::Unmap",
-    1162: "ID3D10Texture1D::GetDesc",
-    1163: "ID3D10Texture2D::QueryInterface",
-    1164: "ID3D10Texture2D::AddRef",
-    1165: "ID3D10Texture2D::Release",
-    1166: "ID3D10Texture2D::GetDevice",
-    1167: "ID3D10Texture2D::GetPrivateData",
-    1168: "ID3D10Texture2D::SetPrivateData",
-    1169: "ID3D10Texture2D::SetPrivateDataInterface",
-    1170: "ID3D10Texture2D::GetType",
-    1171: "ID3D10Texture2D::SetEvictionPriority",
-    1172: "ID3D10Texture2D::GetEvictionPriority",
-    1173: "ID3D10Texture2D::Map",
-    1174: "ID3D10Texture2D::Unmap",
-    1175: "ID3D10Texture2D::GetDesc",
-    1176: "ID3D10Texture3D::QueryInterface",
-    1177: "ID3D10Texture3D::AddRef",
-    1178: "ID3D10Texture3D::Release",
-    1179: "ID3D10Texture3D::GetDevice",
-    1180: "ID3D10Texture3D::GetPrivateData",
-    1181: "ID3D10Texture3D::SetPrivateData",
-    1182: "ID3D10Texture3D::SetPrivateDataInterface",
-    1183: "ID3D10Texture3D::GetType",
-    1184: "ID3D10Texture3D::SetEvictionPriority",
-    1185: "ID3D10Texture3D::GetEvictionPriority",
-    1186: "ID3D10Texture3D::Map",
-    1187: "ID3D10Texture3D::Unmap",
-    1188: "ID3D10Texture3D::GetDesc",
-    1189: "ID3D10ShaderResourceView::QueryInterface",
-    1190: "ID3D10ShaderResourceView::AddRef",
-    1191: "ID3D10ShaderResourceView::Release",
-    1192: "ID3D10ShaderResourceView::GetDevice",
-    1193: "ID3D10ShaderResourceView::GetPrivateData",
-    1194: "ID3D10ShaderResourceView::SetPrivateData",
-    1195: "ID3D10ShaderResourceView::SetPrivateDataInterface",
-    1196: "ID3D10ShaderResourceView::GetResource",
-    1197: "ID3D10ShaderResourceView::GetDesc",
-    1198: "ID3D10RenderTargetView::QueryInterface",
-    1199: "ID3D10RenderTargetView::AddRef",
-    1200: "ID3D10RenderTargetView::Release",
-    1201: "ID3D10RenderTargetView::GetDevice",
-    1202: "ID3D10RenderTargetView::GetPrivateData",
-    1203: "ID3D10RenderTargetView::SetPrivateData",
-    1204: "ID3D10RenderTargetView::SetPrivateDataInterface",
-    1205: "ID3D10RenderTargetView::GetResource",
-    1206: "ID3D10RenderTargetView::GetDesc",
-    1207: "ID3D10DepthStencilView::QueryInterface",
-    1208: "ID3D10DepthStencilView::AddRef",
-    1209: "ID3D10DepthStencilView::Release",
-    1210: "ID3D10DepthStencilView::GetDevice",
-    1211: "ID3D10DepthStencilView::GetPrivateData",
-    1212: "ID3D10DepthStencilView::SetPrivateData",
-    1213: "ID3D10DepthStencilView::SetPrivateDataInterface",
-    1214: "ID3D10DepthStencilView::GetResource",
-    1215: "ID3D10DepthStencilView::GetDesc",
-    1216: "ID3D10VertexShader::QueryInterface",
-    1217: "ID3D10VertexShader::AddRef",
-    1218: "ID3D10VertexShader::Release",
-    1219: "ID3D10VertexShader::GetDevice",
-    1220: "ID3D10VertexShader::GetPrivateData",
-    1221: "ID3D10VertexShader::SetPrivateData",
-    1222: "ID3D10VertexShader::SetPrivateDataInterface",
-    1223: "ID3D10GeometryShader::QueryInterface",
-    1224: "ID3D10GeometryShader::AddRef",
-    1225: "ID3D10GeometryShader::Release",
-    1226: "ID3D10GeometryShader::GetDevice",
-    1227: "ID3D10GeometryShader::GetPrivateData",
-    1228: "ID3D10GeometryShader::SetPrivateData",
-    1229: "ID3D10GeometryShader::SetPrivateDataInterface",
-    1230: "ID3D10PixelShader::QueryInterface",
-    1231: "ID3D10PixelShader::AddRef",
-    1232: "ID3D10PixelShader::Release",
-    1233: "ID3D10PixelShader::GetDevice",
-    1234: "ID3D10PixelShader::GetPrivateData",
-    1235: "ID3D10PixelShader::SetPrivateData",
-    1236: "ID3D10PixelShader::SetPrivateDataInterface",
-    1237: "ID3D10InputLayout::QueryInterface",
-    1238: "ID3D10InputLayout::AddRef",
-    1239: "ID3D10InputLayout::Release",
-    1240: "ID3D10InputLayout::GetDevice",
-    1241: "ID3D10InputLayout::GetPrivateData",
-    1242: "ID3D10InputLayout::SetPrivateData",
-    1243: "ID3D10InputLayout::SetPrivateDataInterface",
-    1244: "ID3D10SamplerState::QueryInterface",
-    1245: "ID3D10SamplerState::AddRef",
-    1246: "ID3D10SamplerState::Release",
-    1247: "ID3D10SamplerState::GetDevice",
-    1248: "ID3D10SamplerState::GetPrivateData",
-    1249: "ID3D10SamplerState::SetPrivateData",
-    1250: "ID3D10SamplerState::SetPrivateDataInterface",
-    1251: "ID3D10SamplerState::GetDesc",
-    1252: "ID3D10Query::QueryInterface",
-    1253: "ID3D10Query::AddRef",
-    1254: "ID3D10Query::Release",
-    1255: "ID3D10Query::GetDevice",
-    1256: "ID3D10Query::GetPrivateData",
-    1257: "ID3D10Query::SetPrivateData",
-    1258: "ID3D10Query::SetPrivateDataInterface",
-    1259: "ID3D10Query::Begin",
-    1260: "ID3D10Query::End",
-    1261: "ID3D10Query::GetData",
-    1262: "ID3D10Query::GetDataSize",
-    1263: "ID3D10Query::GetDesc",
-    1264: "ID3D10Predicate::QueryInterface",
-    1265: "ID3D10Predicate::AddRef",
-    1266: "ID3D10Predicate::Release",
-    1267: "ID3D10Predicate::GetDevice",
-    1268: "ID3D10Predicate::GetPrivateData",
-    1269: "ID3D10Predicate::SetPrivateData",
-    1270: "ID3D10Predicate::SetPrivateDataInterface",
-    1271: "ID3D10Predicate::Begin",
-    1272: "ID3D10Predicate::End",
-    1273: "ID3D10Predicate::GetData",
-    1274: "ID3D10Predicate::GetDataSize",
-    1275: "ID3D10Predicate::GetDesc",
-    1276: "ID3D10Counter::QueryInterface",
-    1277: "ID3D10Counter::AddRef",
-    1278: "ID3D10Counter::Release",
-    1279: "ID3D10Counter::GetDevice",
-    1280: "ID3D10Counter::GetPrivateData",
-    1281: "ID3D10Counter::SetPrivateData",
-    1282: "ID3D10Counter::SetPrivateDataInterface",
-    1283: "ID3D10Counter::Begin",
-    1284: "ID3D10Counter::End",
-    1285: "ID3D10Counter::GetData",
-    1286: "ID3D10Counter::GetDataSize",
-    1287: "ID3D10Counter::GetDesc",
-    1288: "ID3D10Device::QueryInterface",
-    1289: "ID3D10Device::AddRef",
-    1290: "ID3D10Device::Release",
-    1291: "ID3D10Device::VSSetConstantBuffers",
-    1292: "ID3D10Device::PSSetShaderResources",
-    1293: "ID3D10Device::PSSetShader",
-    1294: "ID3D10Device::PSSetSamplers",
-    1295: "ID3D10Device::VSSetShader",
-    1296: "ID3D10Device::DrawIndexed",
-    1297: "ID3D10Device::Draw",
-    1298: "ID3D10Device::PSSetConstantBuffers",
-    1299: "ID3D10Device::IASetInputLayout",
-    1300: "ID3D10Device::IASetVertexBuffers",
-    1301: "ID3D10Device::IASetIndexBuffer",
-    1302: "ID3D10Device::DrawIndexedInstanced",
-    1303: "ID3D10Device::DrawInstanced",
-    1304: "ID3D10Device::GSSetConstantBuffers",
-    1305: "ID3D10Device::GSSetShader",
-    1306: "ID3D10Device::IASetPrimitiveTopology",
-    1307: "ID3D10Device::VSSetShaderResources",
-    1308: "ID3D10Device::VSSetSamplers",
-    1309: "ID3D10Device::SetPredication",
-    1310: "ID3D10Device::GSSetShaderResources",
-    1311: "ID3D10Device::GSSetSamplers",
-    1312: "ID3D10Device::OMSetRenderTargets",
-    1313: "ID3D10Device::OMSetBlendState",
-    1314: "ID3D10Device::OMSetDepthStencilState",
-    1315: "ID3D10Device::SOSetTargets",
-    1316: "ID3D10Device::DrawAuto",
-    1317: "ID3D10Device::RSSetState",
-    1318: "ID3D10Device::RSSetViewports",
-    1319: "ID3D10Device::RSSetScissorRects",
-    1320: "ID3D10Device::CopySubresourceRegion",
-    1321: "ID3D10Device::CopyResource",
-    1322: "ID3D10Device::UpdateSubresource",
-    1323: "ID3D10Device::ClearRenderTargetView",
-    1324: "ID3D10Device::ClearDepthStencilView",
-    1325: "ID3D10Device::GenerateMips",
-    1326: "ID3D10Device::ResolveSubresource",
-    1327: "ID3D10Device::VSGetConstantBuffers",
-    1328: "ID3D10Device::PSGetShaderResources",
-    1329: "ID3D10Device::PSGetShader",
-    1330: "ID3D10Device::PSGetSamplers",
-    1331: "ID3D10Device::VSGetShader",
-    1332: "ID3D10Device::PSGetConstantBuffers",
-    1333: "ID3D10Device::IAGetInputLayout",
-    1334: "ID3D10Device::IAGetVertexBuffers",
-    1335: "ID3D10Device::IAGetIndexBuffer",
-    1336: "ID3D10Device::GSGetConstantBuffers",
-    1337: "ID3D10Device::GSGetShader",
-    1338: "ID3D10Device::IAGetPrimitiveTopology",
-    1339: "ID3D10Device::VSGetShaderResources",
-    1340: "ID3D10Device::VSGetSamplers",
-    1341: "ID3D10Device::GetPredication",
-    1342: "ID3D10Device::GSGetShaderResources",
-    1343: "ID3D10Device::GSGetSamplers",
-    1344: "ID3D10Device::OMGetRenderTargets",
-    1345: "ID3D10Device::OMGetBlendState",
-    1346: "ID3D10Device::OMGetDepthStencilState",
-    1347: "ID3D10Device::SOGetTargets",
-    1348: "ID3D10Device::RSGetState",
-    1349: "ID3D10Device::RSGetViewports",
-    1350: "ID3D10Device::RSGetScissorRects",
-    1351: "ID3D10Device::GetDeviceRemovedReason",
-    1352: "ID3D10Device::SetExceptionMode",
-    1353: "ID3D10Device::GetExceptionMode",
-    1354: "ID3D10Device::GetPrivateData",
-    1355: "ID3D10Device::SetPrivateData",
-    1356: "ID3D10Device::SetPrivateDataInterface",
-    1357: "ID3D10Device::ClearState",
-    1358: "ID3D10Device::Flush",
-    1359: "ID3D10Device::CreateBuffer",
-    1360: "ID3D10Device::CreateTexture1D",
-    1361: "ID3D10Device::CreateTexture2D",
-    1362: "ID3D10Device::CreateTexture3D",
-    1363: "ID3D10Device::CreateShaderResourceView",
-    1364: "ID3D10Device::CreateRenderTargetView",
-    1365: "ID3D10Device::CreateDepthStencilView",
-    1366: "ID3D10Device::CreateInputLayout",
-    1367: "ID3D10Device::CreateVertexShader",
-    1368: "ID3D10Device::CreateGeometryShader",
-    1369: "ID3D10Device::CreateGeometryShaderWithStreamOutput",
-    1370: "ID3D10Device::CreatePixelShader",
-    1371: "ID3D10Device::CreateBlendState",
-    1372: "ID3D10Device::CreateDepthStencilState",
-    1373: "ID3D10Device::CreateRasterizerState",
-    1374: "ID3D10Device::CreateSamplerState",
-    1375: "ID3D10Device::CreateQuery",
-    1376: "ID3D10Device::CreatePredicate",
-    1377: "ID3D10Device::CreateCounter",
-    1378: "ID3D10Device::CheckFormatSupport",
-    1379: "ID3D10Device::CheckMultisampleQualityLevels",
-    1380: "ID3D10Device::CheckCounterInfo",
-    1381: "ID3D10Device::CheckCounter",
-    1382: "ID3D10Device::GetCreationFlags",
-    1383: "ID3D10Device::OpenSharedResource",
-    1384: "ID3D10Multithread::QueryInterface",
-    1385: "ID3D10Multithread::AddRef",
-    1386: "ID3D10Multithread::Release",
-    1387: "ID3D10Multithread::Enter",
-    1388: "ID3D10Multithread::Leave",
-    1389: "ID3D10Multithread::SetMultithreadProtected",
-    1390: "ID3D10Multithread::GetMultithreadProtected",
-    1391: "ID3D10StateBlock::QueryInterface",
-    1392: "ID3D10StateBlock::AddRef",
-    1393: "ID3D10StateBlock::Release",
-    1394: "ID3D10StateBlock::Capture",
-    1395: "ID3D10StateBlock::Apply",
-    1396: "ID3D10StateBlock::ReleaseAllDeviceObjects",
-    1397: "ID3D10StateBlock::GetDevice",
-    1398: "ID3D10Effect::QueryInterface",
-    1399: "ID3D10Effect::AddRef",
-    1400: "ID3D10Effect::Release",
-    1401: "ID3D10Effect::IsValid",
-    1402: "ID3D10Effect::IsPool",
-    1403: "ID3D10Effect::GetDevice",
-    1404: "ID3D10Effect::GetDesc",
-    1405: "ID3D10Effect::GetConstantBufferByIndex",
-    1406: "ID3D10Effect::GetConstantBufferByName",
-    1407: "ID3D10Effect::GetVariableByIndex",
-    1408: "ID3D10Effect::GetVariableByName",
-    1409: "ID3D10Effect::GetVariableBySemantic",
-    1410: "ID3D10Effect::GetTechniqueByIndex",
-    1411: "ID3D10Effect::GetTechniqueByName",
-    1412: "ID3D10Effect::Optimize",
-    1413: "ID3D10Effect::IsOptimized",
-    1414: "ID3D10EffectPool::QueryInterface",
-    1415: "ID3D10EffectPool::AddRef",
-    1416: "ID3D10EffectPool::Release",
-    1417: "ID3D10EffectPool::AsEffect",
-    1418: "ID3D10EffectTechnique::IsValid",
-    1419: "ID3D10EffectTechnique::GetDesc",
-    1420: "ID3D10EffectTechnique::GetAnnotationByIndex",
-    1421: "ID3D10EffectTechnique::GetAnnotationByName",
-    1422: "ID3D10EffectTechnique::GetPassByIndex",
-    1423: "ID3D10EffectTechnique::GetPassByName",
-    1424: "ID3D10EffectTechnique::ComputeStateBlockMask",
-    1425: "ID3D10EffectPass::IsValid",
-    1426: "ID3D10EffectPass::GetDesc",
-    1427: "ID3D10EffectPass::GetVertexShaderDesc",
-    1428: "ID3D10EffectPass::GetGeometryShaderDesc",
-    1429: "ID3D10EffectPass::GetPixelShaderDesc",
-    1430: "ID3D10EffectPass::GetAnnotationByIndex",
-    1431: "ID3D10EffectPass::GetAnnotationByName",
-    1432: "ID3D10EffectPass::Apply",
-    1433: "ID3D10EffectPass::ComputeStateBlockMask",
-    1434: "ID3D10EffectVariable::IsValid",
-    1435: "ID3D10EffectVariable::GetType",
-    1436: "ID3D10EffectVariable::GetDesc",
-    1437: "ID3D10EffectVariable::GetAnnotationByIndex",
-    1438: "ID3D10EffectVariable::GetAnnotationByName",
-    1439: "ID3D10EffectVariable::GetMemberByIndex",
-    1440: "ID3D10EffectVariable::GetMemberByName",
-    1441: "ID3D10EffectVariable::GetMemberBySemantic",
-    1442: "ID3D10EffectVariable::GetElement",
-    1443: "ID3D10EffectVariable::GetParentConstantBuffer",
-    1444: "ID3D10EffectVariable::AsScalar",
-    1445: "ID3D10EffectVariable::AsVector",
-    1446: "ID3D10EffectVariable::AsMatrix",
-    1447: "ID3D10EffectVariable::AsString",
-    1448: "ID3D10EffectVariable::AsShaderResource",
-    1449: "ID3D10EffectVariable::AsRenderTargetView",
-    1450: "ID3D10EffectVariable::AsDepthStencilView",
-    1451: "ID3D10EffectVariable::AsConstantBuffer",
-    1452: "ID3D10EffectVariable::AsShader",
-    1453: "ID3D10EffectVariable::AsBlend",
-    1454: "ID3D10EffectVariable::AsDepthStencil",
-    1455: "ID3D10EffectVariable::AsRasterizer",
-    1456: "ID3D10EffectVariable::AsSampler",
-    1457: "ID3D10EffectVariable::SetRawValue",
-    1458: "ID3D10EffectVariable::GetRawValue",
-    1459: "ID3D10EffectScalarVariable::IsValid",
-    1460: "ID3D10EffectScalarVariable::GetType",
-    1461: "ID3D10EffectScalarVariable::GetDesc",
-    1462: "ID3D10EffectScalarVariable::GetAnnotationByIndex",
-    1463: "ID3D10EffectScalarVariable::GetAnnotationByName",
-    1464: "ID3D10EffectScalarVariable::GetMemberByIndex",
-    1465: "ID3D10EffectScalarVariable::GetMemberByName",
-    1466: "ID3D10EffectScalarVariable::GetMemberBySemantic",
-    1467: "ID3D10EffectScalarVariable::GetElement",
-    1468: "ID3D10EffectScalarVariable::GetParentConstantBuffer",
-    1469: "ID3D10EffectScalarVariable::AsScalar",
-    1470: "ID3D10EffectScalarVariable::AsVector",
-    1471: "ID3D10EffectScalarVariable::AsMatrix",
-    1472: "ID3D10EffectScalarVariable::AsString",
-    1473: "ID3D10EffectScalarVariable::AsShaderResource",
-    1474: "ID3D10EffectScalarVariable::AsRenderTargetView",
-    1475: "ID3D10EffectScalarVariable::AsDepthStencilView",
-    1476: "ID3D10EffectScalarVariable::AsConstantBuffer",
-    1477: "ID3D10EffectScalarVariable::AsShader",
-    1478: "ID3D10EffectScalarVariable::AsBlend",
-    1479: "ID3D10EffectScalarVariable::AsDepthStencil",
-    1480: "ID3D10EffectScalarVariable::AsRasterizer",
-    1481: "ID3D10EffectScalarVariable::AsSampler",
-    1482: "ID3D10EffectScalarVariable::SetRawValue",
-    1483: "ID3D10EffectScalarVariable::GetRawValue",
-    1484: "ID3D10EffectScalarVariable::SetFloat",
-    1485: "ID3D10EffectScalarVariable::GetFloat",
-    1486: "ID3D10EffectScalarVariable::SetFloatArray",
-    1487: "ID3D10EffectScalarVariable::GetFloatArray",
-    1488: "ID3D10EffectScalarVariable::SetInt",
-    1489: "ID3D10EffectScalarVariable::GetInt",
-    1490: "ID3D10EffectScalarVariable::SetIntArray",
-    1491: "ID3D10EffectScalarVariable::GetIntArray",
-    1492: "ID3D10EffectScalarVariable::SetBool",
-    1493: "ID3D10EffectScalarVariable::GetBool",
-    1494: "ID3D10EffectScalarVariable::SetBoolArray",
-    1495: "ID3D10EffectScalarVariable::GetBoolArray",
-    1496: "ID3D10EffectVectorVariable::IsValid",
-    1497: "ID3D10EffectVectorVariable::GetType",
-    1498: "ID3D10EffectVectorVariable::GetDesc",
-    1499: "ID3D10EffectVectorVariable::GetAnnotationByIndex",
-    1500: "ID3D10EffectVectorVariable::GetAnnotationByName",
-    1501: "ID3D10EffectVectorVariable::GetMemberByIndex",
-    1502: "ID3D10EffectVectorVariable::GetMemberByName",
-    1503: "ID3D10EffectVectorVariable::GetMemberBySemantic",
-    1504: "ID3D10EffectVectorVariable::GetElement",
-    1505: "ID3D10EffectVectorVariable::GetParentConstantBuffer",
-    1506: "ID3D10EffectVectorVariable::AsScalar",
-    1507: "ID3D10EffectVectorVariable::AsVector",
-    1508: "ID3D10EffectVectorVariable::AsMatrix",
-    1509: "ID3D10EffectVectorVariable::AsString",
-    1510: "ID3D10EffectVectorVariable::AsShaderResource",
-    1511: "ID3D10EffectVectorVariable::AsRenderTargetView",
-    1512: "ID3D10EffectVectorVariable::AsDepthStencilView",
-    1513: "ID3D10EffectVectorVariable::AsConstantBuffer",
-    1514: "ID3D10EffectVectorVariable::AsShader",
-    1515: "ID3D10EffectVectorVariable::AsBlend",
-    1516: "ID3D10EffectVectorVariable::AsDepthStencil",
-    1517: "ID3D10EffectVectorVariable::AsRasterizer",
-    1518: "ID3D10EffectVectorVariable::AsSampler",
-    1519: "ID3D10EffectVectorVariable::SetRawValue",
-    1520: "ID3D10EffectVectorVariable::GetRawValue",
-    1521: "ID3D10EffectVectorVariable::SetBoolVector",
-    1522: "ID3D10EffectVectorVariable::SetIntVector",
-    1523: "ID3D10EffectVectorVariable::SetFloatVector",
-    1524: "ID3D10EffectVectorVariable::GetBoolVector",
-    1525: "ID3D10EffectVectorVariable::GetIntVector",
-    1526: "ID3D10EffectVectorVariable::GetFloatVector",
-    1527: "ID3D10EffectVectorVariable::SetBoolVectorArray",
-    1528: "ID3D10EffectVectorVariable::SetIntVectorArray",
-    1529: "ID3D10EffectVectorVariable::SetFloatVectorArray",
-    1530: "ID3D10EffectVectorVariable::GetBoolVectorArray",
-    1531: "ID3D10EffectVectorVariable::GetIntVectorArray",
-    1532: "ID3D10EffectVectorVariable::GetFloatVectorArray",
-    1533: "ID3D10EffectMatrixVariable::IsValid",
-    1534: "ID3D10EffectMatrixVariable::GetType",
-    1535: "ID3D10EffectMatrixVariable::GetDesc",
-    1536: "ID3D10EffectMatrixVariable::GetAnnotationByIndex",
-    1537: "ID3D10EffectMatrixVariable::GetAnnotationByName",
-    1538: "ID3D10EffectMatrixVariable::GetMemberByIndex",
-    1539: "ID3D10EffectMatrixVariable::GetMemberByName",
-    1540: "ID3D10EffectMatrixVariable::GetMemberBySemantic",
-    1541: "ID3D10EffectMatrixVariable::GetElement",
-    1542: "ID3D10EffectMatrixVariable::GetParentConstantBuffer",
-    1543: "ID3D10EffectMatrixVariable::AsScalar",
-    1544: "ID3D10EffectMatrixVariable::AsVector",
-    1545: "ID3D10EffectMatrixVariable::AsMatrix",
-    1546: "ID3D10EffectMatrixVariable::AsString",
-    1547: "ID3D10EffectMatrixVariable::AsShaderResource",
-    1548: "ID3D10EffectMatrixVariable::AsRenderTargetView",
-    1549: "ID3D10EffectMatrixVariable::AsDepthStencilView",
-    1550: "ID3D10EffectMatrixVariable::AsConstantBuffer",
-    1551: "ID3D10EffectMatrixVariable::AsShader",
-    1552: "ID3D10EffectMatrixVariable::AsBlend",
-    1553: "ID3D10EffectMatrixVariable::AsDepthStencil",
-    1554: "ID3D10EffectMatrixVariable::AsRasterizer",
-    1555: "ID3D10EffectMatrixVariable::AsSampler",
-    1556: "ID3D10EffectMatrixVariable::SetRawValue",
-    1557: "ID3D10EffectMatrixVariable::GetRawValue",
-    1558: "ID3D10EffectMatrixVariable::SetMatrix",
-    1559: "ID3D10EffectMatrixVariable::GetMatrix",
-    1560: "ID3D10EffectMatrixVariable::SetMatrixArray",
-    1561: "ID3D10EffectMatrixVariable::GetMatrixArray",
-    1562: "ID3D10EffectMatrixVariable::SetMatrixTranspose",
-    1563: "ID3D10EffectMatrixVariable::GetMatrixTranspose",
-    1564: "ID3D10EffectMatrixVariable::SetMatrixTransposeArray",
-    1565: "ID3D10EffectMatrixVariable::GetMatrixTransposeArray",
-    1566: "ID3D10EffectStringVariable::IsValid",
-    1567: "ID3D10EffectStringVariable::GetType",
-    1568: "ID3D10EffectStringVariable::GetDesc",
-    1569: "ID3D10EffectStringVariable::GetAnnotationByIndex",
-    1570: "ID3D10EffectStringVariable::GetAnnotationByName",
-    1571: "ID3D10EffectStringVariable::GetMemberByIndex",
-    1572: "ID3D10EffectStringVariable::GetMemberByName",
-    1573: "ID3D10EffectStringVariable::GetMemberBySemantic",
-    1574: "ID3D10EffectStringVariable::GetElement",
-    1575: "ID3D10EffectStringVariable::GetParentConstantBuffer",
-    1576: "ID3D10EffectStringVariable::AsScalar",
-    1577: "ID3D10EffectStringVariable::AsVector",
-    1578: "ID3D10EffectStringVariable::AsMatrix",
-    1579: "ID3D10EffectStringVariable::AsString",
-    1580: "ID3D10EffectStringVariable::AsShaderResource",
-    1581: "ID3D10EffectStringVariable::AsRenderTargetView",
-    1582: "ID3D10EffectStringVariable::AsDepthStencilView",
-    1583: "ID3D10EffectStringVariable::AsConstantBuffer",
-    1584: "ID3D10EffectStringVariable::AsShader",
-    1585: "ID3D10EffectStringVariable::AsBlend",
-    1586: "ID3D10EffectStringVariable::AsDepthStencil",
-    1587: "ID3D10EffectStringVariable::AsRasterizer",
-    1588: "ID3D10EffectStringVariable::AsSampler",
-    1589: "ID3D10EffectStringVariable::SetRawValue",
-    1590: "ID3D10EffectStringVariable::GetRawValue",
-    1591: "ID3D10EffectStringVariable::GetString",
-    1592: "ID3D10EffectStringVariable::GetStringArray",
-    1593: "ID3D10EffectShaderResourceVariable::IsValid",
-    1594: "ID3D10EffectShaderResourceVariable::GetType",
-    1595: "ID3D10EffectShaderResourceVariable::GetDesc",
-    1596: "ID3D10EffectShaderResourceVariable::GetAnnotationByIndex",
-    1597: "ID3D10EffectShaderResourceVariable::GetAnnotationByName",
-    1598: "ID3D10EffectShaderResourceVariable::GetMemberByIndex",
-    1599: "ID3D10EffectShaderResourceVariable::GetMemberByName",
-    1600: "ID3D10EffectShaderResourceVariable::GetMemberBySemantic",
-    1601: "ID3D10EffectShaderResourceVariable::GetElement",
-    1602: "ID3D10EffectShaderResourceVariable::GetParentConstantBuffer",
-    1603: "ID3D10EffectShaderResourceVariable::AsScalar",
-    1604: "ID3D10EffectShaderResourceVariable::AsVector",
-    1605: "ID3D10EffectShaderResourceVariable::AsMatrix",
-    1606: "ID3D10EffectShaderResourceVariable::AsString",
-    1607: "ID3D10EffectShaderResourceVariable::AsShaderResource",
-    1608: "ID3D10EffectShaderResourceVariable::AsRenderTargetView",
-    1609: "ID3D10EffectShaderResourceVariable::AsDepthStencilView",
-    1610: "ID3D10EffectShaderResourceVariable::AsConstantBuffer",
-    1611: "ID3D10EffectShaderResourceVariable::AsShader",
-    1612: "ID3D10EffectShaderResourceVariable::AsBlend",
-    1613: "ID3D10EffectShaderResourceVariable::AsDepthStencil",
-    1614: "ID3D10EffectShaderResourceVariable::AsRasterizer",
-    1615: "ID3D10EffectShaderResourceVariable::AsSampler",
-    1616: "ID3D10EffectShaderResourceVariable::SetRawValue",
-    1617: "ID3D10EffectShaderResourceVariable::GetRawValue",
-    1618: "ID3D10EffectShaderResourceVariable::SetResource",
-    1619: "ID3D10EffectShaderResourceVariable::GetResource",
-    1620: "ID3D10EffectShaderResourceVariable::SetResourceArray",
-    1621: "ID3D10EffectShaderResourceVariable::GetResourceArray",
-    1622: "ID3D10EffectRenderTargetViewVariable::IsValid",
-    1623: "ID3D10EffectRenderTargetViewVariable::GetType",
-    1624: "ID3D10EffectRenderTargetViewVariable::GetDesc",
-    1625: "ID3D10EffectRenderTargetViewVariable::GetAnnotationByIndex",
-    1626: "ID3D10EffectRenderTargetViewVariable::GetAnnotationByName",
-    1627: "ID3D10EffectRenderTargetViewVariable::GetMemberByIndex",
-    1628: "ID3D10EffectRenderTargetViewVariable::GetMemberByName",
-    1629: "ID3D10EffectRenderTargetViewVariable::GetMemberBySemantic",
-    1630: "ID3D10EffectRenderTargetViewVariable::GetElement",
-    1631: "ID3D10EffectRenderTargetViewVariable::GetParentConstantBuffer",
-    1632: "ID3D10EffectRenderTargetViewVariable::AsScalar",
-    1633: "ID3D10EffectRenderTargetViewVariable::AsVector",
-    1634: "ID3D10EffectRenderTargetViewVariable::AsMatrix",
-    1635: "ID3D10EffectRenderTargetViewVariable::AsString",
-    1636: "ID3D10EffectRenderTargetViewVariable::AsShaderResource",
-    1637: "ID3D10EffectRenderTargetViewVariable::AsRenderTargetView",
-    1638: "ID3D10EffectRenderTargetViewVariable::AsDepthStencilView",
-    1639: "ID3D10EffectRenderTargetViewVariable::AsConstantBuffer",
-    1640: "ID3D10EffectRenderTargetViewVariable::AsShader",
-    1641: "ID3D10EffectRenderTargetViewVariable::AsBlend",
-    1642: "ID3D10EffectRenderTargetViewVariable::AsDepthStencil",
-    1643: "ID3D10EffectRenderTargetViewVariable::AsRasterizer",
-    1644: "ID3D10EffectRenderTargetViewVariable::AsSampler",
-    1645: "ID3D10EffectRenderTargetViewVariable::SetRawValue",
-    1646: "ID3D10EffectRenderTargetViewVariable::GetRawValue",
-    1647: "ID3D10EffectRenderTargetViewVariable::SetRenderTarget",
-    1648: "ID3D10EffectRenderTargetViewVariable::GetRenderTarget",
-    1649: "ID3D10EffectRenderTargetViewVariable::SetRenderTargetArray",
-    1650: "ID3D10EffectRenderTargetViewVariable::GetRenderTargetArray",
-    1651: "ID3D10EffectDepthStencilViewVariable::IsValid",
-    1652: "ID3D10EffectDepthStencilViewVariable::GetType",
-    1653: "ID3D10EffectDepthStencilViewVariable::GetDesc",
-    1654: "ID3D10EffectDepthStencilViewVariable::GetAnnotationByIndex",
-    1655: "ID3D10EffectDepthStencilViewVariable::GetAnnotationByName",
-    1656: "ID3D10EffectDepthStencilViewVariable::GetMemberByIndex",
-    1657: "ID3D10EffectDepthStencilViewVariable::GetMemberByName",
-    1658: "ID3D10EffectDepthStencilViewVariable::GetMemberBySemantic",
-    1659: "ID3D10EffectDepthStencilViewVariable::GetElement",
-    1660: "ID3D10EffectDepthStencilViewVariable::GetParentConstantBuffer",
-    1661: "ID3D10EffectDepthStencilViewVariable::AsScalar",
-    1662: "ID3D10EffectDepthStencilViewVariable::AsVector",
-    1663: "ID3D10EffectDepthStencilViewVariable::AsMatrix",
-    1664: "ID3D10EffectDepthStencilViewVariable::AsString",
-    1665: "ID3D10EffectDepthStencilViewVariable::AsShaderResource",
-    1666: "ID3D10EffectDepthStencilViewVariable::AsRenderTargetView",
-    1667: "ID3D10EffectDepthStencilViewVariable::AsDepthStencilView",
-    1668: "ID3D10EffectDepthStencilViewVariable::AsConstantBuffer",
-    1669: "ID3D10EffectDepthStencilViewVariable::AsShader",
-    1670: "ID3D10EffectDepthStencilViewVariable::AsBlend",
-    1671: "ID3D10EffectDepthStencilViewVariable::AsDepthStencil",
-    1672: "ID3D10EffectDepthStencilViewVariable::AsRasterizer",
-    1673: "ID3D10EffectDepthStencilViewVariable::AsSampler",
-    1674: "ID3D10EffectDepthStencilViewVariable::SetRawValue",
-    1675: "ID3D10EffectDepthStencilViewVariable::GetRawValue",
-    1676: "ID3D10EffectDepthStencilViewVariable::SetDepthStencil",
-    1677: "ID3D10EffectDepthStencilViewVariable::GetDepthStencil",
-    1678: "ID3D10EffectDepthStencilViewVariable::SetDepthStencilArray",
-    1679: "ID3D10EffectDepthStencilViewVariable::GetDepthStencilArray",
-    1680: "ID3D10EffectConstantBuffer::IsValid",
-    1681: "ID3D10EffectConstantBuffer::GetType",
-    1682: "ID3D10EffectConstantBuffer::GetDesc",
-    1683: "ID3D10EffectConstantBuffer::GetAnnotationByIndex",
-    1684: "ID3D10EffectConstantBuffer::GetAnnotationByName",
-    1685: "ID3D10EffectConstantBuffer::GetMemberByIndex",
-    1686: "ID3D10EffectConstantBuffer::GetMemberByName",
-    1687: "ID3D10EffectConstantBuffer::GetMemberBySemantic",
-    1688: "ID3D10EffectConstantBuffer::GetElement",
-    1689: "ID3D10EffectConstantBuffer::GetParentConstantBuffer",
-    1690: "ID3D10EffectConstantBuffer::AsScalar",
-    1691: "ID3D10EffectConstantBuffer::AsVector",
-    1692: "ID3D10EffectConstantBuffer::AsMatrix",
-    1693: "ID3D10EffectConstantBuffer::AsString",
-    1694: "ID3D10EffectConstantBuffer::AsShaderResource",
-    1695: "ID3D10EffectConstantBuffer::AsRenderTargetView",
-    1696: "ID3D10EffectConstantBuffer::AsDepthStencilView",
-    1697: "ID3D10EffectConstantBuffer::AsConstantBuffer",
-    1698: "ID3D10EffectConstantBuffer::AsShader",
-    1699: "ID3D10EffectConstantBuffer::AsBlend",
-    1700: "ID3D10EffectConstantBuffer::AsDepthStencil",
-    1701: "ID3D10EffectConstantBuffer::AsRasterizer",
-    1702: "ID3D10EffectConstantBuffer::AsSampler",
-    1703: "ID3D10EffectConstantBuffer::SetRawValue",
-    1704: "ID3D10EffectConstantBuffer::GetRawValue",
-    1705: "ID3D10EffectConstantBuffer::SetConstantBuffer",
-    1706: "ID3D10EffectConstantBuffer::GetConstantBuffer",
-    1707: "ID3D10EffectConstantBuffer::SetTextureBuffer",
-    1708: "ID3D10EffectConstantBuffer::GetTextureBuffer",
-    1709: "ID3D10EffectShaderVariable::IsValid",
-    1710: "ID3D10EffectShaderVariable::GetType",
-    1711: "ID3D10EffectShaderVariable::GetDesc",
-    1712: "ID3D10EffectShaderVariable::GetAnnotationByIndex",
-    1713: "ID3D10EffectShaderVariable::GetAnnotationByName",
-    1714: "ID3D10EffectShaderVariable::GetMemberByIndex",
-    1715: "ID3D10EffectShaderVariable::GetMemberByName",
-    1716: "ID3D10EffectShaderVariable::GetMemberBySemantic",
-    1717: "ID3D10EffectShaderVariable::GetElement",
-    1718: "ID3D10EffectShaderVariable::GetParentConstantBuffer",
-    1719: "ID3D10EffectShaderVariable::AsScalar",
-    1720: "ID3D10EffectShaderVariable::AsVector",
-    1721: "ID3D10EffectShaderVariable::AsMatrix",
-    1722: "ID3D10EffectShaderVariable::AsString",
-    1723: "ID3D10EffectShaderVariable::AsShaderResource",
-    1724: "ID3D10EffectShaderVariable::AsRenderTargetView",
-    1725: "ID3D10EffectShaderVariable::AsDepthStencilView",
-    1726: "ID3D10EffectShaderVariable::AsConstantBuffer",
-    1727: "ID3D10EffectShaderVariable::AsShader",
-    1728: "ID3D10EffectShaderVariable::AsBlend",
-    1729: "ID3D10EffectShaderVariable::AsDepthStencil",
-    1730: "ID3D10EffectShaderVariable::AsRasterizer",
-    1731: "ID3D10EffectShaderVariable::AsSampler",
-    1732: "ID3D10EffectShaderVariable::SetRawValue",
-    1733: "ID3D10EffectShaderVariable::GetRawValue",
-    1734: "ID3D10EffectShaderVariable::GetShaderDesc",
-    1735: "ID3D10EffectShaderVariable::GetVertexShader",
-    1736: "ID3D10EffectShaderVariable::GetGeometryShader",
-    1737: "ID3D10EffectShaderVariable::GetPixelShader",
-    1738: "ID3D10EffectShaderVariable::GetInputSignatureElementDesc",
-    1739: "ID3D10EffectShaderVariable::GetOutputSignatureElementDesc",
-    1740: "ID3D10EffectBlendVariable::IsValid",
-    1741: "ID3D10EffectBlendVariable::GetType",
-    1742: "ID3D10EffectBlendVariable::GetDesc",
-    1743: "ID3D10EffectBlendVariable::GetAnnotationByIndex",
-    1744: "ID3D10EffectBlendVariable::GetAnnotationByName",
-    1745: "ID3D10EffectBlendVariable::GetMemberByIndex",
-    1746: "ID3D10EffectBlendVariable::GetMemberByName",
-    1747: "ID3D10EffectBlendVariable::GetMemberBySemantic",
-    1748: "ID3D10EffectBlendVariable::GetElement",
-    1749: "ID3D10EffectBlendVariable::GetParentConstantBuffer",
-    1750: "ID3D10EffectBlendVariable::AsScalar",
-    1751: "ID3D10EffectBlendVariable::AsVector",
-    1752: "ID3D10EffectBlendVariable::AsMatrix",
-    1753: "ID3D10EffectBlendVariable::AsString",
-    1754: "ID3D10EffectBlendVariable::AsShaderResource",
-    1755: "ID3D10EffectBlendVariable::AsRenderTargetView",
-    1756: "ID3D10EffectBlendVariable::AsDepthStencilView",
-    1757: "ID3D10EffectBlendVariable::AsConstantBuffer",
-    1758: "ID3D10EffectBlendVariable::AsShader",
-    1759: "ID3D10EffectBlendVariable::AsBlend",
-    1760: "ID3D10EffectBlendVariable::AsDepthStencil",
-    1761: "ID3D10EffectBlendVariable::AsRasterizer",
-    1762: "ID3D10EffectBlendVariable::AsSampler",
-    1763: "ID3D10EffectBlendVariable::SetRawValue",
-    1764: "ID3D10EffectBlendVariable::GetRawValue",
-    1765: "ID3D10EffectBlendVariable::GetBlendState",
-    1766: "ID3D10EffectBlendVariable::GetBackingStore",
-    1767: "ID3D10EffectDepthStencilVariable::IsValid",
-    1768: "ID3D10EffectDepthStencilVariable::GetType",
-    1769: "ID3D10EffectDepthStencilVariable::GetDesc",
-    1770: "ID3D10EffectDepthStencilVariable::GetAnnotationByIndex",
-    1771: "ID3D10EffectDepthStencilVariable::GetAnnotationByName",
-    1772: "ID3D10EffectDepthStencilVariable::GetMemberByIndex",
-    1773: "ID3D10EffectDepthStencilVariable::GetMemberByName",
-    1774: "ID3D10EffectDepthStencilVariable::GetMemberBySemantic",
-    1775: "ID3D10EffectDepthStencilVariable::GetElement",
-    1776: "ID3D10EffectDepthStencilVariable::GetParentConstantBuffer",
-    1777: "ID3D10EffectDepthStencilVariable::AsScalar",
-    1778: "ID3D10EffectDepthStencilVariable::AsVector",
-    1779: "ID3D10EffectDepthStencilVariable::AsMatrix",
-    1780: "ID3D10EffectDepthStencilVariable::AsString",
-    1781: "ID3D10EffectDepthStencilVariable::AsShaderResource",
-    1782: "ID3D10EffectDepthStencilVariable::AsRenderTargetView",
-    1783: "ID3D10EffectDepthStencilVariable::AsDepthStencilView",
-    1784: "ID3D10EffectDepthStencilVariable::AsConstantBuffer",
-    1785: "ID3D10EffectDepthStencilVariable::AsShader",
-    1786: "ID3D10EffectDepthStencilVariable::AsBlend",
-    1787: "ID3D10EffectDepthStencilVariable::AsDepthStencil",
-    1788: "ID3D10EffectDepthStencilVariable::AsRasterizer",
-    1789: "ID3D10EffectDepthStencilVariable::AsSampler",
-    1790: "ID3D10EffectDepthStencilVariable::SetRawValue",
-    1791: "ID3D10EffectDepthStencilVariable::GetRawValue",
-    1792: "ID3D10EffectDepthStencilVariable::GetDepthStencilState",
-    1793: "ID3D10EffectDepthStencilVariable::GetBackingStore",
-    1794: "ID3D10EffectRasterizerVariable::IsValid",
-    1795: "ID3D10EffectRasterizerVariable::GetType",
-    1796: "ID3D10EffectRasterizerVariable::GetDesc",
-    1797: "ID3D10EffectRasterizerVariable::GetAnnotationByIndex",
-    1798: "ID3D10EffectRasterizerVariable::GetAnnotationByName",
-    1799: "ID3D10EffectRasterizerVariable::GetMemberByIndex",
-    1800: "ID3D10EffectRasterizerVariable::GetMemberByName",
-    1801: "ID3D10EffectRasterizerVariable::GetMemberBySemantic",
-    1802: "ID3D10EffectRasterizerVariable::GetElement",
-    1803: "ID3D10EffectRasterizerVariable::GetParentConstantBuffer",
-    1804: "ID3D10EffectRasterizerVariable::AsScalar",
-    1805: "ID3D10EffectRasterizerVariable::AsVector",
-    1806: "ID3D10EffectRasterizerVariable::AsMatrix",
-    1807: "ID3D10EffectRasterizerVariable::AsString",
-    1808: "ID3D10EffectRasterizerVariable::AsShaderResource",
-    1809: "ID3D10EffectRasterizerVariable::AsRenderTargetView",
-    1810: "ID3D10EffectRasterizerVariable::AsDepthStencilView",
-    1811: "ID3D10EffectRasterizerVariable::AsConstantBuffer",
-    1812: "ID3D10EffectRasterizerVariable::AsShader",
-    1813: "ID3D10EffectRasterizerVariable::AsBlend",
-    1814: "ID3D10EffectRasterizerVariable::AsDepthStencil",
-    1815: "ID3D10EffectRasterizerVariable::AsRasterizer",
-    1816: "ID3D10EffectRasterizerVariable::AsSampler",
-    1817: "ID3D10EffectRasterizerVariable::SetRawValue",
-    1818: "ID3D10EffectRasterizerVariable::GetRawValue",
-    1819: "ID3D10EffectRasterizerVariable::GetRasterizerState",
-    1820: "ID3D10EffectRasterizerVariable::GetBackingStore",
-    1821: "ID3D10EffectSamplerVariable::IsValid",
-    1822: "ID3D10EffectSamplerVariable::GetType",
-    1823: "ID3D10EffectSamplerVariable::GetDesc",
-    1824: "ID3D10EffectSamplerVariable::GetAnnotationByIndex",
-    1825: "ID3D10EffectSamplerVariable::GetAnnotationByName",
-    1826: "ID3D10EffectSamplerVariable::GetMemberByIndex",
-    1827: "ID3D10EffectSamplerVariable::GetMemberByName",
-    1828: "ID3D10EffectSamplerVariable::GetMemberBySemantic",
-    1829: "ID3D10EffectSamplerVariable::GetElement",
-    1830: "ID3D10EffectSamplerVariable::GetParentConstantBuffer",
-    1831: "ID3D10EffectSamplerVariable::AsScalar",
-    1832: "ID3D10EffectSamplerVariable::AsVector",
-    1833: "ID3D10EffectSamplerVariable::AsMatrix",
-    1834: "ID3D10EffectSamplerVariable::AsString",
-    1835: "ID3D10EffectSamplerVariable::AsShaderResource",
-    1836: "ID3D10EffectSamplerVariable::AsRenderTargetView",
-    1837: "ID3D10EffectSamplerVariable::AsDepthStencilView",
-    1838: "ID3D10EffectSamplerVariable::AsConstantBuffer",
-    1839: "ID3D10EffectSamplerVariable::AsShader",
-    1840: "ID3D10EffectSamplerVariable::AsBlend",
-    1841: "ID3D10EffectSamplerVariable::AsDepthStencil",
-    1842: "ID3D10EffectSamplerVariable::AsRasterizer",
-    1843: "ID3D10EffectSamplerVariable::AsSampler",
-    1844: "ID3D10EffectSamplerVariable::SetRawValue",
-    1845: "ID3D10EffectSamplerVariable::GetRawValue",
-    1846: "ID3D10EffectSamplerVariable::GetSampler",
-    1847: "ID3D10EffectSamplerVariable::GetBackingStore",
-    1848: "ID3D10Device::SetTextFilterSize",
-    1849: "ID3D10Device::GetTextFilterSize",
-    1874: "IDXGIResource::QueryInterface",
-    1875: "IDXGIResource::AddRef",
-    1876: "IDXGIResource::Release",
-    1877: "IDXGIResource::SetPrivateData",
-    1878: "IDXGIResource::SetPrivateDataInterface",
-    1879: "IDXGIResource::GetPrivateData",
-    1880: "IDXGIResource::GetParent",
-    1881: "IDXGIResource::GetDevice",
-    1882: "IDXGIResource::GetSharedHandle",
-    1883: "IDXGIResource::GetUsage",
-    1884: "IDXGIResource::SetEvictionPriority",
-    1885: "IDXGIResource::GetEvictionPriority",
-    1886: "CreateDXGIFactory1",
-    1887: "IDXGIKeyedMutex::QueryInterface",
-    1888: "IDXGIKeyedMutex::AddRef",
-    1889: "IDXGIKeyedMutex::Release",
-    1890: "IDXGIKeyedMutex::SetPrivateData",
-    1891: "IDXGIKeyedMutex::SetPrivateDataInterface",
-    1892: "IDXGIKeyedMutex::GetPrivateData",
-    1893: "IDXGIKeyedMutex::GetParent",
-    1894: "IDXGIKeyedMutex::GetDevice",
-    1895: "IDXGIKeyedMutex::AcquireSync",
-    1896: "IDXGIKeyedMutex::ReleaseSync",
-    1897: "IDXGISurface::GetDC",
-    1898: "IDXGISurface::ReleaseDC",
-    1899: "IDXGIFactory::EnumAdapters1",
-    1900: "IDXGIFactory::IsCurrent",
-    1901: "IDXGIAdapter::GetDesc1",
-    1902: "IDXGIDevice::SetMaximumFrameLatency",
-    1903: "IDXGIDevice::GetMaximumFrameLatency",
-    2000: "D3D11CreateDevice",
-    2001: "D3D11CreateDeviceAndSwapChain",
-    2011: "ID3D11DepthStencilState::QueryInterface",
-    2012: "ID3D11DepthStencilState::AddRef",
-    2013: "ID3D11DepthStencilState::Release",
-    2014: "ID3D11DepthStencilState::GetDevice",
-    2015: "ID3D11DepthStencilState::GetPrivateData",
-    2016: "ID3D11DepthStencilState::SetPrivateData",
-    2017: "ID3D11DepthStencilState::SetPrivateDataInterface",
-    2018: "ID3D11DepthStencilState::GetDesc",
-    2019: "ID3D11BlendState::QueryInterface",
-    2020: "ID3D11BlendState::AddRef",
-    2021: "ID3D11BlendState::Release",
-    2022: "ID3D11BlendState::GetDevice",
-    2023: "ID3D11BlendState::GetPrivateData",
-    2024: "ID3D11BlendState::SetPrivateData",
-    2025: "ID3D11BlendState::SetPrivateDataInterface",
-    2026: "ID3D11BlendState::GetDesc",
-    2027: "ID3D11RasterizerState::QueryInterface",
-    2028: "ID3D11RasterizerState::AddRef",
-    2029: "ID3D11RasterizerState::Release",
-    2030: "ID3D11RasterizerState::GetDevice",
-    2031: "ID3D11RasterizerState::GetPrivateData",
-    2032: "ID3D11RasterizerState::SetPrivateData",
-    2033: "ID3D11RasterizerState::SetPrivateDataInterface",
-    2034: "ID3D11RasterizerState::GetDesc",
-    2035: "ID3D11Buffer::QueryInterface",
-    2036: "ID3D11Buffer::AddRef",
-    2037: "ID3D11Buffer::Release",
-    2038: "ID3D11Buffer::GetDevice",
-    2039: "ID3D11Buffer::GetPrivateData",
-    2040: "ID3D11Buffer::SetPrivateData",
-    2041: "ID3D11Buffer::SetPrivateDataInterface",
-    2042: "ID3D11Buffer::GetType",
-    2043: "ID3D11Buffer::SetEvictionPriority",
-    2044: "ID3D11Buffer::GetEvictionPriority",
-    2045: "ID3D11Buffer::GetDesc",
-    2046: "ID3D11Texture1D::QueryInterface",
-    2047: "ID3D11Texture1D::AddRef",
-    2048: "ID3D11Texture1D::Release",
-    2049: "ID3D11Texture1D::GetDevice",
-    2050: "ID3D11Texture1D::GetPrivateData",
-    2051: "ID3D11Texture1D::SetPrivateData",
-    2052: "ID3D11Texture1D::SetPrivateDataInterface",
-    2053: "ID3D11Texture1D::GetType",
-    2054: "ID3D11Texture1D::SetEvictionPriority",
-    2055: "ID3D11Texture1D::GetEvictionPriority",
-    2056: "ID3D11Texture1D::GetDesc",
-    2057: "ID3D11Texture2D::QueryInterface",
-    2058: "ID3D11Texture2D::AddRef",
-    2059: "ID3D11Texture2D::Release",
-    2060: "ID3D11Texture2D::GetDevice",
-    2061: "ID3D11Texture2D::GetPrivateData",
-    2062: "ID3D11Texture2D::SetPrivateData",
-    2063: "ID3D11Texture2D::SetPrivateDataInterface",
-    2064: "ID3D11Texture2D::GetType",
-    2065: "ID3D11Texture2D::SetEvictionPriority",
-    2066: "ID3D11Texture2D::GetEvictionPriority",
-    2067: "ID3D11Texture2D::GetDesc",
-    2068: "ID3D11Texture3D::QueryInterface",
-    2069: "ID3D11Texture3D::AddRef",
-    2070: "ID3D11Texture3D::Release",
-    2071: "ID3D11Texture3D::GetDevice",
-    2072: "ID3D11Texture3D::GetPrivateData",
-    2073: "ID3D11Texture3D::SetPrivateData",
-    2074: "ID3D11Texture3D::SetPrivateDataInterface",
-    2075: "ID3D11Texture3D::GetType",
-    2076: "ID3D11Texture3D::SetEvictionPriority",
-    2077: "ID3D11Texture3D::GetEvictionPriority",
-    2078: "ID3D11Texture3D::GetDesc",
-    2079: "ID3D11ShaderResourceView::QueryInterface",
-    2080: "ID3D11ShaderResourceView::AddRef",
-    2081: "ID3D11ShaderResourceView::Release",
-    2082: "ID3D11ShaderResourceView::GetDevice",
-    2083: "ID3D11ShaderResourceView::GetPrivateData",
-    2084: "ID3D11ShaderResourceView::SetPrivateData",
-    2085: "ID3D11ShaderResourceView::SetPrivateDataInterface",
-    2086: "ID3D11ShaderResourceView::GetResource",
-    2087: "ID3D11ShaderResourceView::GetDesc",
-    2088: "ID3D11RenderTargetView::QueryInterface",
-    2089: "ID3D11RenderTargetView::AddRef",
-    2090: "ID3D11RenderTargetView::Release",
-    2091: "ID3D11RenderTargetView::GetDevice",
-    2092: "ID3D11RenderTargetView::GetPrivateData",
-    2093: "ID3D11RenderTargetView::SetPrivateData",
-    2094: "ID3D11RenderTargetView::SetPrivateDataInterface",
-    2095: "ID3D11RenderTargetView::GetResource",
-    2096: "ID3D11RenderTargetView::GetDesc",
-    2097: "ID3D11DepthStencilView::QueryInterface",
-    2098: "ID3D11DepthStencilView::AddRef",
-    2099: "ID3D11DepthStencilView::Release",
-    2100: "ID3D11DepthStencilView::GetDevice",
-    2101: "ID3D11DepthStencilView::GetPrivateData",
-    2102: "ID3D11DepthStencilView::SetPrivateData",
-    2103: "ID3D11DepthStencilView::SetPrivateDataInterface",
-    2104: "ID3D11DepthStencilView::GetResource",
-    2105: "ID3D11DepthStencilView::GetDesc",
-    2106: "ID3D11UnorderedAccessView::QueryInterface",
-    2107: "ID3D11UnorderedAccessView::AddRef",
-    2108: "ID3D11UnorderedAccessView::Release",
-    2109: "ID3D11UnorderedAccessView::GetDevice",
-    2110: "ID3D11UnorderedAccessView::GetPrivateData",
-    2111: "ID3D11UnorderedAccessView::SetPrivateData",
-    2112: "ID3D11UnorderedAccessView::SetPrivateDataInterface",
-    2113: "ID3D11UnorderedAccessView::GetResource",
-    2114: "ID3D11UnorderedAccessView::GetDesc",
-    2115: "ID3D11VertexShader::QueryInterface",
-    2116: "ID3D11VertexShader::AddRef",
-    2117: "ID3D11VertexShader::Release",
-    2118: "ID3D11VertexShader::GetDevice",
-    2119: "ID3D11VertexShader::GetPrivateData",
-    2120: "ID3D11VertexShader::SetPrivateData",
-    2121: "ID3D11VertexShader::SetPrivateDataInterface",
-    2122: "ID3D11HullShader::QueryInterface",
-    2123: "ID3D11HullShader::AddRef",
-    2124: "ID3D11HullShader::Release",
-    2125: "ID3D11HullShader::GetDevice",
-    2126: "ID3D11HullShader::GetPrivateData",
-    2127: "ID3D11HullShader::SetPrivateData",
-    2128: "ID3D11HullShader::SetPrivateDataInterface",
-    2129: "ID3D11DomainShader::QueryInterface",
-    2130: "ID3D11DomainShader::AddRef",
-    2131: "ID3D11DomainShader::Release",
-    2132: "ID3D11DomainShader::GetDevice",
-    2133: "ID3D11DomainShader::GetPrivateData",
-    2134: "ID3D11DomainShader::SetPrivateData",
-    2135: "ID3D11DomainShader::SetPrivateDataInterface",
-    2136: "ID3D11GeometryShader::QueryInterface",
-    2137: "ID3D11GeometryShader::AddRef",
-    2138: "ID3D11GeometryShader::Release",
-    2139: "ID3D11GeometryShader::GetDevice",
-    2140: "ID3D11GeometryShader::GetPrivateData",
-    2141: "ID3D11GeometryShader::SetPrivateData",
-    2142: "ID3D11GeometryShader::SetPrivateDataInterface",
-    2143: "ID3D11PixelShader::QueryInterface",
-    2144: "ID3D11PixelShader::AddRef",
-    2145: "ID3D11PixelShader::Release",
-    2146: "ID3D11PixelShader::GetDevice",
-    2147: "ID3D11PixelShader::GetPrivateData",
-    2148: "ID3D11PixelShader::SetPrivateData",
-    2149: "ID3D11PixelShader::SetPrivateDataInterface",
-    2150: "ID3D11ComputeShader::QueryInterface",
-    2151: "ID3D11ComputeShader::AddRef",
-    2152: "ID3D11ComputeShader::Release",
-    2153: "ID3D11ComputeShader::GetDevice",
-    2154: "ID3D11ComputeShader::GetPrivateData",
-    2155: "ID3D11ComputeShader::SetPrivateData",
-    2156: "ID3D11ComputeShader::SetPrivateDataInterface",
-    2157: "ID3D11InputLayout::QueryInterface",
-    2158: "ID3D11InputLayout::AddRef",
-    2159: "ID3D11InputLayout::Release",
-    2160: "ID3D11InputLayout::GetDevice",
-    2161: "ID3D11InputLayout::GetPrivateData",
-    2162: "ID3D11InputLayout::SetPrivateData",
-    2163: "ID3D11InputLayout::SetPrivateDataInterface",
-    2164: "ID3D11SamplerState::QueryInterface",
-    2165: "ID3D11SamplerState::AddRef",
-    2166: "ID3D11SamplerState::Release",
-    2167: "ID3D11SamplerState::GetDevice",
-    2168: "ID3D11SamplerState::GetPrivateData",
-    2169: "ID3D11SamplerState::SetPrivateData",
-    2170: "ID3D11SamplerState::SetPrivateDataInterface",
-    2171: "ID3D11SamplerState::GetDesc",
-    2172: "ID3D11Query::QueryInterface",
-    2173: "ID3D11Query::AddRef",
-    2174: "ID3D11Query::Release",
-    2175: "ID3D11Query::GetDevice",
-    2176: "ID3D11Query::GetPrivateData",
-    2177: "ID3D11Query::SetPrivateData",
-    2178: "ID3D11Query::SetPrivateDataInterface",
-    2179: "ID3D11Query::GetDataSize",
-    2180: "ID3D11Query::GetDesc",
-    2181: "ID3D11Predicate::QueryInterface",
-    2182: "ID3D11Predicate::AddRef",
-    2183: "ID3D11Predicate::Release",
-    2184: "ID3D11Predicate::GetDevice",
-    2185: "ID3D11Predicate::GetPrivateData",
-    2186: "ID3D11Predicate::SetPrivateData",
-    2187: "ID3D11Predicate::SetPrivateDataInterface",
-    2188: "ID3D11Predicate::GetDataSize",
-    2189: "ID3D11Predicate::GetDesc",
-    2190: "ID3D11Counter::QueryInterface",
-    2191: "ID3D11Counter::AddRef",
-    2192: "ID3D11Counter::Release",
-    2193: "ID3D11Counter::GetDevice",
-    2194: "ID3D11Counter::GetPrivateData",
-    2195: "ID3D11Counter::SetPrivateData",
-    2196: "ID3D11Counter::SetPrivateDataInterface",
-    2197: "ID3D11Counter::GetDataSize",
-    2198: "ID3D11Counter::GetDesc",
-    2199: "ID3D11ClassInstance::QueryInterface",
-    2200: "ID3D11ClassInstance::AddRef",
-    2201: "ID3D11ClassInstance::Release",
-    2202: "ID3D11ClassInstance::GetDevice",
-    2203: "ID3D11ClassInstance::GetPrivateData",
-    2204: "ID3D11ClassInstance::SetPrivateData",
-    2205: "ID3D11ClassInstance::SetPrivateDataInterface",
-    2206: "ID3D11ClassInstance::GetClassLinkage",
-    2207: "ID3D11ClassInstance::GetDesc",
-    2208: "ID3D11ClassInstance::GetInstanceName",
-    2209: "ID3D11ClassInstance::GetTypeName",
-    2210: "ID3D11ClassLinkage::QueryInterface",
-    2211: "ID3D11ClassLinkage::AddRef",
-    2212: "ID3D11ClassLinkage::Release",
-    2213: "ID3D11ClassLinkage::GetDevice",
-    2214: "ID3D11ClassLinkage::GetPrivateData",
-    2215: "ID3D11ClassLinkage::SetPrivateData",
-    2216: "ID3D11ClassLinkage::SetPrivateDataInterface",
-    2217: "ID3D11ClassLinkage::GetClassInstance",
-    2218: "ID3D11ClassLinkage::CreateClassInstance",
-    2219: "ID3D11CommandList::QueryInterface",
-    2220: "ID3D11CommandList::AddRef",
-    2221: "ID3D11CommandList::Release",
-    2222: "ID3D11CommandList::GetDevice",
-    2223: "ID3D11CommandList::GetPrivateData",
-    2224: "ID3D11CommandList::SetPrivateData",
-    2225: "ID3D11CommandList::SetPrivateDataInterface",
-    2226: "ID3D11CommandList::GetContextFlags",
-    2228: "ID3D11DeviceContext::AddRef",
-    2229: "ID3D11DeviceContext::Release",
-    2230: "ID3D11DeviceContext::GetDevice",
-    2231: "ID3D11DeviceContext::GetPrivateData",
-    2232: "ID3D11DeviceContext::SetPrivateData",
-    2233: "ID3D11DeviceContext::SetPrivateDataInterface",
-    2234: "ID3D11DeviceContext::VSSetConstantBuffers",
-    2235: "ID3D11DeviceContext::PSSetShaderResources",
-    2236: "ID3D11DeviceContext::PSSetShader",
-    2237: "ID3D11DeviceContext::PSSetSamplers",
-    2238: "ID3D11DeviceContext::VSSetShader",
-    2239: "ID3D11DeviceContext::DrawIndexed",
-    2240: "ID3D11DeviceContext::Draw",
-    2241: "ID3D11DeviceContext::Map",
-    2242: "ID3D11DeviceContext::Unmap",
-    2243: "ID3D11DeviceContext::PSSetConstantBuffers",
-    2244: "ID3D11DeviceContext::IASetInputLayout",
-    2245: "ID3D11DeviceContext::IASetVertexBuffers",
-    2246: "ID3D11DeviceContext::IASetIndexBuffer",
-    2247: "ID3D11DeviceContext::DrawIndexedInstanced",
-    2248: "ID3D11DeviceContext::DrawInstanced",
-    2249: "ID3D11DeviceContext::GSSetConstantBuffers",
-    2250: "ID3D11DeviceContext::GSSetShader",
-    2251: "ID3D11DeviceContext::IASetPrimitiveTopology",
-    2252: "ID3D11DeviceContext::VSSetShaderResources",
-    2253: "ID3D11DeviceContext::VSSetSamplers",
-    2254: "ID3D11DeviceContext::Begin",
-    2255: "ID3D11DeviceContext::End",
-    2256: "ID3D11DeviceContext::GetData",
-    2257: "ID3D11DeviceContext::SetPredication",
-    2258: "ID3D11DeviceContext::GSSetShaderResources",
-    2259: "ID3D11DeviceContext::GSSetSamplers",
-    2260: "ID3D11DeviceContext::OMSetRenderTargets",
-    2261: "ID3D11DeviceContext::OMSetRenderTargetsAndUnorderedAccessViews",
-    2262: "ID3D11DeviceContext::OMSetBlendState",
-    2263: "ID3D11DeviceContext::OMSetDepthStencilState",
-    2264: "ID3D11DeviceContext::SOSetTargets",
-    2265: "ID3D11DeviceContext::DrawAuto",
-    2266: "ID3D11DeviceContext::DrawIndexedInstancedIndirect",
-    2267: "ID3D11DeviceContext::DrawInstancedIndirect",
-    2268: "ID3D11DeviceContext::Dispatch",
-    2269: "ID3D11DeviceContext::DispatchIndirect",
-    2270: "ID3D11DeviceContext::RSSetState",
-    2271: "ID3D11DeviceContext::RSSetViewports",
-    2272: "ID3D11DeviceContext::RSSetScissorRects",
-    2273: "ID3D11DeviceContext::CopySubresourceRegion",
-    2274: "ID3D11DeviceContext::CopyResource",
-    2275: "ID3D11DeviceContext::UpdateSubresource",
-    2276: "ID3D11DeviceContext::CopyStructureCount",
-    2277: "ID3D11DeviceContext::ClearRenderTargetView",
-    2278: "ID3D11DeviceContext::ClearUnorderedAccessViewUint",
-    2279: "ID3D11DeviceContext::ClearUnorderedAccessViewFloat",
-    2280: "ID3D11DeviceContext::ClearDepthStencilView",
-    2281: "ID3D11DeviceContext::GenerateMips",
-    2282: "ID3D11DeviceContext::SetResourceMinLOD",
-    2283: "ID3D11DeviceContext::GetResourceMinLOD",
-    2284: "ID3D11DeviceContext::ResolveSubresource",
-    2285: "ID3D11DeviceContext::ExecuteCommandList",
-    2286: "ID3D11DeviceContext::HSSetShaderResources",
-    2287: "ID3D11DeviceContext::HSSetShader",
-    2288: "ID3D11DeviceContext::HSSetSamplers",
-    2289: "ID3D11DeviceContext::HSSetConstantBuffers",
-    2290: "ID3D11DeviceContext::DSSetShaderResources",
-    2291: "ID3D11DeviceContext::DSSetShader",
-    2292: "ID3D11DeviceContext::DSSetSamplers",
-    2293: "ID3D11DeviceContext::DSSetConstantBuffers",
-    2294: "ID3D11DeviceContext::CSSetShaderResources",
-    2295: "ID3D11DeviceContext::CSSetUnorderedAccessViews",
-    2296: "ID3D11DeviceContext::CSSetShader",
-    2297: "ID3D11DeviceContext::CSSetSamplers",
-    2298: "ID3D11DeviceContext::CSSetConstantBuffers",
-    2299: "ID3D11DeviceContext::VSGetConstantBuffers",
-    2300: "ID3D11DeviceContext::PSGetShaderResources",
-    2301: "ID3D11DeviceContext::PSGetShader",
-    2302: "ID3D11DeviceContext::PSGetSamplers",
-    2303: "ID3D11DeviceContext::VSGetShader",
-    2304: "ID3D11DeviceContext::PSGetConstantBuffers",
-    2305: "ID3D11DeviceContext::IAGetInputLayout",
-    2306: "ID3D11DeviceContext::IAGetVertexBuffers",
-    2307: "ID3D11DeviceContext::IAGetIndexBuffer",
-    2308: "ID3D11DeviceContext::GSGetConstantBuffers",
-    2309: "ID3D11DeviceContext::GSGetShader",
-    2310: "ID3D11DeviceContext::IAGetPrimitiveTopology",
-    2311: "ID3D11DeviceContext::VSGetShaderResources",
-    2312: "ID3D11DeviceContext::VSGetSamplers",
-    2313: "ID3D11DeviceContext::GetPredication",
-    2314: "ID3D11DeviceContext::GSGetShaderResources",
-    2315: "ID3D11DeviceContext::GSGetSamplers",
-    2316: "ID3D11DeviceContext::OMGetRenderTargets",
-    2317: "ID3D11DeviceContext::OMGetRenderTargetsAndUnorderedAccessViews",
-    2318: "ID3D11DeviceContext::OMGetBlendState",
-    2319: "ID3D11DeviceContext::OMGetDepthStencilState",
-    2320: "ID3D11DeviceContext::SOGetTargets",
-    2321: "ID3D11DeviceContext::RSGetState",
-    2322: "ID3D11DeviceContext::RSGetViewports",
-    2323: "ID3D11DeviceContext::RSGetScissorRects",
-    2324: "ID3D11DeviceContext::HSGetShaderResources",
-    2325: "ID3D11DeviceContext::HSGetShader",
-    2326: "ID3D11DeviceContext::HSGetSamplers",
-    2327: "ID3D11DeviceContext::HSGetConstantBuffers",
-    2328: "ID3D11DeviceContext::DSGetShaderResources",
-    2329: "ID3D11DeviceContext::DSGetShader",
-    2330: "ID3D11DeviceContext::DSGetSamplers",
-    2331: "ID3D11DeviceContext::DSGetConstantBuffers",
-    2332: "ID3D11DeviceContext::CSGetShaderResources",
-    2333: "ID3D11DeviceContext::CSGetUnorderedAccessViews",
-    2334: "ID3D11DeviceContext::CSGetShader",
-    2335: "ID3D11DeviceContext::CSGetSamplers",
-    2336: "ID3D11DeviceContext::CSGetConstantBuffers",
-    2337: "ID3D11DeviceContext::ClearState",
-    2338: "ID3D11DeviceContext::Flush",
-    2339: "ID3D11DeviceContext::GetType",
-    2340: "ID3D11DeviceContext::GetContextFlags",
-    2341: "ID3D11DeviceContext::FinishCommandList",
-    2342: "ID3D11Device::QueryInterface",
-    2343: "ID3D11Device::AddRef",
-    2344: "ID3D11Device::Release",
-    2345: "ID3D11Device::CreateBuffer",
-    2346: "ID3D11Device::CreateTexture1D",
-    2347: "ID3D11Device::CreateTexture2D",
-    2348: "ID3D11Device::CreateTexture3D",
-    2349: "ID3D11Device::CreateShaderResourceView",
-    2350: "ID3D11Device::CreateUnorderedAccessView",
-    2351: "ID3D11Device::CreateRenderTargetView",
-    2352: "ID3D11Device::CreateDepthStencilView",
-    2353: "ID3D11Device::CreateInputLayout",
-    2354: "ID3D11Device::CreateVertexShader",
-    2355: "ID3D11Device::CreateGeometryShader",
-    2356: "ID3D11Device::CreateGeometryShaderWithStreamOutput",
-    2357: "ID3D11Device::CreatePixelShader",
-    2358: "ID3D11Device::CreateHullShader",
-    2359: "ID3D11Device::CreateDomainShader",
-    2360: "ID3D11Device::CreateComputeShader",
-    2361: "ID3D11Device::CreateClassLinkage",
-    2362: "ID3D11Device::CreateBlendState",
-    2363: "ID3D11Device::CreateDepthStencilState",
-    2364: "ID3D11Device::CreateRasterizerState",
-    2365: "ID3D11Device::CreateSamplerState",
-    2366: "ID3D11Device::CreateQuery",
-    2367: "ID3D11Device::CreatePredicate",
-    2368: "ID3D11Device::CreateCounter",
-    2369: "ID3D11Device::CreateDeferredContext",
-    2370: "ID3D11Device::OpenSharedResource",
-    2371: "ID3D11Device::CheckFormatSupport",
-    2372: "ID3D11Device::CheckMultisampleQualityLevels",
-    2373: "ID3D11Device::CheckCounterInfo",
-    2374: "ID3D11Device::CheckCounter",
-    2375: "ID3D11Device::CheckFeatureSupport",
-    2376: "ID3D11Device::GetPrivateData",
-    2377: "ID3D11Device::SetPrivateData",
-    2378: "ID3D11Device::SetPrivateDataInterface",
-    2379: "ID3D11Device::GetFeatureLevel",
-    2380: "ID3D11Device::GetCreationFlags",
-    2381: "ID3D11Device::GetDeviceRemovedReason",
-    2382: "ID3D11Device::GetImmediateContext",
-    2383: "ID3D11Device::SetExceptionMode",
-    2384: "ID3D11Device::GetExceptionMode",
-}
+from array import array
+from bisect import bisect_left
+
+# one "id name" line per function, sorted by id
+functionTable = """\
+1 CreateObject
+2 DestroyObject
+206 Direct3DCreate9
+207 DebugSetMute
+208 DebugSetLevel
+209 Direct3DShaderValidatorCreate9
+210 PSGPSampleTexture
+212 D3DPERF_BeginEvent
+213 D3DPERF_EndEvent
+214 D3DPERF_SetMarker
+215 D3DPERF_SetRegion
+216 D3DPERF_QueryRepeatFrame
+217 D3DPERF_SetOptions
+218 D3DPERF_GetStatus
+219 IDirect3D9::QueryInterface
+220 IDirect3D9::AddRef
+221 IDirect3D9::Release
+222 IDirect3D9::RegisterSoftwareDevice
+223 IDirect3D9::GetAdapterCount
+224 IDirect3D9::GetAdapterIdentifier
+225 IDirect3D9::GetAdapterModeCount
+226 IDirect3D9::EnumAdapterModes
+227 IDirect3D9::GetAdapterDisplayMode
+228 IDirect3D9::CheckDeviceType
+229 IDirect3D9::CheckDeviceFormat
+230 IDirect3D9::CheckDeviceMultiSampleType
+231 IDirect3D9::CheckDepthStencilMatch
+232 IDirect3D9::CheckDeviceFormatConversion
+233 IDirect3D9::GetDeviceCaps
+234 IDirect3D9::GetAdapterMonitor
+235 IDirect3D9::CreateDevice
+236 IDirect3DDevice9::QueryInterface
+237 IDirect3DDevice9::AddRef
+238 IDirect3DDevice9::Release
+239 IDirect3DDevice9::TestCooperativeLevel
+240 IDirect3DDevice9::GetAvailableTextureMem
+241 IDirect3DDevice9::EvictManagedResources
+242 IDirect3DDevice9::GetDirect3D
+243 IDirect3DDevice9::GetDeviceCaps
+244 IDirect3DDevice9::GetDisplayMode
+245 IDirect3DDevice9::GetCreationParameters
+246 IDirect3DDevice9::SetCursorProperties
+247 IDirect3DDevice9::SetCursorPosition
+248 IDirect3DDevice9::ShowCursor
+249 IDirect3DDevice9::CreateAdditionalSwapChain
+250 IDirect3DDevice9::GetSwapChain
+251 IDirect3DDevice9::GetNumberOfSwapChains
+252 IDirect3DDevice9::Reset
+253 IDirect3DDevice9::Present
+254 IDirect3DDevice9::GetBackBuffer
+255 IDirect3DDevice9::GetRasterStatus
+256 IDirect3DDevice9::SetDialogBoxMode
+257 IDirect3DDevice9::SetGammaRamp
+258 IDirect3DDevice9::GetGammaRamp
+259 IDirect3DDevice9::CreateTexture
+260 IDirect3DDevice9::CreateVolumeTexture
+261 IDirect3DDevice9::CreateCubeTexture
+262 IDirect3DDevice9::CreateVertexBuffer
+263 IDirect3DDevice9::CreateIndexBuffer
+264 IDirect3DDevice9::CreateRenderTarget
+265 IDirect3DDevice9::CreateDepthStencilSurface
+266 IDirect3DDevice9::UpdateSurface
+267 IDirect3DDevice9::UpdateTexture
+268 IDirect3DDevice9::GetRenderTargetData
+269 IDirect3DDevice9::GetFrontBufferData
+270 IDirect3DDevice9::StretchRect
+271 IDirect3DDevice9::ColorFill
+272 IDirect3DDevice9::CreateOffscreenPlainSurface
+273 IDirect3DDevice9::SetRenderTarget
+274 IDirect3DDevice9::GetRenderTarget
+275 IDirect3DDevice9::SetDepthStencilSurface
+276 IDirect3DDevice9::GetDepthStencilSurface
+277 IDirect3DDevice9::BeginScene
+278 IDirect3DDevice9::EndScene
+279 IDirect3DDevice9::Clear
+280 IDirect3DDevice9::SetTransform
+281 IDirect3DDevice9::GetTransform
+282 IDirect3DDevice9::MultiplyTransform
+283 IDirect3DDevice9::SetViewport
+284 IDirect3DDevice9::GetViewport
+285 IDirect3DDevice9::SetMaterial
+286 IDirect3DDevice9::GetMaterial
+287 IDirect3DDevice9::SetLight
+288 IDirect3DDevice9::GetLight
+289 IDirect3DDevice9::LightEnable
+290 IDirect3DDevice9::GetLightEnable
+291 IDirect3DDevice9::SetClipPlane
+292 IDirect3DDevice9::GetClipPlane
+293 IDirect3DDevice9::SetRenderState
+294 IDirect3DDevice9::GetRenderState
+295 IDirect3DDevice9::CreateStateBlock
+296 IDirect3DDevice9::BeginStateBlock
+297 IDirect3DDevice9::EndStateBlock
+298 IDirect3DDevice9::SetClipStatus
+299 IDirect3DDevice9::GetClipStatus
+300 IDirect3DDevice9::GetTexture
+301 IDirect3DDevice9::SetTexture
+302 IDirect3DDevice9::GetTextureStageState
+303 IDirect3DDevice9::SetTextureStageState
+304 IDirect3DDevice9::GetSamplerState
+305 IDirect3DDevice9::SetSamplerState
+306 IDirect3DDevice9::ValidateDevice
+307 IDirect3DDevice9::SetPaletteEntries
+308 IDirect3DDevice9::GetPaletteEntries
+309 IDirect3DDevice9::SetCurrentTexturePalette
+310 IDirect3DDevice9::GetCurrentTexturePalette
+311 IDirect3DDevice9::SetScissorRect
+312 IDirect3DDevice9::GetScissorRect
+313 IDirect3DDevice9::SetSoftwareVertexProcessing
+314 IDirect3DDevice9::GetSoftwareVertexProcessing
+315 IDirect3DDevice9::SetNPatchMode
+316 IDirect3DDevice9::GetNPatchMode
+317 IDirect3DDevice9::DrawPrimitive
+318 IDirect3DDevice9::DrawIndexedPrimitive
+319 IDirect3DDevice9::DrawPrimitiveUP
+320 IDirect3DDevice9::DrawIndexedPrimitiveUP
+321 IDirect3DDevice9::ProcessVertices
+322 IDirect3DDevice9::CreateVertexDeclaration
+323 IDirect3DDevice9::SetVertexDeclaration
+324 IDirect3DDevice9::GetVertexDeclaration
+325 IDirect3DDevice9::SetFVF
+326 IDirect3DDevice9::GetFVF
+327 IDirect3DDevice9::CreateVertexShader
+328 IDirect3DDevice9::SetVertexShader
+329 IDirect3DDevice9::GetVertexShader
+330 IDirect3DDevice9::SetVertexShaderConstantF
+331 IDirect3DDevice9::GetVertexShaderConstantF
+332 IDirect3DDevice9::SetVertexShaderConstantI
+333 IDirect3DDevice9::GetVertexShaderConstantI
+334 IDirect3DDevice9::SetVertexShaderConstantB
+335 IDirect3DDevice9::GetVertexShaderConstantB
+336 IDirect3DDevice9::SetStreamSource
+337 IDirect3DDevice9::GetStreamSource
+338 IDirect3DDevice9::SetStreamSourceFreq
+339 IDirect3DDevice9::GetStreamSourceFreq
+340 IDirect3DDevice9::SetIndices
+341 IDirect3DDevice9::GetIndices
+342 IDirect3DDevice9::CreatePixelShader
+343 IDirect3DDevice9::SetPixelShader
+344 IDirect3DDevice9::GetPixelShader
+345 IDirect3DDevice9::SetPixelShaderConstantF
+346 IDirect3DDevice9::GetPixelShaderConstantF
+347 IDirect3DDevice9::SetPixelShaderConstantI
+348 IDirect3DDevice9::GetPixelShaderConstantI
+349 IDirect3DDevice9::SetPixelShaderConstantB
+350 IDirect3DDevice9::GetPixelShaderConstantB
+351 IDirect3DDevice9::DrawRectPatch
+352 IDirect3DDevice9::DrawTriPatch
+353 IDirect3DDevice9::DeletePatch
+354 IDirect3DDevice9::CreateQuery
+355 IDirect3DSwapChain9::QueryInterface
+356 IDirect3DSwapChain9::AddRef
+357 IDirect3DSwapChain9::Release
+358 IDirect3DSwapChain9::Present
+359 IDirect3DSwapChain9::GetFrontBufferData
+360 IDirect3DSwapChain9::GetBackBuffer
+361 IDirect3DSwapChain9::GetRasterStatus
+362 IDirect3DSwapChain9::GetDisplayMode
+363 IDirect3DSwapChain9::GetDevice
+364 IDirect3DSwapChain9::GetPresentParameters
+365 IDirect3DTexture9::QueryInterface
+366 IDirect3DTexture9::AddRef
+367 IDirect3DTexture9::Release
+368 IDirect3DTexture9::GetDevice
+369 IDirect3DTexture9::SetPrivateData
+370 IDirect3DTexture9::GetPrivateData
+371 IDirect3DTexture9::FreePrivateData
+372 IDirect3DTexture9::SetPriority
+373 IDirect3DTexture9::GetPriority
+374 IDirect3DTexture9::PreLoad
+375 IDirect3DTexture9::GetType
+376 IDirect3DTexture9::SetLOD
+377 IDirect3DTexture9::GetLOD
+378 IDirect3DTexture9::GetLevelCount
+379 IDirect3DTexture9::SetAutoGenFilterType
+380 IDirect3DTexture9::GetAutoGenFilterType
+381 IDirect3DTexture9::GenerateMipSubLevels
+382 IDirect3DTexture9::GetLevelDesc
+383 IDirect3DTexture9::GetSurfaceLevel
+384 IDirect3DTexture9::LockRect
+385 IDirect3DTexture9::UnlockRect
+386 IDirect3DTexture9::AddDirtyRect
+387 IDirect3DVolumeTexture9::QueryInterface
+388 IDirect3DVolumeTexture9::AddRef
+389 IDirect3DVolumeTexture9::Release
+390 IDirect3DVolumeTexture9::GetDevice
+391 IDirect3DVolumeTexture9::SetPrivateData
+392 IDirect3DVolumeTexture9::GetPrivateData
+393 IDirect3DVolumeTexture9::FreePrivateData
+394 IDirect3DVolumeTexture9::SetPriority
+395 IDirect3DVolumeTexture9::GetPriority
+396 IDirect3DVolumeTexture9::PreLoad
+397 IDirect3DVolumeTexture9::GetType
+398 IDirect3DVolumeTexture9::SetLOD
+399 IDirect3DVolumeTexture9::GetLOD
+400 IDirect3DVolumeTexture9::GetLevelCount
+401 IDirect3DVolumeTexture9::SetAutoGenFilterType
+402 IDirect3DVolumeTexture9::GetAutoGenFilterType
+403 IDirect3DVolumeTexture9::GenerateMipSubLevels
+404 IDirect3DVolumeTexture9::GetLevelDesc
+405 IDirect3DVolumeTexture9::GetVolumeLevel
+406 IDirect3DVolumeTexture9::LockBox
+407 IDirect3DVolumeTexture9::UnlockBox
+408 IDirect3DVolumeTexture9::AddDirtyBox
+409 IDirect3DCubeTexture9::QueryInterface
+410 IDirect3DCubeTexture9::AddRef
+411 IDirect3DCubeTexture9::Release
+412 IDirect3DCubeTexture9::GetDevice
+413 IDirect3DCubeTexture9::SetPrivateData
+414 IDirect3DCubeTexture9::GetPrivateData
+415 IDirect3DCubeTexture9::FreePrivateData
+416 IDirect3DCubeTexture9::SetPriority
+417 IDirect3DCubeTexture9::GetPriority
+418 IDirect3DCubeTexture9::PreLoad
+419 IDirect3DCubeTexture9::GetType
+420 IDirect3DCubeTexture9::SetLOD
+421 IDirect3DCubeTexture9::GetLOD
+422 IDirect3DCubeTexture9::GetLevelCount
+423 IDirect3DCubeTexture9::SetAutoGenFilterType
+424 IDirect3DCubeTexture9::GetAutoGenFilterType
+425 IDirect3DCubeTexture9::GenerateMipSubLevels
+426 IDirect3DCubeTexture9::GetLevelDesc
+427 IDirect3DCubeTexture9::GetCubeMapSurface
+428 IDirect3DCubeTexture9::LockRect
+429 IDirect3DCubeTexture9::UnlockRect
+430 IDirect3DCubeTexture9::AddDirtyRect
+431 IDirect3DVertexBuffer9::QueryInterface
+432 IDirect3DVertexBuffer9::AddRef
+433 IDirect3DVertexBuffer9::Release
+434 IDirect3DVertexBuffer9::GetDevice
+435 IDirect3DVertexBuffer9::SetPrivateData
+436 IDirect3DVertexBuffer9::GetPrivateData
+437 IDirect3DVertexBuffer9::FreePrivateData
+438 IDirect3DVertexBuffer9::SetPriority
+439 IDirect3DVertexBuffer9::GetPriority
+440 IDirect3DVertexBuffer9::PreLoad
+441 IDirect3DVertexBuffer9::GetType
+442 IDirect3DVertexBuffer9::Lock
+443 IDirect3DVertexBuffer9::Unlock
+444 IDirect3DVertexBuffer9::GetDesc
+445 IDirect3DIndexBuffer9::QueryInterface
+446 IDirect3DIndexBuffer9::AddRef
+447 IDirect3DIndexBuffer9::Release
+448 IDirect3DIndexBuffer9::GetDevice
+449 IDirect3DIndexBuffer9::SetPrivateData
+450 IDirect3DIndexBuffer9::GetPrivateData
+451 IDirect3DIndexBuffer9::FreePrivateData
+452 IDirect3DIndexBuffer9::SetPriority
+453 IDirect3DIndexBuffer9::GetPriority
+454 IDirect3DIndexBuffer9::PreLoad
+455 IDirect3DIndexBuffer9::GetType
+456 IDirect3DIndexBuffer9::Lock
+457 IDirect3DIndexBuffer9::Unlock
+458 IDirect3DIndexBuffer9::GetDesc
+459 IDirect3DSurface9::QueryInterface
+460 IDirect3DSurface9::AddRef
+461 IDirect3DSurface9::Release
+462 IDirect3DSurface9::GetDevice
+463 IDirect3DSurface9::SetPrivateData
+464 IDirect3DSurface9::GetPrivateData
+465 IDirect3DSurface9::FreePrivateData
+466 IDirect3DSurface9::SetPriority
+467 IDirect3DSurface9::GetPriority
+468 IDirect3DSurface9::PreLoad
+469 IDirect3DSurface9::GetType
+470 IDirect3DSurface9::GetContainer
+471 IDirect3DSurface9::GetDesc
+472 IDirect3DSurface9::LockRect
+473 IDirect3DSurface9::UnlockRect
+474 IDirect3DSurface9::GetDC
+475 IDirect3DSurface9::ReleaseDC
+476 IDirect3DVolume9::QueryInterface
+477 IDirect3DVolume9::AddRef
+478 IDirect3DVolume9::Release
+479 IDirect3DVolume9::GetDevice
+480 IDirect3DVolume9::SetPrivateData
+481 IDirect3DVolume9::GetPrivateData
+482 IDirect3DVolume9::FreePrivateData
+483 IDirect3DVolume9::GetContainer
+484 IDirect3DVolume9::GetDesc
+485 IDirect3DVolume9::LockBox
+486 IDirect3DVolume9::UnlockBox
+487 IDirect3DVertexDeclaration9::QueryInterface
+488 IDirect3DVertexDeclaration9::AddRef
+489 IDirect3DVertexDeclaration9::Release
+490 IDirect3DVertexDeclaration9::GetDevice
+491 IDirect3DVertexDeclaration9::GetDeclaration
+492 IDirect3DVertexShader9::QueryInterface
+493 IDirect3DVertexShader9::AddRef
+494 IDirect3DVertexShader9::Release
+495 IDirect3DVertexShader9::GetDevice
+496 IDirect3DVertexShader9::GetFunction
+497 IDirect3DPixelShader9::QueryInterface
+498 IDirect3DPixelShader9::AddRef
+499 IDirect3DPixelShader9::Release
+500 IDirect3DPixelShader9::GetDevice
+501 IDirect3DPixelShader9::GetFunction
+502 IDirect3DStateBlock9::QueryInterface
+503 IDirect3DStateBlock9::AddRef
+504 IDirect3DStateBlock9::Release
+505 IDirect3DStateBlock9::GetDevice
+506 IDirect3DStateBlock9::Capture
+507 IDirect3DStateBlock9::Apply
+508 IDirect3DQuery9::QueryInterface
+509 IDirect3DQuery9::AddRef
+510 IDirect3DQuery9::Release
+511 IDirect3DQuery9::GetDevice
+512 IDirect3DQuery9::GetType
+513 IDirect3DQuery9::GetDataSize
+514 IDirect3DQuery9::Issue
+515 IDirect3DQuery9::GetData
+516 IDirect3DVideoDevice9::QueryInterface
+517 IDirect3DVideoDevice9::AddRef
+518 IDirect3DVideoDevice9::Release
+519 IDirect3DVideoDevice9::CreateSurface
+520 IDirect3DVideoDevice9::GetDXVACompressedBufferInfo
+521 IDirect3DVideoDevice9::GetDXVAGuids
+522 IDirect3DVideoDevice9::GetDXVAInternalInfo
+523 IDirect3DVideoDevice9::GetUncompressedDXVAFormats
+524 IDirect3DVideoDevice9::CreateDXVADevice
+525 IDirect3DDXVADevice9::QueryInterface
+526 IDirect3DDXVADevice9::AddRef
+527 IDirect3DDXVADevice9::Release
+528 IDirect3DDXVADevice9::BeginFrame
+529 IDirect3DDXVADevice9::EndFrame
+530 IDirect3DDXVADevice9::Execute
+531 IDirect3DDXVADevice9::QueryStatus
+532 D3DXCheckVersion
+533 D3DXCreateSprite
+534 D3DXCreateFontW
+535 D3DXCreateEffect
+536 D3DXCreateEffectFromFileA
+537 D3DXCreateEffectFromFileW
+538 D3DXCreateEffectFromResourceA
+539 D3DXCreateEffectFromResourceW
+540 D3DXCreateEffectEx
+541 D3DXCreateEffectFromFileExA
+542 D3DXCreateEffectFromFileExW
+543 D3DXCreateEffectFromResourceExA
+544 D3DXCreateEffectFromResourceExW
+545 D3DXCreateMesh
+546 D3DXCreateMeshFVF
+547 D3DXLoadMeshFromXA
+548 D3DXLoadMeshFromXW
+549 D3DXCompileShaderFromFileA
+550 D3DXCompileShaderFromFileW
+551 D3DXCompileShaderFromResourceA
+552 D3DXCompileShaderFromResourceW
+553 D3DXCompileShader
+554 D3DXGetShaderConstantTable
+555 ID3DXSprite::QueryInterface
+556 ID3DXSprite::AddRef
+557 ID3DXSprite::Release
+558 ID3DXSprite::GetDevice
+559 ID3DXSprite::GetTransform
+560 ID3DXSprite::SetTransform
+561 ID3DXSprite::SetWorldViewRH
+562 ID3DXSprite::SetWorldViewLH
+563 ID3DXSprite::Begin
+564 ID3DXSprite::Draw
+565 ID3DXSprite::Flush
+566 ID3DXSprite::End
+567 ID3DXSprite::OnLostDevice
+568 ID3DXSprite::OnResetDevice
+569 ID3DXFont::QueryInterface
+570 ID3DXFont::AddRef
+571 ID3DXFont::Release
+572 ID3DXFont::GetDevice
+573 ID3DXFont::GetDescA
+574 ID3DXFont::GetDescW
+575 ID3DXFont::GetTextMetricsA
+576 ID3DXFont::GetTextMetricsW
+577 ID3DXFont::GetDC
+578 ID3DXFont::GetGlyphData
+579 ID3DXFont::PreloadCharacters
+580 ID3DXFont::PreloadGlyphs
+581 ID3DXFont::PreloadTextA
+582 ID3DXFont::PreloadTextW
+583 ID3DXFont::DrawTextA
+584 ID3DXFont::DrawTextW
+585 ID3DXFont::OnLostDevice
+586 ID3DXFont::OnResetDevice
+587 ID3DXEffect::QueryInterface
+588 ID3DXEffect::AddRef
+589 ID3DXEffect::Release
+590 ID3DXEffect::GetDesc
+591 ID3DXEffect::GetParameterDesc
+592 ID3DXEffect::GetTechniqueDesc
+593 ID3DXEffect::GetPassDesc
+594 ID3DXEffect::GetFunctionDesc
+595 ID3DXEffect::GetParameter
+596 ID3DXEffect::GetParameterByName
+597 ID3DXEffect::GetParameterBySemantic
+598 ID3DXEffect::GetParameterElement
+599 ID3DXEffect::GetTechnique
+600 ID3DXEffect::GetTechniqueByName
+601 ID3DXEffect::GetPass
+602 ID3DXEffect::GetPassByName
+603 ID3DXEffect::GetFunction
+604 ID3DXEffect::GetFunctionByName
+605 ID3DXEffect::GetAnnotation
+606 ID3DXEffect::GetAnnotationByName
+607 ID3DXEffect::SetValue
+608 ID3DXEffect::GetValue
+609 ID3DXEffect::SetBool
+610 ID3DXEffect::GetBool
+611 ID3DXEffect::SetBoolArray
+612 ID3DXEffect::GetBoolArray
+613 ID3DXEffect::SetInt
+614 ID3DXEffect::GetInt
+615 ID3DXEffect::SetIntArray
+616 ID3DXEffect::GetIntArray
+617 ID3DXEffect::SetFloat
+618 ID3DXEffect::GetFloat
+619 ID3DXEffect::SetFloatArray
+620 ID3DXEffect::GetFloatArray
+621 ID3DXEffect::SetVector
+622 ID3DXEffect::GetVector
+623 ID3DXEffect::SetVectorArray
+624 ID3DXEffect::GetVectorArray
+625 ID3DXEffect::SetMatrix
+626 ID3DXEffect::GetMatrix
+627 ID3DXEffect::SetMatrixArray
+628 ID3DXEffect::GetMatrixArray
+629 ID3DXEffect::SetMatrixPointerArray
+630 ID3DXEffect::GetMatrixPointerArray
+631 ID3DXEffect::SetMatrixTranspose
+632 ID3DXEffect::GetMatrixTranspose
+633 ID3DXEffect::SetMatrixTransposeArray
+634 ID3DXEffect::GetMatrixTransposeArray
+635 ID3DXEffect::SetMatrixTransposePointerArray
+636 ID3DXEffect::GetMatrixTransposePointerArray
+637 ID3DXEffect::SetString
+638 ID3DXEffect::GetString
+639 ID3DXEffect::SetTexture
+640 ID3DXEffect::GetTexture
+641 ID3DXEffect::SetPixelShader
+642 ID3DXEffect::GetPixelShader
+643 ID3DXEffect::SetVertexShader
+644 ID3DXEffect::GetVertexShader
+645 ID3DXEffect::SetArrayRange
+646 ID3DXEffect::GetPool
+647 ID3DXEffect::SetTechnique
+648 ID3DXEffect::GetCurrentTechnique
+649 ID3DXEffect::ValidateTechnique
+650 ID3DXEffect::FindNextValidTechnique
+651 ID3DXEffect::IsParameterUsed
+652 ID3DXEffect::Begin
+653 ID3DXEffect::BeginPass
+654 ID3DXEffect::CommitChanges
+655 ID3DXEffect::EndPass
+656 ID3DXEffect::End
+657 ID3DXEffect::GetDevice
+658 ID3DXEffect::OnLostDevice
+659 ID3DXEffect::OnResetDevice
+660 ID3DXEffect::SetStateManager
+661 ID3DXEffect::GetStateManager
+662 ID3DXEffect::BeginParameterBlock
+663 ID3DXEffect::EndParameterBlock
+664 ID3DXEffect::ApplyParameterBlock
+665 ID3DXEffect::CloneEffect
+666 ID3DXMesh::QueryInterface
+667 ID3DXMesh::AddRef
+668 ID3DXMesh::Release
+669 ID3DXMesh::DrawSubset
+670 ID3DXMesh::GetNumFaces
+671 ID3DXMesh::GetNumVertices
+672 ID3DXMesh::GetFVF
+673 ID3DXMesh::GetDeclaration
+674 ID3DXMesh::GetNumBytesPerVertex
+675 ID3DXMesh::GetOptions
+676 ID3DXMesh::GetDevice
+677 ID3DXMesh::CloneMeshFVF
+678 ID3DXMesh::CloneMesh
+679 ID3DXMesh::GetVertexBuffer
+680 ID3DXMesh::GetIndexBuffer
+681 ID3DXMesh::LockVertexBuffer
+682 ID3DXMesh::UnlockVertexBuffer
+683 ID3DXMesh::LockIndexBuffer
+684 ID3DXMesh::UnlockIndexBuffer
+685 ID3DXMesh::GetAttributeTable
+686 ID3DXMesh::ConvertPointRepsToAdjacency
+687 ID3DXMesh::ConvertAdjacencyToPointReps
+688 ID3DXMesh::GenerateAdjacency
+689 ID3DXMesh::UpdateSemantics
+690 ID3DXMesh::LockAttributeBuffer
+691 ID3DXMesh::UnlockAttributeBuffer
+692 ID3DXMesh::Optimize
+693 ID3DXMesh::OptimizeInplace
+694 ID3DXMesh::SetAttributeTable
+695 ID3DXConstantTable::QueryInterface
+696 ID3DXConstantTable::AddRef
+697 ID3DXConstantTable::Release
+698 ID3DXConstantTable::GetBufferPointer
+699 ID3DXConstantTable::GetBufferSize
+700 ID3DXConstantTable::GetDesc
+701 ID3DXConstantTable::GetConstantDesc
+702 ID3DXConstantTable::GetSamplerIndex
+703 ID3DXConstantTable::GetConstant
+704 ID3DXConstantTable::GetConstantByName
+705 ID3DXConstantTable::GetConstantElement
+706 ID3DXConstantTable::SetDefaults
+707 ID3DXConstantTable::SetValue
+708 ID3DXConstantTable::SetBool
+709 ID3DXConstantTable::SetBoolArray
+710 ID3DXConstantTable::SetInt
+711 ID3DXConstantTable::SetIntArray
+712 ID3DXConstantTable::SetFloat
+713 ID3DXConstantTable::SetFloatArray
+714 ID3DXConstantTable::SetVector
+715 ID3DXConstantTable::SetVectorArray
+716 ID3DXConstantTable::SetMatrix
+717 ID3DXConstantTable::SetMatrixArray
+718 ID3DXConstantTable::SetMatrixPointerArray
+719 ID3DXConstantTable::SetMatrixTranspose
+720 ID3DXConstantTable::SetMatrixTransposeArray
+721 ID3DXConstantTable::SetMatrixTransposePointerArray
+722 CreateProcessA
+723 CreateProcessW
+724 ID3DXEffect::DeleteParameterBlock
+725 D3DXTessellateNPatches
+726 D3DXGeneratePMesh
+727 D3DXLoadMeshHierarchyFromXA
+728 D3DXLoadMeshHierarchyFromXW
+729 ID3DXEffect::SetRawValue
+730 D3DXSimplifyMesh
+731 Direct3DCreate9Ex
+732 IDirect3D9::GetAdapterModeCountEx
+733 IDirect3D9::EnumAdapterModesEx
+734 IDirect3D9::GetAdapterDisplayModeEx
+735 IDirect3D9::CreateDeviceEx
+736 IDirect3D9::GetAdapterLUID
+737 IDirect3DDevice9::SetConvolutionMonoKernel
+738 IDirect3DDevice9::ComposeRects
+739 IDirect3DDevice9::PresentEx
+740 IDirect3DDevice9::GetGPUThreadPriority
+741 IDirect3DDevice9::SetGPUThreadPriority
+742 IDirect3DDevice9::WaitForVBlank
+743 IDirect3DDevice9::CheckResourceResidency
+744 IDirect3DDevice9::SetMaximumFrameLatency
+745 IDirect3DDevice9::GetMaximumFrameLatency
+746 IDirect3DDevice9::CheckDeviceState
+747 IDirect3DDevice9::CreateRenderTargetEx
+748 IDirect3DDevice9::CreateOffscreenPlainSurfaceEx
+749 IDirect3DDevice9::CreateDepthStencilSurfaceEx
+750 IDirect3DDevice9::ResetEx
+751 IDirect3DDevice9::GetDisplayModeEx
+752 IDirect3DSwapChain9::GetLastPresentCount
+753 IDirect3DSwapChain9::GetPresentStats
+754 IDirect3DSwapChain9::GetDisplayModeEx
+755 OutputDebugStringA
+756 OutputDebugStringW
+1000 CreateDXGIFactory
+1001 IDXGISurface::QueryInterface
+1002 IDXGISurface::AddRef
+1003 IDXGISurface::Release
+1004 IDXGISurface::SetPrivateData
+1005 IDXGISurface::SetPrivateDataInterface
+1006 IDXGISurface::GetPrivateData
+1007 IDXGISurface::GetParent
+1008 IDXGISurface::GetDevice
+1009 IDXGISurface::GetDesc
+1010 IDXGISurface::Map
+1011 IDXGISurface::Unmap
+1012 IDXGIAdapter::QueryInterface
+1013 IDXGIAdapter::AddRef
+1014 IDXGIAdapter::Release
+1015 IDXGIAdapter::SetPrivateData
+1016 IDXGIAdapter::SetPrivateDataInterface
+1017 IDXGIAdapter::GetPrivateData
+1018 IDXGIAdapter::GetParent
+1019 IDXGIAdapter::EnumOutputs
+1020 IDXGIAdapter::GetDesc
+1021 IDXGIAdapter::CheckInterfaceSupport
+1022 IDXGIOutput::QueryInterface
+1023 IDXGIOutput::AddRef
+1024 IDXGIOutput::Release
+1025 IDXGIOutput::SetPrivateData
+1026 IDXGIOutput::SetPrivateDataInterface
+1027 IDXGIOutput::GetPrivateData
+1028 IDXGIOutput::GetParent
+1029 IDXGIOutput::GetDesc
+1030 IDXGIOutput::GetDisplayModeList
+1031 IDXGIOutput::FindClosestMatchingMode
+1032 IDXGIOutput::WaitForVBlank
+1033 IDXGIOutput::TakeOwnership
+1034 IDXGIOutput::ReleaseOwnership
+1035 IDXGIOutput::GetGammaControlCapabilities
+1036 IDXGIOutput::SetGammaControl
+1037 IDXGIOutput::GetGammaControl
+1038 IDXGIOutput::SetDisplaySurface
+1039 IDXGIOutput::GetDisplaySurfaceData
+1040 IDXGIOutput::GetFrameStatistics
+1041 IDXGISwapChain::QueryInterface
+1042 IDXGISwapChain::AddRef
+1043 IDXGISwapChain::Release
+1044 IDXGISwapChain::SetPrivateData
+1045 IDXGISwapChain::SetPrivateDataInterface
+1046 IDXGISwapChain::GetPrivateData
+1047 IDXGISwapChain::GetParent
+1048 IDXGISwapChain::GetDevice
+1049 IDXGISwapChain::Present
+1050 IDXGISwapChain::GetBuffer
+1051 IDXGISwapChain::SetFullscreenState
+1052 IDXGISwapChain::GetFullscreenState
+1053 IDXGISwapChain::GetDesc
+1054 IDXGISwapChain::ResizeBuffers
+1055 IDXGISwapChain::ResizeTarget
+1056 IDXGISwapChain::GetContainingOutput
+1057 IDXGISwapChain::GetFrameStatistics
+1058 IDXGISwapChain::GetLastPresentCount
+1059 IDXGIFactory::QueryInterface
+1060 IDXGIFactory::AddRef
+1061 IDXGIFactory::Release
+1062 IDXGIFactory::SetPrivateData
+1063 IDXGIFactory::SetPrivateDataInterface
+1064 IDXGIFactory::GetPrivateData
+1065 IDXGIFactory::GetParent
+1066 IDXGIFactory::EnumAdapters
+1067 IDXGIFactory::MakeWindowAssociation
+1068 IDXGIFactory::GetWindowAssociation
+1069 IDXGIFactory::CreateSwapChain
+1070 IDXGIFactory::CreateSoftwareAdapter
+1071 IDXGIDevice::QueryInterface
+1072 IDXGIDevice::AddRef
+1073 IDXGIDevice::Release
+1074 IDXGIDevice::SetPrivateData
+1075 IDXGIDevice::SetPrivateDataInterface
+1076 IDXGIDevice::GetPrivateData
+1077 IDXGIDevice::GetParent
+1078 IDXGIDevice::GetAdapter
+1079 IDXGIDevice::CreateSurface
+1080 IDXGIDevice::QueryResourceResidency
+1081 IDXGIDevice::SetGPUThreadPriority
+1082 IDXGIDevice::GetGPUThreadPriority
+1083 D3D10CreateDevice
+1084 D3D10CreateDeviceAndSwapChain
+1085 D3D10CreateStateBlock
+1086 D3D10CreateEffectFromMemory
+1087 D3D10CreateEffectPoolFromMemory
+1088 D3D10CreateDevice1
+1089 D3D10CreateDeviceAndSwapChain1
+1090 ID3D10Device1::CreateShaderResourceView1
+1091 ID3D10Device1::CreateBlendState1
+1092 ID3D10Device1::GetFeatureLevel
+1093 ID3D10BlendState::GetDesc1
+1094 ID3D10ShaderResourceView::GetDesc1
+1113 ID3D10DepthStencilState::QueryInterface
+1114 ID3D10DepthStencilState::AddRef
+1115 ID3D10DepthStencilState::Release
+1116 ID3D10DepthStencilState::GetDevice
+1117 ID3D10DepthStencilState::GetPrivateData
+1118 ID3D10DepthStencilState::SetPrivateData
+1119 ID3D10DepthStencilState::SetPrivateDataInterface
+1120 ID3D10DepthStencilState::GetDesc
+1121 ID3D10BlendState::QueryInterface
+1122 ID3D10BlendState::AddRef
+1123 ID3D10BlendState::Release
+1124 ID3D10BlendState::GetDevice
+1125 ID3D10BlendState::GetPrivateData
+1126 ID3D10BlendState::SetPrivateData
+1127 ID3D10BlendState::SetPrivateDataInterface
+1128 ID3D10BlendState::GetDesc
+1129 ID3D10RasterizerState::QueryInterface
+1130 ID3D10RasterizerState::AddRef
+1131 ID3D10RasterizerState::Release
+1132 ID3D10RasterizerState::GetDevice
+1133 ID3D10RasterizerState::GetPrivateData
+1134 ID3D10RasterizerState::SetPrivateData
+1135 ID3D10RasterizerState::SetPrivateDataInterface
+1136 ID3D10RasterizerState::GetDesc
+1137 ID3D10Buffer::QueryInterface
+1138 ID3D10Buffer::AddRef
+1139 ID3D10Buffer::Release
+1140 ID3D10Buffer::GetDevice
+1141 ID3D10Buffer::GetPrivateData
+1142 ID3D10Buffer::SetPrivateData
+1143 ID3D10Buffer::SetPrivateDataInterface
+1144 ID3D10Buffer::GetType
+1145 ID3D10Buffer::SetEvictionPriority
+1146 ID3D10Buffer::GetEvictionPriority
+1147 ID3D10Buffer::Map
+1148 ID3D10Buffer::Unmap
+1149 ID3D10Buffer::GetDesc
+1150 ID3D10Texture1D::QueryInterface
+1151 ID3D10Texture1D::AddRef
+1152 ID3D10Texture1D::Release
+1153 ID3D10Texture1D::GetDevice
+1154 ID3D10Texture1D::GetPrivateData
+1155 ID3D10Texture1D::SetPrivateData
+1156 ID3D10Texture1D::SetPrivateDataInterface
+1157 ID3D10Texture1D::GetType
+1158 ID3D10Texture1D::SetEvictionPriority
+1159 ID3D10Texture1D::GetEvictionPriority
+1160 ID3D10Texture1D::Map
+1161 ID3D10Texture1D::Unmap
+1162 ID3D10Texture1D::GetDesc
+1163 ID3D10Texture2D::QueryInterface
+1164 ID3D10Texture2D::AddRef
+1165 ID3D10Texture2D::Release
+1166 ID3D10Texture2D::GetDevice
+1167 ID3D10Texture2D::GetPrivateData
+1168 ID3D10Texture2D::SetPrivateData
+1169 ID3D10Texture2D::SetPrivateDataInterface
+1170 ID3D10Texture2D::GetType
+1171 ID3D10Texture2D::SetEvictionPriority
+1172 ID3D10Texture2D::GetEvictionPriority
+1173 ID3D10Texture2D::Map
+1174 ID3D10Texture2D::Unmap
+1175 ID3D10Texture2D::GetDesc
+1176 ID3D10Texture3D::QueryInterface
+1177 ID3D10Texture3D::AddRef
+1178 ID3D10Texture3D::Release
+1179 ID3D10Texture3D::GetDevice
+1180 ID3D10Texture3D::GetPrivateData
+1181 ID3D10Texture3D::SetPrivateData
+1182 ID3D10Texture3D::SetPrivateDataInterface
+1183 ID3D10Texture3D::GetType
+1184 ID3D10Texture3D::SetEvictionPriority
+1185 ID3D10Texture3D::GetEvictionPriority
+1186 ID3D10Texture3D::Map
+1187 ID3D10Texture3D::Unmap
+1188 ID3D10Texture3D::GetDesc
+1189 ID3D10ShaderResourceView::QueryInterface
+1190 ID3D10ShaderResourceView::AddRef
+1191 ID3D10ShaderResourceView::Release
+1192 ID3D10ShaderResourceView::GetDevice
+1193 ID3D10ShaderResourceView::GetPrivateData
+1194 ID3D10ShaderResourceView::SetPrivateData
+1195 ID3D10ShaderResourceView::SetPrivateDataInterface
+1196 ID3D10ShaderResourceView::GetResource
+1197 ID3D10ShaderResourceView::GetDesc
+1198 ID3D10RenderTargetView::QueryInterface
+1199 ID3D10RenderTargetView::AddRef
+1200 ID3D10RenderTargetView::Release
+1201 ID3D10RenderTargetView::GetDevice
+1202 ID3D10RenderTargetView::GetPrivateData
+1203 ID3D10RenderTargetView::SetPrivateData
+1204 ID3D10RenderTargetView::SetPrivateDataInterface
+1205 ID3D10RenderTargetView::GetResource
+1206 ID3D10RenderTargetView::GetDesc
+1207 ID3D10DepthStencilView::QueryInterface
+1208 ID3D10DepthStencilView::AddRef
+1209 ID3D10DepthStencilView::Release
+1210 ID3D10DepthStencilView::GetDevice
+1211 ID3D10DepthStencilView::GetPrivateData
+1212 ID3D10DepthStencilView::SetPrivateData
+1213 ID3D10DepthStencilView::SetPrivateDataInterface
+1214 ID3D10DepthStencilView::GetResource
+1215 ID3D10DepthStencilView::GetDesc
+1216 ID3D10VertexShader::QueryInterface
+1217 ID3D10VertexShader::AddRef
+1218 ID3D10VertexShader::Release
+1219 ID3D10VertexShader::GetDevice
+1220 ID3D10VertexShader::GetPrivateData
+1221 ID3D10VertexShader::SetPrivateData
+1222 ID3D10VertexShader::SetPrivateDataInterface
+1223 ID3D10GeometryShader::QueryInterface
+1224 ID3D10GeometryShader::AddRef
+1225 ID3D10GeometryShader::Release
+1226 ID3D10GeometryShader::GetDevice
+1227 ID3D10GeometryShader::GetPrivateData
+1228 ID3D10GeometryShader::SetPrivateData
+1229 ID3D10GeometryShader::SetPrivateDataInterface
+1230 ID3D10PixelShader::QueryInterface
+1231 ID3D10PixelShader::AddRef
+1232 ID3D10PixelShader::Release
+1233 ID3D10PixelShader::GetDevice
+1234 ID3D10PixelShader::GetPrivateData
+1235 ID3D10PixelShader::SetPrivateData
+1236 ID3D10PixelShader::SetPrivateDataInterface
+1237 ID3D10InputLayout::QueryInterface
+1238 ID3D10InputLayout::AddRef
+1239 ID3D10InputLayout::Release
+1240 ID3D10InputLayout::GetDevice
+1241 ID3D10InputLayout::GetPrivateData
+1242 ID3D10InputLayout::SetPrivateData
+1243 ID3D10InputLayout::SetPrivateDataInterface
+1244 ID3D10SamplerState::QueryInterface
+1245 ID3D10SamplerState::AddRef
+1246 ID3D10SamplerState::Release
+1247 ID3D10SamplerState::GetDevice
+1248 ID3D10SamplerState::GetPrivateData
+1249 ID3D10SamplerState::SetPrivateData
+1250 ID3D10SamplerState::SetPrivateDataInterface
+1251 ID3D10SamplerState::GetDesc
+1252 ID3D10Query::QueryInterface
+1253 ID3D10Query::AddRef
+1254 ID3D10Query::Release
+1255 ID3D10Query::GetDevice
+1256 ID3D10Query::GetPrivateData
+1257 ID3D10Query::SetPrivateData
+1258 ID3D10Query::SetPrivateDataInterface
+1259 ID3D10Query::Begin
+1260 ID3D10Query::End
+1261 ID3D10Query::GetData
+1262 ID3D10Query::GetDataSize
+1263 ID3D10Query::GetDesc
+1264 ID3D10Predicate::QueryInterface
+1265 ID3D10Predicate::AddRef
+1266 ID3D10Predicate::Release
+1267 ID3D10Predicate::GetDevice
+1268 ID3D10Predicate::GetPrivateData
+1269 ID3D10Predicate::SetPrivateData
+1270 ID3D10Predicate::SetPrivateDataInterface
+1271 ID3D10Predicate::Begin
+1272 ID3D10Predicate::End
+1273 ID3D10Predicate::GetData
+1274 ID3D10Predicate::GetDataSize
+1275 ID3D10Predicate::GetDesc
+1276 ID3D10Counter::QueryInterface
+1277 ID3D10Counter::AddRef
+1278 ID3D10Counter::Release
+1279 ID3D10Counter::GetDevice
+1280 ID3D10Counter::GetPrivateData
+1281 ID3D10Counter::SetPrivateData
+1282 ID3D10Counter::SetPrivateDataInterface
+1283 ID3D10Counter::Begin
+1284 ID3D10Counter::End
+1285 ID3D10Counter::GetData
+1286 ID3D10Counter::GetDataSize
+1287 ID3D10Counter::GetDesc
+1288 ID3D10Device::QueryInterface
+1289 ID3D10Device::AddRef
+1290 ID3D10Device::Release
+1291 ID3D10Device::VSSetConstantBuffers
+1292 ID3D10Device::PSSetShaderResources
+1293 ID3D10Device::PSSetShader
+1294 ID3D10Device::PSSetSamplers
+1295 ID3D10Device::VSSetShader
+1296 ID3D10Device::DrawIndexed
+1297 ID3D10Device::Draw
+1298 ID3D10Device::PSSetConstantBuffers
+1299 ID3D10Device::IASetInputLayout
+1300 ID3D10Device::IASetVertexBuffers
+1301 ID3D10Device::IASetIndexBuffer
+1302 ID3D10Device::DrawIndexedInstanced
+1303 ID3D10Device::DrawInstanced
+1304 ID3D10Device::GSSetConstantBuffers
+1305 ID3D10Device::GSSetShader
+1306 ID3D10Device::IASetPrimitiveTopology
+1307 ID3D10Device::VSSetShaderResources
+1308 ID3D10Device::VSSetSamplers
+1309 ID3D10Device::SetPredication
+1310 ID3D10Device::GSSetShaderResources
+1311 ID3D10Device::GSSetSamplers
+1312 ID3D10Device::OMSetRenderTargets
+1313 ID3D10Device::OMSetBlendState
+1314 ID3D10Device::OMSetDepthStencilState
+1315 ID3D10Device::SOSetTargets
+1316 ID3D10Device::DrawAuto
+1317 ID3D10Device::RSSetState
+1318 ID3D10Device::RSSetViewports
+1319 ID3D10Device::RSSetScissorRects
+1320 ID3D10Device::CopySubresourceRegion
+1321 ID3D10Device::CopyResource
+1322 ID3D10Device::UpdateSubresource
+1323 ID3D10Device::ClearRenderTargetView
+1324 ID3D10Device::ClearDepthStencilView
+1325 ID3D10Device::GenerateMips
+1326 ID3D10Device::ResolveSubresource
+1327 ID3D10Device::VSGetConstantBuffers
+1328 ID3D10Device::PSGetShaderResources
+1329 ID3D10Device::PSGetShader
+1330 ID3D10Device::PSGetSamplers
+1331 ID3D10Device::VSGetShader
+1332 ID3D10Device::PSGetConstantBuffers
+1333 ID3D10Device::IAGetInputLayout
+1334 ID3D10Device::IAGetVertexBuffers
+1335 ID3D10Device::IAGetIndexBuffer
+1336 ID3D10Device::GSGetConstantBuffers
+1337 ID3D10Device::GSGetShader
+1338 ID3D10Device::IAGetPrimitiveTopology
+1339 ID3D10Device::VSGetShaderResources
+1340 ID3D10Device::VSGetSamplers
+1341 ID3D10Device::GetPredication
+1342 ID3D10Device::GSGetShaderResources
+1343 ID3D10Device::GSGetSamplers
+1344 ID3D10Device::OMGetRenderTargets
+1345 ID3D10Device::OMGetBlendState
+1346 ID3D10Device::OMGetDepthStencilState
+1347 ID3D10Device::SOGetTargets
+1348 ID3D10Device::RSGetState
+1349 ID3D10Device::RSGetViewports
+1350 ID3D10Device::RSGetScissorRects
+1351 ID3D10Device::GetDeviceRemovedReason
+1352 ID3D10Device::SetExceptionMode
+1353 ID3D10Device::GetExceptionMode
+1354 ID3D10Device::GetPrivateData
+1355 ID3D10Device::SetPrivateData
+1356 ID3D10Device::SetPrivateDataInterface
+1357 ID3D10Device::ClearState
+1358 ID3D10Device::Flush
+1359 ID3D10Device::CreateBuffer
+1360 ID3D10Device::CreateTexture1D
+1361 ID3D10Device::CreateTexture2D
+1362 ID3D10Device::CreateTexture3D
+1363 ID3D10Device::CreateShaderResourceView
+1364 ID3D10Device::CreateRenderTargetView
+1365 ID3D10Device::CreateDepthStencilView
+1366 ID3D10Device::CreateInputLayout
+1367 ID3D10Device::CreateVertexShader
+1368 ID3D10Device::CreateGeometryShader
+1369 ID3D10Device::CreateGeometryShaderWithStreamOutput
+1370 ID3D10Device::CreatePixelShader
+1371 ID3D10Device::CreateBlendState
+1372 ID3D10Device::CreateDepthStencilState
+1373 ID3D10Device::CreateRasterizerState
+1374 ID3D10Device::CreateSamplerState
+1375 ID3D10Device::CreateQuery
+1376 ID3D10Device::CreatePredicate
+1377 ID3D10Device::CreateCounter
+1378 ID3D10Device::CheckFormatSupport
+1379 ID3D10Device::CheckMultisampleQualityLevels
+1380 ID3D10Device::CheckCounterInfo
+1381 ID3D10Device::CheckCounter
+1382 ID3D10Device::GetCreationFlags
+1383 ID3D10Device::OpenSharedResource
+1384 ID3D10Multithread::QueryInterface
+1385 ID3D10Multithread::AddRef
+1386 ID3D10Multithread::Release
+1387 ID3D10Multithread::Enter
+1388 ID3D10Multithread::Leave
+1389 ID3D10Multithread::SetMultithreadProtected
+1390 ID3D10Multithread::GetMultithreadProtected
+1391 ID3D10StateBlock::QueryInterface
+1392 ID3D10StateBlock::AddRef
+1393 ID3D10StateBlock::Release
+1394 ID3D10StateBlock::Capture
+1395 ID3D10StateBlock::Apply
+1396 ID3D10StateBlock::ReleaseAllDeviceObjects
+1397 ID3D10StateBlock::GetDevice
+1398 ID3D10Effect::QueryInterface
+1399 ID3D10Effect::AddRef
+1400 ID3D10Effect::Release
+1401 ID3D10Effect::IsValid
+1402 ID3D10Effect::IsPool
+1403 ID3D10Effect::GetDevice
+1404 ID3D10Effect::GetDesc
+1405 ID3D10Effect::GetConstantBufferByIndex
+1406 ID3D10Effect::GetConstantBufferByName
+1407 ID3D10Effect::GetVariableByIndex
+1408 ID3D10Effect::GetVariableByName
+1409 ID3D10Effect::GetVariableBySemantic
+1410 ID3D10Effect::GetTechniqueByIndex
+1411 ID3D10Effect::GetTechniqueByName
+1412 ID3D10Effect::Optimize
+1413 ID3D10Effect::IsOptimized
+1414 ID3D10EffectPool::QueryInterface
+1415 ID3D10EffectPool::AddRef
+1416 ID3D10EffectPool::Release
+1417 ID3D10EffectPool::AsEffect
+1418 ID3D10EffectTechnique::IsValid
+1419 ID3D10EffectTechnique::GetDesc
+1420 ID3D10EffectTechnique::GetAnnotationByIndex
+1421 ID3D10EffectTechnique::GetAnnotationByName
+1422 ID3D10EffectTechnique::GetPassByIndex
+1423 ID3D10EffectTechnique::GetPassByName
+1424 ID3D10EffectTechnique::ComputeStateBlockMask
+1425 ID3D10EffectPass::IsValid
+1426 ID3D10EffectPass::GetDesc
+1427 ID3D10EffectPass::GetVertexShaderDesc
+1428 ID3D10EffectPass::GetGeometryShaderDesc
+1429 ID3D10EffectPass::GetPixelShaderDesc
+1430 ID3D10EffectPass::GetAnnotationByIndex
+1431 ID3D10EffectPass::GetAnnotationByName
+1432 ID3D10EffectPass::Apply
+1433 ID3D10EffectPass::ComputeStateBlockMask
+1434 ID3D10EffectVariable::IsValid
+1435 ID3D10EffectVariable::GetType
+1436 ID3D10EffectVariable::GetDesc
+1437 ID3D10EffectVariable::GetAnnotationByIndex
+1438 ID3D10EffectVariable::GetAnnotationByName
+1439 ID3D10EffectVariable::GetMemberByIndex
+1440 ID3D10EffectVariable::GetMemberByName
+1441 ID3D10EffectVariable::GetMemberBySemantic
+1442 ID3D10EffectVariable::GetElement
+1443 ID3D10EffectVariable::GetParentConstantBuffer
+1444 ID3D10EffectVariable::AsScalar
+1445 ID3D10EffectVariable::AsVector
+1446 ID3D10EffectVariable::AsMatrix
+1447 ID3D10EffectVariable::AsString
+1448 ID3D10EffectVariable::AsShaderResource
+1449 ID3D10EffectVariable::AsRenderTargetView
+1450 ID3D10EffectVariable::AsDepthStencilView
+1451 ID3D10EffectVariable::AsConstantBuffer
+1452 ID3D10EffectVariable::AsShader
+1453 ID3D10EffectVariable::AsBlend
+1454 ID3D10EffectVariable::AsDepthStencil
+1455 ID3D10EffectVariable::AsRasterizer
+1456 ID3D10EffectVariable::AsSampler
+1457 ID3D10EffectVariable::SetRawValue
+1458 ID3D10EffectVariable::GetRawValue
+1459 ID3D10EffectScalarVariable::IsValid
+1460 ID3D10EffectScalarVariable::GetType
+1461 ID3D10EffectScalarVariable::GetDesc
+1462 ID3D10EffectScalarVariable::GetAnnotationByIndex
+1463 ID3D10EffectScalarVariable::GetAnnotationByName
+1464 ID3D10EffectScalarVariable::GetMemberByIndex
+1465 ID3D10EffectScalarVariable::GetMemberByName
+1466 ID3D10EffectScalarVariable::GetMemberBySemantic
+1467 ID3D10EffectScalarVariable::GetElement
+1468 ID3D10EffectScalarVariable::GetParentConstantBuffer
+1469 ID3D10EffectScalarVariable::AsScalar
+1470 ID3D10EffectScalarVariable::AsVector
+1471 ID3D10EffectScalarVariable::AsMatrix
+1472 ID3D10EffectScalarVariable::AsString
+1473 ID3D10EffectScalarVariable::AsShaderResource
+1474 ID3D10EffectScalarVariable::AsRenderTargetView
+1475 ID3D10EffectScalarVariable::AsDepthStencilView
+1476 ID3D10EffectScalarVariable::AsConstantBuffer
+1477 ID3D10EffectScalarVariable::AsShader
+1478 ID3D10EffectScalarVariable::AsBlend
+1479 ID3D10EffectScalarVariable::AsDepthStencil
+1480 ID3D10EffectScalarVariable::AsRasterizer
+1481 ID3D10EffectScalarVariable::AsSampler
+1482 ID3D10EffectScalarVariable::SetRawValue
+1483 ID3D10EffectScalarVariable::GetRawValue
+1484 ID3D10EffectScalarVariable::SetFloat
+1485 ID3D10EffectScalarVariable::GetFloat
+1486 ID3D10EffectScalarVariable::SetFloatArray
+1487 ID3D10EffectScalarVariable::GetFloatArray
+1488 ID3D10EffectScalarVariable::SetInt
+1489 ID3D10EffectScalarVariable::GetInt
+1490 ID3D10EffectScalarVariable::SetIntArray
+1491 ID3D10EffectScalarVariable::GetIntArray
+1492 ID3D10EffectScalarVariable::SetBool
+1493 ID3D10EffectScalarVariable::GetBool
+1494 ID3D10EffectScalarVariable::SetBoolArray
+1495 ID3D10EffectScalarVariable::GetBoolArray
+1496 ID3D10EffectVectorVariable::IsValid
+1497 ID3D10EffectVectorVariable::GetType
+1498 ID3D10EffectVectorVariable::GetDesc
+1499 ID3D10EffectVectorVariable::GetAnnotationByIndex
+1500 ID3D10EffectVectorVariable::GetAnnotationByName
+1501 ID3D10EffectVectorVariable::GetMemberByIndex
+1502 ID3D10EffectVectorVariable::GetMemberByName
+1503 ID3D10EffectVectorVariable::GetMemberBySemantic
+1504 ID3D10EffectVectorVariable::GetElement
+1505 ID3D10EffectVectorVariable::GetParentConstantBuffer
+1506 ID3D10EffectVectorVariable::AsScalar
+1507 ID3D10EffectVectorVariable::AsVector
+1508 ID3D10EffectVectorVariable::AsMatrix
+1509 ID3D10EffectVectorVariable::AsString
+1510 ID3D10EffectVectorVariable::AsShaderResource
+1511 ID3D10EffectVectorVariable::AsRenderTargetView
+1512 ID3D10EffectVectorVariable::AsDepthStencilView
+1513 ID3D10EffectVectorVariable::AsConstantBuffer
+1514 ID3D10EffectVectorVariable::AsShader
+1515 ID3D10EffectVectorVariable::AsBlend
+1516 ID3D10EffectVectorVariable::AsDepthStencil
+1517 ID3D10EffectVectorVariable::AsRasterizer
+1518 ID3D10EffectVectorVariable::AsSampler
+1519 ID3D10EffectVectorVariable::SetRawValue
+1520 ID3D10EffectVectorVariable::GetRawValue
+1521 ID3D10EffectVectorVariable::SetBoolVector
+1522 ID3D10EffectVectorVariable::SetIntVector
+1523 ID3D10EffectVectorVariable::SetFloatVector
+1524 ID3D10EffectVectorVariable::GetBoolVector
+1525 ID3D10EffectVectorVariable::GetIntVector
+1526 ID3D10EffectVectorVariable::GetFloatVector
+1527 ID3D10EffectVectorVariable::SetBoolVectorArray
+1528 ID3D10EffectVectorVariable::SetIntVectorArray
+1529 ID3D10EffectVectorVariable::SetFloatVectorArray
+1530 ID3D10EffectVectorVariable::GetBoolVectorArray
+1531 ID3D10EffectVectorVariable::GetIntVectorArray
+1532 ID3D10EffectVectorVariable::GetFloatVectorArray
+1533 ID3D10EffectMatrixVariable::IsValid
+1534 ID3D10EffectMatrixVariable::GetType
+1535 ID3D10EffectMatrixVariable::GetDesc
+1536 ID3D10EffectMatrixVariable::GetAnnotationByIndex
+1537 ID3D10EffectMatrixVariable::GetAnnotationByName
+1538 ID3D10EffectMatrixVariable::GetMemberByIndex
+1539 ID3D10EffectMatrixVariable::GetMemberByName
+1540 ID3D10EffectMatrixVariable::GetMemberBySemantic
+1541 ID3D10EffectMatrixVariable::GetElement
+1542 ID3D10EffectMatrixVariable::GetParentConstantBuffer
+1543 ID3D10EffectMatrixVariable::AsScalar
+1544 ID3D10EffectMatrixVariable::AsVector
+1545 ID3D10EffectMatrixVariable::AsMatrix
+1546 ID3D10EffectMatrixVariable::AsString
+1547 ID3D10EffectMatrixVariable::AsShaderResource
+1548 ID3D10EffectMatrixVariable::AsRenderTargetView
+1549 ID3D10EffectMatrixVariable::AsDepthStencilView
+1550 ID3D10EffectMatrixVariable::AsConstantBuffer
+1551 ID3D10EffectMatrixVariable::AsShader
+1552 ID3D10EffectMatrixVariable::AsBlend
+1553 ID3D10EffectMatrixVariable::AsDepthStencil
+1554 ID3D10EffectMatrixVariable::AsRasterizer
+1555 ID3D10EffectMatrixVariable::AsSampler
+1556 ID3D10EffectMatrixVariable::SetRawValue
+1557 ID3D10EffectMatrixVariable::GetRawValue
+1558 ID3D10EffectMatrixVariable::SetMatrix
+1559 ID3D10EffectMatrixVariable::GetMatrix
+1560 ID3D10EffectMatrixVariable::SetMatrixArray
+1561 ID3D10EffectMatrixVariable::GetMatrixArray
+1562 ID3D10EffectMatrixVariable::SetMatrixTranspose
+1563 ID3D10EffectMatrixVariable::GetMatrixTranspose
+1564 ID3D10EffectMatrixVariable::SetMatrixTransposeArray
+1565 ID3D10EffectMatrixVariable::GetMatrixTransposeArray
+1566 ID3D10EffectStringVariable::IsValid
+1567 ID3D10EffectStringVariable::GetType
+1568 ID3D10EffectStringVariable::GetDesc
+1569 ID3D10EffectStringVariable::GetAnnotationByIndex
+1570 ID3D10EffectStringVariable::GetAnnotationByName
+1571 ID3D10EffectStringVariable::GetMemberByIndex
+1572 ID3D10EffectStringVariable::GetMemberByName
+1573 ID3D10EffectStringVariable::GetMemberBySemantic
+1574 ID3D10EffectStringVariable::GetElement
+1575 ID3D10EffectStringVariable::GetParentConstantBuffer
+1576 ID3D10EffectStringVariable::AsScalar
+1577 ID3D10EffectStringVariable::AsVector
+1578 ID3D10EffectStringVariable::AsMatrix
+1579 ID3D10EffectStringVariable::AsString
+1580 ID3D10EffectStringVariable::AsShaderResource
+1581 ID3D10EffectStringVariable::AsRenderTargetView
+1582 ID3D10EffectStringVariable::AsDepthStencilView
+1583 ID3D10EffectStringVariable::AsConstantBuffer
+1584 ID3D10EffectStringVariable::AsShader
+1585 ID3D10EffectStringVariable::AsBlend
+1586 ID3D10EffectStringVariable::AsDepthStencil
+1587 ID3D10EffectStringVariable::AsRasterizer
+1588 ID3D10EffectStringVariable::AsSampler
+1589 ID3D10EffectStringVariable::SetRawValue
+1590 ID3D10EffectStringVariable::GetRawValue
+1591 ID3D10EffectStringVariable::GetString
+1592 ID3D10EffectStringVariable::GetStringArray
+1593 ID3D10EffectShaderResourceVariable::IsValid
+1594 ID3D10EffectShaderResourceVariable::GetType
+1595 ID3D10EffectShaderResourceVariable::GetDesc
+1596 ID3D10EffectShaderResourceVariable::GetAnnotationByIndex
+1597 ID3D10EffectShaderResourceVariable::GetAnnotationByName
+1598 ID3D10EffectShaderResourceVariable::GetMemberByIndex
+1599 ID3D10EffectShaderResourceVariable::GetMemberByName
+1600 ID3D10EffectShaderResourceVariable::GetMemberBySemantic
+1601 ID3D10EffectShaderResourceVariable::GetElement
+1602 ID3D10EffectShaderResourceVariable::GetParentConstantBuffer
+1603 ID3D10EffectShaderResourceVariable::AsScalar
+1604 ID3D10EffectShaderResourceVariable::AsVector
+1605 ID3D10EffectShaderResourceVariable::AsMatrix
+1606 ID3D10EffectShaderResourceVariable::AsString
+1607 ID3D10EffectShaderResourceVariable::AsShaderResource
+1608 ID3D10EffectShaderResourceVariable::AsRenderTargetView
+1609 ID3D10EffectShaderResourceVariable::AsDepthStencilView
+1610 ID3D10EffectShaderResourceVariable::AsConstantBuffer
+1611 ID3D10EffectShaderResourceVariable::AsShader
+1612 ID3D10EffectShaderResourceVariable::AsBlend
+1613 ID3D10EffectShaderResourceVariable::AsDepthStencil
+1614 ID3D10EffectShaderResourceVariable::AsRasterizer
+1615 ID3D10EffectShaderResourceVariable::AsSampler
+1616 ID3D10EffectShaderResourceVariable::SetRawValue
+1617 ID3D10EffectShaderResourceVariable::GetRawValue
+1618 ID3D10EffectShaderResourceVariable::SetResource
+1619 ID3D10EffectShaderResourceVariable::GetResource
+1620 ID3D10EffectShaderResourceVariable::SetResourceArray
+1621 ID3D10EffectShaderResourceVariable::GetResourceArray
+1622 ID3D10EffectRenderTargetViewVariable::IsValid
+1623 ID3D10EffectRenderTargetViewVariable::GetType
+1624 ID3D10EffectRenderTargetViewVariable::GetDesc
+1625 ID3D10EffectRenderTargetViewVariable::GetAnnotationByIndex
+1626 ID3D10EffectRenderTargetViewVariable::GetAnnotationByName
+1627 ID3D10EffectRenderTargetViewVariable::GetMemberByIndex
+1628 ID3D10EffectRenderTargetViewVariable::GetMemberByName
+1629 ID3D10EffectRenderTargetViewVariable::GetMemberBySemantic
+1630 ID3D10EffectRenderTargetViewVariable::GetElement
+1631 ID3D10EffectRenderTargetViewVariable::GetParentConstantBuffer
+1632 ID3D10EffectRenderTargetViewVariable::AsScalar
+1633 ID3D10EffectRenderTargetViewVariable::AsVector
+1634 ID3D10EffectRenderTargetViewVariable::AsMatrix
+1635 ID3D10EffectRenderTargetViewVariable::AsString
+1636 ID3D10EffectRenderTargetViewVariable::AsShaderResource
+1637 ID3D10EffectRenderTargetViewVariable::AsRenderTargetView
+1638 ID3D10EffectRenderTargetViewVariable::AsDepthStencilView
+1639 ID3D10EffectRenderTargetViewVariable::AsConstantBuffer
+1640 ID3D10EffectRenderTargetViewVariable::AsShader
+1641 ID3D10EffectRenderTargetViewVariable::AsBlend
+1642 ID3D10EffectRenderTargetViewVariable::AsDepthStencil
+1643 ID3D10EffectRenderTargetViewVariable::AsRasterizer
+1644 ID3D10EffectRenderTargetViewVariable::AsSampler
+1645 ID3D10EffectRenderTargetViewVariable::SetRawValue
+1646 ID3D10EffectRenderTargetViewVariable::GetRawValue
+1647 ID3D10EffectRenderTargetViewVariable::SetRenderTarget
+1648 ID3D10EffectRenderTargetViewVariable::GetRenderTarget
+1649 ID3D10EffectRenderTargetViewVariable::SetRenderTargetArray
+1650 ID3D10EffectRenderTargetViewVariable::GetRenderTargetArray
+1651 ID3D10EffectDepthStencilViewVariable::IsValid
+1652 ID3D10EffectDepthStencilViewVariable::GetType
+1653 ID3D10EffectDepthStencilViewVariable::GetDesc
+1654 ID3D10EffectDepthStencilViewVariable::GetAnnotationByIndex
+1655 ID3D10EffectDepthStencilViewVariable::GetAnnotationByName
+1656 ID3D10EffectDepthStencilViewVariable::GetMemberByIndex
+1657 ID3D10EffectDepthStencilViewVariable::GetMemberByName
+1658 ID3D10EffectDepthStencilViewVariable::GetMemberBySemantic
+1659 ID3D10EffectDepthStencilViewVariable::GetElement
+1660 ID3D10EffectDepthStencilViewVariable::GetParentConstantBuffer
+1661 ID3D10EffectDepthStencilViewVariable::AsScalar
+1662 ID3D10EffectDepthStencilViewVariable::AsVector
+1663 ID3D10EffectDepthStencilViewVariable::AsMatrix
+1664 ID3D10EffectDepthStencilViewVariable::AsString
+1665 ID3D10EffectDepthStencilViewVariable::AsShaderResource
+1666 ID3D10EffectDepthStencilViewVariable::AsRenderTargetView
+1667 ID3D10EffectDepthStencilViewVariable::AsDepthStencilView
+1668 ID3D10EffectDepthStencilViewVariable::AsConstantBuffer
+1669 ID3D10EffectDepthStencilViewVariable::AsShader
+1670 ID3D10EffectDepthStencilViewVariable::AsBlend
+1671 ID3D10EffectDepthStencilViewVariable::AsDepthStencil
+1672 ID3D10EffectDepthStencilViewVariable::AsRasterizer
+1673 ID3D10EffectDepthStencilViewVariable::AsSampler
+1674 ID3D10EffectDepthStencilViewVariable::SetRawValue
+1675 ID3D10EffectDepthStencilViewVariable::GetRawValue
+1676 ID3D10EffectDepthStencilViewVariable::SetDepthStencil
+1677 ID3D10EffectDepthStencilViewVariable::GetDepthStencil
+1678 ID3D10EffectDepthStencilViewVariable::SetDepthStencilArray
+1679 ID3D10EffectDepthStencilViewVariable::GetDepthStencilArray
+1680 ID3D10EffectConstantBuffer::IsValid
+1681 ID3D10EffectConstantBuffer::GetType
+1682 ID3D10EffectConstantBuffer::GetDesc
+1683 ID3D10EffectConstantBuffer::GetAnnotationByIndex
+1684 ID3D10EffectConstantBuffer::GetAnnotationByName
+1685 ID3D10EffectConstantBuffer::GetMemberByIndex
+1686 ID3D10EffectConstantBuffer::GetMemberByName
+1687 ID3D10EffectConstantBuffer::GetMemberBySemantic
+1688 ID3D10EffectConstantBuffer::GetElement
+1689 ID3D10EffectConstantBuffer::GetParentConstantBuffer
+1690 ID3D10EffectConstantBuffer::AsScalar
+1691 ID3D10EffectConstantBuffer::AsVector
+1692 ID3D10EffectConstantBuffer::AsMatrix
+1693 ID3D10EffectConstantBuffer::AsString
+1694 ID3D10EffectConstantBuffer::AsShaderResource
+1695 ID3D10EffectConstantBuffer::AsRenderTargetView
+1696 ID3D10EffectConstantBuffer::AsDepthStencilView
+1697 ID3D10EffectConstantBuffer::AsConstantBuffer
+1698 ID3D10EffectConstantBuffer::AsShader
+1699 ID3D10EffectConstantBuffer::AsBlend
+1700 ID3D10EffectConstantBuffer::AsDepthStencil
+1701 ID3D10EffectConstantBuffer::AsRasterizer
+1702 ID3D10EffectConstantBuffer::AsSampler
+1703 ID3D10EffectConstantBuffer::SetRawValue
+1704 ID3D10EffectConstantBuffer::GetRawValue
+1705 ID3D10EffectConstantBuffer::SetConstantBuffer
+1706 ID3D10EffectConstantBuffer::GetConstantBuffer
+1707 ID3D10EffectConstantBuffer::SetTextureBuffer
+1708 ID3D10EffectConstantBuffer::GetTextureBuffer
+1709 ID3D10EffectShaderVariable::IsValid
+1710 ID3D10EffectShaderVariable::GetType
+1711 ID3D10EffectShaderVariable::GetDesc
+1712 ID3D10EffectShaderVariable::GetAnnotationByIndex
+1713 ID3D10EffectShaderVariable::GetAnnotationByName
+1714 ID3D10EffectShaderVariable::GetMemberByIndex
+1715 ID3D10EffectShaderVariable::GetMemberByName
+1716 ID3D10EffectShaderVariable::GetMemberBySemantic
+1717 ID3D10EffectShaderVariable::GetElement
+1718 ID3D10EffectShaderVariable::GetParentConstantBuffer
+1719 ID3D10EffectShaderVariable::AsScalar
+1720 ID3D10EffectShaderVariable::AsVector
+1721 ID3D10EffectShaderVariable::AsMatrix
+1722 ID3D10EffectShaderVariable::AsString
+1723 ID3D10EffectShaderVariable::AsShaderResource
+1724 ID3D10EffectShaderVariable::AsRenderTargetView
+1725 ID3D10EffectShaderVariable::AsDepthStencilView
+1726 ID3D10EffectShaderVariable::AsConstantBuffer
+1727 ID3D10EffectShaderVariable::AsShader
+1728 ID3D10EffectShaderVariable::AsBlend
+1729 ID3D10EffectShaderVariable::AsDepthStencil
+1730 ID3D10EffectShaderVariable::AsRasterizer
+1731 ID3D10EffectShaderVariable::AsSampler
+1732 ID3D10EffectShaderVariable::SetRawValue
+1733 ID3D10EffectShaderVariable::GetRawValue
+1734 ID3D10EffectShaderVariable::GetShaderDesc
+1735 ID3D10EffectShaderVariable::GetVertexShader
+1736 ID3D10EffectShaderVariable::GetGeometryShader
+1737 ID3D10EffectShaderVariable::GetPixelShader
+1738 ID3D10EffectShaderVariable::GetInputSignatureElementDesc
+1739 ID3D10EffectShaderVariable::GetOutputSignatureElementDesc
+1740 ID3D10EffectBlendVariable::IsValid
+1741 ID3D10EffectBlendVariable::GetType
+1742 ID3D10EffectBlendVariable::GetDesc
+1743 ID3D10EffectBlendVariable::GetAnnotationByIndex
+1744 ID3D10EffectBlendVariable::GetAnnotationByName
+1745 ID3D10EffectBlendVariable::GetMemberByIndex
+1746 ID3D10EffectBlendVariable::GetMemberByName
+1747 ID3D10EffectBlendVariable::GetMemberBySemantic
+1748 ID3D10EffectBlendVariable::GetElement
+1749 ID3D10EffectBlendVariable::GetParentConstantBuffer
+1750 ID3D10EffectBlendVariable::AsScalar
+1751 ID3D10EffectBlendVariable::AsVector
+1752 ID3D10EffectBlendVariable::AsMatrix
+1753 ID3D10EffectBlendVariable::AsString
+1754 ID3D10EffectBlendVariable::AsShaderResource
+1755 ID3D10EffectBlendVariable::AsRenderTargetView
+1756 ID3D10EffectBlendVariable::AsDepthStencilView
+1757 ID3D10EffectBlendVariable::AsConstantBuffer
+1758 ID3D10EffectBlendVariable::AsShader
+1759 ID3D10EffectBlendVariable::AsBlend
+1760 ID3D10EffectBlendVariable::AsDepthStencil
+1761 ID3D10EffectBlendVariable::AsRasterizer
+1762 ID3D10EffectBlendVariable::AsSampler
+1763 ID3D10EffectBlendVariable::SetRawValue
+1764 ID3D10EffectBlendVariable::GetRawValue
+1765 ID3D10EffectBlendVariable::GetBlendState
+1766 ID3D10EffectBlendVariable::GetBackingStore
+1767 ID3D10EffectDepthStencilVariable::IsValid
+1768 ID3D10EffectDepthStencilVariable::GetType
+1769 ID3D10EffectDepthStencilVariable::GetDesc
+1770 ID3D10EffectDepthStencilVariable::GetAnnotationByIndex
+1771 ID3D10EffectDepthStencilVariable::GetAnnotationByName
+1772 ID3D10EffectDepthStencilVariable::GetMemberByIndex
+1773 ID3D10EffectDepthStencilVariable::GetMemberByName
+1774 ID3D10EffectDepthStencilVariable::GetMemberBySemantic
+1775 ID3D10EffectDepthStencilVariable::GetElement
+1776 ID3D10EffectDepthStencilVariable::GetParentConstantBuffer
+1777 ID3D10EffectDepthStencilVariable::AsScalar
+1778 ID3D10EffectDepthStencilVariable::AsVector
+1779 ID3D10EffectDepthStencilVariable::AsMatrix
+1780 ID3D10EffectDepthStencilVariable::AsString
+1781 ID3D10EffectDepthStencilVariable::AsShaderResource
+1782 ID3D10EffectDepthStencilVariable::AsRenderTargetView
+1783 ID3D10EffectDepthStencilVariable::AsDepthStencilView
+1784 ID3D10EffectDepthStencilVariable::AsConstantBuffer
+1785 ID3D10EffectDepthStencilVariable::AsShader
+1786 ID3D10EffectDepthStencilVariable::AsBlend
+1787 ID3D10EffectDepthStencilVariable::AsDepthStencil
+1788 ID3D10EffectDepthStencilVariable::AsRasterizer
+1789 ID3D10EffectDepthStencilVariable::AsSampler
+1790 ID3D10EffectDepthStencilVariable::SetRawValue
+1791 ID3D10EffectDepthStencilVariable::GetRawValue
+1792 ID3D10EffectDepthStencilVariable::GetDepthStencilState
+1793 ID3D10EffectDepthStencilVariable::GetBackingStore
+1794 ID3D10EffectRasterizerVariable::IsValid
+1795 ID3D10EffectRasterizerVariable::GetType
+1796 ID3D10EffectRasterizerVariable::GetDesc
+1797 ID3D10EffectRasterizerVariable::GetAnnotationByIndex
+1798 ID3D10EffectRasterizerVariable::GetAnnotationByName
+1799 ID3D10EffectRasterizerVariable::GetMemberByIndex
+1800 ID3D10EffectRasterizerVariable::GetMemberByName
+1801 ID3D10EffectRasterizerVariable::GetMemberBySemantic
+1802 ID3D10EffectRasterizerVariable::GetElement
+1803 ID3D10EffectRasterizerVariable::GetParentConstantBuffer
+1804 ID3D10EffectRasterizerVariable::AsScalar
+1805 ID3D10EffectRasterizerVariable::AsVector
+1806 ID3D10EffectRasterizerVariable::AsMatrix
+1807 ID3D10EffectRasterizerVariable::AsString
+1808 ID3D10EffectRasterizerVariable::AsShaderResource
+1809 ID3D10EffectRasterizerVariable::AsRenderTargetView
+1810 ID3D10EffectRasterizerVariable::AsDepthStencilView
+1811 ID3D10EffectRasterizerVariable::AsConstantBuffer
+1812 ID3D10EffectRasterizerVariable::AsShader
+1813 ID3D10EffectRasterizerVariable::AsBlend
+1814 ID3D10EffectRasterizerVariable::AsDepthStencil
+1815 ID3D10EffectRasterizerVariable::AsRasterizer
+1816 ID3D10EffectRasterizerVariable::AsSampler
+1817 ID3D10EffectRasterizerVariable::SetRawValue
+1818 ID3D10EffectRasterizerVariable::GetRawValue
+1819 ID3D10EffectRasterizerVariable::GetRasterizerState
+1820 ID3D10EffectRasterizerVariable::GetBackingStore
+1821 ID3D10EffectSamplerVariable::IsValid
+1822 ID3D10EffectSamplerVariable::GetType
+1823 ID3D10EffectSamplerVariable::GetDesc
+1824 ID3D10EffectSamplerVariable::GetAnnotationByIndex
+1825 ID3D10EffectSamplerVariable::GetAnnotationByName
+1826 ID3D10EffectSamplerVariable::GetMemberByIndex
+1827 ID3D10EffectSamplerVariable::GetMemberByName
+1828 ID3D10EffectSamplerVariable::GetMemberBySemantic
+1829 ID3D10EffectSamplerVariable::GetElement
+1830 ID3D10EffectSamplerVariable::GetParentConstantBuffer
+1831 ID3D10EffectSamplerVariable::AsScalar
+1832 ID3D10EffectSamplerVariable::AsVector
+1833 ID3D10EffectSamplerVariable::AsMatrix
+1834 ID3D10EffectSamplerVariable::AsString
+1835 ID3D10EffectSamplerVariable::AsShaderResource
+1836 ID3D10EffectSamplerVariable::AsRenderTargetView
+1837 ID3D10EffectSamplerVariable::AsDepthStencilView
+1838 ID3D10EffectSamplerVariable::AsConstantBuffer
+1839 ID3D10EffectSamplerVariable::AsShader
+1840 ID3D10EffectSamplerVariable::AsBlend
+1841 ID3D10EffectSamplerVariable::AsDepthStencil
+1842 ID3D10EffectSamplerVariable::AsRasterizer
+1843 ID3D10EffectSamplerVariable::AsSampler
+1844 ID3D10EffectSamplerVariable::SetRawValue
+1845 ID3D10EffectSamplerVariable::GetRawValue
+1846 ID3D10EffectSamplerVariable::GetSampler
+1847 ID3D10EffectSamplerVariable::GetBackingStore
+1848 ID3D10Device::SetTextFilterSize
+1849 ID3D10Device::GetTextFilterSize
+1874 IDXGIResource::QueryInterface
+1875 IDXGIResource::AddRef
+1876 IDXGIResource::Release
+1877 IDXGIResource::SetPrivateData
+1878 IDXGIResource::SetPrivateDataInterface
+1879 IDXGIResource::GetPrivateData
+1880 IDXGIResource::GetParent
+1881 IDXGIResource::GetDevice
+1882 IDXGIResource::GetSharedHandle
+1883 IDXGIResource::GetUsage
+1884 IDXGIResource::SetEvictionPriority
+1885 IDXGIResource::GetEvictionPriority
+1886 CreateDXGIFactory1
+1887 IDXGIKeyedMutex::QueryInterface
+1888 IDXGIKeyedMutex::AddRef
+1889 IDXGIKeyedMutex::Release
+1890 IDXGIKeyedMutex::SetPrivateData
+1891 IDXGIKeyedMutex::SetPrivateDataInterface
+1892 IDXGIKeyedMutex::GetPrivateData
+1893 IDXGIKeyedMutex::GetParent
+1894 IDXGIKeyedMutex::GetDevice
+1895 IDXGIKeyedMutex::AcquireSync
+1896 IDXGIKeyedMutex::ReleaseSync
+1897 IDXGISurface::GetDC
+1898 IDXGISurface::ReleaseDC
+1899 IDXGIFactory::EnumAdapters1
+1900 IDXGIFactory::IsCurrent
+1901 IDXGIAdapter::GetDesc1
+1902 IDXGIDevice::SetMaximumFrameLatency
+1903 IDXGIDevice::GetMaximumFrameLatency
+2000 D3D11CreateDevice
+2001 D3D11CreateDeviceAndSwapChain
+2011 ID3D11DepthStencilState::QueryInterface
+2012 ID3D11DepthStencilState::AddRef
+2013 ID3D11DepthStencilState::Release
+2014 ID3D11DepthStencilState::GetDevice
+2015 ID3D11DepthStencilState::GetPrivateData
+2016 ID3D11DepthStencilState::SetPrivateData
+2017 ID3D11DepthStencilState::SetPrivateDataInterface
+2018 ID3D11DepthStencilState::GetDesc
+2019 ID3D11BlendState::QueryInterface
+2020 ID3D11BlendState::AddRef
+2021 ID3D11BlendState::Release
+2022 ID3D11BlendState::GetDevice
+2023 ID3D11BlendState::GetPrivateData
+2024 ID3D11BlendState::SetPrivateData
+2025 ID3D11BlendState::SetPrivateDataInterface
+2026 ID3D11BlendState::GetDesc
+2027 ID3D11RasterizerState::QueryInterface
+2028 ID3D11RasterizerState::AddRef
+2029 ID3D11RasterizerState::Release
+2030 ID3D11RasterizerState::GetDevice
+2031 ID3D11RasterizerState::GetPrivateData
+2032 ID3D11RasterizerState::SetPrivateData
+2033 ID3D11RasterizerState::SetPrivateDataInterface
+2034 ID3D11RasterizerState::GetDesc
+2035 ID3D11Buffer::QueryInterface
+2036 ID3D11Buffer::AddRef
+2037 ID3D11Buffer::Release
+2038 ID3D11Buffer::GetDevice
+2039 ID3D11Buffer::GetPrivateData
+2040 ID3D11Buffer::SetPrivateData
+2041 ID3D11Buffer::SetPrivateDataInterface
+2042 ID3D11Buffer::GetType
+2043 ID3D11Buffer::SetEvictionPriority
+2044 ID3D11Buffer::GetEvictionPriority
+2045 ID3D11Buffer::GetDesc
+2046 ID3D11Texture1D::QueryInterface
+2047 ID3D11Texture1D::AddRef
+2048 ID3D11Texture1D::Release
+2049 ID3D11Texture1D::GetDevice
+2050 ID3D11Texture1D::GetPrivateData
+2051 ID3D11Texture1D::SetPrivateData
+2052 ID3D11Texture1D::SetPrivateDataInterface
+2053 ID3D11Texture1D::GetType
+2054 ID3D11Texture1D::SetEvictionPriority
+2055 ID3D11Texture1D::GetEvictionPriority
+2056 ID3D11Texture1D::GetDesc
+2057 ID3D11Texture2D::QueryInterface
+2058 ID3D11Texture2D::AddRef
+2059 ID3D11Texture2D::Release
+2060 ID3D11Texture2D::GetDevice
+2061 ID3D11Texture2D::GetPrivateData
+2062 ID3D11Texture2D::SetPrivateData
+2063 ID3D11Texture2D::SetPrivateDataInterface
+2064 ID3D11Texture2D::GetType
+2065 ID3D11Texture2D::SetEvictionPriority
+2066 ID3D11Texture2D::GetEvictionPriority
+2067 ID3D11Texture2D::GetDesc
+2068 ID3D11Texture3D::QueryInterface
+2069 ID3D11Texture3D::AddRef
+2070 ID3D11Texture3D::Release
+2071 ID3D11Texture3D::GetDevice
+2072 ID3D11Texture3D::GetPrivateData
+2073 ID3D11Texture3D::SetPrivateData
+2074 ID3D11Texture3D::SetPrivateDataInterface
+2075 ID3D11Texture3D::GetType
+2076 ID3D11Texture3D::SetEvictionPriority
+2077 ID3D11Texture3D::GetEvictionPriority
+2078 ID3D11Texture3D::GetDesc
+2079 ID3D11ShaderResourceView::QueryInterface
+2080 ID3D11ShaderResourceView::AddRef
+2081 ID3D11ShaderResourceView::Release
+2082 ID3D11ShaderResourceView::GetDevice
+2083 ID3D11ShaderResourceView::GetPrivateData
+2084 ID3D11ShaderResourceView::SetPrivateData
+2085 ID3D11ShaderResourceView::SetPrivateDataInterface
+2086 ID3D11ShaderResourceView::GetResource
+2087 ID3D11ShaderResourceView::GetDesc
+2088 ID3D11RenderTargetView::QueryInterface
+2089 ID3D11RenderTargetView::AddRef
+2090 ID3D11RenderTargetView::Release
+2091 ID3D11RenderTargetView::GetDevice
+2092 ID3D11RenderTargetView::GetPrivateData
+2093 ID3D11RenderTargetView::SetPrivateData
+2094 ID3D11RenderTargetView::SetPrivateDataInterface
+2095 ID3D11RenderTargetView::GetResource
+2096 ID3D11RenderTargetView::GetDesc
+2097 ID3D11DepthStencilView::QueryInterface
+2098 ID3D11DepthStencilView::AddRef
+2099 ID3D11DepthStencilView::Release
+2100 ID3D11DepthStencilView::GetDevice
+2101 ID3D11DepthStencilView::GetPrivateData
+2102 ID3D11DepthStencilView::SetPrivateData
+2103 ID3D11DepthStencilView::SetPrivateDataInterface
+2104 ID3D11DepthStencilView::GetResource
+2105 ID3D11DepthStencilView::GetDesc
+2106 ID3D11UnorderedAccessView::QueryInterface
+2107 ID3D11UnorderedAccessView::AddRef
+2108 ID3D11UnorderedAccessView::Release
+2109 ID3D11UnorderedAccessView::GetDevice
+2110 ID3D11UnorderedAccessView::GetPrivateData
+2111 ID3D11UnorderedAccessView::SetPrivateData
+2112 ID3D11UnorderedAccessView::SetPrivateDataInterface
+2113 ID3D11UnorderedAccessView::GetResource
+2114 ID3D11UnorderedAccessView::GetDesc
+2115 ID3D11VertexShader::QueryInterface
+2116 ID3D11VertexShader::AddRef
+2117 ID3D11VertexShader::Release
+2118 ID3D11VertexShader::GetDevice
+2119 ID3D11VertexShader::GetPrivateData
+2120 ID3D11VertexShader::SetPrivateData
+2121 ID3D11VertexShader::SetPrivateDataInterface
+2122 ID3D11HullShader::QueryInterface
+2123 ID3D11HullShader::AddRef
+2124 ID3D11HullShader::Release
+2125 ID3D11HullShader::GetDevice
+2126 ID3D11HullShader::GetPrivateData
+2127 ID3D11HullShader::SetPrivateData
+2128 ID3D11HullShader::SetPrivateDataInterface
+2129 ID3D11DomainShader::QueryInterface
+2130 ID3D11DomainShader::AddRef
+2131 ID3D11DomainShader::Release
+2132 ID3D11DomainShader::GetDevice
+2133 ID3D11DomainShader::GetPrivateData
+2134 ID3D11DomainShader::SetPrivateData
+2135 ID3D11DomainShader::SetPrivateDataInterface
+2136 ID3D11GeometryShader::QueryInterface
+2137 ID3D11GeometryShader::AddRef
+2138 ID3D11GeometryShader::Release
+2139 ID3D11GeometryShader::GetDevice
+2140 ID3D11GeometryShader::GetPrivateData
+2141 ID3D11GeometryShader::SetPrivateData
+2142 ID3D11GeometryShader::SetPrivateDataInterface
+2143 ID3D11PixelShader::QueryInterface
+2144 ID3D11PixelShader::AddRef
+2145 ID3D11PixelShader::Release
+2146 ID3D11PixelShader::GetDevice
+2147 ID3D11PixelShader::GetPrivateData
+2148 ID3D11PixelShader::SetPrivateData
+2149 ID3D11PixelShader::SetPrivateDataInterface
+2150 ID3D11ComputeShader::QueryInterface
+2151 ID3D11ComputeShader::AddRef
+2152 ID3D11ComputeShader::Release
+2153 ID3D11ComputeShader::GetDevice
+2154 ID3D11ComputeShader::GetPrivateData
+2155 ID3D11ComputeShader::SetPrivateData
+2156 ID3D11ComputeShader::SetPrivateDataInterface
+2157 ID3D11InputLayout::QueryInterface
+2158 ID3D11InputLayout::AddRef
+2159 ID3D11InputLayout::Release
+2160 ID3D11InputLayout::GetDevice
+2161 ID3D11InputLayout::GetPrivateData
+2162 ID3D11InputLayout::SetPrivateData
+2163 ID3D11InputLayout::SetPrivateDataInterface
+2164 ID3D11SamplerState::QueryInterface
+2165 ID3D11SamplerState::AddRef
+2166 ID3D11SamplerState::Release
+2167 ID3D11SamplerState::GetDevice
+2168 ID3D11SamplerState::GetPrivateData
+2169 ID3D11SamplerState::SetPrivateData
+2170 ID3D11SamplerState::SetPrivateDataInterface
+2171 ID3D11SamplerState::GetDesc
+2172 ID3D11Query::QueryInterface
+2173 ID3D11Query::AddRef
+2174 ID3D11Query::Release
+2175 ID3D11Query::GetDevice
+2176 ID3D11Query::GetPrivateData
+2177 ID3D11Query::SetPrivateData
+2178 ID3D11Query::SetPrivateDataInterface
+2179 ID3D11Query::GetDataSize
+2180 ID3D11Query::GetDesc
+2181 ID3D11Predicate::QueryInterface
+2182 ID3D11Predicate::AddRef
+2183 ID3D11Predicate::Release
+2184 ID3D11Predicate::GetDevice
+2185 ID3D11Predicate::GetPrivateData
+2186 ID3D11Predicate::SetPrivateData
+2187 ID3D11Predicate::SetPrivateDataInterface
+2188 ID3D11Predicate::GetDataSize
+2189 ID3D11Predicate::GetDesc
+2190 ID3D11Counter::QueryInterface
+2191 ID3D11Counter::AddRef
+2192 ID3D11Counter::Release
+2193 ID3D11Counter::GetDevice
+2194 ID3D11Counter::GetPrivateData
+2195 ID3D11Counter::SetPrivateData
+2196 ID3D11Counter::SetPrivateDataInterface
+2197 ID3D11Counter::GetDataSize
+2198 ID3D11Counter::GetDesc
+2199 ID3D11ClassInstance::QueryInterface
+2200 ID3D11ClassInstance::AddRef
+2201 ID3D11ClassInstance::Release
+2202 ID3D11ClassInstance::GetDevice
+2203 ID3D11ClassInstance::GetPrivateData
+2204 ID3D11ClassInstance::SetPrivateData
+2205 ID3D11ClassInstance::SetPrivateDataInterface
+2206 ID3D11ClassInstance::GetClassLinkage
+2207 ID3D11ClassInstance::GetDesc
+2208 ID3D11ClassInstance::GetInstanceName
+2209 ID3D11ClassInstance::GetTypeName
+2210 ID3D11ClassLinkage::QueryInterface
+2211 ID3D11ClassLinkage::AddRef
+2212 ID3D11ClassLinkage::Release
+2213 ID3D11ClassLinkage::GetDevice
+2214 ID3D11ClassLinkage::GetPrivateData
+2215 ID3D11ClassLinkage::SetPrivateData
+2216 ID3D11ClassLinkage::SetPrivateDataInterface
+2217 ID3D11ClassLinkage::GetClassInstance
+2218 ID3D11ClassLinkage::CreateClassInstance
+2219 ID3D11CommandList::QueryInterface
+2220 ID3D11CommandList::AddRef
+2221 ID3D11CommandList::Release
+2222 ID3D11CommandList::GetDevice
+2223 ID3D11CommandList::GetPrivateData
+2224 ID3D11CommandList::SetPrivateData
+2225 ID3D11CommandList::SetPrivateDataInterface
+2226 ID3D11CommandList::GetContextFlags
+2228 ID3D11DeviceContext::AddRef
+2229 ID3D11DeviceContext::Release
+2230 ID3D11DeviceContext::GetDevice
+2231 ID3D11DeviceContext::GetPrivateData
+2232 ID3D11DeviceContext::SetPrivateData
+2233 ID3D11DeviceContext::SetPrivateDataInterface
+2234 ID3D11DeviceContext::VSSetConstantBuffers
+2235 ID3D11DeviceContext::PSSetShaderResources
+2236 ID3D11DeviceContext::PSSetShader
+2237 ID3D11DeviceContext::PSSetSamplers
+2238 ID3D11DeviceContext::VSSetShader
+2239 ID3D11DeviceContext::DrawIndexed
+2240 ID3D11DeviceContext::Draw
+2241 ID3D11DeviceContext::Map
+2242 ID3D11DeviceContext::Unmap
+2243 ID3D11DeviceContext::PSSetConstantBuffers
+2244 ID3D11DeviceContext::IASetInputLayout
+2245 ID3D11DeviceContext::IASetVertexBuffers
+2246 ID3D11DeviceContext::IASetIndexBuffer
+2247 ID3D11DeviceContext::DrawIndexedInstanced
+2248 ID3D11DeviceContext::DrawInstanced
+2249 ID3D11DeviceContext::GSSetConstantBuffers
+2250 ID3D11DeviceContext::GSSetShader
+2251 ID3D11DeviceContext::IASetPrimitiveTopology
+2252 ID3D11DeviceContext::VSSetShaderResources
+2253 ID3D11DeviceContext::VSSetSamplers
+2254 ID3D11DeviceContext::Begin
+2255 ID3D11DeviceContext::End
+2256 ID3D11DeviceContext::GetData
+2257 ID3D11DeviceContext::SetPredication
+2258 ID3D11DeviceContext::GSSetShaderResources
+2259 ID3D11DeviceContext::GSSetSamplers
+2260 ID3D11DeviceContext::OMSetRenderTargets
+2261 ID3D11DeviceContext::OMSetRenderTargetsAndUnorderedAccessViews
+2262 ID3D11DeviceContext::OMSetBlendState
+2263 ID3D11DeviceContext::OMSetDepthStencilState
+2264 ID3D11DeviceContext::SOSetTargets
+2265 ID3D11DeviceContext::DrawAuto
+2266 ID3D11DeviceContext::DrawIndexedInstancedIndirect
+2267 ID3D11DeviceContext::DrawInstancedIndirect
+2268 ID3D11DeviceContext::Dispatch
+2269 ID3D11DeviceContext::DispatchIndirect
+2270 ID3D11DeviceContext::RSSetState
+2271 ID3D11DeviceContext::RSSetViewports
+2272 ID3D11DeviceContext::RSSetScissorRects
+2273 ID3D11DeviceContext::CopySubresourceRegion
+2274 ID3D11DeviceContext::CopyResource
+2275 ID3D11DeviceContext::UpdateSubresource
+2276 ID3D11DeviceContext::CopyStructureCount
+2277 ID3D11DeviceContext::ClearRenderTargetView
+2278 ID3D11DeviceContext::ClearUnorderedAccessViewUint
+2279 ID3D11DeviceContext::ClearUnorderedAccessViewFloat
+2280 ID3D11DeviceContext::ClearDepthStencilView
+2281 ID3D11DeviceContext::GenerateMips
+2282 ID3D11DeviceContext::SetResourceMinLOD
+2283 ID3D11DeviceContext::GetResourceMinLOD
+2284 ID3D11DeviceContext::ResolveSubresource
+2285 ID3D11DeviceContext::ExecuteCommandList
+2286 ID3D11DeviceContext::HSSetShaderResources
+2287 ID3D11DeviceContext::HSSetShader
+2288 ID3D11DeviceContext::HSSetSamplers
+2289 ID3D11DeviceContext::HSSetConstantBuffers
+2290 ID3D11DeviceContext::DSSetShaderResources
+2291 ID3D11DeviceContext::DSSetShader
+2292 ID3D11DeviceContext::DSSetSamplers
+2293 ID3D11DeviceContext::DSSetConstantBuffers
+2294 ID3D11DeviceContext::CSSetShaderResources
+2295 ID3D11DeviceContext::CSSetUnorderedAccessViews
+2296 ID3D11DeviceContext::CSSetShader
+2297 ID3D11DeviceContext::CSSetSamplers
+2298 ID3D11DeviceContext::CSSetConstantBuffers
+2299 ID3D11DeviceContext::VSGetConstantBuffers
+2300 ID3D11DeviceContext::PSGetShaderResources
+2301 ID3D11DeviceContext::PSGetShader
+2302 ID3D11DeviceContext::PSGetSamplers
+2303 ID3D11DeviceContext::VSGetShader
+2304 ID3D11DeviceContext::PSGetConstantBuffers
+2305 ID3D11DeviceContext::IAGetInputLayout
+2306 ID3D11DeviceContext::IAGetVertexBuffers
+2307 ID3D11DeviceContext::IAGetIndexBuffer
+2308 ID3D11DeviceContext::GSGetConstantBuffers
+2309 ID3D11DeviceContext::GSGetShader
+2310 ID3D11DeviceContext::IAGetPrimitiveTopology
+2311 ID3D11DeviceContext::VSGetShaderResources
+2312 ID3D11DeviceContext::VSGetSamplers
+2313 ID3D11DeviceContext::GetPredication
+2314 ID3D11DeviceContext::GSGetShaderResources
+2315 ID3D11DeviceContext::GSGetSamplers
+2316 ID3D11DeviceContext::OMGetRenderTargets
+2317 ID3D11DeviceContext::OMGetRenderTargetsAndUnorderedAccessViews
+2318 ID3D11DeviceContext::OMGetBlendState
+2319 ID3D11DeviceContext::OMGetDepthStencilState
+2320 ID3D11DeviceContext::SOGetTargets
+2321 ID3D11DeviceContext::RSGetState
+2322 ID3D11DeviceContext::RSGetViewports
+2323 ID3D11DeviceContext::RSGetScissorRects
+2324 ID3D11DeviceContext::HSGetShaderResources
+2325 ID3D11DeviceContext::HSGetShader
+2326 ID3D11DeviceContext::HSGetSamplers
+2327 ID3D11DeviceContext::HSGetConstantBuffers
+2328 ID3D11DeviceContext::DSGetShaderResources
+2329 ID3D11DeviceContext::DSGetShader
+2330 ID3D11DeviceContext::DSGetSamplers
+2331 ID3D11DeviceContext::DSGetConstantBuffers
+2332 ID3D11DeviceContext::CSGetShaderResources
+2333 ID3D11DeviceContext::CSGetUnorderedAccessViews
+2334 ID3D11DeviceContext::CSGetShader
+2335 ID3D11DeviceContext::CSGetSamplers
+2336 ID3D11DeviceContext::CSGetConstantBuffers
+2337 ID3D11DeviceContext::ClearState
+2338 ID3D11DeviceContext::Flush
+2339 ID3D11DeviceContext::GetType
+2340 ID3D11DeviceContext::GetContextFlags
+2341 ID3D11DeviceContext::FinishCommandList
+2342 ID3D11Device::QueryInterface
+2343 ID3D11Device::AddRef
+2344 ID3D11Device::Release
+2345 ID3D11Device::CreateBuffer
+2346 ID3D11Device::CreateTexture1D
+2347 ID3D11Device::CreateTexture2D
+2348 ID3D11Device::CreateTexture3D
+2349 ID3D11Device::CreateShaderResourceView
+2350 ID3D11Device::CreateUnorderedAccessView
+2351 ID3D11Device::CreateRenderTargetView
+2352 ID3D11Device::CreateDepthStencilView
+2353 ID3D11Device::CreateInputLayout
+2354 ID3D11Device::CreateVertexShader
+2355 ID3D11Device::CreateGeometryShader
+2356 ID3D11Device::CreateGeometryShaderWithStreamOutput
+2357 ID3D11Device::CreatePixelShader
+2358 ID3D11Device::CreateHullShader
+2359 ID3D11Device::CreateDomainShader
+2360 ID3D11Device::CreateComputeShader
+2361 ID3D11Device::CreateClassLinkage
+2362 ID3D11Device::CreateBlendState
+2363 ID3D11Device::CreateDepthStencilState
+2364 ID3D11Device::CreateRasterizerState
+2365 ID3D11Device::CreateSamplerState
+2366 ID3D11Device::CreateQuery
+2367 ID3D11Device::CreatePredicate
+2368 ID3D11Device::CreateCounter
+2369 ID3D11Device::CreateDeferredContext
+2370 ID3D11Device::OpenSharedResource
+2371 ID3D11Device::CheckFormatSupport
+2372 ID3D11Device::CheckMultisampleQualityLevels
+2373 ID3D11Device::CheckCounterInfo
+2374 ID3D11Device::CheckCounter
+2375 ID3D11Device::CheckFeatureSupport
+2376 ID3D11Device::GetPrivateData
+2377 ID3D11Device::SetPrivateData
+2378 ID3D11Device::SetPrivateDataInterface
+2379 ID3D11Device::GetFeatureLevel
+2380 ID3D11Device::GetCreationFlags
+2381 ID3D11Device::GetDeviceRemovedReason
+2382 ID3D11Device::GetImmediateContext
+2383 ID3D11Device::SetExceptionMode
+2384 ID3D11Device::GetExceptionMode
+"""
+
+class FunctionTable:
+    """Id to name mapping over the packed table, unpacked on first use"""
+
+    def __init__(self, table):
+        self.table = table
+        self.ids = None
+        self.starts = None
+        self.ends = None
+        self.reverse = None
+
+    def load(self):
+        # index the table in place instead of building one string per name
+        table = self.table
+        ids = array('I')
+        starts = array('I')
+        ends = array('I')
+        pos = 0
+        while pos < len(table):
+            space = table.index(' ', pos)
+            end = table.index('\n', space)
+            ids.append(int(table[pos:space]))
+            starts.append(space + 1)
+            ends.append(end)
+            pos = end + 1
+        self.starts = starts
+        self.ends = ends
+        self.ids = ids
+
+    def find(self, functionId):
+        if self.ids is None:
+            self.load()
+        i = bisect_left(self.ids, functionId)
+        if i < len(self.ids) and self.ids[i] == functionId:
+            return i
+        return -1
+
+    def get(self, functionId, default=None):
+        i = self.find(functionId)
+        if i < 0:
+            return default
+        return self.table[self.starts[i]:self.ends[i]]
+
+    def getId(self, name, default=None):
+        # reverse lookup, for filtering by name
+        if self.reverse is None:
+            self.reverse = dict((value, key) for key, value in self.items())
+        return self.reverse.get(name, default)
+
+    def __getitem__(self, functionId):
+        i = self.find(functionId)
+        if i < 0:
+            raise KeyError(functionId)
+        return self.table[self.starts[i]:self.ends[i]]
+
+    def __contains__(self, functionId):
+        return self.find(functionId) >= 0
+
+    def __len__(self):
+        if self.ids is None:
+            self.load()
+        return len(self.ids)
+
+    def keys(self):
+        if self.ids is None:
+            self.load()
+        return list(self.ids)
+
+    def items(self):
+        if self.ids is None:
+            self.load()
+        table = self.table
+        return [(functionId, table[start:end]) for functionId, start, end in zip(self.ids, self.starts, self.ends)]
+
+functionName = FunctionTable(functionTable)
@@ -0,0 +1,342 @@
+#!/usr/bin/env python
+##########################################################################
+#
+# Released under the MIT License
+#
+##########################################################################
+
+
+"""Synthetic PIXrun trace generator"""
+
+import struct
+import sys
+from pixfunc import functionName
+
+# element declarations: id, type, name, format (as in PIX captures)
+Elements = [
+    (1, 3, 'EDID', '%d'),
+    (2, 3, 'Event Type', '%d'),
+    (3, 3, 'EID', '%d'),
+    (4, 3, 'Parent EID', '%d'),
+    (5, 2, 'Flags', '0x%08X'),
+    (6, 4, 'Event', '%s'),
+    (7, 5, 'StartTime', '%I64i'),
+    (8, 5, 'Duration', '%I64i'),
+    (9, 3, 'Frame', '%d'),
+    (10, 2, 'Parent', '%d'),
+    (11, 6, 'Children', '%d'),
+    (12, 0, 'FPS', '%0.01f'),
+    (13, 1, 'Path', '%s'),
+    (14, 1, 'Path2', '%s'),
+    (17, 1, 'User Event Name', '%s'),
+    (19, 7, 'PackedCallPackage', ''),
+    (21, 5, 'ThisEventPos', '%I64i'),
+    (22, 5, 'NextSiblingPos', '%I64i'),
+    (24, 5, 'SessionStartTimeStamp', '%I64i'),
+    (27, 5, 'Measured Est. Draw Duration (ns)', '%I64i'),
+]
+
+# event types: id, event type constant, name, fields
+EventTypes = [
+    (1, 1, 'Session Start', [
+        (1, '(edid)'), (2, 'CalcOnLoad,Const,1'), (3, '(eid)'), (4, 'CalcOnLoad,Const,-1'),
+        (5, 'CalcOnLoad,Const,0'), (7, 'CalcOnLoad,Const,0'), (8, 'CalcOnLoad,Const,0'),
+        (6, 'CalcOnLoad,FormatText,0,Start Session'), (13, '(expfilepath)'), (14, '(runfilepath)'),
+        (24, '(sessionstarttimestamp)')]),
+    (2, 2, 'Session End', [
+        (1, '(edid)'), (2, 'CalcOnLoad,Const,2'), (3, '(eid)'), (4, 'CalcOnLoad,Const,-1'),
+        (5, 'CalcOnLoad,Const,0'), (7, '(time)'), (8, 'CalcOnLoad,Const,0'),
+        (6, 'CalcOnLoad,FormatText,0,End Session')]),
+    (5, 5, 'Frame Begin', [
+        (1, '(edid)'), (2, 'CalcOnLoad,Const,5'), (3, '(eid)'), (4, '(parenteid)'),
+        (11, 'CalcOnLoad,Const,0'), (5, '(rowflags)'), (7, '(time)'), (9, '(frame)'),
+        (6, 'CalcOnLoad,FormatText,1,Frame %d,3,MemberOf,ThisRow,Frame'), (8, 'Async,(duration)'),
+        (12, 'CalcOnLoad,Divide,Const,1000000000.0,MemberOf,ThisRow,Duration'),
+        (21, '(frameeventfilepos)'), (22, '(lastframeeventfilepos)')]),
+    (6, 7, 'User Event Begin', [
+        (1, '(edid)'), (2, 'CalcOnLoad,Const,7'), (3, '(eid)'), (4, '(parenteid)'),
+        (10, 'CalcOnLoad,Const,0'), (11, 'CalcOnLoad,Const,0'), (5, 'CalcOnLoad,Const,0'),
+        (7, '(time)'), (17, '(usereventname)'),
+        (6, 'CalcOnLoad,FormatText,1,%s,1,MemberOf,ThisRow,User Event Name'), (8, 'Async,(duration)')]),
+    (8, 10, 'D3D Call', [
+        (1, '(edid)'), (2, 'CalcOnLoad,Const,10'), (3, '(eid)'), (4, '(parenteid)'),
+        (11, 'CalcOnLoad,Const,0'), (10, 'CalcOnLoad,Const,0'), (5, 'CalcOnLoad,Const,0'),
+        (7, '(time)'), (6, 'CalcOnLoad,CallPlusParams,MemberOf,ThisRow,PackedCallPackage'),
+        (19, 'Async,(packedcallpkg)'), (27, 'Async,(drawduration)')]),
+    (11, 13, 'D3D Call (Sync)', [
+        (1, '(edid)'), (2, 'CalcOnLoad,Const,13'), (3, '(eid)'), (4, '(parenteid)'),
+        (11, 'CalcOnLoad,Const,0'), (10, 'CalcOnLoad,Const,0'), (5, 'CalcOnLoad,Const,0'),
+        (7, '(time)'), (6, 'CalcOnLoad,CallPlusParams,MemberOf,ThisRow,PackedCallPackage'),
+        (19, '(packedcallpkg)')]),
+]
+
+NoParent = 0xFFFFFFFF
+
+# D3D constants used by the generated calls
+D3DRS_ZENABLE = 7
+D3DRS_CULLMODE = 22
+D3DRS_LIGHTING = 137
+D3DSAMP_MINFILTER = 6
+D3DPT_TRIANGLELIST = 4
+D3DFMT_A8R8G8B8 = 21
+D3DPOOL_MANAGED = 1
+
+# D3DPERF regions of the generated frames
+Passes = [u'Shadows', u'Opaque', u'Transparent']
+
+# object types, as found in CreateObject/DestroyObject calls
+ObjectDirect3D = 11
+ObjectDevice = 12
+ObjectTexture = 19
+ObjectVertexBuffer = 17
+
+def dword(value):
+    return struct.pack('<I', value & 0xFFFFFFFF)
+
+def qword(value):
+    return struct.pack('<Q', value)
+
+def string(value):
+    data = value.encode('UTF-16LE')
+    return dword(len(value)) + data + '\0\0'
+
+class Writer:
+
+    def __init__(self, output):
+        self.output = output
+        self.offset = output.tell()
+
+    def writeChunk(self, tag, body):
+        offset = self.offset
+        self.output.write(dword(4 + len(body)) + dword(tag) + body)
+        self.offset += 8 + len(body)
+        return offset
+
+    def patch(self, offset, data):
+        self.output.seek(offset)
+        self.output.write(data)
+        self.output.seek(self.offset)
+
+class TraceObject:
+
+    def __init__(self, address, objectType, size=0, width=0, height=0):
+        self.address = address
+        self.objectType = objectType
+        self.size = size
+        self.width = width
+        self.height = height
+        self.createEID = 0
+        self.destroyEID = 0
+
+class TraceGenerator:
+    """Writes a valid .PIXRun file with a given number of frames and calls per frame"""
+
+    def __init__(self, output, frames, calls, payload=0, markers=False):
+        self.writer = Writer(output)
+        self.frames = frames
+        self.calls = calls
+        self.payload = payload # extra argument dwords per call package
+        self.markers = markers # D3DPERF regions around the passes
+        self.eid = 0
+        self.time = 0
+        self.events = 0
+        self.objects = []
+        self.nextAddress = 0x03f00000
+        self.regions = 0 # open D3DPERF regions
+
+    def generate(self):
+        self.writeSchema()
+        self.writeEvent([dword(1), dword(self.newEID()), string(u'C:\\synthetic.tmp'),
+                            string(u'X:\\synthetic.pixrun'), qword(0)])
+        self.d3d = self.newObject(ObjectDirect3D)
+        self.device = self.newObject(ObjectDevice)
+        self.textures = []
+        self.buffers = []
+        lastFrame = None
+        for frame in range(1, self.frames + 1):
+            offset = self.writer.offset
+            if lastFrame is not None:
+                self.writer.patch(lastFrame, qword(offset))
+            lastFrame = self.writeFrame(frame)
+        self.writeEvent([dword(2), dword(self.newEID()), qword(self.tick())])
+        self.writeObjectInfo()
+
+    def writeSchema(self):
+        self.writer.writeChunk(1000, dword(104) + dword(1) + dword(1) + dword(28))
+        for elementId, typeId, name, fmt in Elements:
+            self.writer.writeChunk(1001, dword(elementId) + dword(typeId) + dword(0) + string(unicode(name)) + string(unicode(fmt)))
+        for eventTypeId, constant, name, fields in EventTypes:
+            body = dword(eventTypeId) + dword(constant) + string(unicode(name)) + dword(len(fields))
+            for elementId, fieldFormat in fields:
+                body += dword(elementId) + string(unicode(fieldFormat))
+            self.writer.writeChunk(1002, body)
+
+    def newEID(self):
+        self.eid += 1
+        return self.eid
+
+    def tick(self, ns=2000):
+        self.time += ns
+        return self.time
+
+    def newObject(self, objectType, size=0, width=0, height=0):
+        obj = TraceObject(self.nextAddress, objectType, size, width, height)
+        self.nextAddress += 0x100
+        self.objects.append(obj)
+        return obj
+
+    def writeEvent(self, fields):
+        self.events += 1
+        # the first field (EDID) is the event type id
+        return self.writer.writeChunk(1003, ''.join(fields))
+
+    def writeCall(self, parent, name, args, sync=False):
+        eid = self.newEID()
+        # string arguments are written inline
+        args = ''.join(a if isinstance(a, str) else dword(a) for a in args)
+        package = dword(functionName.getId(name)) + dword(1) + dword(0) + args
+        package += '\0\0\0\0' * self.payload
+        package = dword(len(package)) + package
+        if sync:
+            self.writeEvent([dword(11), dword(eid), dword(parent), qword(self.tick()), package])
+        else:
+            self.writeEvent([dword(8), dword(eid), dword(parent), qword(self.tick())])
+            self.writer.writeChunk(1004, dword(eid) + dword(19) + package)
+        return eid
+
+    def createObject(self, parent, creator, name, obj, args):
+        eid = self.writeCall(parent, name, [creator.address] + args)
+        obj.createEID = self.writeCall(eid, 'CreateObject', [obj.objectType, obj.address, 0])
+        return eid
+
+    def destroyObject(self, parent, name, obj):
+        eid = self.writeCall(parent, name, [obj.address])
+        obj.destroyEID = self.writeCall(eid, 'DestroyObject', [obj.objectType, obj.address, 0])
+        return eid
+
+    def writeSetup(self, frameEID):
+        self.createObject(frameEID, self.d3d, 'Direct3DCreate9', self.d3d, [32])
+        self.createObject(frameEID, self.d3d, 'IDirect3D9::CreateDevice', self.device, [0, 1, 0, 0x40])
+        for i in range(2):
+            buf = self.newObject(ObjectVertexBuffer, 48 << i)
+            self.createObject(frameEID, self.device, 'IDirect3DDevice9::CreateVertexBuffer', buf, [buf.size, 0, 0x42, 0])
+            self.writeCall(frameEID, 'IDirect3DVertexBuffer9::Lock', [buf.address, 0, 0, 0, 0])
+            self.writeCall(frameEID, 'IDirect3DVertexBuffer9::Unlock', [buf.address])
+            self.buffers.append(buf)
+
+    def writeTexture(self, frameEID):
+        # textures are streamed in and out during the trace
+        size = 64 << (len(self.textures) % 4)
+        tex = self.newObject(ObjectTexture, size * size * 4, size, size)
+        self.createObject(frameEID, self.device, 'IDirect3DDevice9::CreateTexture', tex,
+                          [size, size, 1, 0, D3DFMT_A8R8G8B8, D3DPOOL_MANAGED, 0])
+        self.writeCall(frameEID, 'IDirect3DTexture9::LockRect', [tex.address, 0, 0, 0, 0])
+        self.writeCall(frameEID, 'IDirect3DTexture9::UnlockRect', [tex.address, 0])
+        self.textures.append(tex)
+        if len(self.textures) > 2:
+            self.destroyObject(frameEID, 'IDirect3DTexture9::Release', self.textures.pop(0))
+
+    def beginEvent(self, parent, name):
+        self.writeCall(parent, 'D3DPERF_BeginEvent', [0xFFFFFFFF, string(name)])
+        self.regions += 1
+
+    def endEvents(self, parent, depth):
+        # closes the regions down to depth
+        while self.regions > depth:
+            self.writeCall(parent, 'D3DPERF_EndEvent', [])
+            self.regions -= 1
+
+    def writeFrame(self, frame):
+        frameEID = self.newEID()
+        offset = self.writer.offset
+        start = self.time
+        self.writeEvent([dword(5), dword(frameEID), dword(NoParent), dword(0),
+                            qword(self.tick()), dword(frame), qword(offset), qword(0)])
+        if frame == 1:
+            self.writeSetup(frameEID)
+        if frame % 16 == 1:
+            self.writeTexture(frameEID)
+
+        dev = self.device.address
+        self.writeCall(frameEID, 'IDirect3DDevice9::Clear', [dev, 0, 0, 7, 0, 0, 0])
+        self.writeCall(frameEID, 'IDirect3DDevice9::BeginScene', [dev])
+        n = max(0, self.calls - 4)
+        if self.markers:
+            self.beginEvent(frameEID, u'Scene')
+        for i in range(n):
+            k = i % 8
+            if self.markers and k == 0:
+                self.beginEvent(frameEID, Passes[i // 8 % len(Passes)])
+            if self.markers and k == 6 and i // 8 % len(Passes) == 1:
+                self.beginEvent(frameEID, u'Skinned')
+            if k == 0:
+                self.writeCall(frameEID, 'IDirect3DDevice9::SetRenderState', [dev, D3DRS_ZENABLE, i & 1])
+            elif k == 1:
+                self.writeCall(frameEID, 'IDirect3DDevice9::SetRenderState', [dev, D3DRS_CULLMODE, 1 + i % 3])
+            elif k == 2:
+                tex = self.textures[i % len(self.textures)]
+                self.writeCall(frameEID, 'IDirect3DDevice9::SetTexture', [dev, 0, tex.address])
+            elif k == 3:
+                self.writeCall(frameEID, 'IDirect3DDevice9::SetSamplerState', [dev, 0, D3DSAMP_MINFILTER, 2])
+            elif k == 4:
+                buf = self.buffers[i % len(self.buffers)]
+                self.writeCall(frameEID, 'IDirect3DDevice9::SetStreamSource', [dev, 0, buf.address, 0, 16])
+            elif k == 5:
+                self.writeCall(frameEID, 'IDirect3DDevice9::SetFVF', [dev, 0x42], sync=True)
+            elif k == 6:
+                self.writeCall(frameEID, 'IDirect3DDevice9::DrawPrimitive', [dev, D3DPT_TRIANGLELIST, 0, 1 + i])
+            else:
+                self.writeCall(frameEID, 'IDirect3DDevice9::DrawIndexedPrimitive',
+                               [dev, D3DPT_TRIANGLELIST, 0, 0, 3 * i, 0, i])
+            if self.markers and (k == 7 or i == n - 1):
+                self.endEvents(frameEID, 1)
+        if self.markers:
+            self.endEvents(frameEID, 0)
+            self.writeCall(frameEID, 'D3DPERF_SetMarker', [0xFFFFFFFF, string(u'Present')])
+        self.writeCall(frameEID, 'IDirect3DDevice9::EndScene', [dev])
+        self.writeCall(frameEID, 'IDirect3DDevice9::Present', [dev, 0, 0, 0, 0])
+
+        if frame == self.frames:
+            # tear down everything still alive
+            for tex in self.textures:
+                self.destroyObject(frameEID, 'IDirect3DTexture9::Release', tex)
+            for buf in self.buffers:
+                self.destroyObject(frameEID, 'IDirect3DVertexBuffer9::Release', buf)
+            self.destroyObject(frameEID, 'IDirect3DDevice9::Release', self.device)
+            self.destroyObject(frameEID, 'IDirect3D9::Release', self.d3d)
+
+        # frame duration arrives asynchronously
+        self.writer.writeChunk(1004, dword(frameEID) + dword(8) + qword(self.time - start))
+        return offset + 44 # NextSiblingPos field of the Frame Begin event
+
+    def writeObjectInfo(self):
+        body = ''
+        for obj in self.objects:
+            record = [obj.address, obj.objectType, 0, 0, 0x10000000, obj.size, D3DPOOL_MANAGED, D3DFMT_A8R8G8B8,
+                      obj.width, obj.height, 0, 1, 1, 0, 2, 0, obj.createEID, obj.destroyEID, 0, 0]
+            body += ''.join(dword(v) for v in record)
+        self.writer.writeChunk(1005, dword(1) + dword(len(body)) + body + string(u''))
+
+def main():
+    argv = [arg for arg in sys.argv if arg != '--markers']
+    markers = len(argv) != len(sys.argv)
+    if len(argv) < 4:
+        sys.stdout.flush()
+        sys.stderr.write('Usage: pixgen.py [--markers] pix_out frames calls [payload]\n')
+        sys.stderr.write('\n\tpix_out\toutput pix file')
+        sys.stderr.write('\n\tframes\tnumber of frames')
+        sys.stderr.write('\n\tcalls\tnumber of calls per frame')
+        sys.stderr.write('\n\tpayload\textra dwords per call package\n\n')
+        exit(1)
+    else:
+        payload = 0
+        if len(argv) >= 5:
+            payload = int(argv[4])
+        output = open(argv[1], 'wb')
+        generator = TraceGenerator(output, int(argv[2]), int(argv[3]), payload, markers)
+        generator.generate()
+        output.close()
+        print '#events = %i' % generator.events
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+##########################################################################
+#
+# Released under the MIT License
+#
+##########################################################################
+
+
+"""Chunk and frame offset index for PIXrun files"""
+
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from pixparser import Parser, DWord
+
+ChunkHeader = struct.Struct('<II')
+
+IndexMagic = 'PIXIDX\0\0'
+IndexVersion = 1
+# magic, version, file size, file mtime, #chunks, #frames, first event chunk
+IndexHeader = struct.Struct('<8sIQdIII')
+
+class TraceIndex:
+
+    def __init__(self, size=0, mtime=0.0):
+        self.size = size
+        self.mtime = mtime
+        self.eventChunk = 0
+        # per chunk (offsets are doubles: exact up to 2**53 bytes and
+        # portable, unlike the platform-sized 'L' arrays)
+        self.chunkOffsets = array('d')
+        self.chunkTags = array('I')
+        self.chunkEIDs = array('I')
+        # per frame
+        self.frameChunks = array('I')
+        self.frameFirstEIDs = array('I')
+        self.frameLastEIDs = array('I')
+        self.frameThisPos = array('d')
+        self.frameNextPos = array('d')
+
+    def arrays(self):
+        return [self.chunkOffsets, self.chunkTags, self.chunkEIDs,
+                self.frameChunks, self.frameFirstEIDs, self.frameLastEIDs,
+                self.frameThisPos, self.frameNextPos]
+
+    def chunkCount(self):
+        return len(self.chunkOffsets)
+
+    def frameCount(self):
+        return len(self.frameChunks)
+
+    def frameRange(self, frame):
+        # chunk indices [start, end) of a frame, frame 0 being what precedes the first frame
+        if frame == 0:
+            start = self.eventChunk
+        else:
+            start = self.frameChunks[frame - 1]
+        if frame < len(self.frameChunks):
+            end = self.frameChunks[frame]
+        else:
+            end = len(self.chunkOffsets)
+        return start, end
+
+    def frameBounds(self, frame):
+        # (offset, chunkID, end offset) of a frame, the last one ending with the trace (None)
+        start, end = self.frameRange(frame)
+        endOffset = int(self.chunkOffsets[end]) if end < len(self.chunkOffsets) else None
+        return int(self.chunkOffsets[start]), start + 1, endOffset
+
+    def frameStarts(self):
+        # (frame, offset, chunkID) of the first event and of every Frame Begin
+        chunks = [self.eventChunk] + list(self.frameChunks)
+        return [(frame, int(self.chunkOffsets[chunk]), chunk + 1)
+                for frame, chunk in enumerate(chunks)]
+
+    def findFrame(self, frame):
+        # seek arguments (offset, chunkID, frameID) of a Frame Begin chunk
+        chunk = self.frameChunks[frame - 1]
+        return int(self.chunkOffsets[chunk]), chunk + 1, frame
+
+    def findEvent(self, eid):
+        # seek arguments (offset, chunkID, frameID) of an event chunk
+        frame = bisect_right(self.frameFirstEIDs, eid)
+        start, end = self.frameRange(frame)
+        tags = self.chunkTags
+        eids = self.chunkEIDs
+        for chunk in xrange(start, end):
+            if eids[chunk] == eid and tags[chunk] == 1003:
+                if chunk == start and frame > 0:
+                    # the Frame Begin event itself
+                    return int(self.chunkOffsets[chunk]), chunk + 1, frame
+                return int(self.chunkOffsets[chunk]), chunk + 1, frame + 1
+        raise KeyError('no event with EID %i' % eid)
+
+class IndexBuilder(Parser):
+
+    def __init__(self, stream, index):
+        Parser.__init__(self, stream, 0)
+        self.trace = index
+        self.eid = 0
+
+    def parseChunk(self):
+        self.eid = 0
+        res = Parser.parseChunk(self)
+        if res:
+            trace = self.trace
+            if self.chunkTag == 1003 and not trace.eventChunk:
+                trace.eventChunk = len(trace.chunkOffsets)
+            trace.chunkOffsets.append(self.lastChunkOffset)
+            trace.chunkTags.append(self.chunkTag)
+            trace.chunkEIDs.append(self.eid)
+        return res
+
+    def parseEventAsync(self):
+        self.eid = DWord.unpack_from(self.stream.data, self.stream.pos)[0]
+        Parser.parseEventAsync(self)
+
+    def processEvent(self, eventType, data, offsets):
+        self.eid = data.get('EID', 0)
+        trace = self.trace
+        if trace.frameLastEIDs and self.eid > trace.frameLastEIDs[-1]:
+            trace.frameLastEIDs[-1] = self.eid
+
+    def processFrame(self, eventType, data, offsets):
+        self.eid = data['EID']
+        trace = self.trace
+        trace.frameChunks.append(len(trace.chunkOffsets))
+        trace.frameFirstEIDs.append(self.eid)
+        trace.frameLastEIDs.append(self.eid)
+        trace.frameThisPos.append(data['ThisEventPos'])
+        trace.frameNextPos.append(data['NextSiblingPos'])
+        return True # parse the frame content
+
+def frameStarts(parser):
+    # same as TraceIndex.frameStarts, found by walking chunk headers only
+    parser.parseSchema()
+    frameTypes = set(eventTypeId for eventTypeId, eventType in parser.eventTypes.items()
+                     if eventType.name == "Frame Begin")
+    stream = parser.stream
+    data = stream.data
+    size = parser.stream.size
+    offset = parser.nextChunkOffset
+    chunkID = parser.chunkID
+    starts = [(0, offset, chunkID)]
+    while offset + 8 <= size:
+        stream.load(offset, offset + 8) # chunks do not cross blocks
+        chunkSize, tag = ChunkHeader.unpack_from(data, offset)
+        if tag == 1003 and offset + 12 <= size:
+            if DWord.unpack_from(data, offset + 8)[0] in frameTypes:
+                starts.append((len(starts), offset, chunkID))
+        offset += 4 + chunkSize
+        chunkID += 1
+    return starts
+
+def indexPath(path):
+    return path + '.pixidx'
+
+def buildIndex(stream):
+    st = os.fstat(stream.fileno())
+    index = TraceIndex(st.st_size, st.st_mtime)
+    IndexBuilder(stream, index).parse()
+    return index
+
+def saveIndex(index, path):
+    with open(path, 'wb') as f:
+        f.write(IndexHeader.pack(IndexMagic, IndexVersion, index.size, index.mtime,
+                                 index.chunkCount(), index.frameCount(), index.eventChunk))
+        for a in index.arrays():
+            if sys.byteorder != 'little':
+                a = array(a.typecode, a)
+                a.byteswap()
+            a.tofile(f)
+
+def loadIndex(path):
+    # returns None when the sidecar is missing or out of date
+    try:
+        st = os.stat(path)
+        f = open(indexPath(path), 'rb')
+    except EnvironmentError:
+        return None
+    with f:
+        header = f.read(IndexHeader.size)
+        if len(header) < IndexHeader.size:
+            return None
+        magic, version, size, mtime, numChunks, numFrames, eventChunk = IndexHeader.unpack(header)
+        if magic != IndexMagic or version != IndexVersion:
+            return None
+        if size != st.st_size or mtime != st.st_mtime:
+            return None
+        index = TraceIndex(size, mtime)
+        index.eventChunk = eventChunk
+        counts = [numChunks] * 3 + [numFrames] * 5
+        try:
+            for a, n in zip(index.arrays(), counts):
+                a.fromfile(f, n)
+                if sys.byteorder != 'little':
+                    a.byteswap()
+        except EOFError:
+            return None
+    return index
+
+def openIndex(path):
+    # load the sidecar index, rebuilding it if it is stale
+    index = loadIndex(path)
+    if index is None:
+        with open(path, 'rb') as stream:
+            index = buildIndex(stream)
+        try:
+            saveIndex(index, indexPath(path))
+        except EnvironmentError:
+            pass # read-only location, keep the index in memory
+    return index
+
+def main():
+    if len(sys.argv) < 2:
+        sys.stdout.flush()
+        sys.stderr.write('Requires a pixfile as argument!\n')
+        exit(1)
+    else:
+        index = openIndex(sys.argv[1])
+        print '#chunks = %i' % index.chunkCount()
+        print '#frames = %i' % index.frameCount()
+        for frame in range(1, index.frameCount() + 1):
+            start, end = index.frameRange(frame)
+            print 'Frame #%i: EID %i-%i, chunks %i-%i, at %i' % (
+                frame, index.frameFirstEIDs[frame - 1], index.frameLastEIDs[frame - 1],
+                start + 1, end, index.frameThisPos[frame - 1])
+
+if __name__ == '__main__':
+    main()
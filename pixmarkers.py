@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+##########################################################################
+#
+# Released under the MIT License
+#
+##########################################################################
+
+
+"""Entry point for PIXrun D3DPERF region profiler"""
+
+import sys
+from pixargs import functionArguments
+from pixfunc import functionName
+from pixparser import Parser, DWord
+
+BeginEvent = functionName.getId('D3DPERF_BeginEvent')
+EndEvent = functionName.getId('D3DPERF_EndEvent')
+SetMarker = functionName.getId('D3DPERF_SetMarker')
+
+class RegionStats:
+    """Occurrences, inner calls and StartTime durations of the regions sharing a name"""
+
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.calls = 0
+        self.total = 0 # inclusive duration
+        self.exclusive = 0 # without the nested regions
+        self.longest = 0
+        self.frames = 0
+        self.lastFrame = -1
+
+    def add(self, calls, duration, exclusive, frame):
+        self.count += 1
+        self.calls += calls
+        self.total += duration
+        self.exclusive += exclusive
+        self.longest = max(self.longest, duration)
+        if frame != self.lastFrame:
+            self.lastFrame = frame
+            self.frames += 1
+
+class MarkerProfiler(Parser):
+    def __init__(self, stream, paths=False):
+        Parser.__init__(self, stream, 0)
+        self.paths = paths # aggregate by Outer/Inner path instead of name
+        self.nameIndex = functionArguments.index(BeginEvent, 'Name')
+        self.stack = [] # open regions: [key, StartTime, calls at begin, frame, nested duration]
+        self.regions = {}
+        self.markers = {} # SetMarker name -> count
+        self.calls = 0
+        self.unmatched = 0 # EndEvent without BeginEvent
+        self.marker = None # (function id, call offset) of a marker in the event being decoded
+        self.asyncEID = None
+        self.times = {} # EID -> StartTime of the events of the current frame
+        self.firstTime = self.lastTime = 0
+
+    def processFrame(self, eventType, data, offsets):
+        self.times = {}
+        self.processEvent(eventType, data, offsets)
+        return True # every call is counted
+
+    def processEvent(self, eventType, data, offsets):
+        time = data.get('StartTime', 0)
+        if time:
+            if not self.firstTime:
+                self.firstTime = time
+            self.lastTime = max(self.lastTime, time)
+        if self.marker is not None:
+            functionId, offset = self.marker
+            self.marker = None
+            self.processMarker(functionId, offset, time)
+        else:
+            self.times[data.get('EID', 0)] = time
+
+    def parseEventAsync(self):
+        self.asyncEID = DWord.unpack_from(self.stream.data, self.stream.pos)[0]
+        Parser.parseEventAsync(self)
+        self.asyncEID = None
+
+    def processCallId(self, functionId):
+        self.calls += 1
+        if functionId == BeginEvent or functionId == EndEvent or functionId == SetMarker:
+            if self.asyncEID is None:
+                # handled once the event StartTime is decoded
+                self.marker = (functionId, self.callOffset)
+            else:
+                self.processMarker(functionId, self.callOffset, self.times.pop(self.asyncEID, self.lastTime))
+
+    def processMarker(self, functionId, offset, time):
+        frame = self.frameID - 1
+        if functionId == BeginEvent:
+            name = self.markerName(offset)
+            if self.paths and self.stack:
+                name = self.stack[-1][0] + '/' + name
+            self.stack.append([name, time, self.calls, frame, 0])
+        elif functionId == EndEvent:
+            if not self.stack:
+                self.unmatched += 1
+                return
+            self.close(time, self.calls - 1, frame)
+        else:
+            name = self.markerName(offset)
+            self.markers[name] = self.markers.get(name, 0) + 1
+
+    def close(self, time, calls, frame):
+        key, start, startCalls, startFrame, nested = self.stack.pop()
+        duration = max(0, time - start)
+        region = self.regions.get(key)
+        if region is None:
+            region = self.regions[key] = RegionStats(key)
+        region.add(calls - startCalls, duration, duration - nested, startFrame)
+        if self.stack:
+            self.stack[-1][4] += duration
+
+    def markerName(self, offset):
+        # inline UTF-16 string argument, or its address
+        data = self.stream.data
+        size = DWord.unpack_from(data, offset)[0]
+        pos = offset + 8 + 4 * self.nameIndex # past the size and function id
+        if size < pos - offset:
+            return ''
+        length = DWord.unpack_from(data, pos)[0]
+        if length and size >= pos - offset + 2 * length:
+            return data[pos + 4:pos + 4 + 2 * length].decode('UTF-16LE', 'ignore')
+        return '0x%08x' % length
+
+    def finish(self):
+        # regions still open at the end of the trace close on the last event
+        unclosed = len(self.stack)
+        while self.stack:
+            self.close(self.lastTime, self.calls, self.frameID - 1)
+        return unclosed
+
+    def report(self, top=20, out=sys.stdout):
+        span = max(1, self.lastTime - self.firstTime)
+        regions = sorted(self.regions.values(), key=lambda r: -r.total)
+        out.write('%8s %8s %10s %14s %14s %14s %6s  %s\n' % ('count', 'frames', 'calls', 'total', 'exclusive',
+                                                             'longest', 'share', 'region'))
+        for r in regions[:top]:
+            out.write('%8i %8i %10i %14i %14i %14i %5.1f%%  %s\n' % (r.count, r.frames, r.calls, r.total, r.exclusive,
+                                                                    r.longest, 100.0 * r.total / span,
+                                                                    r.name.encode('utf-8')))
+        if len(regions) > top:
+            out.write('(%i more regions)\n' % (len(regions) - top))
+        for name, count in sorted(self.markers.items(), key=lambda item: -item[1])[:top]:
+            out.write('%8i  marker %s\n' % (count, name.encode('utf-8')))
+
+def main():
+    argv = [arg for arg in sys.argv if arg != '--paths']
+    paths = len(argv) != len(sys.argv)
+    if len(argv) < 2:
+        sys.stdout.flush()
+        sys.stderr.write('Usage: pixmarkers.py [--paths] pix_in [top]\n')
+        exit(1)
+    else:
+        top = 20
+        if len(argv) >= 3:
+            top = int(argv[2])
+        stream = open(argv[1], 'rb')
+        parser = MarkerProfiler(stream, paths)
+        parser.parse()
+        unclosed = parser.finish()
+        parser.report(top)
+        if parser.unmatched or unclosed:
+            print '#unmatched EndEvent = %i, #unclosed BeginEvent = %i' % (parser.unmatched, unclosed)
+
+if __name__ == '__main__':
+    main()
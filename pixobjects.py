@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+##########################################################################
+#
+# Released under the MIT License
+#
+##########################################################################
+
+
+"""Object lifetime index over PIXrun Object Info records"""
+
+import sys
+from array import array
+from bisect import bisect_right
+
+# dwords of an Object Info record
+ObjectFields = ['Address', 'unknown2', 'unknown3', 'Creator', 'unknown5', 'Size', 'Pool', 'Format',
+                'Width', 'Height', 'Depth', 'Mips', 'unknown13', 'unknown14', 'unknown15', 'unknown16',
+                'CreateEID', 'DestroyEID', 'unknown19', 'unknown20']
+RecordSize = len(ObjectFields)
+Address = ObjectFields.index('Address')
+Size = ObjectFields.index('Size')
+CreateEID = ObjectFields.index('CreateEID')
+DestroyEID = ObjectFields.index('DestroyEID')
+
+Forever = 0xFFFFFFFF # lifetime end of objects that are never destroyed
+
+class ObjectTable:
+    """Object Info records, with an interval index over their [CreateEID, DestroyEID) lifetimes"""
+
+    def __init__(self):
+        self.records = array('I') # RecordSize dwords per object
+        self.built = False
+
+    def __len__(self):
+        return len(self.records) // RecordSize
+
+    def extend(self, data):
+        records = array('I')
+        records.fromstring(data)
+        if sys.byteorder != 'little':
+            records.byteswap()
+        self.records.extend(records)
+        self.built = False
+
+    def column(self, name):
+        return self.records[ObjectFields.index(name)::RecordSize]
+
+    def record(self, i):
+        values = self.records[i * RecordSize:(i + 1) * RecordSize]
+        return dict(zip(ObjectFields, values))
+
+    def lifetime(self, i):
+        start = self.records[i * RecordSize + CreateEID]
+        end = self.records[i * RecordSize + DestroyEID]
+        return start, max(end or Forever, start)
+
+    def build(self):
+        n = len(self)
+        starts = self.column('CreateEID')
+        # inverted lifetimes are made empty, so that they are never alive
+        ends = array('I', [max(end or Forever, start) for start, end in zip(starts, self.column('DestroyEID'))])
+        sizes = self.column('Size')
+        self.starts = starts
+        self.ends = ends
+
+        # sorted lifetime bounds with size prefix sums, for counts and bytes alive
+        byStart = sorted(range(n), key=starts.__getitem__)
+        byEnd = sorted(range(n), key=ends.__getitem__)
+        self.sortedStarts = array('I', [starts[i] for i in byStart])
+        self.sortedEnds = array('I', [ends[i] for i in byEnd])
+        self.startBytes = self.prefixSums(sizes[i] for i in byStart)
+        self.endBytes = self.prefixSums(sizes[i] for i in byEnd)
+
+        # address -> objects and their CreateEIDs, in creation order
+        self.addresses = {}
+        self.addressStarts = {}
+        for i in byStart:
+            address = self.records[i * RecordSize + Address]
+            self.addresses.setdefault(address, []).append(i)
+            self.addressStarts.setdefault(address, []).append(starts[i])
+
+        self.buildTree([i for i in byStart if starts[i] < ends[i]])
+        self.built = True
+
+    def prefixSums(self, values):
+        sums = array('d', [0]) # exact up to 2**53 bytes
+        total = 0
+        for value in values:
+            total += value
+            sums.append(total)
+        return sums
+
+    def buildTree(self, objects):
+        # centered interval tree in flat arrays: each node keeps the lifetimes
+        # overlapping its center, sorted by start and by decreasing end. Lifetimes
+        # must not be empty, so that the one starting at the center stays there
+        self.centers = array('I')
+        self.lefts = array('i')
+        self.rights = array('i')
+        self.spans = array('I') # offset, length into overlapsByStart/overlapsByEnd
+        self.overlapsByStart = array('I')
+        self.overlapsByEnd = array('I')
+        starts = self.starts
+        ends = self.ends
+        if not objects:
+            return
+        pending = [(objects, -1, False)]
+        while pending:
+            objects, parent, isRight = pending.pop()
+            bounds = sorted(starts[i] for i in objects)
+            center = bounds[len(bounds) // 2]
+            left = [i for i in objects if ends[i] <= center]
+            right = [i for i in objects if starts[i] > center]
+            overlaps = [i for i in objects if starts[i] <= center < ends[i]]
+            node = len(self.centers)
+            self.centers.append(center)
+            self.lefts.append(-1)
+            self.rights.append(-1)
+            self.spans.append(len(self.overlapsByStart))
+            self.spans.append(len(overlaps))
+            self.overlapsByStart.extend(sorted(overlaps, key=starts.__getitem__))
+            self.overlapsByEnd.extend(sorted(overlaps, key=ends.__getitem__, reverse=True))
+            if parent >= 0:
+                if isRight:
+                    self.rights[parent] = node
+                else:
+                    self.lefts[parent] = node
+            if left:
+                pending.append((left, node, False))
+            if right:
+                pending.append((right, node, True))
+
+    def aliveAt(self, eid):
+        # objects whose lifetime contains eid, in O(log n + k)
+        if not self.built:
+            self.build()
+        alive = []
+        node = 0 if len(self.centers) else -1
+        while node >= 0:
+            center = self.centers[node]
+            offset = self.spans[2 * node]
+            end = offset + self.spans[2 * node + 1]
+            if eid < center:
+                for i in self.overlapsByStart[offset:end]:
+                    if self.starts[i] > eid:
+                        break
+                    alive.append(i)
+                node = self.lefts[node]
+            else:
+                for i in self.overlapsByEnd[offset:end]:
+                    if self.ends[i] <= eid:
+                        break
+                    alive.append(i)
+                node = self.rights[node]
+        return alive
+
+    def countAliveAt(self, eid):
+        if not self.built:
+            self.build()
+        return bisect_right(self.sortedStarts, eid) - bisect_right(self.sortedEnds, eid)
+
+    def bytesAliveAt(self, eid):
+        if not self.built:
+            self.build()
+        created = self.startBytes[bisect_right(self.sortedStarts, eid)]
+        destroyed = self.endBytes[bisect_right(self.sortedEnds, eid)]
+        return int(created - destroyed)
+
+    def byAddress(self, address):
+        if not self.built:
+            self.build()
+        return self.addresses.get(address, [])
+
+    def findObject(self, address, eid):
+        # the latest object created at an address that is alive at a given EID, or -1
+        objects = self.byAddress(address)
+        if not objects:
+            return -1
+        for k in xrange(bisect_right(self.addressStarts[address], eid) - 1, -1, -1):
+            if self.ends[objects[k]] > eid:
+                return objects[k]
+        return -1
+
+def loadObjects(stream):
+    # walk the chunk headers, only decoding Object Info chunks
+    from pixparser import Parser
+    parser = Parser(stream)
+    while True:
+        tag = parser.peekChunkTag()
+        if tag is None:
+            break
+        if tag == 1005:
+            parser.parseChunk()
+        else:
+            parser.skipChunk()
+    return parser.objects
+
+def frameEIDs(path):
+    # first EID of every frame, from the index when it is up to date
+    from pixindex import frameStarts, loadIndex
+    from pixparser import Parser
+    index = loadIndex(path)
+    if index is not None:
+        return list(index.frameFirstEIDs)
+    parser = Parser(open(path, 'rb'))
+    return [parser.decodeEvent(offset)[0]['EID'] for frame, offset, chunkID in frameStarts(parser)[1:]]
+
+def main():
+    if len(sys.argv) < 2:
+        sys.stdout.flush()
+        sys.stderr.write('Usage: pixobjects.py pix_in [eid]\n')
+        exit(1)
+    else:
+        objects = loadObjects(open(sys.argv[1], 'rb'))
+        print '#objects = %i' % len(objects)
+        if len(sys.argv) >= 3:
+            eid = int(sys.argv[2])
+            alive = sorted(objects.aliveAt(eid), key=lambda i: objects.lifetime(i))
+            print 'Alive at EID %i: %i objects, %i bytes' % (eid, len(alive), objects.bytesAliveAt(eid))
+            for i in alive:
+                print '{Address:#010x} {unknown2:3d} {Size:10d} {Format:#010x} {Width:5d} {Height:5d} {CreateEID:8d} {DestroyEID:8d}'.format(**objects.record(i))
+        else:
+            for frame, eid in enumerate(frameEIDs(sys.argv[1]), 1):
+                print 'Frame #%i (EID %i): %i objects, %i bytes' % (frame, eid, objects.countAliveAt(eid), objects.bytesAliveAt(eid))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,287 @@
+#!/usr/bin/env python
+##########################################################################
+#
+# Released under the MIT License
+#
+##########################################################################
+
+
+"""Packed PIXrun files, made of independently compressed frame blocks"""
+
+import ctypes
+import ctypes.util
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from pixindex import frameStarts
+from pixparser import MappedStream, PackedMagic, Parser
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None # zlib only
+
+PackedVersion = 1
+# magic, version, codec, raw size, #blocks, block index offset
+PackedHeader = struct.Struct('<8sI4sQIQ')
+# raw offset, packed offset, raw size, packed size, crc32 of the raw bytes
+BlockEntry = struct.Struct('<QQIII')
+BlockBudget = 256 << 20 # inflated bytes kept by random accesses
+MADV_DONTNEED = 4
+
+def loadLibc():
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        libc.madvise.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int]
+        return libc
+    except (OSError, AttributeError, TypeError):
+        return None # blocks are still evicted, but their pages stay allocated
+
+libc = loadLibc() if hasattr(mmap, 'MAP_PRIVATE') else None
+
+class ZlibCodec:
+    name = 'zlib'
+
+    def __init__(self, level=6):
+        self.level = level
+
+    def compress(self, data):
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data, size):
+        return zlib.decompress(data)
+
+class ZstdCodec:
+    name = 'zstd'
+
+    def __init__(self, level=3):
+        self.level = level
+
+    def compress(self, data):
+        return zstandard.ZstdCompressor(level=self.level).compress(data)
+
+    def decompress(self, data, size):
+        return zstandard.ZstdDecompressor().decompress(data, max_output_size=size)
+
+Codecs = {'zlib': ZlibCodec, 'zstd': ZstdCodec}
+
+def makeCodec(name, level=None):
+    if name not in Codecs:
+        raise ValueError('unknown codec %s' % name)
+    if name == 'zstd' and zstandard is None:
+        raise ValueError('the zstd codec requires the zstandard module')
+    codec = Codecs[name]
+    return codec() if level is None else codec(level)
+
+def codecName(codec):
+    return codec.name.ljust(4, '\0')
+
+class PackedStream(MappedStream):
+    """Raw view of a packed trace, decompressing its blocks on demand
+
+    Blocks are inflated by load(), chunk by chunk when parsing, and the least recently used ones beyond
+    budget bytes are released as other blocks are inflated, or by trim(). The data of a range is thus only
+    valid from its load() until blocks outside it get loaded.
+    """
+
+    def __init__(self, stream):
+        if not isinstance(stream, MappedStream):
+            stream = MappedStream(stream)
+        self.packed = stream
+        self.file = stream.file
+        self.pos = 0
+        header = stream.data[:PackedHeader.size]
+        if len(header) < PackedHeader.size:
+            raise ValueError('truncated packed trace')
+        magic, version, codec, size, numBlocks, indexOffset = PackedHeader.unpack(header)
+        if magic != PackedMagic or version != PackedVersion:
+            raise ValueError('not a packed trace')
+        self.codec = makeCodec(codec.rstrip('\0'))
+        self.rawOffsets = array('d')
+        self.packedOffsets = array('d')
+        self.rawSizes = array('I')
+        self.packedSizes = array('I')
+        self.crcs = array('I')
+        for i in xrange(numBlocks):
+            entry = BlockEntry.unpack_from(stream.data, indexOffset + i * BlockEntry.size)
+            for column, value in zip((self.rawOffsets, self.packedOffsets, self.rawSizes, self.packedSizes,
+                                      self.crcs), entry):
+                column.append(value)
+        self.loaded = bytearray(numBlocks)
+        self.size = size
+        self.budget = BlockBudget
+        self.recent = OrderedDict() # inflated blocks, least recently used first
+        self.inflated = 0 # bytes
+        self.window = (0, 0) # raw range of the last block loaded
+        self.address = None
+        # anonymous pages stay unallocated until a block is written there, and private
+        # ones are given back by madvise when a block is released
+        if libc is not None:
+            self.data = mmap.mmap(-1, max(size, 1), flags=mmap.MAP_PRIVATE)
+            self.address = ctypes.addressof(ctypes.c_char.from_buffer(self.data))
+        else:
+            self.data = mmap.mmap(-1, max(size, 1))
+
+    def blockCount(self):
+        return len(self.rawOffsets)
+
+    def load(self, start, end):
+        # decompress the blocks covering [start, end)
+        end = max(end, start + 1)
+        if self.window[0] <= start and end <= self.window[1]:
+            return # parsers load every chunk of the current block
+        block = max(0, bisect_right(self.rawOffsets, start) - 1)
+        while block < len(self.rawOffsets) and self.rawOffsets[block] < end:
+            if not self.loaded[block]:
+                self.trim(start, end)
+                self.loadBlock(block)
+            else:
+                self.recent[block] = self.recent.pop(block)
+            block += 1
+        if block > 0:
+            blockStart = int(self.rawOffsets[block - 1])
+            self.window = (blockStart, blockStart + self.rawSizes[block - 1])
+
+    def trim(self, start, end):
+        # release the least recently used blocks beyond the budget, except those covering [start, end)
+        if self.inflated <= self.budget:
+            return
+        for block in list(self.recent):
+            if self.inflated <= self.budget:
+                break
+            blockStart = int(self.rawOffsets[block])
+            if blockStart < max(end, start + 1) and start < blockStart + self.rawSizes[block]:
+                continue
+            self.releaseBlock(block)
+
+    def readBlock(self, block):
+        offset = int(self.packedOffsets[block])
+        try:
+            raw = self.codec.decompress(self.packed.data[offset:offset + self.packedSizes[block]], self.rawSizes[block])
+        except Exception, e:
+            raise ValueError('corrupted block %i (%s)' % (block, e))
+        if len(raw) != self.rawSizes[block] or zlib.crc32(raw) & 0xFFFFFFFF != self.crcs[block]:
+            raise ValueError('corrupted block %i' % block)
+        return raw
+
+    def loadBlock(self, block):
+        raw = self.readBlock(block)
+        start = int(self.rawOffsets[block])
+        self.data[start:start + len(raw)] = raw
+        self.loaded[block] = 1
+        self.recent[block] = True
+        self.inflated += len(raw)
+
+    def releaseBlock(self, block):
+        del self.recent[block]
+        self.window = (0, 0)
+        self.loaded[block] = 0
+        self.inflated -= self.rawSizes[block]
+        if self.address is not None:
+            # the pages entirely within the block, those at its ends may hold its neighbours
+            start = int(self.rawOffsets[block])
+            first = -(-start // mmap.PAGESIZE) * mmap.PAGESIZE
+            last = (start + self.rawSizes[block]) // mmap.PAGESIZE * mmap.PAGESIZE
+            if last > first:
+                libc.madvise(self.address + first, last - first, MADV_DONTNEED)
+
+    def refresh(self):
+        return False # packed traces are complete
+
+    def close(self):
+        self.data.close()
+        self.packed.close()
+
+def blockBounds(stream):
+    # raw [start, end) of the blocks: schema and events before the first frame, then one block per frame
+    parser = Parser(stream)
+    starts = [offset for frame, offset, chunkID in frameStarts(parser)[1:]]
+    bounds = [0] + starts + [stream.size]
+    return [(start, end) for start, end in zip(bounds[:-1], bounds[1:]) if end > start]
+
+def pack(path, output, codec):
+    stream = MappedStream(open(path, 'rb'))
+    if stream.data[:len(PackedMagic)] == PackedMagic:
+        raise ValueError('%s is already packed' % path)
+    blocks = blockBounds(stream)
+    output.write(PackedHeader.pack(PackedMagic, PackedVersion, codecName(codec), stream.size, len(blocks), 0))
+    offset = PackedHeader.size
+    entries = []
+    for start, end in blocks:
+        raw = stream.data[start:end]
+        packed = codec.compress(raw)
+        output.write(packed)
+        entries.append(BlockEntry.pack(start, offset, len(raw), len(packed), zlib.crc32(raw) & 0xFFFFFFFF))
+        offset += len(packed)
+    output.write(''.join(entries))
+    output.seek(0)
+    output.write(PackedHeader.pack(PackedMagic, PackedVersion, codecName(codec), stream.size, len(blocks), offset))
+    stream.close()
+    return len(blocks), stream.size, offset + len(entries) * BlockEntry.size
+
+def unpack(path, output):
+    stream = PackedStream(open(path, 'rb'))
+    for block in xrange(stream.blockCount()):
+        output.write(stream.readBlock(block))
+    size = stream.size
+    stream.close()
+    return size
+
+def parseOptions(args):
+    options = {}
+    paths = []
+    for arg in args:
+        if arg.startswith('--') and '=' in arg:
+            name, value = arg[2:].split('=', 1)
+            options[name] = value
+        else:
+            paths.append(arg)
+    return options, paths
+
+def packMain(args):
+    options, paths = parseOptions(args)
+    if not 1 <= len(paths) <= 2:
+        sys.stdout.flush()
+        sys.stderr.write('Usage: pixrun.py pack [--codec=zlib|zstd] [--level=n] pix_in [pix_out]\n')
+        sys.stderr.write('\n\tpix_out\tpacked file, pix_in.pixpack by default\n\n')
+        exit(1)
+    else:
+        level = int(options['level']) if 'level' in options else None
+        try:
+            codec = makeCodec(options.get('codec', 'zlib'), level)
+        except ValueError, e:
+            sys.stderr.write('%s\n' % e)
+            exit(1)
+        outPath = paths[1] if len(paths) > 1 else paths[0] + '.pixpack'
+        with open(outPath, 'wb') as output:
+            blocks, rawSize, packedSize = pack(paths[0], output, codec)
+        print '#blocks = %i' % blocks
+        print '%i -> %i bytes (%.1fx)' % (rawSize, packedSize, float(rawSize) / max(packedSize, 1))
+
+def unpackMain(args):
+    options, paths = parseOptions(args)
+    if not 1 <= len(paths) <= 2:
+        sys.stdout.flush()
+        sys.stderr.write('Usage: pixrun.py unpack pix_in [pix_out]\n')
+        exit(1)
+    else:
+        outPath = paths[1] if len(paths) > 1 else paths[0]
+        if len(paths) == 1:
+            outPath = outPath[:-len('.pixpack')] if outPath.endswith('.pixpack') else outPath + '.pixrun'
+        with open(outPath, 'wb') as output:
+            try:
+                size = unpack(paths[0], output)
+            except ValueError, e:
+                sys.stderr.write('%s: %s\n' % (paths[0], e))
+                exit(1)
+        print '%i bytes' % size
+
+if __name__ == '__main__':
+    if len(sys.argv) >= 2 and sys.argv[1] == 'unpack':
+        unpackMain(sys.argv[2:])
+    else:
+        packMain(sys.argv[2:] if len(sys.argv) >= 2 and sys.argv[1] == 'pack' else sys.argv[1:])
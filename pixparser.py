@@ -34,10 +34,20 @@
 """Parser for PIXRun files."""
 
 
+import json
+import mmap
 import os
 import struct
 import sys
+import time
+from array import array
+from collections import OrderedDict
+from timeit import default_timer as timer
 from pixfunc import functionName
+from pixobjects import ObjectTable, RecordSize
+
+DWord = struct.Struct('<I')
+PackedMagic = 'PIXPACK\0' # see pixpack
 
 class Verbosity:
     silent  = 0
@@ -47,28 +57,61 @@ class Verbosity:
     alldata = 4
 
 class Logger:
+    """Level-gated output, formatted only when enabled and written through a buffer"""
+
+    bufferSize = 1 << 16
 
-    def __init__(self, verbosity):
+    def __init__(self, verbosity, out=None):
         self.verbosity = int(verbosity)
+        self.out = out if out is not None else sys.stdout
+        self.encoding = getattr(self.out, 'encoding', None) or 'utf-8'
+        self.lines = []
+        self.buffered = 0
+        self.sink = None # file receiving the alldata dumps as JSON lines
 
-    def log_minimal(self, str):
+    def log_minimal(self, fmt, *args):
         if self.verbosity >= Verbosity.minimal:
-            print str
+            self.write(fmt % args if args else fmt)
 
-    def log_basic(self, str):
+    def log_basic(self, fmt, *args):
         if self.verbosity >= Verbosity.basic:
-            print str
+            self.write(fmt % args if args else fmt)
 
-    def log_verbose(self, str):
+    def log_verbose(self, fmt, *args):
         if self.verbosity >= Verbosity.verbose:
-            print str
+            self.write(fmt % args if args else fmt)
 
-    def log_alldata(self, str):
+    def log_alldata(self, fmt, *args):
         if self.verbosity >= Verbosity.alldata:
-            print str
+            self.write(fmt % args if args else fmt)
+
+    def record(self, **fields):
+        self.sink.write(json.dumps(fields))
+        self.sink.write('\n')
+
+    def write(self, line):
+        if isinstance(line, unicode):
+            line = line.encode(self.encoding, 'replace')
+        self.lines.append(line)
+        self.buffered += len(line) + 1
+        if self.buffered >= self.bufferSize:
+            self.drain()
+
+    def drain(self):
+        if self.lines:
+            self.lines.append('')
+            self.out.write('\n'.join(self.lines))
+            self.lines = []
+            self.buffered = 0
+
+    def flushLog(self):
+        self.drain()
+        self.out.flush()
+        if self.sink is not None:
+            self.sink.flush()
 
     def error(self, str):
-        std.stdout.flush()
+        self.flushLog()
         sys.stderr.write('Error: %s' % str)
 
 class Element:
@@ -92,73 +135,508 @@ class EventType:
         s = '%s(%r)' % (self.name, self.fields)
         return s
 
+class EventDecoder:
+    """Precompiled field layout of an event type"""
+
+    # struct codes of the fixed-width element types
+    fixedTypes = {2: 'I', 3: 'I', 5: 'Q'}
+
+    def __init__(self, eventType, elements):
+        self.eventType = eventType
+        self.isFrame = eventType.name == "Frame Begin"
+        # runs of fixed-width fields are unpacked by a single struct,
+        # strings and call packages go through parseElement
+        self.runs = []
+        fmt = ''
+        names = []
+        self.hasAsyncCall = False # call package in an Event Async chunk
+        for elementId, fieldFormat in eventType.fields:
+            element = elements[elementId]
+            if not fieldFormat.startswith('('):
+                # constant or async field
+                self.hasAsyncCall = self.hasAsyncCall or element.typeId == 7
+                continue
+            code = self.fixedTypes.get(element.typeId)
+            if code is not None:
+                fmt += code
+                names.append(element.name)
+                continue
+            if names:
+                self.addRun(fmt, names)
+                fmt = ''
+                names = []
+            self.runs.append((None, element, None))
+        if names:
+            self.addRun(fmt, names)
+
+        # where to peek at the EID without decoding the event
+        self.eidOffset = None
+        if self.runs and self.runs[0][0] is not None:
+            layout, names, rel = self.runs[0]
+            if 'EID' in names:
+                self.eidOffset = rel[names.index('EID')]
+
+    def addRun(self, fmt, names):
+        layout = struct.Struct('<' + fmt)
+        rel = [struct.calcsize('<' + fmt[:i]) for i in range(len(fmt))]
+        self.runs.append((layout, names, rel))
+
+    def decode(self, parser, data, offsets):
+        stream = parser.stream
+        for layout, names, rel in self.runs:
+            pos = stream.pos
+            if layout is None:
+                element = names
+                value = parser.parseElement(element)
+                data[element.name] = value
+                offsets[element.name] = pos
+                if value is None:
+                    break
+            else:
+                stream.pos = pos + layout.size
+                data.update(zip(names, layout.unpack_from(stream.data, pos)))
+                offsets.update(zip(names, [pos + off for off in rel]))
+
+class Event(object):
+    """Event record whose fields are only decoded when accessed"""
+
+    __slots__ = ('parser', 'typeId', 'eid', 'frame', 'offset', 'fields')
+
+    def __init__(self, parser, typeId, eid, frame, offset):
+        self.parser = parser
+        self.typeId = typeId
+        self.eid = eid
+        self.frame = frame
+        self.offset = offset # of the chunk
+        self.fields = None
+
+    @property
+    def eventType(self):
+        return self.parser.eventTypes[self.typeId]
+
+    @property
+    def data(self):
+        if self.fields is None:
+            self.fields = self.parser.decodeEvent(self.offset)
+        return self.fields[0]
+
+    @property
+    def offsets(self):
+        if self.fields is None:
+            self.fields = self.parser.decodeEvent(self.offset)
+        return self.fields[1]
+
+    def __getitem__(self, name):
+        return self.data[name]
+
+    def get(self, name, default=None):
+        return self.data.get(name, default)
+
+    def __repr__(self):
+        return 'Event(%i, %s, frame %i, at %i)' % (self.eid, self.eventType.name, self.frame, self.offset)
+
+class MappedStream:
+    """Read-only file view over a memory map, walked by offset"""
+
+    def __init__(self, stream):
+        self.file = stream
+        self.pos = 0
+        try:
+            self.data = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, ValueError, EnvironmentError):
+            # empty files and non-file streams cannot be mapped
+            self.data = stream.read()
+        self.size = len(self.data)
+
+    def refresh(self):
+        # map the bytes appended to the file since, and tell whether there were any
+        try:
+            size = os.fstat(self.file.fileno()).st_size
+        except (AttributeError, EnvironmentError):
+            return False
+        if size <= self.size:
+            return False
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, EnvironmentError):
+            self.file.seek(0)
+            self.data = self.file.read()
+        self.size = len(self.data)
+        return True
+
+    def read(self, size=-1):
+        start = self.pos
+        if size < 0:
+            end = self.size
+        else:
+            end = min(start + size, self.size)
+        self.pos = max(start, end)
+        return self.data[start:end]
+
+    def seek(self, offset, whence=0):
+        if whence == 1:
+            offset += self.pos
+        elif whence == 2:
+            offset += self.size
+        self.pos = offset
+
+    def tell(self):
+        return self.pos
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def load(self, start, end):
+        pass # everything is mapped, see PackedStream
+
+    def trim(self, start, end):
+        pass # nothing to release
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+# chunk tag -> name, log level and parse method
+ChunkTypes = {
+    1000: ('Header', Verbosity.basic, 'parseHeader'),
+    1001: ('Elem Declare', Verbosity.basic, 'parseElementDeclaration'),
+    1002: ('Event Type', Verbosity.basic, 'parseEventType'),
+    1003: ('Event', Verbosity.minimal, 'parseEvent'),
+    1004: ('Event Async', Verbosity.basic, 'parseEventAsync'),
+    1005: ('Object Info', Verbosity.basic, 'parseObjectInfo'),
+    1006: ('System Info', Verbosity.basic, 'parseSystemInfo'),
+    1007: ('Display Info', Verbosity.basic, 'parseDisplayInfo'),
+    1008: ('Module Info', Verbosity.basic, 'parseModuleInfo'),
+}
+
+class ParseProfile:
+    """Chunk counts, bytes and parse time per chunk tag and per event type"""
+
+    def __init__(self):
+        self.tags = {} # tag -> [count, bytes, seconds]
+        self.events = {} # event type name -> [count, bytes, seconds]
+
+    def add(self, parser, tag, size, seconds):
+        self.count(self.tags, tag, size, seconds)
+        if tag == 1003:
+            eventTypeId = DWord.unpack_from(parser.stream.data, parser.lastChunkOffset + 8)[0]
+            self.count(self.events, parser.eventTypes[eventTypeId].name, size, seconds)
+
+    def count(self, table, key, size, seconds):
+        entry = table.get(key)
+        if entry is None:
+            entry = table[key] = [0, 0, 0.0]
+        entry[0] += 1
+        entry[1] += size
+        entry[2] += seconds
+
+    def report(self, out=sys.stdout):
+        for title, table, names in (('tag', self.tags, lambda tag: ChunkTypes[tag][0]),
+                                    ('event type', self.events, lambda name: name)):
+            out.write('%-6s %-24s %10s %12s %10s %10s %8s\n' % (
+                '', title, 'chunks', 'bytes', 'seconds', 'us/chunk', 'MB/s'))
+            for key in sorted(table, key=lambda key: -table[key][2]):
+                count, size, seconds = table[key]
+                out.write('%-6s %-24s %10i %12i %10.3f %10.2f %8.2f\n' % (
+                    key if title == 'tag' else '', names(key)[:24], count, size, seconds,
+                    1e6 * seconds / count, size / max(seconds, 1e-9) / (1 << 20)))
+            total = [sum(entry[i] for entry in table.values()) for i in range(3)]
+            out.write('%-6s %-24s %10i %12i %10.3f\n\n' % ('', 'total', total[0], total[1], total[2]))
+
+class DecodedFrame:
+    """Events of a frame, as columns"""
+
+    def __init__(self):
+        self.eids = array('I')
+        self.parents = array('I') # Parent EID
+        self.functions = array('I') # call package function id, 0 without call
+        self.times = array('d') # StartTime
+        self.calls = array('d') # call package offset, 0 without call
+
+    def __len__(self):
+        return len(self.eids)
+
+    def arrays(self):
+        return [self.eids, self.parents, self.functions, self.times, self.calls]
+
+    def nbytes(self):
+        return sum(a.itemsize * len(a) for a in self.arrays())
+
+class FrameCache:
+    """Decoded frames within a byte budget, the least recently used ones being evicted first"""
+
+    def __init__(self, budget=64 << 20):
+        self.budget = budget
+        self.frames = OrderedDict() # frame -> DecodedFrame, least recently used first
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.frames)
+
+    def get(self, frame):
+        # None on a miss
+        decoded = self.frames.pop(frame, None)
+        if decoded is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.frames[frame] = decoded
+        return decoded
+
+    def put(self, frame, decoded):
+        old = self.frames.pop(frame, None)
+        if old is not None:
+            self.bytes -= old.nbytes()
+        self.frames[frame] = decoded
+        self.bytes += decoded.nbytes()
+        # the frame just added stays, even above the budget
+        while self.bytes > self.budget and len(self.frames) > 1:
+            _, evicted = self.frames.popitem(last=False)
+            self.bytes -= evicted.nbytes()
+            self.evictions += 1
+
+    def clear(self):
+        self.frames.clear()
+        self.bytes = 0
+
+    def summary(self):
+        return {'frames': len(self.frames), 'bytes': self.bytes, 'budget': self.budget,
+                'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
 class Parser(Logger):
 
     def __init__(self, stream, verbosity=0):
         Logger.__init__(self, verbosity)
+        if not isinstance(stream, MappedStream):
+            stream = MappedStream(stream)
+        if stream.data[:len(PackedMagic)] == PackedMagic:
+            # packed trace, its blocks are decompressed on demand
+            from pixpack import PackedStream
+            stream = PackedStream(stream)
         self.stream = stream
+        self.structs = {}
         self.lastChunkOffset = 0
         self.nextChunkOffset = 0
         self.elements = {}
         self.eventTypes = {}
+        self.decoders = {}
         self.chunkID = 1
         self.frameID = 1
+        self.chunkTag = 0
+        self.index = None
+        self.objects = ObjectTable()
+        self.asyncs = None # set to an AsyncTable to record the async values
+        self.tree = None # set to an EventTree to record the event hierarchy
+        self.frameCache = None # set to a FrameCache to keep the frames of decodeFrame
+        self.callOffset = 0 # offset of the last call package
+        self.following = False
+        self.profile = None # set to a ParseProfile to time the chunks
 
     def parse(self):
-        while self.parseChunk():
-            pass
+        try:
+            while self.parseChunk():
+                pass
+        finally:
+            self.flushLog() # the buffered lines give the context of errors
+
+    def follow(self, interval=1.0, timeout=None):
+        # parse a capture while it is being written, polling for new chunks
+        # until it stops growing for timeout seconds (forever by default)
+        self.following = True
+        idle = 0
+        try:
+            while True:
+                while self.chunkComplete() and self.parseChunk():
+                    idle = 0
+                if self.stream.refresh():
+                    continue
+                self.flushLog()
+                self.processIdle()
+                if timeout is not None and idle >= timeout:
+                    break
+                time.sleep(interval)
+                idle += interval
+        finally:
+            self.flushLog()
+
+    def processIdle(self):
+        pass # called when waiting for new chunks in follow mode
+
+    def parseRange(self, end):
+        # parse chunks up to a given offset
+        self.stream.load(self.nextChunkOffset, end)
+        try:
+            while self.nextChunkOffset < end and self.parseChunk():
+                pass
+        finally:
+            self.flushLog()
+
+    def parseSchema(self):
+        # element declarations and event types precede the first event
+        self.stream.load(self.nextChunkOffset, self.nextChunkOffset + 1)
+        try:
+            while self.peekChunkTag() not in (None, 1003):
+                self.parseChunk()
+        finally:
+            self.flushLog()
+
+    def peekChunkTag(self):
+        pos = self.nextChunkOffset + 4
+        if pos + 4 > self.stream.size:
+            return None
+        self.stream.load(pos, pos + 4) # chunks do not cross blocks
+        return DWord.unpack_from(self.stream.data, pos)[0]
+
+    def chunkComplete(self):
+        # whether the next chunk is entirely in the file (captures may still be written)
+        pos = self.nextChunkOffset
+        if pos + 8 > self.stream.size:
+            return False
+        self.stream.load(pos, pos + 8)
+        return pos + 4 + DWord.unpack_from(self.stream.data, pos)[0] <= self.stream.size
+
+    def skipChunk(self):
+        stream = self.stream
+        self.lastChunkOffset = self.nextChunkOffset
+        stream.load(self.lastChunkOffset, self.lastChunkOffset + 8)
+        size = DWord.unpack_from(stream.data, self.lastChunkOffset)[0]
+        self.chunkTag = DWord.unpack_from(stream.data, self.lastChunkOffset + 4)[0]
+        self.nextChunkOffset += 4 + size
+        stream.pos = self.nextChunkOffset
+        self.chunkID += 1
+
+    def iterEvents(self):
+        # yields Event records for the remaining events, decoding only their type and EID
+        data = self.stream.data
+        while True:
+            tag = self.peekChunkTag()
+            if tag is None:
+                self.flushLog()
+                return
+            if tag != 1003:
+                if tag in (1000, 1001, 1002) or (tag == 1004 and self.asyncs is not None):
+                    self.parseChunk()
+                else:
+                    self.skipChunk()
+                continue
+            offset = self.nextChunkOffset
+            self.skipChunk()
+            eventTypeId = DWord.unpack_from(data, offset + 8)[0]
+            decoder = self.eventDecoder(eventTypeId)
+            if decoder.isFrame:
+                self.frameID += 1
+            event = Event(self, eventTypeId, 0, self.frameID - 1, offset)
+            if decoder.eidOffset is not None:
+                event.eid = DWord.unpack_from(data, offset + 8 + decoder.eidOffset)[0]
+            else:
+                event.eid = event.get('EID', 0)
+            yield event
+
+    def decodeEvent(self, offset):
+        # (data, offsets) of the event chunk at offset, leaving the parser position unchanged
+        stream = self.stream
+        stream.load(offset, offset + 1) # chunks do not cross blocks
+        pos = stream.pos
+        stream.pos = offset + 8
+        try:
+            eventTypeId = DWord.unpack_from(stream.data, stream.pos)[0]
+            data = {}
+            offsets = {}
+            self.eventDecoder(eventTypeId).decode(self, data, offsets)
+        finally:
+            stream.pos = pos
+        return data, offsets
+
+    def eventDecoder(self, eventTypeId):
+        decoder = self.decoders.get(eventTypeId)
+        if decoder is None:
+            decoder = self.decoders[eventTypeId] = EventDecoder(self.eventTypes[eventTypeId], self.elements)
+        return decoder
+
+    def seekChunk(self, offset, chunkID, frameID):
+        self.stream.pos = self.nextChunkOffset = offset
+        self.chunkID = chunkID
+        self.frameID = frameID
+
+    def seekFrame(self, frame):
+        if not self.eventTypes:
+            self.parseSchema()
+        self.seekChunk(*self.index.findFrame(frame))
+
+    def seekEvent(self, eid):
+        if not self.eventTypes:
+            self.parseSchema()
+        self.seekChunk(*self.index.findEvent(eid))
+
+    def decodeFrame(self, frame):
+        # DecodedFrame of a frame (0 being the events before the first one), using the index
+        cache = self.frameCache
+        offset, chunkID, end = self.index.frameBounds(frame)
+        if end is None:
+            end = self.stream.size
+        if cache is not None:
+            decoded = cache.get(frame)
+            if decoded is not None:
+                # the call package offsets of the frame must be readable
+                self.stream.load(offset, end)
+                self.stream.trim(offset, end)
+                return decoded
+        if not self.eventTypes:
+            self.parseSchema()
+        decoder = FrameDecoder(self.stream)
+        # share the schema instead of re-reading it
+        decoder.elements = self.elements
+        decoder.eventTypes = self.eventTypes
+        decoder.decoders = self.decoders
+        decoder.seekChunk(offset, chunkID, max(frame, 1))
+        decoder.parseRange(end)
+        self.stream.trim(offset, end)
+        if cache is not None:
+            cache.put(frame, decoder.frame)
+        return decoder.frame
 
     def parseChunk(self):
-        lastOffset = self.stream.tell()
+        stream = self.stream
+        lastOffset = stream.pos
         self.lastChunkOffset = self.nextChunkOffset
 
         if lastOffset != self.nextChunkOffset:
             if self.verbosity >= Verbosity.verbose:
-                print '%08x: skipping %i bytes' % (lastOffset, self.nextChunkOffset - lastOffset)
+                self.write('%08x: skipping %i bytes' % (lastOffset, self.nextChunkOffset - lastOffset))
                 self.parseUnknown()
-            self.stream.seek(self.nextChunkOffset)
+            stream.pos = self.nextChunkOffset
 
         # parsing new chunk
-        size = self.stream.read(4)
-        if not size:
+        if stream.pos + 4 > stream.size:
             return False
-        size, = struct.unpack('I', size)
+        stream.load(stream.pos, stream.pos + 4) # chunks do not cross blocks
+        size = self.parseDWord()
         self.nextChunkOffset += 4 + size
 
-        self.log_basic('Chunk %i' % self.chunkID)
+        self.log_basic('Chunk %i', self.chunkID)
         self.chunkID += 1
-        self.log_verbose('%08x -> %08x' % (self.lastChunkOffset, self.nextChunkOffset))
-
-        tag = self.parseDWord()
-        if tag == 1000:
-            self.log_basic('Header')
-            self.parseHeader()
-        elif tag == 1001:
-            self.log_basic('Elem Declare')
-            self.parseElementDeclaration()
-        elif tag == 1002:
-            self.log_basic('Event Type')
-            self.parseEventType()
-        elif tag == 1003:
-            self.log_minimal('Event')
-            self.parseEvent()
-        elif tag == 1004:
-            self.log_basic('Event Async')
-            self.parseEventAsync()
-        elif tag == 1005:
-            self.log_basic('Object Info')
-            self.parseObjectInfo()
-        elif tag == 1006:
-            self.log_basic('System Info')
-            self.parseSystemInfo()
-        elif tag == 1007:
-            self.log_basic('Display Info')
-            self.parseDisplayInfo()
-        elif tag == 1008:
-            self.log_basic('Module Info')
-            self.parseModuleInfo()
+        self.log_verbose('%08x -> %08x', self.lastChunkOffset, self.nextChunkOffset)
+
+        tag = self.chunkTag = self.parseDWord()
+        handler = ChunkTypes.get(tag)
+        if handler is None:
+            self.log_minimal('%08x: unknown tag %i', self.lastChunkOffset, tag)
         else:
-            self.log_minimal('%08x: unknown tag %i' % (self.lastChunkOffset, tag))
+            name, level, method = handler
+            parse = getattr(self, method) # resolved per chunk, so that instance overrides apply
+            if self.verbosity >= level:
+                self.write(name)
+            if self.profile is None:
+                parse()
+            else:
+                start = timer()
+                parse()
+                self.profile.add(self, tag, 4 + size, timer() - start)
 
         return True
 
@@ -167,87 +645,75 @@ class Parser(Logger):
         unknown2 = self.parseDWord()
         unknown3 = self.parseDWord()
         unknown4 = self.parseDWord()
-        if self.verbosity >= Verbosity.basic:
-            print "\tunknown1 = %s" % unknown1
-            print "\tunknown2 = %s" % unknown2
-            print "\tunknown3 = %s" % unknown3
-            print "\tunknown4 = %s" % unknown4
+        self.log_basic("\tunknown1 = %s", unknown1)
+        self.log_basic("\tunknown2 = %s", unknown2)
+        self.log_basic("\tunknown3 = %s", unknown3)
+        self.log_basic("\tunknown4 = %s", unknown4)
 
     def parseObjectInfo(self):
         unknown1 = self.parseDWord()
-        self.log_basic("\tunknown1 = %s" % unknown1)
+        self.log_basic("\tunknown1 = %s", unknown1)
         size = self.parseDWord()
-        n = 20
-        self.log_basic("     Address  ?    ? Creator      ?     Size Pool     Format WidthHeight Depth Mips ?   ?   ?   ?   ?   ?   ?   ?")
-        for i in range(0, size / (n*4)):
-            attrs = {}
-            attrs["Address"] = self.parseDWord()
-            attrs["unknown2"] = self.parseDWord()
-            attrs["unknown3"] = self.parseDWord()
-            attrs["Creator"] = self.parseDWord() # 0: app, 1: runtime
-            attrs["unknown5"] = self.parseDWord()
-            attrs["Size"] = self.parseDWord()
-            attrs["Pool"] = self.parseDWord()
-            attrs["Format"] = self.parseDWord()
-            attrs["Width"] = self.parseDWord()
-            attrs["Height"] = self.parseDWord()
-            attrs["Depth"] = self.parseDWord()
-            attrs["Mips"] = self.parseDWord()
-            attrs["unknown13"] = self.parseDWord()
-            attrs["unknown14"] = self.parseDWord()
-            attrs["unknown15"] = self.parseDWord()
-            attrs["unknown16"] = self.parseDWord()
-            attrs["CreateEID"] = self.parseDWord()
-            attrs["DestroyEID"] = self.parseDWord()
-            attrs["unknown19"] = self.parseDWord()
-            attrs["unknown20"] = self.parseDWord()
-            self.log_basic("{Address:#010x} {unknown2:d} {unknown3:4d} {Creator:d} {unknown5:#010x} {Size:8d} {Pool:4d} {Format:#010x} {Width:5d} {Height:5d} {Depth:5d} {Mips:2d} {unknown13:3d} {unknown14:3d} {unknown15:3d} {unknown16:3d} {CreateEID:3d} {DestroyEID:3d} {unknown19:3d} {unknown20:3d}".format(**attrs))
+        n = RecordSize
+        count = min(size / (n*4), (self.stream.size - self.stream.pos) / (n*4))
+        first = len(self.objects)
+        self.objects.extend(self.stream.read(count * n*4))
+        if self.verbosity >= Verbosity.basic:
+            self.log_basic("     Address  ?    ? Creator      ?     Size Pool     Format WidthHeight Depth Mips ?   ?   ?   ?   ?   ?   ?   ?")
+            for i in range(first, first + count):
+                attrs = self.objects.record(i)
+                self.log_basic("{Address:#010x} {unknown2:d} {unknown3:4d} {Creator:d} {unknown5:#010x} {Size:8d} {Pool:4d} {Format:#010x} {Width:5d} {Height:5d} {Depth:5d} {Mips:2d} {unknown13:3d} {unknown14:3d} {unknown15:3d} {unknown16:3d} {CreateEID:3d} {DestroyEID:3d} {unknown19:3d} {unknown20:3d}".format(**attrs))
         #unknown3 = self.parseDWord()
         #print "\tunknown3 = %s" % unknown3
         unknown4 = self.parseString()
         unknown4 = unknown4.split('\0')
-        self.log_basic("\tunknown4 = %r" % unknown4)
+        self.log_basic("\tunknown4 = %r", unknown4)
 
     def parseSystemInfo(self):
         unknown1 = self.parseDWord()
-        self.log_basic("\tunknown1 = %s" % unknown1)
+        self.log_basic("\tunknown1 = %s", unknown1)
         winVer = self.parseString()
-        self.log_basic("\twinVer = %s" % winVer)
+        self.log_basic("\twinVer = %s", winVer)
         procDesc = self.parseString()
-        self.log_basic("\tprocDesc = %s" % procDesc)
+        self.log_basic("\tprocDesc = %s", procDesc)
 
     def parseDisplayInfo(self):
         unknown1 = self.parseDWord()
-        self.log_basic("\tunknown1 = %s" % unknown1)
+        self.log_basic("\tunknown1 = %s", unknown1)
         display = self.parseString()
-        self.log_basic("\tdisplay = %s" % display)
+        self.log_basic("\tdisplay = %s", display)
         driver = self.parseString()
-        self.log_basic("\tdriver = %s" % driver)
+        self.log_basic("\tdriver = %s", driver)
         unknown = self.parseString()
-        self.log_basic("\tunknown = %s" % unknown)
+        self.log_basic("\tunknown = %s", unknown)
         unknown = self.parseString()
-        self.log_basic("\tunknown = %s" % unknown)
+        self.log_basic("\tunknown = %s", unknown)
         unknown = self.parseString()
-        self.log_basic("\tunknown = %s" % unknown)
+        self.log_basic("\tunknown = %s", unknown)
 
     def parseModuleInfo(self):
         unknown1 = self.parseDWord()
-        self.log_basic("\tunknown1 = %s" % unknown1)
+        self.log_basic("\tunknown1 = %s", unknown1)
         numModules = self.parseDWord()
         for i in range(numModules):
             module = self.parseString()
             version = self.parseString()
-            self.log_basic("\t%s\t%s" % (module, version))
+            self.log_basic("\t%s\t%s", module, version)
 
     def parseUnknown(self):
         if self.verbosity < Verbosity.alldata:
             return
-        while self.stream.tell() < self.nextChunkOffset:
-            data = self.stream.read(4)
-            if len(data) < 4:
-                break
-            dword, = struct.unpack('I', data)
-            print ("\t0x%08x\t%r" % (dword, data))
+        stream = self.stream
+        end = min(self.nextChunkOffset, stream.size)
+        if self.sink is not None:
+            count = max(0, (end - stream.pos) // 4)
+            self.record(chunk=self.chunkID - 1, offset=stream.pos,
+                        dwords=list(self.parseStruct('<%iI' % count)))
+            return
+        while stream.pos + 4 <= end:
+            data = stream.data[stream.pos:stream.pos + 4]
+            dword = self.parseDWord()
+            self.write("\t0x%08x\t%r" % (dword, data))
 
     def parseElementDeclaration(self):
         elementId = self.parseDWord()
@@ -256,12 +722,11 @@ class Parser(Logger):
         name = self.parseString()
         fmt = self.parseString()
 
-        if self.verbosity >= Verbosity.basic:
-            print 'Element %i' % elementId
-            print "\ttypeId = %s" % typeId
-            print "\tunknown2 = %s" % unknown2
-            print "\tname = %s" % name
-            print "\tformat = %s" % fmt
+        self.log_basic('Element %i', elementId)
+        self.log_basic("\ttypeId = %s", typeId)
+        self.log_basic("\tunknown2 = %s", unknown2)
+        self.log_basic("\tname = %s", name)
+        self.log_basic("\tformat = %s", fmt)
 
         self.elements[elementId] = Element(typeId, name, fmt)
 
@@ -269,8 +734,8 @@ class Parser(Logger):
         eventTypeId = self.parseDWord()
         boo = self.parseDWord()
         name = self.parseString()
-        self.log_basic('EventType %i / %i' % (eventTypeId, boo))
-        self.log_basic("\t%s" % name)
+        self.log_basic('EventType %i / %i', eventTypeId, boo)
+        self.log_basic("\t%s", name)
         n = self.parseDWord()
         fields = []
         for i in range(n):
@@ -278,51 +743,76 @@ class Parser(Logger):
             element = self.elements[elementId]
             fieldFormat = self.parseString()
             fields.append((elementId, fieldFormat))
-            self.log_basic("\t%s\t%s" % (element, fieldFormat))
+            self.log_basic("\t%s\t%s", element, fieldFormat)
         eventType = EventType(name, fields)
         self.eventTypes[eventTypeId] = eventType
+        self.decoders.pop(eventTypeId, None)
 
     def parseEvent(self):
         eventTypeId = self.parseDWord()
         eventType = self.eventTypes[eventTypeId]
 
-        self.log_minimal("\ttype = %s" % eventType.name)
+        self.log_minimal("\ttype = %s", eventType.name)
 
         # unread the eventTypeId
-        self.stream.seek(-4, 1)
-        pos = self.stream.tell()
+        self.stream.pos -= 4
+        pos = self.stream.pos
 
         if eventType.name == "Frame Begin":
-            self.log_minimal("\tframe = %i (at %i)" % (self.frameID, pos))
+            self.log_minimal("\tframe = %i (at %i)", self.frameID, pos)
 
         data = {}
         offsets = {}
 
+        decoder = self.eventDecoder(eventTypeId)
+        if self.verbosity >= Verbosity.basic:
+            self.parseFields(eventType, data, offsets)
+        else:
+            decoder.decode(self, data, offsets)
+
+        if self.tree is not None:
+            self.addTreeEvent(decoder, data, pos)
+
+        # for real parsers
+        if decoder.isFrame:
+            selected = self.processFrame(eventType, data, offsets)
+            self.frameID += 1
+            if self.verbosity < Verbosity.basic and not selected:
+                nextOffset = data['NextSiblingPos']
+                if nextOffset != 0:
+                    self.nextChunkOffset = nextOffset
+                elif not self.following:
+                    # special case for end of file
+                    self.nextChunkOffset = self.stream.size
+                # else the frame is still being written, parse through it
+        else:
+            self.processEvent(eventType, data, offsets)
+
+    def addTreeEvent(self, decoder, data, pos):
+        function = 0
+        if pos < self.callOffset < self.nextChunkOffset:
+            function = DWord.unpack_from(self.stream.data, self.callOffset + 4)[0]
+        frame = self.frameID if decoder.isFrame else self.frameID - 1
+        eid = data.get('EID', 0)
+        self.tree.add(eid, data.get('Parent EID', 0xFFFFFFFF), function, frame, data.get('StartTime', 0))
+        if function == 0 and decoder.hasAsyncCall:
+            self.tree.addPending(eid)
+
+    def parseFields(self, eventType, data, offsets):
+        # field by field decoding, with logging
         for elementId, fieldFormat in eventType.fields:
             element = self.elements[elementId]
             if fieldFormat.startswith('('):
-                off = self.stream.tell()
+                off = self.stream.pos
                 value = self.parseElement(element)
                 data[element.name] = value
                 offsets[element.name] = off
-                self.log_basic("\t%s\t%r" % (element.name, value))
+                self.log_basic("\t%s\t%r", element.name, value)
                 if value is None:
                     break
             else:
                 value = fieldFormat
-                self.log_verbose("\t%s\t%s" % (element.name, value))
-
-        # for real parsers
-        if eventType.name == "Frame Begin":
-            selected = self.processFrame(eventType, data, offsets)
-            self.frameID += 1
-            if self.verbosity < Verbosity.basic and not selected:
-                self.nextChunkOffset = data['NextSiblingPos']
-                # special case for end of file
-                if self.nextChunkOffset == 0:
-                    self.nextChunkOffset = os.fstat(self.stream.fileno()).st_size
-        else:
-            self.processEvent(eventType, data, offsets)
+                self.log_verbose("\t%s\t%s", element.name, value)
 
     def processEvent(self, eventType, data, offsets):
         pass # to be implemented by parents
@@ -334,11 +824,28 @@ class Parser(Logger):
         eventId = self.parseDWord()
         elementId = self.parseDWord()
         element = self.elements.get(elementId)
-        self.log_basic('Event %i Async' % eventId)
-        self.log_basic("\telement = %s" % self.elements.get(elementId))
+        self.log_basic('Event %i Async', eventId)
+        self.log_basic("\telement = %s", self.elements.get(elementId))
+        offset = self.stream.pos
         value = self.parseElement(element)
         if value is not None:
-            self.log_alldata("\tvalue = %s" % value)
+            if self.sink is not None and self.verbosity >= Verbosity.alldata:
+                self.record(chunk=self.chunkID - 1, eid=eventId, element=element.name, value=value)
+            else:
+                self.log_alldata("\tvalue = %s", value)
+        if self.tree is not None and element.typeId == 7:
+            self.tree.setFunction(eventId, DWord.unpack_from(self.stream.data, offset + 4)[0])
+        if self.asyncs is not None:
+            if element.typeId == 7:
+                value = DWord.unpack_from(self.stream.data, offset + 4)[0] # function id
+            elif element.typeId == 1:
+                value = 0 # read from the offset
+            if value is not None: # elements of unknown types are not decoded
+                self.asyncs.add(eventId, elementId, value, offset)
+
+    def processCallId(self, functionId):
+        # override to match on raw ids and skip the name lookup
+        self.processCall(functionName.get(functionId, ''))
 
     def processCall(self, functionName):
         pass
@@ -359,44 +866,122 @@ class Parser(Logger):
             return value
         elif element.typeId == 7:
             # call package
+            self.callOffset = self.stream.pos
             size = self.parseDWord()
-            self.log_basic("\tsize = %u" % size)
+            self.log_basic("\tsize = %u", size)
             functionId = self.parseDWord()
-            functionStr = functionName.get(functionId, '')
-            self.processCall(functionStr)
-            self.log_basic("\tfunction = %s (%i)" % (functionStr, functionId))
+            self.processCallId(functionId)
+            if self.verbosity >= Verbosity.basic:
+                self.log_basic("\tfunction = %s (%i)", functionName.get(functionId, ''), functionId)
 
             if self.verbosity < Verbosity.alldata:
                 return None
 
+            if self.sink is not None:
+                self.record(chunk=self.chunkID - 1, offset=self.callOffset, function=functionId,
+                            name=functionName.get(functionId, ''), args=self.callArguments().tolist())
+                self.stream.pos = min(self.callOffset + 4 + size, self.nextChunkOffset) # past the payload
+                return None
             for i in xrange(4, size, 4):
-                if self.stream.tell() >= self.nextChunkOffset:
-                    print "unexpected end of chunk"
+                if self.stream.pos >= self.nextChunkOffset:
+                    self.write("unexpected end of chunk")
                 dword = self.parseDWord()
-                print ("\t0x%08x" % (dword,))
+                self.write("\t0x%08x" % (dword,))
         else:
             self.error('%s has unknown type %i, %s\n' % (element.name, element.typeId, element.fmt))
             return None
 
+    def callArguments(self, offset=None):
+        # payload dwords of a call package, [1, return value, arguments...], as an array('I')
+        end = self.stream.size
+        if offset is None:
+            offset = self.callOffset
+            end = min(end, self.nextChunkOffset)
+        else:
+            self.stream.load(offset, offset + 1) # chunks do not cross blocks
+        data = self.stream.data
+        size = DWord.unpack_from(data, offset)[0]
+        count = max(0, min(size - 4, end - offset - 8) // 4)
+        args = array('I')
+        args.fromstring(data[offset + 8:offset + 8 + 4 * count])
+        if sys.byteorder != 'little':
+            args.byteswap()
+        return args
+
     def parseSetTextureStage(self):
-        self.log_basic("\t0x%08x" % self.parseDWord())
-        self.log_basic("\t0x%08x" % self.parseDWord())
-        self.log_basic("\t0x%08x" % self.parseDWord())
+        self.log_basic("\t0x%08x", self.parseDWord())
+        self.log_basic("\t0x%08x", self.parseDWord())
+        self.log_basic("\t0x%08x", self.parseDWord())
 
     def parseString(self):
         length = self.parseDWord()
-        size = (length + 1) * 2
-        buf = self.stream.read(size)
-        buf = buf[:length * 2]
+        stream = self.stream
+        start = stream.pos
+        stream.pos = min(start + (length + 1) * 2, stream.size)
+        buf = stream.data[start:start + length * 2]
         return buf.decode('UTF-16', 'ignore')
 
     def parseDWord(self):
-        dword, = self.parseStruct('I')
-        return dword
+        stream = self.stream
+        pos = stream.pos
+        stream.pos = pos + 4
+        return DWord.unpack_from(stream.data, pos)[0]
 
     def parseStruct(self, fmt):
-        size = struct.calcsize(fmt)
-        buf = self.stream.read(size)
-        return struct.unpack(fmt, buf)
+        s = self.structs.get(fmt)
+        if s is None:
+            s = self.structs[fmt] = struct.Struct(fmt)
+        stream = self.stream
+        pos = stream.pos
+        stream.pos = pos + s.size
+        return s.unpack_from(stream.data, pos)
+
+class FrameDecoder(Parser):
+    """Collects the events of a frame range into a DecodedFrame"""
+
+    def __init__(self, stream):
+        Parser.__init__(self, stream, 0)
+        self.frame = DecodedFrame()
+        self.call = None # (function id, offset) of the event being decoded
+        self.asyncEID = None
+        self.pending = {} # EID -> row waiting for its async call package
+        self.asyncCalls = {} # event type name -> whether its call package is async
 
+    def processFrame(self, eventType, data, offsets):
+        self.processEvent(eventType, data, offsets)
+        return True
+
+    def hasAsyncCall(self, eventType):
+        hasCall = self.asyncCalls.get(eventType.name)
+        if hasCall is None:
+            hasCall = self.asyncCalls[eventType.name] = any(
+                self.elements[elementId].typeId == 7 and not fieldFormat.startswith('(')
+                for elementId, fieldFormat in eventType.fields)
+        return hasCall
+
+    def processEvent(self, eventType, data, offsets):
+        frame = self.frame
+        eid = data.get('EID', 0)
+        function, offset = self.call or (0, 0)
+        self.call = None
+        if not function and self.hasAsyncCall(eventType):
+            self.pending[eid] = len(frame.eids)
+        frame.eids.append(eid)
+        frame.parents.append(data.get('Parent EID', 0xFFFFFFFF))
+        frame.functions.append(function)
+        frame.times.append(data.get('StartTime', 0))
+        frame.calls.append(offset)
+
+    def parseEventAsync(self):
+        self.asyncEID = DWord.unpack_from(self.stream.data, self.stream.pos)[0]
+        Parser.parseEventAsync(self)
+        self.asyncEID = None
 
+    def processCallId(self, functionId):
+        if self.asyncEID is None:
+            self.call = (functionId, self.callOffset)
+        else:
+            row = self.pending.pop(self.asyncEID, None)
+            if row is not None:
+                self.frame.functions[row] = functionId
+                self.frame.calls[row] = self.callOffset
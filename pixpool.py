@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+##########################################################################
+#
+# Released under the MIT License
+#
+##########################################################################
+
+
+"""Process pool running parsers over independent frames"""
+
+import multiprocessing
+from pixindex import frameStarts, loadIndex
+from pixparser import MappedStream, Parser
+
+# per-process state, set up once by initWorker
+worker = {}
+
+def initWorker(path, elements, eventTypes, factory, args):
+    # packed traces get their block index and inflated view once per process
+    worker['stream'] = Parser(MappedStream(open(path, 'rb'))).stream
+    worker['elements'] = elements
+    worker['eventTypes'] = eventTypes
+    worker['decoders'] = {}
+    worker['factory'] = factory
+    # factory.workerArgs(*args) prepares the arguments of every task once, e.g. compiles a query
+    prepare = getattr(factory, 'workerArgs', None)
+    worker['args'] = prepare(*args) if prepare is not None else args
+
+def parseFrame(task):
+    frame, start, end, chunkID = task
+    parser = worker['factory'](worker['stream'], *worker['args'])
+    # share the schema instead of re-reading it
+    parser.elements = worker['elements']
+    parser.eventTypes = worker['eventTypes']
+    parser.decoders = worker['decoders']
+    parser.seekChunk(start, chunkID, max(frame, 1))
+    parser.parseRange(end)
+    parser.stream.trim(start, end)
+    return frame, parser.collect()
+
+def frameTasks(path):
+    stream = MappedStream(open(path, 'rb'))
+    parser = Parser(stream)
+    index = loadIndex(path)
+    if index is not None:
+        parser.parseSchema()
+        starts = index.frameStarts()
+    else:
+        starts = frameStarts(parser)
+    ends = [start for _, start, _ in starts[1:]] + [parser.stream.size]
+    tasks = [(frame, start, end, chunkID) for (frame, start, chunkID), end in zip(starts, ends)]
+    return parser, tasks
+
+def mapFrames(path, factory, args, jobs):
+    # yields (frame, parser.collect()) in frame order, frame 0 being the events
+    # before the first frame; factory(stream, *args) must build the parser
+    parser, tasks = frameTasks(path)
+    pool = multiprocessing.Pool(jobs, initWorker, (path, parser.elements, parser.eventTypes, factory, args))
+    try:
+        chunksize = max(1, len(tasks) // (jobs * 8))
+        for result in pool.imap(parseFrame, tasks, chunksize):
+            yield result
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
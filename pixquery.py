@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+##########################################################################
+#
+# Released under the MIT License
+#
+##########################################################################
+
+
+"""Call queries compiled into predicates over the call package dwords"""
+
+import re
+from pixargs import ArgumentsStart, Float, constants, functionArguments
+from pixfunc import functionName
+from pixparser import DWord
+
+# pattern [where condition], e.g. "DrawIndexedPrimitive where arg3 > 10000"
+Where = re.compile(r'\s+where(?:\s+|$)', re.I) # a trailing where lacks its condition
+Token = re.compile(r'\s*(==|!=|<=|>=|<|>|&|\(|\)|0[xX][0-9a-fA-F]+|-?\d+\.\d*(?:[eE][-+]?\d+)?'
+                   r'|-?\d+|[A-Za-z_]\w*)')
+Operators = ('==', '!=', '<=', '>=', '<', '>', '&')
+Argument = re.compile(r'^arg(\d+)$')
+
+class Query:
+    """A function name pattern, and an optional condition on the arguments of the matching calls"""
+
+    def __init__(self, text):
+        # comparisons are unsigned unless the value or the argument is a float,
+        # and a named argument the function does not have never compares true
+        self.text = text
+        parts = Where.split(text.strip(), 1)
+        self.pattern = parts[0]
+        try:
+            self.regex = re.compile(self.pattern)
+        except re.error, e:
+            raise ValueError('%s in %r' % (e, self.pattern))
+        self.condition = None
+        if len(parts) > 1:
+            self.tokens = tokenize(parts[1])
+            self.condition = self.parseOr()
+            if self.tokens:
+                raise ValueError('unexpected %r in query' % self.tokens[0])
+        # resolve the pattern against the function table once
+        self.functionIds = set(functionId for functionId, name in functionName.items()
+                               if self.regex.search(name))
+        self.matchUnknown = self.regex.search('') is not None # unknown ids have no name
+        self.predicates = Predicates(self)
+
+    def parseOr(self):
+        node = self.parseAnd()
+        while self.accept('or'):
+            node = ('or', node, self.parseAnd())
+        return node
+
+    def parseAnd(self):
+        node = self.parseNot()
+        while self.accept('and'):
+            node = ('and', node, self.parseNot())
+        return node
+
+    def parseNot(self):
+        if self.accept('not'):
+            return ('not', self.parseNot())
+        if self.accept('('):
+            node = self.parseOr()
+            self.expect(')')
+            return node
+        operand = self.next()
+        if not (operand[0].isalpha() or operand[0] == '_'):
+            raise ValueError('expected an argument instead of %r in query' % operand)
+        operator = self.next()
+        if operator not in Operators:
+            raise ValueError('expected a comparison after %r in query' % operand)
+        return ('cmp', operand, operator, parseValue(self.next()))
+
+    def accept(self, token):
+        if self.tokens and self.tokens[0].lower() == token:
+            self.tokens.pop(0)
+            return True
+        return False
+
+    def expect(self, token):
+        if not self.accept(token):
+            raise ValueError('expected %r in query' % token)
+
+    def next(self):
+        if not self.tokens:
+            raise ValueError('unexpected end of query')
+        return self.tokens.pop(0)
+
+    def source(self, functionId, node):
+        # python expression over the trace data d and the call package offset o
+        kind = node[0]
+        if kind == 'or' or kind == 'and':
+            return '(%s %s %s)' % (self.source(functionId, node[1]), kind, self.source(functionId, node[2]))
+        elif kind == 'not':
+            return '(not %s)' % self.source(functionId, node[1])
+        _, operand, operator, value = node
+        index, isFloat = argumentIndex(functionId, operand)
+        if index is None:
+            return 'False'
+        offset = 8 + 4 * index # past the size and function id
+        if isFloat or isinstance(value, float):
+            dword = 'F(d, o + %i)[0]' % offset
+        else:
+            dword = 'U(d, o + %i)[0]' % offset
+        if operator == '&':
+            test = '%s & %r' % (dword, value)
+        else:
+            test = '%s %s %r' % (dword, operator, value)
+        # the size covers the function id and the payload up to this dword
+        return '(U(d, o)[0] >= %i and %s)' % (offset, test)
+
+    def matches(self, functionId, data, offset):
+        # whether the call package at offset is a call of the query, unknown ids having an empty name
+        if functionId not in self.functionIds and not (self.matchUnknown and functionId not in functionName):
+            return False
+        return self.condition is None or self.predicates[functionId](data, offset)
+
+    def compile(self, functionId):
+        # predicate(data, offset) of the call package at offset, None without condition
+        if self.condition is None:
+            return None
+        source = self.source(functionId, self.condition)
+        return eval('lambda d, o: ' + source, {'U': DWord.unpack_from, 'F': Float.unpack_from})
+
+class Predicates(dict):
+    """Predicates by function id, compiled on first use"""
+
+    def __init__(self, query):
+        dict.__init__(self)
+        self.query = query
+
+    def __missing__(self, functionId):
+        predicate = self[functionId] = self.query.compile(functionId)
+        return predicate
+
+def tokenize(text):
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        m = Token.match(text, pos)
+        if m is None:
+            raise ValueError('invalid query at %r' % text[pos:].strip())
+        tokens.append(m.group(1))
+        pos = m.end()
+    return tokens
+
+def parseValue(token):
+    if token in constants:
+        return constants[token]
+    try:
+        if token.lower().startswith('0x'):
+            return int(token, 16)
+        elif '.' in token:
+            return float(token)
+        return int(token) & 0xFFFFFFFF
+    except ValueError:
+        raise ValueError('unknown constant %r in query' % token)
+
+def argumentIndex(functionId, operand):
+    # (payload index, float argument) of an operand, (None, False) when the function has no such argument
+    if operand == 'ret':
+        return 1, False
+    m = Argument.match(operand)
+    if m is not None:
+        # methods take "this" first
+        isMethod = '::' in functionName.get(functionId, '')
+        return ArgumentsStart + isMethod + int(m.group(1)), False
+    signature = functionArguments.get(functionId)
+    if signature is None:
+        return None, False
+    for i, (name, kind) in enumerate(signature.arguments):
+        if name == operand:
+            return ArgumentsStart + i, kind == 'float'
+    return None, False
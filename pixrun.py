@@ -11,22 +11,63 @@
 """Entry point for PIXrun parser"""
 
 import sys
-from pixparser import Parser, Verbosity
+from pixparser import ParseProfile, Parser, Verbosity
+
+def batch(args):
+    import pixbatch
+    pixbatch.main(args)
+
+def serve(args):
+    import pixserve
+    pixserve.main(args)
+
+def pack(args):
+    import pixpack
+    pixpack.packMain(args)
+
+def unpack(args):
+    import pixpack
+    pixpack.unpackMain(args)
+
+# subcommands, loaded on demand
+Commands = {
+    'batch': batch,
+    'serve': serve,
+    'pack': pack,
+    'unpack': unpack,
+}
 
 def main():
     if len(sys.argv) < 2:
         sys.stdout.flush()
         sys.stderr.write('Requires a pixfile as argument!\n')
+        sys.stderr.write('Usage: pixrun.py pix_in [verbosity] [--profile] [--jsonl=dump.jsonl]\n')
+        sys.stderr.write('       pixrun.py %s ...\n' % '|'.join(sorted(Commands)))
         exit(1)
+    elif sys.argv[1] in Commands:
+        Commands[sys.argv[1]](sys.argv[2:])
     else:
         
-        pixfile = open(sys.argv[1], 'rb')
+        options = [arg for arg in sys.argv[1:] if arg.startswith('--')]
+        argv = [arg for arg in sys.argv if arg not in options]
+        pixfile = open(argv[1], 'rb')
         verbosity = Verbosity.silent
-        if len(sys.argv) >= 3:
-            verbosity = sys.argv[2]
+        if len(argv) >= 3:
+            verbosity = argv[2]
         # create parser and run it
         parser = Parser(pixfile, verbosity)
+        for option in options:
+            if option == '--profile':
+                parser.profile = ParseProfile()
+            elif option.startswith('--jsonl='):
+                # alldata dumps as JSON lines
+                parser.sink = open(option[len('--jsonl='):], 'wb', 1 << 20)
         parser.parse()
+        if parser.sink is not None:
+            parser.sink.close()
+        if parser.profile is not None:
+            sys.stdout.flush()
+            parser.profile.report(sys.stderr)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+##########################################################################
+#
+# Released under the MIT License
+#
+##########################################################################
+
+
+"""Local HTTP server answering frame queries over one PIXrun file"""
+
+import json
+import sys
+import time
+import traceback
+import urlparse
+from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from pixfunc import functionName
+from pixindex import openIndex
+from pixparser import FrameCache, MappedStream, Parser
+from pixquery import Query
+from pixstats import DrawCalls, StateCalls
+
+NoParent = 0xFFFFFFFF
+
+class TraceServer:
+    """Schema, index and mapping of a trace, and a parser caching the decoded frames"""
+
+    def __init__(self, path, cacheBytes=256 << 20):
+        self.path = path
+        self.parser = Parser(MappedStream(open(path, 'rb')))
+        self.stream = self.parser.stream # raw view of packed traces
+        self.parser.index = openIndex(path)
+        self.parser.frameCache = FrameCache(cacheBytes)
+        self.parser.parseSchema()
+        self.drawIds = set(i for i, name in functionName.items() if DrawCalls.search(name))
+        self.stateIds = set(i for i, name in functionName.items() if StateCalls.search(name))
+
+    def frameCount(self):
+        return self.parser.index.frameCount()
+
+    def decodeFrame(self, frame):
+        if not 0 <= frame <= self.frameCount():
+            raise ValueError('no frame %i' % frame)
+        return self.parser.decodeFrame(frame)
+
+    def frameRange(self, params):
+        # frames [start, end] of a query, all frames by default
+        count = self.frameCount()
+        start = int(params.get('start', 1))
+        end = int(params.get('end', count))
+        return xrange(max(start, 0), min(end, count) + 1)
+
+    def info(self, params):
+        return {'path': self.path, 'size': self.stream.size, 'frames': self.frameCount(),
+                'chunks': self.parser.index.chunkCount(), 'cache': self.parser.frameCache.summary()}
+
+    def listFrames(self, params):
+        index = self.parser.index
+        frames = []
+        for frame in self.frameRange(params):
+            if frame == 0:
+                continue
+            offset, chunkID, end = index.frameBounds(frame)
+            if end is None:
+                end = self.stream.size
+            frames.append({'frame': frame, 'offset': offset, 'bytes': end - offset,
+                           'first_eid': index.frameFirstEIDs[frame - 1],
+                           'last_eid': index.frameLastEIDs[frame - 1]})
+        return {'frames': frames}
+
+    def events(self, params):
+        frame = int(params.get('frame', 1))
+        decoded = self.decodeFrame(frame)
+        withArgs = params.get('args', '0') != '0'
+        parser = self.parser
+        events = []
+        for eid, parent, function, startTime, offset in zip(decoded.eids, decoded.parents, decoded.functions,
+                                                            decoded.times, decoded.calls):
+            event = {'eid': eid, 'parent': None if parent == NoParent else parent, 'time': startTime}
+            if function:
+                event['function'] = functionName.get(function, function)
+                if withArgs:
+                    event['args'] = parser.callArguments(int(offset)).tolist()
+            events.append(event)
+        return {'frame': frame, 'events': events}
+
+    def grep(self, params):
+        if 'pattern' not in params:
+            raise ValueError('missing pattern')
+        query = Query(params['pattern'])
+        data = self.stream.data
+        frames = []
+        total = 0
+        for frame in self.frameRange(params):
+            decoded = self.decodeFrame(frame)
+            matches = 0
+            for function, offset in zip(decoded.functions, decoded.calls):
+                if function and query.matches(function, data, int(offset)):
+                    matches += 1
+            if matches:
+                frames.append({'frame': frame, 'matches': matches})
+                total += matches
+        return {'pattern': query.pattern, 'matches': total, 'frames': frames}
+
+    def stats(self, params):
+        frames = []
+        for frame in self.frameRange(params):
+            if frame == 0:
+                continue
+            decoded = self.decodeFrame(frame)
+            draws = states = calls = 0
+            for function in decoded.functions:
+                if function:
+                    calls += 1
+                    if function in self.drawIds:
+                        draws += 1
+                    elif function in self.stateIds:
+                        states += 1
+            times = [t for t in decoded.times if t]
+            duration = max(times) - min(times) if times else 0
+            frames.append({'frame': frame, 'draws': draws, 'states': states, 'calls': calls,
+                           'duration': duration})
+        return {'frames': frames}
+
+    def close(self):
+        self.parser.frameCache.clear()
+        self.stream.close()
+
+    queries = {
+        '/info': info,
+        '/frames': listFrames,
+        '/events': events,
+        '/grep': grep,
+        '/stats': stats,
+    }
+
+class QueryHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        url = urlparse.urlparse(self.path)
+        params = dict(urlparse.parse_qsl(url.query))
+        query = TraceServer.queries.get(url.path.rstrip('/') or '/info')
+        if query is None:
+            self.reply(404, {'error': 'unknown query %s' % url.path, 'queries': sorted(TraceServer.queries)})
+            return
+        start = time.time()
+        try:
+            result = query(self.server.trace, params)
+        except ValueError, e:
+            self.reply(400, {'error': str(e)})
+            return
+        except Exception, e:
+            # malformed or truncated traces
+            self.log_error('%s', traceback.format_exc())
+            self.reply(500, {'error': '%s: %s' % (e.__class__.__name__, e)})
+            return
+        result['seconds'] = round(time.time() - start, 6)
+        self.reply(200, result)
+
+    def reply(self, status, result):
+        body = json.dumps(result)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, fmt, *args):
+        if self.server.verbose:
+            BaseHTTPRequestHandler.log_message(self, fmt, *args)
+
+def serve(path, port=8377, cacheBytes=256 << 20, verbose=False):
+    # answers on localhost only, until interrupted
+    server = HTTPServer(('127.0.0.1', port), QueryHandler)
+    server.trace = TraceServer(path, cacheBytes)
+    server.verbose = verbose
+    sys.stderr.write('Serving %s (%i frames) on http://127.0.0.1:%i/\n' % (path, server.trace.frameCount(),
+                                                                          server.server_address[1]))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.trace.close()
+
+def main(args):
+    options = {}
+    paths = []
+    for arg in args:
+        if arg.startswith('--') and '=' in arg:
+            name, value = arg[2:].split('=', 1)
+            options[name] = value
+        elif arg == '--verbose':
+            options['verbose'] = True
+        else:
+            paths.append(arg)
+    if len(paths) != 1:
+        sys.stdout.flush()
+        sys.stderr.write('Usage: pixrun.py serve [--port=8377] [--cache=MB] [--verbose] pix_in\n')
+        sys.stderr.write('\nQueries: /info /frames /events?frame=n[&args=1] /grep?pattern=p /stats,\n'
+                         'with start=a&end=b to restrict the frames\n\n')
+        exit(1)
+    else:
+        cacheBytes = int(float(options.get('cache', 256)) * (1 << 20))
+        serve(paths[0], int(options.get('port', 8377)), cacheBytes, 'verbose' in options)
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
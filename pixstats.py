@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+##########################################################################
+#
+# Released under the MIT License
+#
+##########################################################################
+
+
+"""Entry point for PIXrun per-frame statistics"""
+
+import re
+import struct
+import sys
+import zlib
+from array import array
+from pixfunc import functionName
+from pixparser import MappedStream, Parser, DWord
+
+DrawCalls = re.compile(r'::Draw')
+StateCalls = re.compile(r'::Set(RenderState|Texture|SamplerState)$')
+
+StatsMagic = 'PIXSTAT\0'
+StatsVersion = 3
+# magic, version, #frames, resume offset, resume chunk, resume frame, fingerprint of the trace before the resume offset
+StatsHeader = struct.Struct('<8sIIQIII')
+BlockSize = 64 << 20
+FingerprintWindow = 1 << 20 # trace bytes checked before the resume offset
+
+class FrameStats:
+    """Statistics of the closed frames, and where to resume parsing for the next ones"""
+
+    def __init__(self):
+        self.draws = array('I')
+        self.states = array('I')
+        self.calls = array('I')
+        self.starts = array('d') # first StartTime
+        self.durations = array('d') # StartTime span up to the next frame
+        self.resume = (0, 1, 1) # offset, chunk id and frame id of the first open frame
+        self.fingerprint = 0 # of the trace before the resume offset
+
+    def arrays(self):
+        return [self.draws, self.states, self.calls, self.starts, self.durations]
+
+    def frameCount(self):
+        return len(self.draws)
+
+    def append(self, draws, states, calls, start, duration):
+        self.draws.append(draws)
+        self.states.append(states)
+        self.calls.append(calls)
+        self.starts.append(start)
+        self.durations.append(duration)
+
+class StatsParser(Parser):
+    def __init__(self, stream, stats):
+        Parser.__init__(self, stream, 0)
+        self.stats = stats
+        self.drawIds = set(i for i, name in functionName.items() if DrawCalls.search(name))
+        self.stateIds = set(i for i, name in functionName.items() if StateCalls.search(name))
+        self.current = None # [draws, states, calls, first StartTime, last StartTime] of the open frame
+
+    def parseChunk(self):
+        return self.chunkComplete() and Parser.parseChunk(self)
+
+    def processFrame(self, eventType, data, offsets):
+        startTime = data.get('StartTime', 0)
+        if self.current is not None:
+            if startTime:
+                self.current[4] = startTime
+            self.close()
+        self.current = [0, 0, 0, startTime, startTime]
+        self.stats.resume = (self.lastChunkOffset, self.chunkID - 1, self.frameID)
+        return True # every call is counted
+
+    def processEvent(self, eventType, data, offsets):
+        startTime = data.get('StartTime', 0)
+        if self.current is not None and startTime:
+            if not self.current[3]:
+                self.current[3] = startTime
+            self.current[4] = max(self.current[4], startTime)
+
+    def processCallId(self, functionId):
+        if self.current is not None:
+            self.current[2] += 1
+            if functionId in self.drawIds:
+                self.current[0] += 1
+            elif functionId in self.stateIds:
+                self.current[1] += 1
+
+    def close(self):
+        draws, states, calls, first, last = self.current
+        self.stats.append(draws, states, calls, first, last - first)
+        self.current = None
+
+    def seekResume(self):
+        # continue after the cached frames, if the trace still matches them
+        offset, chunkID, frameID = self.stats.resume
+        if offset == 0:
+            return True
+        self.parseSchema()
+        self.stream.load(offset, offset + 1) # packed traces
+        if offset + 12 > self.stream.size or DWord.unpack_from(self.stream.data, offset + 4)[0] != 1003:
+            return False
+        data, offsets = self.decodeEvent(offset)
+        if data.get('ThisEventPos') != offset:
+            return False
+        # the cached frames must come from the same capture
+        if fingerprint(self.stream, offset) != self.stats.fingerprint:
+            return False
+        self.seekChunk(offset, chunkID, frameID)
+        return True
+
+def checksum(stream, start, end, crc=0):
+    for pos in xrange(start, end, BlockSize):
+        n = min(BlockSize, end - pos)
+        stream.load(pos, pos + n)
+        crc = zlib.crc32(buffer(stream.data, pos, n), crc)
+    return crc
+
+def fingerprint(stream, offset):
+    # crc32 of the chunks before the first event and of the FingerprintWindow bytes before offset,
+    # so that checking a cache costs the same whatever the size of the trace
+    schema = 0
+    while schema + 8 <= offset:
+        stream.load(schema, schema + 8)
+        size, tag = struct.unpack_from('<II', stream.data, schema)
+        if tag == 1003:
+            break
+        schema += 4 + size
+    schema = min(schema, offset)
+    crc = checksum(stream, 0, schema)
+    crc = checksum(stream, max(schema, offset - FingerprintWindow), offset, crc)
+    return crc & 0xFFFFFFFF
+
+def statsPath(path):
+    return path + '.pixstats'
+
+def saveStats(stats, path):
+    with open(path, 'wb') as f:
+        f.write(StatsHeader.pack(StatsMagic, StatsVersion, stats.frameCount(), *(stats.resume + (stats.fingerprint,))))
+        for a in stats.arrays():
+            if sys.byteorder != 'little':
+                a = array(a.typecode, a)
+                a.byteswap()
+            a.tofile(f)
+
+def loadStats(path):
+    # returns None when the cache is missing or unreadable
+    try:
+        f = open(statsPath(path), 'rb')
+    except EnvironmentError:
+        return None
+    with f:
+        header = f.read(StatsHeader.size)
+        if len(header) < StatsHeader.size:
+            return None
+        magic, version, numFrames, offset, chunkID, frameID, crc = StatsHeader.unpack(header)
+        if magic != StatsMagic or version != StatsVersion:
+            return None
+        stats = FrameStats()
+        stats.resume = (offset, chunkID, frameID)
+        stats.fingerprint = crc
+        try:
+            for a in stats.arrays():
+                a.fromfile(f, numFrames)
+                if sys.byteorder != 'little':
+                    a.byteswap()
+        except EOFError:
+            return None
+    return stats
+
+def updateStats(path):
+    # returns the statistics of the closed frames (cached), and those of the open last frame
+    stream = MappedStream(open(path, 'rb'))
+    stats = loadStats(path)
+    parser = None
+    if stats is not None:
+        parser = StatsParser(stream, stats)
+        if not parser.seekResume():
+            parser = None
+    if parser is None:
+        parser = StatsParser(stream, FrameStats())
+    parser.parse()
+    parser.stats.fingerprint = fingerprint(parser.stream, parser.stats.resume[0])
+    try:
+        saveStats(parser.stats, statsPath(path))
+    except EnvironmentError:
+        pass # read-only location
+    last = None
+    if parser.current is not None:
+        draws, states, calls, first, end = parser.current
+        last = (draws, states, calls, first, end - first)
+    return parser.stats, last
+
+def main():
+    if len(sys.argv) < 2:
+        sys.stdout.flush()
+        sys.stderr.write('Usage: pixstats.py pix_in\n')
+        exit(1)
+    else:
+        stats, last = updateStats(sys.argv[1])
+        rows = zip(stats.draws, stats.states, stats.calls, stats.starts, stats.durations)
+        if last is not None:
+            rows.append(last)
+        print '%8s %8s %8s %8s %14s' % ('frame', 'draws', 'states', 'calls', 'duration')
+        for frame, (draws, states, calls, start, duration) in enumerate(rows, 1):
+            print '%8i %8i %8i %8i %14i' % (frame, draws, states, calls, duration)
+        print '%8s %8i %8i %8i %14i' % ('total', sum(r[0] for r in rows), sum(r[1] for r in rows),
+                                       sum(r[2] for r in rows), sum(r[4] for r in rows))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+##########################################################################
+#
+# Released under the MIT License
+#
+##########################################################################
+
+
+"""Event hierarchy from the Parent EID of the events"""
+
+import sys
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from pixfunc import functionName
+from pixparser import MappedStream, Parser
+
+NoParent = 0xFFFFFFFF
+
+class EventTree:
+    """Parent / children adjacency of the events, in flat arrays
+
+    Rows are events in EID order. The children of row r are childIndex[childOffsets[r]:childOffsets[r + 1]],
+    and its subtree is order[starts[r]:ends[r]], the rows being also laid out in pre-order.
+    """
+
+    def __init__(self):
+        self.eids = array('I')
+        self.parents = array('I') # Parent EID
+        self.functions = array('I') # call package function id, 0 without call
+        self.frames = array('I')
+        self.times = array('d') # StartTime
+        self.pending = {} # EID -> row waiting for its async call package
+        self.built = 0 # rows when last built
+
+    def __len__(self):
+        return len(self.eids)
+
+    def add(self, eid, parent, function, frame, time):
+        self.eids.append(eid)
+        self.parents.append(parent)
+        self.functions.append(function)
+        self.frames.append(frame)
+        self.times.append(time)
+
+    def addPending(self, eid):
+        # the call package of the last event comes in an async chunk
+        self.pending[eid] = len(self.eids) - 1
+
+    def setFunction(self, eid, function):
+        row = self.pending.pop(eid, None)
+        if row is not None:
+            self.functions[row] = function
+
+    def build(self):
+        n = len(self.eids)
+        eids = self.eids
+        if any(eids[i - 1] > eids[i] for i in xrange(1, n)):
+            order = sorted(xrange(n), key=eids.__getitem__)
+            for name in ('eids', 'parents', 'functions', 'frames', 'times'):
+                column = getattr(self, name)
+                setattr(self, name, array(column.typecode, [column[i] for i in order]))
+            eids = self.eids
+            self.pending = {}
+        # parent rows, -1 for the roots
+        parentRows = array('i', [-1]) * n
+        counts = array('I', [0]) * (n + 1)
+        for row in xrange(n):
+            parent = self.parents[row]
+            if parent == NoParent or parent == eids[row]:
+                continue
+            p = bisect_left(eids, parent)
+            if p < n and eids[p] == parent:
+                parentRows[row] = p
+                counts[p + 1] += 1
+        # children, in EID order
+        offsets = counts
+        for row in xrange(n):
+            offsets[row + 1] += offsets[row]
+        children = array('I', [0]) * offsets[n]
+        cursor = array('I', offsets)
+        for row in xrange(n):
+            p = parentRows[row]
+            if p >= 0:
+                children[cursor[p]] = row
+                cursor[p] += 1
+        self.parentRows = parentRows
+        self.childOffsets = offsets
+        self.childIndex = children
+        self.roots = array('I', [row for row in xrange(n) if parentRows[row] < 0])
+        self.preorder()
+        self.built = n
+
+    def preorder(self):
+        n = len(self.eids)
+        order = array('I')
+        starts = array('I', [NoParent]) * n
+        offsets, children = self.childOffsets, self.childIndex
+        def visit(root):
+            stack = [root]
+            while stack:
+                row = stack.pop()
+                if starts[row] != NoParent:
+                    continue # cycle of parents
+                starts[row] = len(order)
+                order.append(row)
+                stack.extend(reversed(children[offsets[row]:offsets[row + 1]]))
+        for root in self.roots:
+            visit(root)
+        for row in xrange(n):
+            if starts[row] == NoParent:
+                # only reachable through a cycle of parents, made a root
+                self.parentRows[row] = -1
+                self.roots.append(row)
+                visit(row)
+        # subtree sizes, children before parents
+        sizes = array('I', [1]) * n
+        parentRows = self.parentRows
+        for row in reversed(order):
+            p = parentRows[row]
+            if p >= 0 and starts[p] < starts[row]:
+                sizes[p] += sizes[row]
+        self.order = order
+        self.starts = starts
+        self.ends = array('I', [starts[row] + sizes[row] for row in xrange(n)])
+        self.columns = {}
+
+    def check(self):
+        if self.built != len(self.eids):
+            self.build()
+
+    def row(self, eid):
+        # -1 when the event is unknown
+        self.check()
+        r = bisect_left(self.eids, eid)
+        if r < len(self.eids) and self.eids[r] == eid:
+            return r
+        return -1
+
+    def parent(self, eid):
+        # None for the roots and unknown events
+        r = self.row(eid)
+        if r >= 0:
+            r = self.parentRows[r]
+        return self.eids[r] if r >= 0 else None
+
+    def children(self, eid):
+        r = self.row(eid)
+        if r < 0:
+            return []
+        return [self.eids[c] for c in self.childRows(r)]
+
+    def childRows(self, r):
+        self.check()
+        return self.childIndex[self.childOffsets[r]:self.childOffsets[r + 1]]
+
+    def ancestors(self, eid):
+        r = self.row(eid)
+        eids = []
+        while r >= 0:
+            r = self.parentRows[r]
+            if r >= 0:
+                eids.append(self.eids[r])
+        return eids
+
+    def subtreeRows(self, eid):
+        # rows of the event and its descendants, in pre-order
+        r = self.row(eid)
+        if r < 0:
+            return array('I')
+        return self.order[self.starts[r]:self.ends[r]]
+
+    def subtree(self, eid):
+        eids = self.eids
+        for r in self.subtreeRows(eid):
+            yield eids[r]
+
+    def column(self, name):
+        # a column in pre-order, so that any subtree is a slice of it
+        self.check()
+        values = self.columns.get(name)
+        if values is None:
+            column = getattr(self, name)
+            values = self.columns[name] = array(column.typecode, [column[r] for r in self.order])
+        return values
+
+    def subtreeSlice(self, eid, name):
+        r = self.row(eid)
+        if r < 0:
+            return self.column(name)[:0]
+        return self.column(name)[self.starts[r]:self.ends[r]]
+
+    def size(self, eid):
+        r = self.row(eid)
+        return self.ends[r] - self.starts[r] if r >= 0 else 0
+
+    def count(self, eid, functionIds):
+        # calls of some functions under the event, itself included
+        functions = self.subtreeSlice(eid, 'functions')
+        if len(functionIds) == 1:
+            function, = functionIds
+            return functions.count(function)
+        return sum(1 for f in functions if f in functionIds)
+
+    def histogram(self, eid):
+        # function id -> number of calls under the event
+        counts = Counter(self.subtreeSlice(eid, 'functions'))
+        counts.pop(0, None)
+        return counts
+
+    def span(self, eid):
+        # first and last StartTime under the event
+        times = [t for t in self.subtreeSlice(eid, 'times') if t]
+        if not times:
+            return None
+        return min(times), max(times)
+
+class TreeParser(Parser):
+    def __init__(self, stream):
+        Parser.__init__(self, stream, 0)
+        self.tree = EventTree()
+
+    def processFrame(self, eventType, data, offsets):
+        return True # every event is part of the tree
+
+def loadTree(path):
+    parser = TreeParser(MappedStream(open(path, 'rb')))
+    parser.parse()
+    parser.tree.build()
+    return parser.tree
+
+def main():
+    if len(sys.argv) < 2:
+        sys.stdout.flush()
+        sys.stderr.write('Usage: pixtree.py pix_in [eid [depth]]\n')
+        exit(1)
+    else:
+        tree = loadTree(sys.argv[1])
+        if len(sys.argv) < 3:
+            print '%8s %8s %8s  %s' % ('eid', 'frame', 'events', 'function')
+            for r in tree.roots:
+                eid = tree.eids[r]
+                print '%8i %8i %8i  %s' % (eid, tree.frames[r], tree.size(eid), functionName.get(tree.functions[r], ''))
+        else:
+            eid = int(sys.argv[2])
+            depth = int(sys.argv[3]) if len(sys.argv) >= 4 else NoParent
+            if tree.row(eid) < 0:
+                sys.stderr.write('Unknown event %i\n' % eid)
+                exit(1)
+            base = len(tree.ancestors(eid))
+            for e in tree.subtree(eid):
+                level = len(tree.ancestors(e)) - base
+                if level <= depth:
+                    r = tree.row(e)
+                    print '%s%i %s (%i)' % ('  ' * level, e, functionName.get(tree.functions[r], ''), tree.size(e))
+            print '#calls:'
+            for function, count in tree.histogram(eid).most_common():
+                print '%8i  %s' % (count, functionName.get(function, ''))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,846 @@
+#!/usr/bin/env python
+##########################################################################
+#
+# Released under the MIT License
+#
+##########################################################################
+
+
+"""Behaviour tests over small generated traces"""
+
+import json
+import os
+import random
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+import urllib2
+import pixstats
+from BaseHTTPServer import HTTPServer
+from StringIO import StringIO
+from copy_frames import DependencyParser, FrameParser
+from grep_frames import FrameMatcher
+from pixargs import ArgumentsStart, argumentView, formatCall, functionArguments, signatureTable
+from pixasync import AsyncTable
+from pixbatch import runBatch
+from pixfunc import functionName
+from pixgen import TraceGenerator, TraceObject, ObjectTexture, dword, qword
+from pixobjects import ObjectTable, RecordSize, CreateEID, DestroyEID, Forever
+from pixindex import buildIndex, indexPath, loadIndex, openIndex
+from pixmarkers import BeginEvent, EndEvent, MarkerProfiler
+from pixpack import PackedStream, ZlibCodec, pack, unpack
+from pixparser import DecodedFrame, FrameCache, FrameDecoder, MappedStream, ParseProfile, Parser
+from pixquery import Query
+from pixserve import QueryHandler, TraceServer
+from pixstats import StatsParser, loadStats, statsPath, updateStats
+from pixtree import loadTree
+
+try:
+    from export_events import EventExporter
+except ImportError:
+    EventExporter = None # numpy is optional
+
+def objectTable(lifetimes):
+    # an ObjectTable holding one record per (CreateEID, DestroyEID)
+    table = ObjectTable()
+    for i, (start, end) in enumerate(lifetimes):
+        record = [0] * RecordSize
+        record[0] = 0x1000 + 0x100 * i
+        record[CreateEID] = start
+        record[DestroyEID] = end
+        table.extend(struct.pack('<%iI' % RecordSize, *record))
+    return table
+
+class DegenerateGenerator(TraceGenerator):
+    """Adds objects whose lifetime is empty or inverted, at the address of the device"""
+
+    def writeObjectInfo(self):
+        for createEID, destroyEID in ((3, 3), (9, 4)):
+            obj = TraceObject(self.device.address, ObjectTexture, 256)
+            obj.createEID = createEID
+            obj.destroyEID = destroyEID
+            self.objects.append(obj)
+        TraceGenerator.writeObjectInfo(self)
+
+class UnknownAsyncGenerator(TraceGenerator):
+    """Adds an async FPS value (an element type the parser does not decode) to every frame"""
+
+    def writeFrame(self, frame):
+        lastFrame = TraceGenerator.writeFrame(self, frame)
+        self.writer.writeChunk(1004, dword(self.eid) + dword(12) + struct.pack('<f', 60.0))
+        return lastFrame
+
+class UnknownCallGenerator(TraceGenerator):
+    """Adds a call to a function id missing from the function table to every frame"""
+
+    def writeFrame(self, frame):
+        lastFrame = TraceGenerator.writeFrame(self, frame)
+        eid = self.newEID()
+        self.writeEvent([dword(8), dword(eid), dword(self.eid - 1), qword(self.tick())])
+        self.writer.writeChunk(1004, dword(eid) + dword(19) + dword(16) + dword(0x7FFFFF00) + dword(1) + dword(0)
+                               + dword(frame))
+        return lastFrame
+
+class TraceTest(unittest.TestCase):
+    """Generated traces in a temporary directory"""
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp(prefix='pixrun')
+        self.stdout, self.stderr = sys.stdout, sys.stderr
+        sys.stdout = StringIO() # tools report their progress
+        sys.stderr = StringIO()
+
+    def tearDown(self):
+        sys.stdout, sys.stderr = self.stdout, self.stderr
+        shutil.rmtree(self.dir)
+
+    def path(self, name):
+        return os.path.join(self.dir, name)
+
+    def generate(self, name, frames, calls, markers=False, generator=TraceGenerator):
+        path = self.path(name)
+        with open(path, 'wb') as output:
+            generator(output, frames, calls, 0, markers).generate()
+        return path
+
+    def pack(self, path):
+        packed = path + '.pixpack'
+        with open(packed, 'wb') as output:
+            pack(path, output, ZlibCodec())
+        return packed
+
+    def script(self, *args):
+        script = os.path.join(os.path.dirname(os.path.abspath(__file__)), args[0])
+        return subprocess.check_output([sys.executable, script] + list(args[1:]))
+
+    def eids(self, path):
+        parser = Parser(MappedStream(open(path, 'rb')))
+        eids = [event.eid for event in parser.iterEvents()]
+        parser.stream.close()
+        return eids
+
+    def events(self, path, verbosity=0):
+        # (frame, EID, fields) of every event, from a plain parse
+        parser = Parser(MappedStream(open(path, 'rb')), verbosity)
+        parser.out = StringIO()
+        events = []
+        def processEvent(eventType, data, offsets):
+            events.append((parser.frameID - 1, data.get('EID', 0), data, offsets))
+        def processFrame(eventType, data, offsets):
+            events.append((parser.frameID, data['EID'], data, offsets))
+            return True
+        parser.processEvent = processEvent
+        parser.processFrame = processFrame
+        parser.parse()
+        parser.stream.close()
+        return events
+
+class ObjectTableTest(unittest.TestCase):
+
+    def alive(self, lifetimes, eid):
+        # brute force lifetime check, with inverted lifetimes never alive
+        return sorted(i for i, (start, end) in enumerate(lifetimes) if start <= eid < (end or Forever))
+
+    def testEmptyLifetimes(self):
+        lifetimes = [(5, 5), (9, 3), (2, 0), (4, 8)]
+        table = objectTable(lifetimes)
+        for eid in xrange(12):
+            self.assertEqual(sorted(table.aliveAt(eid)), self.alive(lifetimes, eid))
+            self.assertEqual(table.countAliveAt(eid), len(self.alive(lifetimes, eid)))
+        self.assertEqual(table.findObject(0x1000, 5), -1)
+        self.assertEqual(table.findObject(0x1100, 4), -1)
+
+    def testRandomLifetimes(self):
+        rng = random.Random(11)
+        lifetimes = [(rng.randint(1, 200), rng.choice([0, rng.randint(1, 200)])) for i in xrange(300)]
+        table = objectTable(lifetimes)
+        for eid in xrange(0, 202):
+            self.assertEqual(sorted(table.aliveAt(eid)), self.alive(lifetimes, eid))
+            self.assertEqual(table.countAliveAt(eid), len(self.alive(lifetimes, eid)))
+
+class CopyFramesTest(TraceTest):
+
+    def copyDeps(self, path, frames):
+        output = self.path('copy.pixrun')
+        with open(output, 'wb') as out:
+            DependencyParser(MappedStream(open(path, 'rb')), out, dict((str(f), True) for f in frames)).parse()
+        return output
+
+    def copyFrames(self, path, frames, indexed):
+        output = self.path('copy.pixrun')
+        sys.stdout = StringIO()
+        with open(output, 'wb') as out:
+            parser = FrameParser(MappedStream(open(path, 'rb')), out, dict((str(f), True) for f in frames))
+            if indexed:
+                parser.index = openIndex(path)
+            parser.parse()
+            parser.stream.close()
+        return open(output, 'rb').read(), sys.stdout.getvalue()
+
+    def testIndexedCopy(self):
+        path = self.generate('frames.pixrun', 20, 24)
+        packed = self.pack(path)
+        for frames in ([1], [5], [18, 19, 20], [2, 9, 20], [], [21]):
+            expected = self.copyFrames(path, frames, False)
+            self.assertEqual(self.copyFrames(path, frames, True), expected)
+            self.assertEqual(self.copyFrames(packed, frames, True), expected)
+            self.assertEqual(self.copyFrames(packed, frames, False), expected)
+            self.assertEqual(expected[1].count('Copying frame'), len([f for f in frames if f <= 20]))
+
+    def testDependenciesWithEmptyLifetimes(self):
+        plain = self.generate('plain.pixrun', 20, 24)
+        degenerate = self.generate('degenerate.pixrun', 20, 24, generator=DegenerateGenerator)
+        for frames in ([1], [5], [18, 19], [2, 20]):
+            expected = self.eids(self.copyDeps(plain, frames))
+            self.assertEqual(self.eids(self.copyDeps(degenerate, frames)), expected)
+            self.assertTrue(len(expected) > 0)
+
+class AsyncTableTest(TraceTest):
+
+    def testUndecodedValues(self):
+        path = self.generate('fps.pixrun', 6, 12, generator=UnknownAsyncGenerator)
+        parser = Parser(MappedStream(open(path, 'rb')), 0)
+        parser.asyncs = AsyncTable()
+        for event in parser.iterEvents():
+            pass
+        asyncs = parser.asyncs
+        self.assertTrue(len(asyncs) > 0)
+        self.assertNotIn(12, asyncs.elements)
+        # every D3D call got its call package, every frame its duration
+        self.assertEqual(asyncs.elements.count(8), 6)
+        self.assertEqual(sum(1 for v in asyncs.values if v == 0), 0)
+
+    def testJoin(self):
+        path = self.generate('async.pixrun', 8, 30)
+        parser = Parser(MappedStream(open(path, 'rb')), 0)
+        parser.asyncs = AsyncTable()
+        eids = [event.eid for event in parser.iterEvents()]
+        asyncs = parser.asyncs
+        rows = zip(asyncs.eids, asyncs.elements, asyncs.values)
+        for elementId in set(asyncs.elements):
+            expected = {}
+            for eid, element, value in rows:
+                if element == elementId:
+                    expected.setdefault(eid, value)
+            self.assertEqual(list(asyncs.join(eids, elementId, -1)), [expected.get(eid, -1) for eid in eids])
+            self.assertEqual(list(asyncs.join(eids[::-1], elementId, -1)),
+                             [expected.get(eid, -1) for eid in eids[::-1]])
+            for eid in eids[::7]:
+                self.assertEqual(asyncs.get(eid, elementId), expected.get(eid))
+
+class StatsTest(TraceTest):
+
+    def columns(self, path, fresh=False):
+        if fresh and os.path.exists(statsPath(path)):
+            os.remove(statsPath(path))
+        stats, last = updateStats(path)
+        return [list(a) for a in stats.arrays()], last
+
+    def testReplacedTrace(self):
+        path = self.generate('stats.pixrun', 8, 40)
+        self.columns(path)
+        # same layout, different calls: a SetRenderState of frame 2 becomes a DrawPrimitive
+        with open(path, 'r+b') as f:
+            data = f.read()
+            pos = data.index(dword(functionName.getId('IDirect3DDevice9::SetRenderState')), len(data) // 8)
+            f.seek(pos)
+            f.write(dword(functionName.getId('IDirect3DDevice9::DrawPrimitive')))
+        self.assertEqual(self.columns(path), self.columns(path, fresh=True))
+
+    def testPackedResume(self):
+        packed = self.pack(self.generate('stats.pixrun', 8, 40))
+        expected = self.columns(packed, fresh=True)
+        parser = StatsParser(MappedStream(open(packed, 'rb')), loadStats(packed))
+        self.assertTrue(parser.seekResume())
+        self.assertEqual(self.columns(packed), expected)
+
+    def testGrowingTrace(self):
+        path = self.generate('full.pixrun', 8, 40)
+        growing = self.path('growing.pixrun')
+        data = open(path, 'rb').read()
+        for size in (len(data) // 3, len(data) // 2, len(data)):
+            with open(growing, 'wb') as f:
+                f.write(data[:size])
+            self.assertEqual(self.columns(growing), self.columns(growing, fresh=True))
+        self.assertEqual(self.columns(growing), self.columns(path, fresh=True))
+
+    def testBoundedFingerprint(self):
+        # each run checks the schema and a fixed window before the resume offset, not the whole prefix
+        path = self.generate('full.pixrun', 40, 40)
+        growing = self.path('growing.pixrun')
+        data = open(path, 'rb').read()
+        checked = []
+        def checksum(stream, start, end, crc=0):
+            checked.append(end - start)
+            return pixstatsChecksum(stream, start, end, crc)
+        pixstatsChecksum, window = pixstats.checksum, pixstats.FingerprintWindow
+        pixstats.checksum, pixstats.FingerprintWindow = checksum, 4096
+        try:
+            for size in (len(data) // 3, len(data) // 2, len(data)):
+                with open(growing, 'wb') as f:
+                    f.write(data[:size])
+                self.assertEqual(self.columns(growing), self.columns(growing, fresh=True))
+                del checked[:]
+                self.columns(growing)
+                self.assertTrue(0 < sum(checked) <= 2 * (data.index(dword(1003)) + 4096))
+        finally:
+            pixstats.checksum, pixstats.FingerprintWindow = pixstatsChecksum, window
+
+class IndexTest(TraceTest):
+
+    def testRoundTrip(self):
+        path = self.generate('index.pixrun', 12, 30)
+        index = openIndex(path)
+        self.assertTrue(os.path.exists(indexPath(path)))
+        loaded = loadIndex(path)
+        self.assertEqual([list(a) for a in loaded.arrays()], [list(a) for a in index.arrays()])
+        self.assertEqual(loaded.eventChunk, index.eventChunk)
+        with open(path, 'rb') as stream:
+            self.assertEqual([list(a) for a in buildIndex(stream).arrays()], [list(a) for a in index.arrays()])
+        events = self.events(path)
+        self.assertEqual(index.frameCount(), max(frame for frame, eid, data, offsets in events))
+        # stale sidecars are rebuilt
+        st = os.stat(path)
+        os.utime(path, (st.st_atime, st.st_mtime + 10))
+        self.assertIsNone(loadIndex(path))
+        self.assertEqual(openIndex(path).frameCount(), index.frameCount())
+        with open(path, 'ab') as f:
+            f.write('\0' * 8)
+        self.assertIsNone(loadIndex(path))
+
+    def testSeek(self):
+        path = self.generate('seek.pixrun', 12, 30)
+        events = self.events(path)
+        parser = Parser(MappedStream(open(path, 'rb')))
+        parser.index = openIndex(path)
+        for frame in xrange(1, parser.index.frameCount() + 1):
+            parser.seekFrame(frame)
+            event = next(parser.iterEvents())
+            self.assertEqual((event.frame, event.eid), (frame, parser.index.frameFirstEIDs[frame - 1]))
+        for frame, eid, data, offsets in events[::5]:
+            parser.seekEvent(eid)
+            event = next(parser.iterEvents())
+            self.assertEqual((event.frame, event.eid), (frame, eid))
+        self.assertRaises(KeyError, parser.seekEvent, events[-1][1] + 1)
+        parser.stream.close()
+
+class TreeTest(TraceTest):
+
+    def testTreeMatchesEvents(self):
+        path = self.generate('tree.pixrun', 6, 30, markers=True)
+        tree = loadTree(path)
+        events = self.events(path)
+        parents = dict((eid, data.get('Parent EID', 0xFFFFFFFF)) for frame, eid, data, offsets in events)
+        self.assertEqual(sorted(tree.eids), sorted(parents))
+        children = {}
+        for eid, parent in sorted(parents.items()):
+            children.setdefault(parent, []).append(eid)
+        def size(eid):
+            return 1 + sum(size(child) for child in children.get(eid, []))
+        for eid, parent in parents.items():
+            self.assertEqual(tree.parent(eid), parent if parent in parents else None)
+            self.assertEqual(sorted(tree.children(eid)), children.get(eid, []))
+            self.assertEqual(tree.size(eid), size(eid))
+            self.assertEqual(sorted(tree.subtree(eid))[0], eid)
+
+class ExportTest(TraceTest):
+
+    @unittest.skipIf(EventExporter is None, 'requires numpy')
+    def testColumnsMatchEvents(self):
+        path = self.generate('export.pixrun', 6, 30)
+        tree = loadTree(path)
+        parser = EventExporter(MappedStream(open(path, 'rb')))
+        parser.parse()
+        arrays = parser.arrays()
+        events = self.events(path)
+        self.assertEqual(list(arrays['eid']), [eid for frame, eid, data, offsets in events])
+        self.assertEqual(list(arrays['frame']), [frame for frame, eid, data, offsets in events])
+        self.assertEqual(list(arrays['function']), [tree.functions[tree.row(eid)] for eid in arrays['eid']])
+        parser.stream.close()
+
+class MarkersTest(TraceTest):
+
+    def testRegionsMatchTree(self):
+        path = self.generate('markers.pixrun', 6, 30, markers=True)
+        tree = loadTree(path)
+        parser = MarkerProfiler(MappedStream(open(path, 'rb')))
+        parser.parse()
+        self.assertEqual(parser.finish(), 0)
+        self.assertEqual(parser.unmatched, 0)
+        self.assertEqual(parser.calls, sum(1 for function in tree.functions if function))
+        begins = list(tree.functions).count(BeginEvent)
+        self.assertTrue(begins > 0)
+        self.assertEqual(list(tree.functions).count(EndEvent), begins)
+        self.assertEqual(sum(region.count for region in parser.regions.values()), begins)
+        parser.stream.close()
+
+class ArgumentsTest(TraceTest):
+
+    def testSignatures(self):
+        for line in signatureTable.splitlines():
+            name = line.split()[0]
+            functionId = functionName.getId(name)
+            self.assertIn(functionId, functionArguments, name)
+            signature = functionArguments[functionId]
+            self.assertEqual([argument for argument, kind in signature.arguments],
+                             [argument.split(':')[0] for argument in line.split()[1:]])
+            if '::' in name:
+                self.assertEqual(functionArguments.index(functionId, 'this'), ArgumentsStart)
+        setRenderState = functionName.getId('IDirect3DDevice9::SetRenderState')
+        self.assertEqual(functionArguments.index(setRenderState, 'Value'), ArgumentsStart + 2)
+        self.assertRaises(KeyError, functionArguments.index, setRenderState, 'Nothing')
+        self.assertEqual(formatCall(setRenderState, [1, 0, 0x3f0, 22, 2]),
+                         'IDirect3DDevice9::SetRenderState(this=0x3f0, State=D3DRS_CULLMODE, Value=0x2)')
+        self.assertEqual(formatCall(setRenderState, [1, 0, 0x3f0, 1000]),
+                         'IDirect3DDevice9::SetRenderState(this=0x3f0, State=0x3e8)')
+        clear = functionName.getId('IDirect3DDevice9::Clear')
+        half, = struct.unpack('<I', struct.pack('<f', 0.5))
+        self.assertEqual(formatCall(clear, [1, 0, 1, 0, 0, 3, 0xff, half, 0]),
+                         'IDirect3DDevice9::Clear(this=0x1, Count=0x0, pRects=0x0, Flags=0x3, Color=0xff, Z=0.5, '
+                         'Stencil=0x0)')
+        self.assertEqual(formatCall(0x7FFFFF00, [1, 0, 5, 6]), '(0x5, 0x6)')
+        self.assertNotIn(0x7FFFFF00, functionArguments)
+
+    def testCallArguments(self):
+        path = self.generate('arguments.pixrun', 4, 30, markers=True)
+        data = open(path, 'rb').read()
+        parser = Parser(MappedStream(open(path, 'rb')))
+        calls = []
+        def processCallId(functionId):
+            calls.append((functionId, parser.callOffset, parser.callArguments()))
+        parser.processCallId = processCallId
+        parser.processFrame = lambda eventType, data, offsets: True
+        parser.parse()
+        self.assertEqual(len(calls), len([f for f in loadTree(path).functions if f]))
+        names = set()
+        for functionId, offset, args in calls:
+            size, = struct.unpack_from('<I', data, offset)
+            expected = list(struct.unpack_from('<%iI' % ((size - 4) // 4), data, offset + 8))
+            self.assertEqual(args.tolist(), expected)
+            self.assertEqual(parser.callArguments(offset), args)
+            self.assertEqual(args[:ArgumentsStart].tolist(), [1, 0])
+            if EventExporter is not None:
+                self.assertEqual(argumentView(data, offset).tolist(), expected)
+            names.add(formatCall(functionId, args).split('(')[0])
+            if functionName.get(functionId) == 'IDirect3DDevice9::SetRenderState':
+                self.assertIn(formatCall(functionId, args).split(', ')[1],
+                              ('State=D3DRS_ZENABLE', 'State=D3DRS_CULLMODE'))
+        self.assertIn('IDirect3DDevice9::DrawIndexedPrimitive', names)
+        parser.stream.close()
+
+class QueryTest(unittest.TestCase):
+
+    def testInvalidQueries(self):
+        for text in ['Draw where', 'Draw WHERE  ', 'Draw where arg0', 'Draw where arg0 ==', 'Draw where (arg0 == 1',
+                     'Draw where arg0 == 1 arg1', 'Draw where 1 == arg0', 'Draw where arg0 == D3DNOTHING', '(Draw',
+                     '(Draw where arg0 == 1']:
+            self.assertRaises(ValueError, Query, text)
+
+    def testConditions(self):
+        query = Query('SetRenderState  where  State == D3DRS_CULLMODE and not Value & 1')
+        self.assertEqual(query.pattern, 'SetRenderState')
+        self.assertIsNotNone(query.condition)
+        self.assertIsNone(Query('Draw').condition)
+
+class GrepTest(TraceTest):
+
+    Patterns = ['Set', 'Draw|', '.*', 'DrawIndexedPrimitive where arg3 > 60', 'SetRenderState where arg0 == 7',
+                'Set|Present where ret == 0']
+
+    def grep(self, path, pattern):
+        parser = FrameMatcher(MappedStream(open(path, 'rb')), pattern, 0)
+        parser.parse()
+        return sum(parser.frames.values()), len(parser.frames)
+
+    def testParallelGrep(self):
+        # past frame 256, frames are no longer small cached ints
+        path = self.generate('frames.pixrun', 300, 12)
+        packed = self.pack(path)
+        for pattern in ('Draw', 'SetRenderState where arg0 == D3DRS_CULLMODE'):
+            output = self.script('grep_frames.py', path, pattern, '0')
+            self.assertEqual(self.script('grep_frames.py', path, pattern, '0', '3'), output)
+            self.assertEqual(self.script('grep_frames.py', packed, pattern, '0', '3'), output)
+            self.assertEqual(len(output.splitlines()), 300)
+
+    def testBatchMatchesGrep(self):
+        path = self.generate('unknown.pixrun', 6, 30, generator=UnknownCallGenerator)
+        for pattern in self.Patterns:
+            result, = runBatch([path], pattern, 1)
+            self.assertEqual((result['matches'], result['matched_frames']), self.grep(path, pattern), pattern)
+        self.assertNotEqual(self.grep(path, 'Draw|'), self.grep(path, 'Draw'))
+
+    def testConditionsMatchArguments(self):
+        # brute force evaluation over the arguments of every call: [1, ret, this, arg0, ...]
+        path = self.generate('conditions.pixrun', 8, 40)
+        parser = Parser(MappedStream(open(path, 'rb')))
+        parser.index = openIndex(path)
+        conditions = [
+            ('SetRenderState where arg0 == 7', lambda name, args: 'SetRenderState' in name and args[3] == 7),
+            ('DrawIndexedPrimitive where arg3 > 60', lambda name, args: 'DrawIndexed' in name and args[6] > 60),
+            ('Set|Present where ret == 0', lambda name, args: ('Set' in name or 'Present' in name) and args[1] == 0)]
+        for pattern, condition in conditions:
+            frames = {}
+            for frame in xrange(parser.index.frameCount() + 1):
+                decoded = parser.decodeFrame(frame)
+                for function, offset in zip(decoded.functions, decoded.calls):
+                    if function and condition(functionName.get(function, ''), parser.callArguments(int(offset))):
+                        frames[frame] = frames.get(frame, 0) + 1
+            self.assertTrue(len(frames) > 0, pattern)
+            self.assertEqual(self.grep(path, pattern), (sum(frames.values()), len(frames)), pattern)
+        parser.stream.close()
+
+class BatchTest(TraceTest):
+
+    def testFramesMatchIndex(self):
+        paths = [self.generate('batch%i.pixrun' % i, frames, 12) for i, frames in enumerate((3, 7, 11))]
+        paths.append(self.pack(paths[1]))
+        for result in runBatch(paths[:2] + paths[3:], None, 1) + runBatch(paths, None, 2):
+            self.assertIsNone(result['error'])
+            self.assertEqual(result['frames'], openIndex(result['path']).frameCount())
+        openIndex(paths[2])
+        result, = runBatch([paths[2]], None, 1)
+        self.assertEqual(result['frames'], 11)
+
+class ParserTest(TraceTest):
+
+    def testCompiledDecoding(self):
+        # the precompiled layouts decode the same fields as the logged field by field decoding
+        path = self.generate('fields.pixrun', 6, 30, markers=True)
+        self.assertEqual(self.events(path, 0), self.events(path, 2))
+
+    def testIterEvents(self):
+        path = self.generate('iter.pixrun', 6, 30, markers=True)
+        parser = Parser(MappedStream(open(path, 'rb')))
+        events = [(event.frame, event.eid, event.data, event.offsets) for event in parser.iterEvents()]
+        self.assertEqual(events, self.events(path))
+        parser.stream.close()
+
+    def testFollowMatchesParse(self):
+        path = self.generate('follow.pixrun', 6, 30)
+        parser = Parser(MappedStream(open(path, 'rb')))
+        eids = []
+        parser.processFrame = lambda eventType, data, offsets: eids.append(data['EID']) or True
+        parser.processEvent = lambda eventType, data, offsets: eids.append(data['EID'])
+        parser.follow(0, 0)
+        self.assertEqual(eids, [eid for frame, eid, data, offsets in self.events(path)])
+        parser.stream.close()
+
+
+    def testInstanceHandlers(self):
+        path = self.generate('handlers.pixrun', 3, 12)
+        parser = Parser(MappedStream(open(path, 'rb')), 0)
+        chunks = []
+        parser.processFrame = lambda eventType, data, offsets: True
+        parser.parseObjectInfo = lambda: chunks.append(parser.lastChunkOffset)
+        parser.parse()
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual(len(parser.objects), 0)
+
+    def testProfile(self):
+        path = self.generate('profile.pixrun', 6, 30)
+        index = openIndex(path)
+        parser = Parser(MappedStream(open(path, 'rb')))
+        parser.profile = ParseProfile()
+        types = {}
+        def processEvent(eventType, data, offsets):
+            types[eventType.name] = types.get(eventType.name, 0) + 1
+        def processFrame(eventType, data, offsets):
+            processEvent(eventType, data, offsets)
+            return True
+        parser.processEvent = processEvent
+        parser.processFrame = processFrame
+        parser.parse()
+        profile = parser.profile
+        tags = {}
+        for tag in index.chunkTags:
+            tags[tag] = tags.get(tag, 0) + 1
+        self.assertEqual(dict((tag, entry[0]) for tag, entry in profile.tags.items()), tags)
+        self.assertEqual(sum(entry[1] for entry in profile.tags.values()), os.path.getsize(path))
+        self.assertEqual(dict((name, entry[0]) for name, entry in profile.events.items()), types)
+        self.assertEqual(sum(entry[1] for entry in profile.events.values()), profile.tags[1003][1])
+        self.assertTrue(all(entry[2] >= 0 for entry in profile.tags.values()))
+        out = StringIO()
+        profile.report(out)
+        self.assertIn('Event Async', out.getvalue())
+        parser.stream.close()
+
+    def testJsonLines(self):
+        # alldata values go to the sink instead of the text output
+        path = self.generate('jsonl.pixrun', 3, 20)
+        dump = self.path('dump.jsonl')
+        text = self.script('pixrun.py', path, '4', '--jsonl=' + dump).splitlines()
+        plain = self.script('pixrun.py', path, '4').splitlines()
+        self.assertEqual(text, [line for line in plain if not line.startswith(('\tvalue = ', '\t0x'))])
+        records = [json.loads(line) for line in open(dump)]
+        chunks = [record['chunk'] for record in records]
+        self.assertEqual(chunks, sorted(chunks))
+        parser = Parser(MappedStream(open(path, 'rb')))
+        parser.asyncs = AsyncTable()
+        parser.processFrame = lambda eventType, data, offsets: True
+        parser.parse()
+        asyncs = parser.asyncs
+        values = [(eid, parser.elements[element].name, value)
+                  for eid, element, value in zip(asyncs.eids, asyncs.elements, asyncs.values)
+                  if parser.elements[element].typeId != 7]
+        self.assertTrue(len(values) > 0)
+        self.assertEqual([(record['eid'], record['element'], record['value']) for record in records if 'eid' in record],
+                         values)
+        self.assertEqual(len([record for record in records if 'function' in record]),
+                         len([f for f in loadTree(path).functions if f]))
+        parser.stream.close()
+
+    def testLogFlushedOnErrors(self):
+        path = self.generate('crash.pixrun', 4, 12)
+        parser = Parser(MappedStream(open(path, 'rb')), 2)
+        parser.out = StringIO()
+        def processFrame(eventType, data, offsets):
+            if parser.frameID == 3:
+                raise ValueError('frame %i' % parser.frameID)
+            return True
+        parser.processFrame = processFrame
+        self.assertRaises(ValueError, parser.parse)
+        lines = parser.out.getvalue().splitlines()
+        self.assertIn('Chunk %i' % (parser.chunkID - 1), lines)
+
+    def testCallRecords(self):
+        # one record per call package, its payload consumed
+        path = self.generate('calls.pixrun', 4, 20, markers=True)
+        tree = loadTree(path)
+        parser = Parser(MappedStream(open(path, 'rb')), 4)
+        parser.out = StringIO()
+        parser.sink = StringIO()
+        parser.processFrame = lambda eventType, data, offsets: True
+        parser.parse()
+        records = [json.loads(line) for line in parser.sink.getvalue().splitlines()]
+        calls = [record for record in records if 'function' in record]
+        self.assertEqual([record['function'] for record in calls], [f for f in tree.functions if f])
+        self.assertEqual([record for record in records if 'dwords' in record], [])
+        self.assertNotIn('skipping', parser.out.getvalue())
+        for record in calls:
+            self.assertEqual(record['args'], parser.callArguments(record['offset']).tolist())
+        parser.stream.close()
+
+class FrameDecoderTest(TraceTest):
+
+    def testFramesMatchTree(self):
+        path = self.generate('decode.pixrun', 6, 30, markers=True)
+        tree = loadTree(path)
+        parser = Parser(MappedStream(open(path, 'rb')))
+        parser.index = openIndex(path)
+        parser.parseSchema()
+        for frame in xrange(parser.index.frameCount() + 1):
+            offset, chunkID, end = parser.index.frameBounds(frame)
+            decoder = FrameDecoder(parser.stream)
+            decoder.elements, decoder.eventTypes = parser.elements, parser.eventTypes
+            decoder.seekChunk(offset, chunkID, max(frame, 1))
+            decoder.parseRange(end or parser.stream.size)
+            self.assertEqual(decoder.pending, {})
+            decoded = parser.decodeFrame(frame)
+            rows = [tree.row(eid) for eid in decoded.eids]
+            self.assertEqual(list(decoded.functions), [tree.functions[r] for r in rows])
+            self.assertEqual(list(decoded.parents), [tree.parents[r] for r in rows])
+            self.assertEqual(list(decoder.frame.functions), list(decoded.functions))
+        self.assertEqual(sum(len(parser.decodeFrame(f).eids) for f in xrange(parser.index.frameCount() + 1)),
+                         len(tree))
+
+class FrameCacheTest(TraceTest):
+
+    def decoded(self, events):
+        decoded = DecodedFrame()
+        for eid in xrange(events):
+            for column in decoded.arrays():
+                column.append(eid)
+        return decoded
+
+    def testRandomAccesses(self):
+        # against a least recently used list
+        rng = random.Random(24)
+        sizes = dict((frame, rng.randint(1, 40)) for frame in xrange(30))
+        frames = dict((frame, self.decoded(size)) for frame, size in sizes.items())
+        budget = 20 * frames[0].nbytes() // sizes[0]
+        cache = FrameCache(budget)
+        recent = []
+        hits = misses = evictions = 0
+        for i in xrange(2000):
+            frame = rng.randrange(30)
+            decoded = cache.get(frame)
+            if frame in recent:
+                hits += 1
+                self.assertIs(decoded, frames[frame])
+                recent.remove(frame)
+                recent.append(frame)
+                continue
+            misses += 1
+            self.assertIsNone(decoded)
+            cache.put(frame, frames[frame])
+            recent.append(frame)
+            while sum(frames[f].nbytes() for f in recent) > budget and len(recent) > 1:
+                recent.pop(0)
+                evictions += 1
+            self.assertEqual(list(cache.frames), recent)
+            self.assertEqual(cache.bytes, sum(frames[f].nbytes() for f in recent))
+        self.assertEqual((cache.hits, cache.misses, cache.evictions), (hits, misses, evictions))
+        self.assertTrue(hits > 0 and evictions > 0)
+        summary = cache.summary()
+        self.assertEqual((summary['frames'], summary['bytes']), (len(recent), cache.bytes))
+        cache.clear()
+        self.assertEqual((len(cache), cache.bytes), (0, 0))
+
+    def testOversizedFrame(self):
+        cache = FrameCache(100)
+        cache.put(1, self.decoded(2))
+        cache.put(2, self.decoded(50))
+        self.assertEqual(list(cache.frames), [2])
+        cache.put(2, self.decoded(1))
+        self.assertEqual(cache.bytes, self.decoded(1).nbytes())
+
+    def testDecodeFrame(self):
+        path = self.generate('cache.pixrun', 10, 30)
+        parser = Parser(MappedStream(open(path, 'rb')))
+        parser.index = openIndex(path)
+        sizes = [parser.decodeFrame(frame).nbytes() for frame in xrange(11)]
+        parser.frameCache = FrameCache(sum(sorted(sizes)[-3:]))
+        first = parser.decodeFrame(4)
+        self.assertIs(parser.decodeFrame(4), first)
+        for frame in xrange(11):
+            parser.decodeFrame(frame)
+        self.assertTrue(parser.frameCache.bytes <= parser.frameCache.budget)
+        self.assertIsNot(parser.decodeFrame(4), first)
+        self.assertEqual(list(parser.decodeFrame(4).eids), list(first.eids))
+        summary = parser.frameCache.summary()
+        self.assertEqual((summary['hits'], summary['misses']), (2, 13))
+        parser.stream.close()
+
+class PackTest(TraceTest):
+
+    def testRoundTrip(self):
+        path = self.generate('round.pixrun', 10, 30, markers=True)
+        packed = self.pack(path)
+        unpacked = self.path('unpacked.pixrun')
+        with open(unpacked, 'wb') as output:
+            self.assertEqual(unpack(packed, output), os.path.getsize(path))
+        self.assertEqual(open(unpacked, 'rb').read(), open(path, 'rb').read())
+        self.assertEqual(self.events(packed), self.events(path))
+        self.assertEqual(openIndex(packed).frameCount(), openIndex(path).frameCount())
+        stream = PackedStream(open(packed, 'rb'))
+        self.assertEqual(stream.blockCount(), openIndex(path).frameCount() + 1)
+        stream.close()
+        self.assertRaises(ValueError, pack, packed, StringIO(), ZlibCodec())
+
+    def testSequentialBudget(self):
+        path = self.generate('sequential.pixrun', 30, 60, markers=True)
+        packed = self.pack(path)
+        expected = [(frame, eid) for frame, eid, data, offsets in self.events(path)]
+        def budgeted():
+            parser = Parser(MappedStream(open(packed, 'rb')))
+            parser.stream.budget = 2 * max(parser.stream.rawSizes)
+            return parser
+        def check(parser):
+            stream = parser.stream
+            self.assertTrue(stream.inflated <= stream.budget + max(stream.rawSizes))
+        for mode in ('parse', 'follow', 'iterEvents'):
+            parser = budgeted()
+            eids = []
+            def processFrame(eventType, data, offsets):
+                check(parser)
+                eids.append((parser.frameID, data['EID']))
+                return True
+            parser.processFrame = processFrame
+            parser.processEvent = lambda eventType, data, offsets: eids.append((parser.frameID - 1, data['EID']))
+            if mode == 'parse':
+                parser.parse()
+            elif mode == 'follow':
+                parser.follow(0, 0)
+            else:
+                for event in parser.iterEvents():
+                    check(parser)
+                    eids.append((event.frame, event.data['EID']))
+            self.assertEqual(eids, expected, mode)
+            self.assertTrue(sum(parser.stream.loaded) < parser.stream.blockCount() // 2, mode)
+            parser.stream.close()
+        # skipping frames stays within the budget too
+        parser = budgeted()
+        parser.parse()
+        self.assertEqual(parser.frameID - 1, openIndex(path).frameCount())
+        check(parser)
+        parser.stream.close()
+
+    def testCorruptedBlocks(self):
+        packed = self.pack(self.generate('corrupt.pixrun', 4, 20))
+        data = open(packed, 'rb').read()
+        stream = PackedStream(open(packed, 'rb'))
+        block = 2
+        start = int(stream.packedOffsets[block])
+        stream.close()
+        for pos in (start, start + 5, start + 40, start + 100):
+            corrupted = self.path('corrupted.pixpack')
+            with open(corrupted, 'wb') as f:
+                f.write(data[:pos] + chr(ord(data[pos]) ^ 0x5a) + data[pos + 1:])
+            stream = PackedStream(open(corrupted, 'rb'))
+            self.assertRaises(ValueError, stream.readBlock, block)
+            stream.close()
+
+    def testBlockBudget(self):
+        path = self.generate('budget.pixrun', 30, 60)
+        packed = self.pack(path)
+        raw = Parser(MappedStream(open(path, 'rb')))
+        raw.index = openIndex(path)
+        parser = Parser(MappedStream(open(packed, 'rb')))
+        parser.index = openIndex(packed)
+        parser.frameCache = FrameCache(1 << 20)
+        stream = parser.stream
+        stream.budget = 3 * max(stream.rawSizes)
+        frames = range(parser.index.frameCount() + 1) * 2
+        random.Random(25).shuffle(frames)
+        for frame in frames:
+            decoded = parser.decodeFrame(frame)
+            expected = raw.decodeFrame(frame)
+            self.assertEqual(list(decoded.functions), list(expected.functions))
+            for function, offset in zip(decoded.functions, decoded.calls):
+                if function:
+                    self.assertEqual(parser.callArguments(int(offset)), raw.callArguments(int(offset)))
+            self.assertTrue(stream.inflated <= stream.budget + max(stream.rawSizes))
+            self.assertEqual(stream.inflated, sum(stream.rawSizes[b] for b in stream.recent))
+        self.assertTrue(sum(stream.loaded) < stream.blockCount() // 2)
+
+class ServeTest(TraceTest):
+
+    def get(self, server, query):
+        # (status, JSON reply) of one request
+        thread = threading.Thread(target=server.handle_request)
+        thread.start()
+        try:
+            reply = urllib2.urlopen('http://127.0.0.1:%i%s' % (server.server_address[1], query))
+            status = reply.getcode()
+        except urllib2.HTTPError, e:
+            reply = e
+            status = e.code
+        result = json.loads(reply.read())
+        thread.join()
+        return status, result
+
+    def testErrors(self):
+        path = self.generate('serve.pixrun', 4, 20)
+        server = HTTPServer(('127.0.0.1', 0), QueryHandler)
+        server.trace = TraceServer(path)
+        server.verbose = False
+        try:
+            self.assertEqual(self.get(server, '/events?frame=2')[0], 200)
+            self.assertEqual(self.get(server, '/grep?pattern=Draw%20where')[0], 400)
+            self.assertEqual(self.get(server, '/nothing')[0], 404)
+            def decodeFrame(frame):
+                raise KeyError(frame)
+            server.trace.parser.decodeFrame = decodeFrame
+            status, result = self.get(server, '/events?frame=2')
+            self.assertEqual(status, 500)
+            self.assertEqual(result['error'], 'KeyError: 2')
+        finally:
+            server.server_close()
+            server.trace.close()
+
+if __name__ == '__main__':
+    unittest.main()